@@ -2,6 +2,7 @@
 # DEV: Martinez
 # Cloud Optimizer v1 Free Utility by Martinez
 
+import multiprocessing
 import sys
 from PyQt6 import QtWidgets
 from cloud_optimizer.utils import run_as_admin
@@ -18,6 +19,8 @@ def main():
 
 
 if __name__ == "__main__":
+    # Necessário no executável (PyInstaller) para os processos do localizador de duplicados
+    multiprocessing.freeze_support()
     sys.exit(main())
 
 
@@ -0,0 +1,127 @@
+# Date: 19/10/2026
+# DEV: Martinez
+# Cloud Optimizer v1 Free Utility by Martinez
+
+"""Carga de startup e ajustes sobre o FakeBackend (sistema em memória).
+
+Uso (na pasta do projeto, Linux):
+    python benchmarks/bench_backend.py
+    python benchmarks/bench_backend.py --run-values 50000 --latency 0.0001 --command-latency 0.02
+
+Popula HKCU/HKLM Run com --run-values valores e mede listar, desativar e
+restaurar itens, a remoção dos programas inúteis, o perfil completo (duas
+vezes: a segunda deve ler o estado e não escrever nada) e o desfazer do perfil
+pelo diário, que deve deixar o sistema falso como antes. As latências
+simulam o custo de cada operação de registro/arquivo e de cada comando.
+"""
+
+import argparse
+import copy
+import json
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("CLOUD_OPTIMIZER_HOME", tempfile.mkdtemp(prefix="cloudopt-bench-"))
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from cloud_optimizer import startup, tweaks  # noqa: E402
+from cloud_optimizer.journal import get_journal  # noqa: E402
+from cloud_optimizer.system_backend import HKCU, HKLM, REG_SZ, FakeBackend, set_backend  # noqa: E402
+from cloud_optimizer.tweak_engine import TweakEngine  # noqa: E402
+
+
+def populate(backend, run_values):
+    for i in range(run_values):
+        backend.reg_set(HKCU if i % 2 else HKLM, startup.RUN_SUBKEY, f"App{i:06d}", REG_SZ, f'"C:\\Apps\\app{i}\\app{i}.exe" --background')
+    for name in tweaks.USELESS_PROGRAMS:
+        backend.reg_set(HKCU, startup.RUN_SUBKEY, name, REG_SZ, f'"C:\\Program Files\\{name}\\{name}.exe" /background')
+        backend.add_task(f"\\{name} Update Task", f'"C:\\Program Files\\{name}\\{name}Updater.exe"')
+    for svc in tweaks.SERVICES:
+        backend.add_service(svc)
+    backend.calls.clear()
+
+
+def system_state(backend):
+    """Tudo o que os ajustes alteram no backend falso (chaves vazias contam como ausentes)."""
+    keys = {k: v for k, v in backend._keys.items() if v}
+    return copy.deepcopy((keys, backend.services, backend.tasks, backend.tcp,
+                          backend.power_active, backend.power_schemes))
+
+
+def timed(results, name, func):
+    t0 = time.perf_counter()
+    value = func()
+    results[name] = time.perf_counter() - t0
+    return value
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--run-values", type=int, default=50000, help="valores em HKCU/HKLM Run")
+    parser.add_argument("--disable", type=int, default=200, help="itens desativados e restaurados")
+    parser.add_argument("--latency", type=float, default=0.0, help="latência (s) por operação de registro/arquivo")
+    parser.add_argument("--command-latency", type=float, default=0.0, help="latência (s) por comando")
+    parser.add_argument("--output", help="arquivo JSON com os resultados")
+    args = parser.parse_args(argv)
+
+    backend = FakeBackend(latency=args.latency, command_latency=args.command_latency)
+    set_backend(backend)
+    populate(backend, args.run_values)
+    results = {"run_values": args.run_values}
+
+    items = timed(results, "list_startup_programs", startup.list_startup_programs)
+    if len(items) != args.run_values + len(tweaks.USELESS_PROGRAMS):
+        raise SystemExit(f"Esperado {args.run_values + len(tweaks.USELESS_PROGRAMS)} itens, obtido {len(items)}")
+    targets = items[:args.disable]
+    timed(results, f"disable_startup_item[{len(targets)}]", lambda: [startup.disable_startup_item(e) for e in targets])
+    disabled = timed(results, "list_disabled_startup_items", startup.list_disabled_startup_items)
+    if len(disabled) != len(targets):
+        raise SystemExit(f"Esperado {len(targets)} desativados, obtido {len(disabled)}")
+    timed(results, f"restore_startup_item[{len(disabled)}]", lambda: [startup.restore_startup_item(e) for e in disabled])
+
+    removed = timed(results, "remove_run_entries", tweaks._remove_run_entries)
+    if sorted(removed) != sorted(tweaks.USELESS_PROGRAMS):
+        raise SystemExit(f"Remoção inesperada: {removed}")
+
+    engine = TweakEngine(max_workers=8)
+    steps = [s for s in tweaks.profile_steps() if s.name != 'cleanup.temp']
+    original = system_state(backend)
+    session = get_journal().begin("Perfil Desempenho")
+    for label in ("profile_first", "profile_again"):
+        before = sum(n for k, n in backend.calls.items() if k in ("reg_set", "reg_delete"))
+        commands = len(backend.commands)
+        report = timed(results, label, lambda: engine.run(steps))
+        if not report['ok']:
+            raise SystemExit(f"Perfil falhou: {report['failed']}")
+        writes = [c for c in backend.commands[commands:] if any(op in c for op in ('/setactive', '/change', 'stop', 'config', 'set'))]
+        results[f"{label}_writes"] = len(writes) + sum(n for k, n in backend.calls.items() if k in ("reg_set", "reg_delete")) - before
+        steps = [s for s in tweaks.profile_steps() if s.name != 'cleanup.temp']
+    get_journal().end()
+    if results["profile_again_writes"]:
+        raise SystemExit(f"Perfil reaplicado escreveu {results['profile_again_writes']} vezes")
+
+    commands = len(backend.commands)
+    reverted = timed(results, "rollback", lambda: tweaks.rollback(session))
+    if reverted['errors'] or system_state(backend) != original:
+        raise SystemExit(f"Desfazer não restaurou o estado: {reverted['errors']}")
+    results["rollback_targets"] = reverted['reverted']
+    results["rollback_commands"] = len(backend.commands) - commands
+
+    for name, value in results.items():
+        if isinstance(value, float):
+            print(f"{name:35s} {value * 1000:10.1f} ms")
+    print(f"escritas: perfil {results['profile_first_writes']}, perfil de novo {results['profile_again_writes']}")
+    print(f"desfazer: {results['rollback_targets']} alvos, {results['rollback_commands']} comandos num lote")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+# Date: 19/10/2026
+# DEV: Martinez
+# Cloud Optimizer v1 Free Utility by Martinez
+
+"""Compara comandos em processos individuais com o lote numa sessão de shell.
+
+Uso (na pasta do projeto, Linux):
+    python benchmarks/bench_command_batch.py
+    python benchmarks/bench_command_batch.py --commands 200 --runs 5 --output resultado.json
+
+No Linux o `sh` faz o papel do cmd.exe e `powercfg`, `netsh`, `sc` e
+`schtasks` são funções de shell que imprimem algo e saem com códigos
+diferentes. Antes de medir, confere que o lote devolve exatamente os mesmos
+códigos de saída e saídas que os processos individuais, inclusive para
+stderr, saída sem quebra de linha final, comando inexistente e timeout.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from cloud_optimizer.utils import CommandBatch, ShellSession, run_batch  # noqa: E402
+
+# Substitutos dos comandos do Windows: mesmo formato de chamada, saída e código previsíveis
+STAND_INS = """\
+powercfg() { echo "powercfg $*"; }
+netsh() { echo "Ok."; }
+sc() { if [ "$1" = stop ]; then echo "[SC] ControlService FAILED 1062:" >&2; return 1062; fi; echo "[SC] ChangeServiceConfig SUCCESS"; }
+schtasks() { printf 'SUCCESS: %s' "$*"; }
+"""
+
+
+def tweak_commands(count):
+    """Comandos no formato dos ajustes, repetidos até `count`."""
+    base = [
+        ['powercfg', '/setactive', '8c5e7fda-e8bf-4a96-9a85-a6e23a8c635c'],
+        ['powercfg', '/change', 'monitor-timeout-ac', '0'],
+        ['netsh', 'int', 'tcp', 'set', 'global', 'rss=enabled'],
+        ['sc', 'stop', 'DiagTrack'],
+        ['sc', 'config', 'DiagTrack', 'start=disabled'],
+        ['schtasks', '/change', '/tn', '*OneDrive*', '/disable'],
+    ]
+    return [base[i % len(base)] for i in range(count)]
+
+
+def wrap(cmd, stand_ins):
+    """Roda `cmd` num sh que conhece os substitutos (um processo por comando)."""
+    return ['sh', '-c', f'. {stand_ins}; "$@"', 'sh'] + cmd
+
+
+def check_equivalence(stand_ins):
+    commands = [wrap(c, stand_ins) for c in tweak_commands(6)] + [
+        ['sh', '-c', 'echo saída; echo erro >&2; exit 3'],
+        ['printf', 'sem quebra'],
+        ['echo', "aspas ' e $HOME"],
+        ['true'],
+    ]
+    single = run_batch(commands, batch=False)
+    batched = run_batch(commands)
+    for a, b in zip(single, batched):
+        if (a.returncode, a.stdout + a.stderr) != (b.returncode, b.stdout):
+            raise SystemExit(f"Divergência em {a.args}: {a.returncode} {a.stdout + a.stderr!r} x {b.returncode} {b.stdout!r}")
+    missing = run_batch([['comando-que-nao-existe']])[0]
+    if missing.returncode == 0:
+        raise SystemExit("Comando inexistente não falhou no lote")
+    t0 = time.perf_counter()
+    late = run_batch([['sleep', '5'], ['echo', 'depois']], timeout=0.5)
+    if late[0].returncode != -1 or late[1].stdout != 'depois\n' or time.perf_counter() - t0 > 3:
+        raise SystemExit(f"Timeout não tratado: {late}")
+    print(f"equivalência: {len(commands)} comandos, códigos e saídas iguais; inexistente e timeout tratados")
+
+
+def measure(fn, runs):
+    times = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--commands", type=int, default=50, help="comandos por lote")
+    parser.add_argument("--runs", type=int, default=5, help="repetições (mediana)")
+    parser.add_argument("--output", help="arquivo JSON com os resultados")
+    args = parser.parse_args(argv)
+
+    with tempfile.NamedTemporaryFile("w", suffix=".sh", delete=False) as fh:
+        fh.write(STAND_INS)
+        stand_ins = fh.name
+    try:
+        check_equivalence(stand_ins)
+        commands = tweak_commands(args.commands)
+
+        def single():
+            run_batch([wrap(c, stand_ins) for c in commands], batch=False)
+
+        def batched():
+            # Uma sessão só, com os substitutos carregados uma vez
+            session = ShellSession()
+            session.run(['.', stand_ins])
+            runner = CommandBatch(session=session)
+            for cmd in commands:
+                runner.add(cmd)
+            runner.run()
+            session.close()
+            return session.spawned
+
+        results = {"commands": args.commands, "single_s": measure(single, args.runs), "batched_s": measure(batched, args.runs)}
+        results["spawns_single"] = args.commands
+        results["spawns_batched"] = batched()
+        print(f"processos individuais: {results['single_s'] * 1000:8.1f} ms ({args.commands} processos)")
+        print(f"lote numa sessão:      {results['batched_s'] * 1000:8.1f} ms ({results['spawns_batched']} processo)")
+        print(f"ganho: {results['single_s'] / results['batched_s']:.1f}x")
+    finally:
+        os.remove(stand_ins)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
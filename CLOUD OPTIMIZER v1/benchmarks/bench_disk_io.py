@@ -0,0 +1,69 @@
+# Date: 19/10/2026
+# DEV: Martinez
+# Cloud Optimizer v1 Free Utility by Martinez
+
+"""Benchmark de disco (disk_bench) pela linha de comando, o mesmo da página Benchmark.
+
+Uso (na pasta do projeto):
+    python benchmarks/bench_disk_io.py
+    python benchmarks/bench_disk_io.py --folder /mnt/dados --modes buffered direct mmap --full
+    python benchmarks/bench_disk_io.py --size-mb 64 --duration 1
+
+Roda a bateria padrão (ou a completa: 4K/64K/1M × QD 1/8/32) em cada modo
+pedido sobre um arquivo temporário na pasta e confere que nada ficou para trás.
+Testes que o sistema de arquivos não aceita (ex.: O_DIRECT em tmpfs) aparecem
+como erro e não interrompem os demais.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from cloud_optimizer.disk_bench import MODES, STANDARD_TESTS, build_tests, run_disk_bench  # noqa: E402
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--folder", default=tempfile.gettempdir(), help="pasta no disco a testar")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=['buffered'], help="modos de E/S")
+    parser.add_argument("--full", action="store_true", help="todas as combinações de bloco e QD")
+    parser.add_argument("--size-mb", type=int, default=256, help="tamanho do arquivo de teste")
+    parser.add_argument("--duration", type=float, default=3.0, help="segundos por teste")
+    parser.add_argument("--output", help="arquivo JSON com os resultados")
+    args = parser.parse_args(argv)
+
+    if args.full:
+        tests = build_tests(modes=args.modes)
+    else:
+        tests = [test._replace(mode=mode) for mode in args.modes for test in STANDARD_TESTS]
+    before = set(os.listdir(args.folder))
+
+    def on_progress(ev):
+        if 'result' in ev:
+            r = ev['result']
+            if r.get('error'):
+                print(f"{r['name']:32s} erro: {r['error']}")
+            else:
+                lat = r['latency_us']
+                print(f"{r['name']:32s} {r['mb_s']:10.1f} MB/s {r['iops']:10.0f} IOPS   "
+                      f"p50 {lat['p50']:8.1f}  p99 {lat['p99']:8.1f}  p99.9 {lat['p99.9']:8.1f} µs")
+
+    report = run_disk_bench(args.folder, tests, file_size=args.size_mb * 1024 * 1024, duration=args.duration, progress=on_progress)
+    left = set(os.listdir(args.folder)) - before
+    leftovers = [name for name in left if name.startswith('cloudopt-diskbench-')]
+    if leftovers:
+        raise SystemExit(f"Arquivos temporários não foram apagados: {leftovers}")
+    print(f"{len(report['results'])} testes • arquivo de {report['file_size'] // (1024 * 1024)} MB • {report['elapsed_s']:.1f}s")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2, ensure_ascii=False)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+# Date: 19/10/2026
+# DEV: Martinez
+# Cloud Optimizer v1 Free Utility by Martinez
+
+"""Benchmark do analisador de uso de disco sobre uma árvore sintética.
+
+Uso (na pasta do projeto, Linux):
+    python benchmarks/bench_disk_usage.py --files 2000000
+    python benchmarks/bench_disk_usage.py --files 200000 --workers 1 4 8 --keep /tmp/arvore
+
+Mede a análise completa (por número de threads), a reanálise com cache sem
+mudanças e a reanálise depois de alterar algumas pastas, conferindo os totais
+contra o que foi gerado. A árvore é criada numa pasta temporária (arquivos
+esparsos: o tamanho aparente não ocupa disco) e removida no fim, salvo --keep.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("CLOUD_OPTIMIZER_HOME", tempfile.mkdtemp(prefix="cloudopt-bench-"))
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from cloud_optimizer.disk_usage import DiskUsageTree, analyze_disk_usage, build_tree, cache_path  # noqa: E402
+
+
+def make_tree(root, files, per_dir=50, fanout=20):
+    """Gera `files` arquivos em pastas de `per_dir` arquivos, `fanout` subpastas por nível."""
+    expected = {"files": 0, "bytes": 0, "dirs": 1}
+    dirs = [root]
+    made = 0
+    i = 0
+    while made < files:
+        parent = dirs[i // fanout]
+        path = os.path.join(parent, f"d{i}")
+        os.mkdir(path)
+        dirs.append(path)
+        expected["dirs"] += 1
+        for j in range(min(per_dir, files - made)):
+            size = (i * 31 + j * 17) % 65536
+            with open(os.path.join(path, f"f{j}.dat"), "wb") as fh:
+                fh.truncate(size)
+            expected["bytes"] += size
+            made += 1
+        i += 1
+    expected["files"] = made
+    return expected, dirs
+
+
+def peak_rss_mb():
+    try:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+    except Exception:
+        return None
+
+
+def check(tree, expected):
+    got = {"files": tree.total_files[0], "bytes": tree.total_size[0], "dirs": len(tree)}
+    if got != expected:
+        raise SystemExit(f"Totais divergentes: esperado {expected}, obtido {got}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=200000, help="quantidade de arquivos da árvore sintética")
+    parser.add_argument("--per-dir", type=int, default=50, help="arquivos por pasta")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 8], help="threads para a análise completa")
+    parser.add_argument("--touch", type=int, default=100, help="pastas alteradas antes da reanálise incremental")
+    parser.add_argument("--keep", help="gera/usa a árvore nesta pasta e não a remove")
+    parser.add_argument("--output", help="arquivo JSON com os resultados")
+    args = parser.parse_args(argv)
+
+    root = args.keep or tempfile.mkdtemp(prefix="cloudopt-du-")
+    results = {"files": args.files}
+    try:
+        t0 = time.perf_counter()
+        tree_root = os.path.join(root, "tree")
+        if os.path.isdir(tree_root):
+            # Árvore reaproveitada de um --keep anterior: os totais de referência vêm dela
+            full = build_tree(tree_root, workers=max(args.workers))
+            expected = {"files": full.total_files[0], "bytes": full.total_size[0], "dirs": len(full)}
+            dirs = [full.path(i) for i in range(len(full))]
+        else:
+            os.makedirs(tree_root)
+            expected, dirs = make_tree(tree_root, args.files, args.per_dir)
+        print(f"Árvore: {expected['files']} arquivos, {expected['dirs']} pastas ({time.perf_counter() - t0:.1f}s para preparar)")
+
+        for w in args.workers:
+            tree = build_tree(tree_root, workers=w)
+            check(tree, expected)
+            results[f"full[{w}]"] = tree.elapsed_s
+            print(f"análise completa, {w:2d} threads: {tree.elapsed_s:7.2f}s")
+
+        tree = analyze_disk_usage(tree_root, use_cache=False)
+        t0 = time.perf_counter()
+        DiskUsageTree.load(cache_path(tree_root))
+        results["cache_load"] = time.perf_counter() - t0
+        results["cache_bytes"] = os.path.getsize(cache_path(tree_root))
+
+        tree = analyze_disk_usage(tree_root)
+        check(tree, expected)
+        results["cached_no_changes"] = tree.elapsed_s
+        print(f"reanálise sem mudanças:        {tree.elapsed_s:7.2f}s ({tree.dirs_reused} do cache, {tree.dirs_scanned} lidas)")
+
+        step = max(1, len(dirs) // max(1, args.touch))
+        touched = dirs[1::step][:args.touch]
+        for path in touched:
+            with open(os.path.join(path, "novo.dat"), "wb") as fh:
+                fh.truncate(1000)
+        expected["files"] += len(touched)
+        expected["bytes"] += 1000 * len(touched)
+        tree = analyze_disk_usage(tree_root)
+        check(tree, expected)
+        results["cached_incremental"] = tree.elapsed_s
+        print(f"reanálise, {len(touched)} pastas alteradas: {tree.elapsed_s:7.2f}s ({tree.dirs_scanned} lidas)")
+
+        t0 = time.perf_counter()
+        for i in range(len(tree)):
+            tree.children(i)
+        results["drill_down_all"] = time.perf_counter() - t0
+        results["peak_rss_mb"] = peak_rss_mb()
+        print(f"drill-down de todas as pastas: {results['drill_down_all']:7.2f}s")
+        print(f"cache: {results['cache_bytes'] / 1024 / 1024:.1f} MB, carga {results['cache_load']:.2f}s; pico RSS {results['peak_rss_mb']:.0f} MB")
+    finally:
+        if not args.keep:
+            shutil.rmtree(root, ignore_errors=True)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,219 @@
+# Date: 19/10/2026
+# DEV: Martinez
+# Cloud Optimizer v1 Free Utility by Martinez
+
+"""Benchmarks dos caminhos quentes da MainWindow (Qt offscreen, backends falsos).
+
+Uso (na pasta do projeto, Linux):
+    python benchmarks/bench_main_window.py
+    python benchmarks/bench_main_window.py --output resultado.json --compare anterior.json
+
+Cada caso reporta min/média/p50/p90/p99/max em ms e o pico de memória alocada
+(tracemalloc). O resultado completo é salvo em JSON (padrão: benchmarks/results/).
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import string
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("CLOUD_OPTIMIZER_HOME", tempfile.mkdtemp(prefix="cloudopt-bench-"))
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, PROJECT_DIR)
+
+
+def _install_fake_backend():
+    """Sistema falso em memória (FakeBackend): tweaks e startup rodam fora do Windows."""
+    from cloud_optimizer.system_backend import FakeBackend, set_backend
+    backend = FakeBackend()
+    set_backend(backend)
+    return backend
+
+
+class FakeMonitor:
+    """Monitor falso com métricas sintéticas (sem psutil nem nvidia-smi)."""
+
+    def __init__(self):
+        self._rng = random.Random(1)
+
+    def get_metrics(self):
+        cpu = self._rng.uniform(0, 100)
+        ram = self._rng.uniform(20, 90)
+        return {
+            "cpu_pct": cpu, "ram_used_gb": ram / 10, "ram_pct": ram, "gpu_txt": "N/A", "temp_txt": "55°C",
+            "disk_mb_s": self._rng.uniform(0, 300), "net_mbit_s": self._rng.uniform(0, 100),
+            "mem_available_gb": 10 - ram / 10, "mem_cached_gb": 2.0, "mem_buffers_gb": 0.2,
+            "swap_used_gb": 0.0, "swap_pct": 0.0, "swap_in_mb_s": 0.0, "swap_out_mb_s": 0.0,
+            "major_faults_s": self._rng.uniform(0, 50), "commit_pct": None,
+            "psi_memory_some": self._rng.uniform(0, 5), "psi_memory_full": 0.0,
+            "psi_io_some": self._rng.uniform(0, 10), "psi_io_full": 0.0, "psi_cpu_some": self._rng.uniform(0, 30),
+            "temp_c": 55.0, "temp_max_c": 58.0, "cpu_freq_mhz": 3200.0, "cpu_freq_min_mhz": 3100.0,
+            "cpu_freq_base_mhz": 3000.0, "cpu_freq_pct": 106.7, "throttle_events": 0, "throttled": False, "throttle_reason": None,
+            "formatted": {"CPU": f"{cpu:.0f}%", "RAM": f"{ram / 10:.1f} GB", "GPU": "N/A", "Temp": "55°C",
+                          "Disco": "12.0 MB/s", "Rede": "1.00 Mb/s", "Memória": f"{10 - ram / 10:.1f} GB livres",
+                          "Swap": "0.0 MB/s", "Clock": "3.20 GHz"},
+        }
+
+
+def make_startup_entries(n, seed=7):
+    rng = random.Random(seed)
+    out = []
+    for i in range(n):
+        name = "".join(rng.choices(string.ascii_letters, k=10)) + f" App {i}"
+        exe = rf"C:\Program Files\{name}\{name.split()[0].lower()}.exe"
+        out.append({"name": name, "exe": exe, "value": f'"{exe}" --autostart', "source": rng.choice(["HKCU Run", "HKLM Run", "Startup Folder"])})
+    out.sort(key=lambda d: d["name"].lower())
+    return out
+
+
+def summarize(samples_s, peak_bytes):
+    ms = sorted(s * 1000.0 for s in samples_s)
+
+    def pct(p):
+        return ms[min(len(ms) - 1, int(round(p * (len(ms) - 1))))]
+
+    return {
+        "runs": len(ms), "min_ms": ms[0], "mean_ms": sum(ms) / len(ms), "p50_ms": pct(0.50),
+        "p90_ms": pct(0.90), "p99_ms": pct(0.99), "max_ms": ms[-1], "peak_alloc_kb": peak_bytes / 1024.0,
+    }
+
+
+def measure(app, func, runs, setup=None):
+    """Executa `func` `runs` vezes processando eventos pendentes entre as execuções."""
+    samples = []
+    gc.collect()
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    for _ in range(runs):
+        if setup is not None:
+            setup()
+        t0 = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - t0)
+        app.processEvents()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return summarize(samples, peak)
+
+
+def git_revision():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_DIR, capture_output=True, text=True, check=False)
+        return out.stdout.strip() or None
+    except Exception:
+        return None
+
+
+def run_benchmarks(args):
+    _install_fake_backend()
+    from PyQt6 import QtWidgets
+    import cloud_optimizer.main_window as mw
+
+    mw.Monitor = FakeMonitor
+    startup_entries = {"data": []}
+    mw.list_startup_programs = lambda: list(startup_entries["data"])
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+    results = {}
+
+    results["construct_main_window"] = measure(app, lambda: mw.MainWindow().deleteLater(), args.page_runs)
+    win = mw.MainWindow()
+    win.monitor_timer.stop()
+    win.ui_watchdog.stop()
+
+    results["build_monitor_page"] = measure(app, lambda: win.build_monitor_page().deleteLater(), args.page_runs)
+    win.monitor_timer.stop()
+    results["build_tweaks_page"] = measure(app, lambda: win.build_tweaks_page().deleteLater(), args.page_runs)
+    results["build_startup_page"] = measure(app, lambda: win.build_startup_page().deleteLater(), args.page_runs)
+    win.page_startup = win.build_startup_page()
+
+    monitor = FakeMonitor()
+    metrics = [monitor.get_metrics() for _ in range(args.tick_runs)]
+    it = iter(metrics)
+    results["apply_monitor_metrics"] = measure(app, lambda: win._apply_monitor_metrics(next(it)), args.tick_runs)
+
+    for n in args.sizes:
+        data = make_startup_entries(n)
+        runs = max(3, min(args.filter_runs, 20000 // max(n, 1)))
+        payload = {"data": data, "error": None}
+        results[f"handle_startup_results[{n}]"] = measure(app, lambda: win._handle_startup_results(payload), runs)
+        win._handle_startup_results(payload)
+        for label, term in [("all", ""), ("term", "app 1"), ("miss", "zzqx")]:
+            def setup(term=term):
+                win.startup_search.blockSignals(True)
+                win.startup_search.setText(term)
+                win.startup_search.blockSignals(False)
+            results[f"filter_startup_list[{n}/{label}]"] = measure(app, win.filter_startup_list, runs, setup=setup)
+
+    win.close()
+    return results
+
+
+def compare(current, previous):
+    lines = []
+    for name, cur in current.items():
+        prev = previous.get(name)
+        if not prev:
+            continue
+        delta = (cur["p50_ms"] - prev["p50_ms"]) / prev["p50_ms"] * 100.0 if prev["p50_ms"] else 0.0
+        lines.append(f"{name:45s} p50 {prev['p50_ms']:9.3f} -> {cur['p50_ms']:9.3f} ms ({delta:+6.1f}%)")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000, 10000], help="tamanhos da lista de inicialização")
+    parser.add_argument("--tick-runs", type=int, default=300, help="ticks de _apply_monitor_metrics")
+    parser.add_argument("--filter-runs", type=int, default=50, help="execuções por caso de filtro (reduzido para listas grandes)")
+    parser.add_argument("--page-runs", type=int, default=10, help="execuções por construção de página")
+    parser.add_argument("--output", help="arquivo JSON de saída (padrão: benchmarks/results/bench-<data>.json)")
+    parser.add_argument("--compare", help="JSON de uma execução anterior para comparar p50")
+    args = parser.parse_args(argv)
+
+    started = time.time()
+    results = run_benchmarks(args)
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(started)),
+        "duration_s": round(time.time() - started, 2),
+        "git": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "qt_platform": os.environ.get("QT_QPA_PLATFORM"),
+        "results": results,
+    }
+    try:
+        import resource
+        report["peak_rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+    except Exception:
+        report["peak_rss_mb"] = None
+
+    for name, r in results.items():
+        print(f"{name:45s} p50 {r['p50_ms']:9.3f} ms  p99 {r['p99_ms']:9.3f} ms  pico {r['peak_alloc_kb']:9.1f} KiB")
+
+    output = args.output or os.path.join(BENCH_DIR, "results", time.strftime("bench-%Y%m%d-%H%M%S.json", time.localtime(started)))
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2, ensure_ascii=False)
+    print(f"\nResultado salvo em {output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            previous = json.load(fh).get("results", {})
+        print("\nComparação com", args.compare)
+        print(compare(results, previous))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+# Date: 19/10/2026
+# DEV: Martinez
+# Cloud Optimizer v1 Free Utility by Martinez
+
+"""Manutenção automática (maintenance) com métricas simuladas.
+
+Uso (na pasta do projeto):
+    python benchmarks/bench_maintenance.py
+    python benchmarks/bench_maintenance.py --folders 8 --files 5000
+
+Cria pastas temporárias com arquivos descartáveis e alimenta o agendador com
+amostras no formato do Monitor (CPU/disco), simulando: período ocioso ->
+limpeza começa; atividade -> pausa; programa fechado no meio -> um agendador
+novo retoma do checkpoint sem refazer as pastas concluídas. Mede a latência
+da pausa (amostra com atividade até a tarefa parar de apagar) e mostra a
+prioridade com que a thread da manutenção rodou.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+os.environ.setdefault("CLOUD_OPTIMIZER_HOME", tempfile.mkdtemp(prefix="cloudopt-bench-"))
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+import psutil  # noqa: E402
+
+from cloud_optimizer.cleanup_policy import CleanupPolicy  # noqa: E402
+from cloud_optimizer.maintenance import IdleDetector, MaintenanceScheduler, TempCleanupJob  # noqa: E402
+
+IDLE = {'cpu_pct': 2.0, 'disk_mb_s': 0.0}
+BUSY = {'cpu_pct': 60.0, 'disk_mb_s': 0.0}
+
+
+class _WatchedCleanup(TempCleanupJob):
+    """TempCleanupJob que registra a prioridade (CPU e I/O) da thread em que rodou."""
+
+    def __init__(self, policies, seen):
+        super().__init__(policies)
+        self.seen = seen
+
+    def run(self, ctx):
+        if os.name != 'nt':
+            tid = threading.get_native_id()
+            self.seen['nice'] = os.getpriority(os.PRIO_PROCESS, tid)
+            if hasattr(psutil.Process, 'ionice'):
+                ioclass = psutil.Process(tid).ionice().ioclass
+                self.seen['ionice'] = getattr(ioclass, 'name', ioclass)
+        return super().run(ctx)
+
+
+def make_tree(root, folders, files):
+    paths = []
+    for i in range(folders):
+        path = os.path.join(root, f'pasta{i:02d}')
+        os.makedirs(path)
+        for j in range(files):
+            with open(os.path.join(path, f'{j}.tmp'), 'wb') as fh:
+                fh.write(b'x' * 512)
+        paths.append(path)
+    return paths
+
+
+def remaining(paths):
+    return sum(len(os.listdir(p)) for p in paths)
+
+
+def feed_until(scheduler, sample, condition, limit=30.0, step=0.05):
+    deadline = time.monotonic() + limit
+    while not condition() and time.monotonic() < deadline:
+        scheduler.feed(sample)
+        time.sleep(step)
+    return condition()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--folders", type=int, default=6, help="pastas com arquivos descartáveis")
+    parser.add_argument("--files", type=int, default=3000, help="arquivos por pasta")
+    parser.add_argument("--idle-for", type=float, default=1.0, help="segundos ociosos antes de começar")
+    parser.add_argument("--output", help="arquivo JSON com os resultados")
+    args = parser.parse_args(argv)
+
+    root = tempfile.mkdtemp(prefix="cloudopt-maint-")
+    state_dir = os.path.join(root, 'estado')
+    events, seen = [], {}
+    try:
+        paths = make_tree(os.path.join(root, 'temp'), args.folders, args.files)
+        total = remaining(paths)
+        policies = [CleanupPolicy('Descartáveis', paths)]
+
+        def scheduler():
+            return MaintenanceScheduler(
+                [_WatchedCleanup(policies, seen)], IdleDetector(idle_for=args.idle_for, subtract_own=False),
+                state_dir=state_dir, on_event=lambda ev: events.append((time.monotonic(), ev)),
+            )
+
+        # 1. Ocioso: começa depois de idle_for
+        first = scheduler()
+        t0 = time.monotonic()
+        feed_until(first, IDLE, lambda: remaining(paths) < total)
+        started_after = time.monotonic() - t0
+
+        # 2. Atividade: pausa; mede até a contagem de arquivos parar de cair
+        first.feed(BUSY)
+        paused_at = time.monotonic()
+        last, stable_since = remaining(paths), time.monotonic()
+        while time.monotonic() - stable_since < 0.5:
+            time.sleep(0.01)
+            now_left = remaining(paths)
+            if now_left != last:
+                last, stable_since = now_left, time.monotonic()
+        pause_latency = stable_since - paused_at
+        left_when_paused = last
+
+        # 3. Programa fechado durante a pausa: checkpoint fica salvo
+        first.stop()
+        with open(os.path.join(state_dir, 'temp_cleanup.json'), encoding='utf-8') as fh:
+            checkpoint = json.load(fh)
+
+        # 4. Novo agendador retoma do checkpoint
+        second = scheduler()
+        events.clear()
+        feed_until(second, IDLE, lambda: second.running)
+        feed_until(second, IDLE, lambda: not second.running, limit=120)
+        resumed = [ev for _, ev in events if ev['event'] == 'maintenance_job_start']
+        finished = [ev for _, ev in events if ev['event'] == 'maintenance_job_finish']
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    result = {
+        "files": total,
+        "started_after_s": round(started_after, 2),
+        "pause_latency_ms": round(pause_latency * 1000, 1),
+        "files_left_when_paused": left_when_paused,
+        "folders_in_checkpoint": len(checkpoint['state'].get('done', [])),
+        "resumed_from_checkpoint": bool(resumed and resumed[0]['resumed']),
+        "files_removed_total": finished[0]['report']['files_removed'] if finished else None,
+        "thread_nice": seen.get('nice'),
+        "thread_ionice": seen.get('ionice'),
+    }
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(result, fh, indent=2, ensure_ascii=False)
+    return 0 if result["resumed_from_checkpoint"] and result["files_removed_total"] == total else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+# Date: 19/10/2026
+# DEV: Martinez
+# Cloud Optimizer v1 Free Utility by Martinez
+
+"""Benchmark de rede (net_bench): servidor de teste e cliente pela linha de comando.
+
+Uso (na pasta do projeto):
+    python benchmarks/bench_net.py                              # loopback nesta máquina
+    python benchmarks/bench_net.py --serve 0.0.0.0:5201         # na outra máquina da rede
+    python benchmarks/bench_net.py --target 192.168.0.10:5201   # daqui, contra ela
+    python benchmarks/bench_net.py --buffers 0 65536 4194304 --streams 1 4 8 --duration 3
+
+Mede vazão de envio e recebimento (tamanhos de buffer de socket × conexões em
+paralelo), tempo de ida e volta (p50/p90/p99) e abertura de conexões por
+segundo. Com --label a execução vai para o histórico do app (net_history.jsonl)
+e é comparada com a anterior do mesmo alvo, como na página Benchmark.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from cloud_optimizer.net_bench import NetServer, compare_runs, load_history, parse_target, run_net_bench, save_run  # noqa: E402
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--serve", metavar="HOST:PORTA", help="só roda o servidor de teste até Ctrl+C")
+    parser.add_argument("--target", metavar="HOST:PORTA", help="servidor de teste remoto (padrão: loopback local)")
+    parser.add_argument("--buffers", type=int, nargs="+", default=[0, 65536, 4194304], help="SO_SNDBUF/SO_RCVBUF (0 = automático)")
+    parser.add_argument("--streams", type=int, nargs="+", default=[1, 4], help="conexões em paralelo")
+    parser.add_argument("--directions", nargs="+", choices=["upload", "download"], default=["upload", "download"])
+    parser.add_argument("--duration", type=float, default=2.0, help="segundos por teste")
+    parser.add_argument("--label", help="grava no histórico com este nome e compara com a execução anterior")
+    parser.add_argument("--output", help="arquivo JSON com os resultados")
+    args = parser.parse_args(argv)
+
+    if args.serve:
+        host, port = parse_target(args.serve)
+        with NetServer(host, port) as server:
+            print(f"Servidor de teste em {server.address[0]}:{server.address[1]} (Ctrl+C para sair)")
+            try:
+                while True:
+                    time.sleep(1)
+            except KeyboardInterrupt:
+                pass
+        return 0
+
+    target = parse_target(args.target) if args.target else None
+
+    def on_progress(ev):
+        if 'result' not in ev:
+            return
+        r = ev['result']
+        if r.get('error'):
+            print(f"{r['key']:28s} erro: {r['error']}")
+        elif r['test'] == 'throughput':
+            print(f"{r['key']:28s} {r['mbit_s']:10.0f} Mbit/s")
+        elif r['test'] == 'latency':
+            print(f"{r['key']:28s} p50 {r['p50']:8.1f}  p90 {r['p90']:8.1f}  p99 {r['p99']:8.1f} µs ({r['samples']} mensagens)")
+        else:
+            print(f"{r['key']:28s} {r['rate']:10.0f} conexões/s  p50 {r['p50']:8.1f}  p99 {r['p99']:8.1f} µs")
+
+    run = run_net_bench(target, [b or None for b in args.buffers], args.streams, args.directions, args.duration, on_progress)
+    print(f"{run['target']} • {len(run['results'])} testes • {run['elapsed_s']:.1f}s")
+    if args.label:
+        previous = load_history(run['target'], limit=1)
+        save_run(run, args.label)
+        if previous:
+            print(f"comparado com \"{previous[-1].get('label', '')}\":")
+            for c in compare_runs(previous[-1], run):
+                print(f"  {c['key']:28s} {c['change_pct']:+7.1f}%")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(run, fh, indent=2, ensure_ascii=False)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
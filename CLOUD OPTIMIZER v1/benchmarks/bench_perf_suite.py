@@ -0,0 +1,70 @@
+# Date: 19/10/2026
+# DEV: Martinez
+# Cloud Optimizer v1 Free Utility by Martinez
+
+"""Suíte de medição de impacto (perf_bench) sem aplicar nada: teste A/A.
+
+Uso (na pasta do projeto):
+    python benchmarks/bench_perf_suite.py
+    python benchmarks/bench_perf_suite.py --runs 4 --samples 7 --metrics cpu_single tcp_latency
+
+Roda a suíte várias vezes seguidas na mesma máquina e compara cada execução
+com a anterior. Como nada muda entre elas, todo veredito diferente de
+"sem diferença" é um falso positivo: dá o ruído da máquina e quantas amostras
+são necessárias para confiar no botão MEDIR IMPACTO.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+
+os.environ.setdefault("CLOUD_OPTIMIZER_HOME", tempfile.mkdtemp(prefix="cloudopt-bench-"))
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from cloud_optimizer import perf_bench  # noqa: E402
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=3, help="execuções da suíte")
+    parser.add_argument("--samples", type=int, default=5, help="amostras por teste em cada execução")
+    parser.add_argument("--metrics", nargs="*", choices=sorted(perf_bench.METRICS), help="testes (padrão: todos)")
+    parser.add_argument("--output", help="arquivo JSON com os resultados")
+    args = parser.parse_args(argv)
+
+    runs = []
+    for i in range(args.runs):
+        suite = perf_bench.run_suite(args.samples, args.metrics, label=f"run{i + 1}")
+        runs.append(suite)
+        print(f"execução {i + 1}: {suite['elapsed_s']:.1f}s")
+        for name, m in suite['metrics'].items():
+            if 'error' in m:
+                print(f"  {name:16s} erro: {m['error']}")
+                continue
+            spread = (m['ci_high'] - m['ci_low']) / m['median'] * 100 if m['median'] else 0.0
+            print(f"  {name:16s} {m['median']:12.1f} {m['unit']:5s} IC ±{spread / 2:5.1f}%")
+
+    false_positives, compared = 0, 0
+    comparisons = []
+    for before, after in zip(runs, runs[1:]):
+        cmp = perf_bench.compare(before, after)
+        comparisons.append(cmp)
+        compared += len(cmp)
+        for name, c in cmp.items():
+            if c['verdict'] != 'sem diferença':
+                false_positives += 1
+                print(f"  falso positivo: {name} {c['change_pct']:+.1f}% (IC {c['ci_low']:+.1f}% a {c['ci_high']:+.1f}%)")
+    if compared:
+        print(f"falsos positivos: {false_positives}/{compared} ({false_positives * 100 / compared:.0f}%)")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump({'runs': runs, 'comparisons': comparisons}, fh, indent=2, ensure_ascii=False)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+# Date: 19/10/2026
+# DEV: Martinez
+# Cloud Optimizer v1 Free Utility by Martinez
+
+"""Modo desempenho (process_rules) com processos descartáveis.
+
+Uso (na pasta do projeto):
+    python benchmarks/bench_process_rules.py
+    python benchmarks/bench_process_rules.py --initial 50 --spawned 20 --ticks 200
+
+Abre processos "dummy" (o próprio Python dormindo), liga uma regra que casa
+com eles (prioridade below_normal, CPU 0) e confere que:
+  * os já abertos são ajustados na primeira rodada;
+  * os abertos depois são pegos na rodada seguinte, e só eles;
+  * rodadas sem processo novo não ajustam nada (custo = listar PIDs);
+  * stop() devolve prioridade e afinidade originais.
+O impulso de primeiro plano é testado com uma detecção falsa de janela ativa.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("CLOUD_OPTIMIZER_HOME", tempfile.mkdtemp(prefix="cloudopt-bench-"))
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+import psutil  # noqa: E402
+
+from cloud_optimizer.process_rules import ProcessRule, ProcessRulesEngine  # noqa: E402
+
+DUMMY_MARK = "cloudopt_dummy"
+
+
+def spawn(count):
+    code = f"import time; time.sleep(600)  # {DUMMY_MARK}"
+    return [subprocess.Popen([sys.executable, "-c", code]) for _ in range(count)]
+
+
+def state(procs):
+    out = []
+    for p in procs:
+        proc = psutil.Process(p.pid)
+        out.append((proc.nice(), proc.cpu_affinity() if hasattr(proc, "cpu_affinity") else None))
+    return out
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--initial", type=int, default=10, help="processos abertos antes de ligar")
+    parser.add_argument("--spawned", type=int, default=5, help="processos abertos com o modo ligado")
+    parser.add_argument("--ticks", type=int, default=100, help="rodadas ociosas para medir o custo")
+    parser.add_argument("--output", help="arquivo JSON com os resultados")
+    args = parser.parse_args(argv)
+
+    initial = spawn(args.initial)
+    spawned = []
+    fg = {"pid": None}
+    # Casa pelo executável do Python, mas só os nossos (o filho tem o mesmo nome do interpretador)
+    ours = set()
+    rule = ProcessRule("Dummy", [os.path.basename(psutil.Process().name())], priority="below_normal", cores="0")
+    engine = ProcessRulesEngine([rule], foreground_boost=True, foreground=lambda: fg["pid"], boost="normal")
+    engine.match = lambda entry: rule if entry.pid in ours else None
+    try:
+        time.sleep(0.2)
+        before = state(initial)
+        ours.update(p.pid for p in initial)
+        first = engine.tick()
+        applied_first = sorted(ev["pid"] for ev in first if ev["event"] == "process_rule_applied")
+
+        spawned = spawn(args.spawned)
+        ours.update(p.pid for p in spawned)
+        time.sleep(0.2)
+        second = engine.tick()
+        applied_second = sorted(ev["pid"] for ev in second if ev["event"] == "process_rule_applied")
+
+        idle = []
+        for _ in range(args.ticks):
+            events = engine.tick()
+            assert not [ev for ev in events if ev["event"] == "process_rule_applied"], "reaplicou regra sem processo novo"
+            idle.append(engine.stats["last_tick_s"] * 1000)
+
+        fg["pid"] = spawned[0].pid if spawned else initial[0].pid
+        boost = engine.tick()
+        boosted_nice = psutil.Process(fg["pid"]).nice()
+        fg["pid"] = None
+        unboost = engine.tick()
+        after_unboost = psutil.Process(spawned[0].pid if spawned else initial[0].pid).nice()
+
+        applied = state(initial + spawned)
+        restored = engine.stop(restore=True)
+        final = state(initial)
+    finally:
+        for p in initial + spawned:
+            p.kill(); p.wait()
+
+    result = {
+        "processes": engine.stats["processes"],
+        "first_tick_applied": len(applied_first),
+        "second_tick_applied": len(applied_second),
+        "second_tick_only_new": applied_second == sorted(p.pid for p in spawned),
+        "all_adjusted": all(n == 10 or os.name == "nt" for n, _ in applied),
+        "idle_tick_ms_p50": round(statistics.median(idle), 3),
+        "idle_tick_ms_max": round(max(idle), 3),
+        "boost_events": [ev["event"] for ev in boost + unboost],
+        "boosted_nice": boosted_nice,
+        "nice_after_unboost": after_unboost,
+        "restored": restored["restored"],
+        "restore_failed": len(restored["failed"]),
+        "restored_matches_original": final == before,
+    }
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(result, fh, indent=2, ensure_ascii=False)
+    ok = (result["first_tick_applied"] == args.initial and result["second_tick_only_new"]
+          and result["restored_matches_original"])
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+# Date: 19/10/2026
+# DEV: Martinez
+# Cloud Optimizer v1 Free Utility by Martinez
+
+"""Detector de processos descontrolados (runaway) com processos de teste.
+
+Uso (na pasta do projeto):
+    python benchmarks/bench_runaway.py
+    python benchmarks/bench_runaway.py --idle 1000 --budget 128
+
+Abre um processo que vaza memória (aloca 2 MB a cada 0,1 s), um que prende
+um núcleo em laço e `--idle` processos parados. Com janelas curtas (alertas
+em segundos, não minutos), mede:
+  * em quanto tempo cada alerta aparece;
+  * custo de um tick com todos os processos abertos e quantos foram lidos
+    (tem que ficar perto do orçamento, não do total);
+  * ações: suspender o laço (CPU cai e o alerta some), baixar a prioridade
+    e encerrar o que vaza.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("CLOUD_OPTIMIZER_HOME", tempfile.mkdtemp(prefix="cloudopt-bench-"))
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+import psutil  # noqa: E402
+
+from cloud_optimizer.runaway import RunawayDetector  # noqa: E402
+
+LEAK = "import time\nx = []\nwhile True:\n    x.append(bytearray(2 * 1024 * 1024)); time.sleep(0.1)"
+HOG = "while True:\n    pass"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--idle", type=int, default=200, help="processos parados abertos junto")
+    parser.add_argument("--budget", type=int, default=64, help="leituras por tick (sample_budget)")
+    parser.add_argument("--interval", type=float, default=0.5, help="segundos entre ticks")
+    parser.add_argument("--timeout", type=float, default=60.0, help="tempo máximo esperando os alertas")
+    parser.add_argument("--output", help="arquivo JSON com os resultados")
+    args = parser.parse_args(argv)
+
+    idle = [subprocess.Popen(["sleep", "600"]) if os.name != "nt" else subprocess.Popen([sys.executable, "-c", "import time; time.sleep(600)"])
+            for _ in range(args.idle)]
+    detector = RunawayDetector(sample_budget=args.budget, history=30, min_span_s=4.0, min_growth_mb=20.0,
+                               growth_mb_min=60.0, hog_for_s=3.0, cpu_pct=80.0)
+    detector.tick()  # tabela inicial (processos já abertos)
+    leak = subprocess.Popen([sys.executable, "-c", LEAK])
+    hog = subprocess.Popen([sys.executable, "-c", HOG])
+    started = time.monotonic()
+    detected, ticks, sampled = {}, [], []
+    result = {}
+    try:
+        while len(detected) < 2 and time.monotonic() - started < args.timeout:
+            for ev in detector.tick():
+                if ev['event'] == 'runaway_detected' and ev['pid'] in (leak.pid, hog.pid):
+                    detected.setdefault(ev['kind'], dict(ev, after_s=round(time.monotonic() - started, 2)))
+            ticks.append(detector.stats['last_tick_s'] * 1000)
+            sampled.append(detector.stats['sampled'])
+            time.sleep(args.interval)
+
+        result = {
+            "processes": detector.stats['processes'],
+            "budget": args.budget,
+            "tick_ms_p50": round(statistics.median(ticks), 2),
+            "tick_ms_max": round(max(ticks), 2),
+            "sampled_per_tick_max": max(sampled),
+            "memory_alert": None if 'memory' not in detected else {
+                "pid_ok": detected['memory']['pid'] == leak.pid,
+                "after_s": detected['memory']['after_s'],
+                "slope_mb_min": round(detected['memory']['slope_mb_min'], 1),
+            },
+            "cpu_alert": None if 'cpu' not in detected else {
+                "pid_ok": detected['cpu']['pid'] == hog.pid,
+                "after_s": detected['cpu']['after_s'],
+                "cpu_pct": round(detected['cpu']['cpu_pct'], 1),
+            },
+        }
+
+        detector.act(hog.pid, 'suspend')
+        time.sleep(0.2)  # o sinal de parada é entregue de forma assíncrona
+        result["hog_status_after_suspend"] = psutil.Process(hog.pid).status()
+        cleared = False
+        deadline = time.monotonic() + args.timeout
+        while not cleared and time.monotonic() < deadline:
+            cleared = any(ev['event'] == 'runaway_cleared' and ev['pid'] == hog.pid for ev in detector.tick())
+            time.sleep(args.interval)
+        result["cpu_alert_cleared_after_suspend"] = cleared
+        detector.act(leak.pid, 'lower_priority')
+        result["leak_nice_after_lower"] = psutil.Process(leak.pid).nice()
+        detector.act(leak.pid, 'terminate')
+        exited = any(ev['event'] == 'runaway_cleared' and ev['pid'] == leak.pid and ev['reason'] == 'exited' for ev in detector.tick())
+        result["leak_terminated"] = leak.poll() is not None and exited
+    finally:
+        for p in idle + [leak, hog]:
+            try:
+                p.kill()
+                p.wait()
+            except OSError:
+                pass
+
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(result, fh, indent=2, ensure_ascii=False)
+    ok = bool(result.get("memory_alert") and result.get("cpu_alert") and result.get("leak_terminated"))
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+# Date: 19/10/2026
+# DEV: Martinez
+# Cloud Optimizer v1 Free Utility by Martinez
+
+"""Benchmark do inventário de tarefas agendadas sobre uma saída sintética do schtasks.
+
+Uso (na pasta do projeto):
+    python benchmarks/bench_task_inventory.py
+    python benchmarks/bench_task_inventory.py --tasks 5000 --targets 4 40 400
+
+Gera um CSV no formato de `schtasks /query /fo CSV /v /nh` (várias linhas por
+tarefa, uma por gatilho, caminhos com espaços e aspas) e mede a leitura do
+índice e a busca com quantidades diferentes de alvos. Confere que a consulta
+ao schtasks acontece uma vez só e que cada alvo encontra exatamente as tarefas
+geradas para ele.
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from cloud_optimizer.scheduled_tasks import TaskInventory, parse_schtasks_csv  # noqa: E402
+
+APPS = ["OneDrive", "Skype", "Teams", "Spotify"]
+
+
+def make_csv(tasks, extra_targets):
+    """CSV sintético; retorna (texto, {alvo: caminhos esperados})."""
+    out = io.StringIO()
+    writer = csv.writer(out, quoting=csv.QUOTE_ALL, lineterminator="\r\n")
+    expected = {}
+    targets = APPS + [f"App{i:04d}X" for i in range(extra_targets)]
+    for i in range(tasks):
+        target = targets[i % (len(targets) * 3)] if i % (len(targets) * 3) < len(targets) else None
+        folder = "\\Microsoft\\Windows\\Diagnostico" if target is None else "\\"
+        name = f"Tarefa {i}" if target is None else f"{target} Update Task-S-1-5-21-{i}"
+        exe = f"C:\\Windows\\System32\\svc{i}.exe" if target is None else f"C:\\Program Files\\{target}\\{target}Updater.exe"
+        path = folder.rstrip("\\") + "\\" + name
+        status = "Disabled" if i % 7 == 0 else "Ready"
+        if target:
+            expected.setdefault(target, []).append(path)
+        for trigger in range(1 + i % 3):
+            writer.writerow(["PC", path, "N/A", status, "Interactive only", "N/A", "0", "Martinez",
+                             f'"{exe}" /reporting', "N/A", "N/A", "Enabled" if status == "Ready" else "Disabled",
+                             f"gatilho {trigger}"])
+    return out.getvalue(), expected, targets
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=2000, help="tarefas no CSV sintético")
+    parser.add_argument("--targets", type=int, nargs="+", default=[4, 40, 400], help="quantidades de alvos buscados")
+    parser.add_argument("--output", help="arquivo JSON com os resultados")
+    args = parser.parse_args(argv)
+
+    results = {"tasks": args.tasks}
+    text, _, _ = make_csv(args.tasks, 0)
+    t0 = time.perf_counter()
+    parsed = parse_schtasks_csv(text)
+    results["parse_s"] = time.perf_counter() - t0
+    print(f"CSV: {len(text) / 1024:.0f} KB, {len(parsed)} tarefas, leitura {results['parse_s'] * 1000:.1f} ms")
+
+    for count in args.targets:
+        text, expected, targets = make_csv(args.tasks, max(0, count - len(APPS)))
+        inventory = TaskInventory(query=lambda timeout, text=text: text)
+        inventory.tasks()
+        t0 = time.perf_counter()
+        found = inventory.match(targets[:count])
+        elapsed = time.perf_counter() - t0
+        inventory.match(targets[:count])
+        if inventory.queries != 1:
+            raise SystemExit(f"schtasks consultado {inventory.queries} vezes")
+        got = {t: sorted(task.path for task in tasks) for t, tasks in found.items()}
+        want = {t: sorted(paths) for t, paths in expected.items() if t in targets[:count]}
+        if got != want:
+            raise SystemExit(f"Busca divergente com {count} alvos")
+        results[f"match[{count}]"] = elapsed
+        print(f"{count:4d} alvos: {elapsed * 1000:7.2f} ms, {sum(map(len, found.values()))} tarefas encontradas, 1 consulta")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
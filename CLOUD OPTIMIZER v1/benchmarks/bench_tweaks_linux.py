@@ -0,0 +1,190 @@
+# Date: 19/10/2026
+# DEV: Martinez
+# Cloud Optimizer v1 Free Utility by Martinez
+
+"""Ajustes do Linux sobre uma árvore falsa de sysfs/procfs (LinuxBackend com root).
+
+Uso (na pasta do projeto):
+    python benchmarks/bench_tweaks_linux.py
+    python benchmarks/bench_tweaks_linux.py --cpus 128 --disks 16
+
+Monta em uma pasta temporária /sys/devices/system/cpu/cpufreq, /sys/block,
+/proc/sys/net, unidades do systemd e /tmp com arquivos novos, antigos e um
+socket. Mede e confere: prévia, perfil aplicado, perfil de novo (não deve
+escrever nada), limpeza (só arquivos antigos; o socket fica) e o desfazer
+pelo diário (todo valor volta ao original e as máscaras somem).
+"""
+
+import argparse
+import json
+import os
+import shutil
+import socket
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("CLOUD_OPTIMIZER_HOME", tempfile.mkdtemp(prefix="cloudopt-bench-"))
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from cloud_optimizer import tweaks, tweaks_linux  # noqa: E402
+from cloud_optimizer.system_backend import LinuxBackend, set_backend  # noqa: E402
+from cloud_optimizer.tweak_engine import TweakEngine  # noqa: E402
+
+_OLD = time.time() - 7 * 86400
+
+SYSCTL_DEFAULTS = {
+    'net/core/rmem_max': '212992',
+    'net/core/wmem_max': '212992',
+    'net/ipv4/tcp_rmem': '4096\t131072\t6291456',
+    'net/ipv4/tcp_wmem': '4096\t16384\t4194304',
+    'net/core/netdev_max_backlog': '1000',
+    'net/core/default_qdisc': 'fq_codel',
+    'net/ipv4/tcp_congestion_control': 'cubic',
+    'net/ipv4/tcp_available_congestion_control': 'reno cubic bbr',
+    'net/ipv4/tcp_fastopen': '1',
+    'net/ipv4/tcp_mtu_probing': '0',
+}
+
+
+def _put(root, path, text):
+    full = os.path.join(root, path.lstrip('/'))
+    os.makedirs(os.path.dirname(full), exist_ok=True)
+    with open(full, 'w', encoding='utf-8') as fh:
+        fh.write(text + '\n')
+
+
+def build_tree(root, cpus, disks, temp_files):
+    for i in range(cpus):
+        policy = f'/sys/devices/system/cpu/cpufreq/policy{i}'
+        _put(root, f'{policy}/scaling_available_governors', 'performance powersave')
+        _put(root, f'{policy}/scaling_governor', 'powersave')
+        _put(root, f'{policy}/energy_performance_available_preferences',
+             'default performance balance_performance balance_power power')
+        _put(root, f'{policy}/energy_performance_preference', 'balance_performance')
+    for i in range(disks):
+        dev = f'nvme{i}n1' if i % 2 == 0 else f'sd{chr(ord("a") + i // 2)}'
+        _put(root, f'/sys/block/{dev}/queue/scheduler', '[mq-deadline] kyber bfq none')
+        _put(root, f'/sys/block/{dev}/queue/rotational', '0' if dev.startswith('nvme') else '1')
+    _put(root, '/sys/block/loop0/queue/scheduler', '[none] mq-deadline')
+    for path, value in SYSCTL_DEFAULTS.items():
+        _put(root, f'/proc/sys/{path}', value)
+    for unit in list(tweaks_linux.SERVICES)[:3]:
+        _put(root, f'/usr/lib/systemd/system/{unit}', '[Unit]')
+    sock = None
+    tmp = os.path.join(root, 'tmp')
+    os.makedirs(os.path.join(tmp, '.X11-unix'), exist_ok=True)
+    for i in range(temp_files):
+        path = os.path.join(tmp, f'old{i}.tmp' if i % 2 else f'new{i}.tmp')
+        with open(path, 'wb') as fh:
+            fh.write(b'x' * 1024)
+        if i % 2:
+            os.utime(path, (_OLD, _OLD))
+    try:
+        sock = socket.socket(socket.AF_UNIX)
+        sock.bind(os.path.join(tmp, '.X11-unix', 'X0'))
+        os.utime(os.path.join(tmp, '.X11-unix', 'X0'), (_OLD, _OLD))
+    except (OSError, AttributeError):
+        sock = None
+    os.makedirs(os.path.join(root, 'var', 'tmp'), exist_ok=True)
+    return sock
+
+
+def snapshot(root):
+    """Conteúdo de todos os arquivos de /sys e /proc e os links de /etc."""
+    state = {}
+    for top in ('sys', 'proc', 'etc'):
+        for dirpath, _, files in os.walk(os.path.join(root, top)):
+            for name in files:
+                path = os.path.join(dirpath, name)
+                if os.path.islink(path):
+                    state[path] = '-> ' + os.readlink(path)
+                else:
+                    with open(path, encoding='utf-8') as fh:
+                        # Separadores não importam para o kernel (tcp_rmem: tabs ou espaços)
+                        state[path] = ' '.join(fh.read().split())
+                    if name == 'scheduler':
+                        # No sysfs de verdade o arquivo lista todos com o ativo entre colchetes
+                        state[path] = tweaks_linux._active_scheduler(state[path])
+    return state
+
+
+def timed(results, name, func):
+    t0 = time.perf_counter()
+    value = func()
+    results[name] = time.perf_counter() - t0
+    return value
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cpus", type=int, default=16, help="políticas do cpufreq")
+    parser.add_argument("--disks", type=int, default=4, help="discos em /sys/block")
+    parser.add_argument("--temp-files", type=int, default=2000, help="arquivos em /tmp (metade antigos)")
+    parser.add_argument("--output", help="arquivo JSON com os resultados")
+    args = parser.parse_args(argv)
+
+    root = tempfile.mkdtemp(prefix="cloudopt-sysroot-")
+    os.environ['XDG_CACHE_HOME'] = os.path.join(root, 'home', 'user', '.cache')
+    os.makedirs(os.environ['XDG_CACHE_HOME'])
+    try:
+        sock = build_tree(root, args.cpus, args.disks, args.temp_files)
+        backend = LinuxBackend(root)
+        set_backend(backend)
+        original = snapshot(root)
+        results = {'cpus': args.cpus, 'disks': args.disks}
+
+        preview = timed(results, 'preview_first', tweaks.preview_profile)
+        changes = sum(len(v) for v in preview.values() if isinstance(v, list))
+        expected = args.cpus * 2 + args.disks + len(tweaks_linux.SYSCTL_NETWORK) + 3
+        if changes != expected:
+            raise SystemExit(f"Prévia: esperado {expected} mudanças, obtido {changes}: {json.dumps(preview, indent=1)}")
+
+        engine = TweakEngine(max_workers=8)
+        report = timed(results, 'profile_first', lambda: engine.run(tweaks.profile_steps()))
+        if not report['ok']:
+            raise SystemExit(f"Perfil falhou: {report['failed']} {report['steps']}")
+        applied = snapshot(root)
+        for path in (f'{root}/sys/devices/system/cpu/cpufreq/policy0/scaling_governor',
+                     f'{root}/sys/block/nvme0n1/queue/scheduler',
+                     f'{root}/proc/sys/net/ipv4/tcp_congestion_control'):
+            print(f"  {path[len(root):]}: {original[path]} -> {applied[path]}")
+        left = os.listdir(os.path.join(root, 'tmp'))
+        if any(n.startswith('old') for n in left) or sum(n.startswith('new') for n in left) != args.temp_files // 2:
+            raise SystemExit("Limpeza apagou arquivos novos ou deixou antigos")
+        if sock is not None and not os.path.exists(os.path.join(root, 'tmp', '.X11-unix', 'X0')):
+            raise SystemExit("Limpeza apagou o socket")
+
+        again = timed(results, 'preview_again', tweaks.preview_profile)
+        if any(again.values()):
+            raise SystemExit(f"Prévia após o perfil não está vazia: {again}")
+        timed(results, 'profile_again', lambda: engine.run(tweaks.profile_steps()))
+        if snapshot(root) != applied:
+            raise SystemExit("Perfil reaplicado alterou arquivos")
+
+        reverted = timed(results, 'rollback', lambda: tweaks.rollback(all_sessions=True))
+        if reverted['errors'] or snapshot(root) != original:
+            changed = {k: v for k, v in snapshot(root).items() if original.get(k) != v}
+            raise SystemExit(f"Desfazer incompleto: {reverted['errors']} {changed}")
+        results['reverted'] = reverted['reverted']
+        results['commands'] = len(backend.commands)
+
+        for name, value in results.items():
+            if isinstance(value, float):
+                print(f"{name:20s} {value * 1000:10.1f} ms")
+        print(f"desfeitos: {results['reverted']} alvos; comandos registrados (não executados): {results['commands']}")
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as fh:
+                json.dump(results, fh, indent=2)
+        if sock is not None:
+            sock.close()
+    finally:
+        set_backend(None)
+        shutil.rmtree(root, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
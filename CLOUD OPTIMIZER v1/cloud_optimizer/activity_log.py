@@ -0,0 +1,225 @@
+# Date: 19/10/2026
+# DEV: Martinez
+# Cloud Optimizer v1 Free Utility by Martinez
+
+import gzip
+import json
+import os
+import queue
+import shutil
+import threading
+import time
+import uuid
+from typing import Callable, Dict, List, Optional
+
+from cloud_optimizer.utils import app_data_dir
+
+__all__ = ["ActivityLog"]
+
+_STOP = object()
+
+
+class ActivityLog:
+    """Log de atividades persistente em JSON Lines, gravado por uma thread própria.
+
+    `record` só enfileira o evento (seguro em qualquer thread, inclusive a UI); a
+    thread de escrita agrupa os eventos em lotes, rotaciona o arquivo ao passar de
+    `max_bytes` e, opcionalmente, comprime os arquivos antigos com gzip.
+    Cada linha tem `ts` (relógio de parede), `mono` (time.monotonic), `session`,
+    `event` e `msg`, além dos campos extras informados.
+
+    A fila tem no máximo `max_pending` eventos: numa enxurrada com o disco lento
+    os excedentes são descartados e contados (`dropped`), e a thread de escrita
+    grava um evento `log_dropped` com a quantidade perdida.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        filename: str = "activity.jsonl",
+        max_bytes: int = 2 * 1024 * 1024,
+        backups: int = 5,
+        compress: bool = True,
+        flush_interval: float = 0.5,
+        batch_size: int = 512,
+        max_pending: int = 10000,
+    ) -> None:
+        self.directory = directory or app_data_dir("logs")
+        self.path = os.path.join(self.directory, filename)
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.compress = compress
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.session = uuid.uuid4().hex[:12]
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_pending)
+        self._dropped_lock = threading.Lock()
+        self._dropped_pending = 0  # descartados desde o último log_dropped
+        self.dropped = 0  # total descartado na sessão
+        self._fh = None
+        self._size = 0
+        self._closed = False
+        self._thread = threading.Thread(target=self._writer_loop, name="ActivityLogWriter", daemon=True)
+        self._thread.start()
+
+    # API pública
+    def record(self, event: str, msg: str = "", **fields) -> None:
+        """Enfileira um evento; nunca toca o disco na thread chamadora."""
+        if self._closed:
+            return
+        rec = {"ts": time.time(), "mono": time.monotonic(), "session": self.session, "event": event, "msg": msg}
+        if fields:
+            rec.update(fields)
+        try:
+            self._queue.put_nowait(rec)
+        except queue.Full:
+            with self._dropped_lock:
+                self._dropped_pending += 1
+                self.dropped += 1
+
+    def close(self, timeout: float = 2.0) -> None:
+        """Grava o que estiver pendente e encerra a thread de escrita."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            # A thread de escrita esvazia a fila, então a vaga aparece logo
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+
+    def read_tail(self, limit: int = 200) -> List[Dict]:
+        """Lê os últimos `limit` eventos do disco (use fora da UI thread)."""
+        records: List[Dict] = []
+        for path in self._tail_candidates():
+            lines = self._read_last_lines(path, limit - len(records))
+            parsed = []
+            for line in lines:
+                try:
+                    parsed.append(json.loads(line))
+                except ValueError:
+                    continue
+            records = parsed + records
+            if len(records) >= limit:
+                break
+        return records[-limit:]
+
+    def load_tail_async(self, callback: Callable[[List[Dict]], None], limit: int = 200) -> None:
+        """Lê a cauda do log numa thread e entrega a lista de eventos ao callback."""
+        def job():
+            try:
+                records = self.read_tail(limit)
+            except Exception:
+                records = []
+            callback(records)
+
+        threading.Thread(target=job, daemon=True).start()
+
+    # Thread de escrita
+    def _writer_loop(self) -> None:
+        stop = False
+        while not stop:
+            batch = []
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                dropped = self._dropped_record()
+                if dropped:
+                    self._write_batch([dropped])
+                continue
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+            dropped = self._dropped_record()
+            if dropped:
+                batch.append(dropped)
+            if batch:
+                self._write_batch(batch)
+        if self._fh is not None:
+            try:
+                self._fh.close()
+            except OSError:
+                pass
+            self._fh = None
+
+    def _dropped_record(self) -> Optional[Dict]:
+        with self._dropped_lock:
+            count, self._dropped_pending = self._dropped_pending, 0
+        if not count:
+            return None
+        return {"ts": time.time(), "mono": time.monotonic(), "session": self.session, "event": "log_dropped",
+                "msg": f"{count} eventos descartados (fila do log cheia)", "dropped": count}
+
+    def _write_batch(self, batch: List[Dict]) -> None:
+        try:
+            if self._fh is None:
+                os.makedirs(self.directory, exist_ok=True)
+                self._fh = open(self.path, "a", encoding="utf-8")
+                self._size = self._fh.tell()
+            data = "".join(json.dumps(rec, ensure_ascii=False, default=str) + "\n" for rec in batch)
+            self._fh.write(data)
+            self._fh.flush()
+            self._size += len(data.encode("utf-8"))
+            if self._size >= self.max_bytes:
+                self._rotate()
+        except OSError:
+            # Sem disco disponível o log continua apenas na tela
+            pass
+
+    def _backup_path(self, n: int) -> str:
+        root, ext = os.path.splitext(self.path)
+        return f"{root}.{n}{ext}" + (".gz" if self.compress else "")
+
+    def _rotate(self) -> None:
+        self._fh.close()
+        self._fh = None
+        for n in range(self.backups - 1, 0, -1):
+            src = self._backup_path(n)
+            if os.path.exists(src):
+                os.replace(src, self._backup_path(n + 1))
+        target = self._backup_path(1)
+        if self.compress:
+            with open(self.path, "rb") as src_fh, gzip.open(target, "wb") as dst_fh:
+                shutil.copyfileobj(src_fh, dst_fh)
+            os.remove(self.path)
+        else:
+            os.replace(self.path, target)
+        self._size = 0
+
+    # Leitura da cauda
+    def _tail_candidates(self) -> List[str]:
+        paths = [self.path] + [self._backup_path(n) for n in range(1, self.backups + 1)]
+        return [p for p in paths if os.path.exists(p)]
+
+    @staticmethod
+    def _read_last_lines(path: str, limit: int, block: int = 64 * 1024) -> List[str]:
+        if limit <= 0:
+            return []
+        if path.endswith(".gz"):
+            with gzip.open(path, "rt", encoding="utf-8") as fh:
+                lines = fh.read().splitlines()
+            return lines[-limit:]
+        with open(path, "rb") as fh:
+            fh.seek(0, os.SEEK_END)
+            pos = fh.tell()
+            data = b""
+            while pos > 0 and data.count(b"\n") <= limit:
+                step = min(block, pos)
+                pos -= step
+                fh.seek(pos)
+                data = fh.read(step) + data
+        lines = data.decode("utf-8", errors="replace").splitlines()
+        if pos > 0:
+            # A primeira linha pode estar cortada
+            lines = lines[1:]
+        return lines[-limit:]
@@ -0,0 +1,406 @@
+# Date: 19/10/2026
+# DEV: Martinez
+# Cloud Optimizer v1 Free Utility by Martinez
+
+import os
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from cloud_optimizer.cleanup_policy import CleanupPolicy, is_file_in_use
+from cloud_optimizer.utils import is_link
+
+__all__ = [
+    "Candidate",
+    "scan_candidates",
+    "clean_folders",
+    "preview_folders",
+    "clean_policies",
+    "preview_policies",
+    "unique_folders",
+    "ProgressReporter",
+]
+
+# Arquivo candidato à exclusão, emitido pelo estágio de varredura
+Candidate = namedtuple("Candidate", "path size mtime root atime", defaults=(0.0,))
+
+ProgressCallback = Callable[[Dict], None]
+
+
+def _volume_key(path: str):
+    """Agrupa pastas por volume (letra do drive no Windows, st_dev nos demais)."""
+    drive = os.path.splitdrive(path)[0]
+    if drive:
+        return drive.upper()
+    try:
+        return os.stat(path).st_dev
+    except OSError:
+        return path
+
+
+def unique_folders(folders: Iterable[str]) -> List[str]:
+    """Pastas existentes, sem repetição (mesmo caminho real conta uma vez), na ordem dada."""
+    seen = set()
+    out = []
+    for folder in folders:
+        if not folder or not os.path.isdir(folder):
+            continue
+        key = os.path.normcase(os.path.realpath(folder))
+        if key in seen:
+            continue
+        seen.add(key)
+        out.append(folder)
+    return out
+
+
+def _by_volume(folders: Iterable[str]) -> List[List[str]]:
+    groups: Dict[object, List[str]] = {}
+    for folder in unique_folders(folders):
+        groups.setdefault(_volume_key(folder), []).append(folder)
+    return list(groups.values())
+
+
+class ProgressReporter:
+    """Agrega contadores de várias threads e emite eventos limitados por `interval`."""
+
+    def __init__(self, callback: Optional[ProgressCallback], phase: str, interval: float) -> None:
+        self._callback = callback
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._next_emit = 0.0
+        self._started = time.perf_counter()
+        self.state = {'phase': phase, 'files_scanned': 0, 'bytes_scanned': 0, 'current_folder': ''}
+        if phase == 'delete':
+            self.state.update(bytes_freed=0, files_removed=0, files_skipped=0, dirs_removed=0)
+
+    def add(self, force: bool = False, **deltas) -> None:
+        with self._lock:
+            for key, value in deltas.items():
+                if isinstance(value, str):
+                    self.state[key] = value
+                else:
+                    self.state[key] += value
+            if self._callback is None:
+                return
+            now = time.perf_counter()
+            if not force and now < self._next_emit:
+                return
+            self._next_emit = now + self._interval
+            event = dict(self.state, elapsed_s=now - self._started)
+        try:
+            self._callback(event)
+        except Exception:
+            pass
+
+
+# Estágio 1: varredura
+def scan_candidates(folders: Iterable[str], errors: Optional[List[str]] = None) -> Iterator[Candidate]:
+    """Gera os arquivos das pastas com tamanho e mtime, sem acumular a lista em memória.
+
+    Usa os.scandir reaproveitando o stat em cache de cada DirEntry (no Windows vem
+    da própria listagem). Falhas ao abrir uma pasta raiz vão para `errors`.
+    """
+    for folder in folders:
+        stack = [folder]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False) and not is_link(entry):
+                                stack.append(entry.path)
+                                continue
+                            st = entry.stat(follow_symlinks=False)
+                        except OSError:
+                            continue
+                        yield Candidate(entry.path, st.st_size, st.st_mtime, folder, st.st_atime)
+            except OSError as e:
+                if current == folder and errors is not None:
+                    errors.append(f"{folder}: {e}")
+
+
+def _remove_empty_dirs(root: str) -> int:
+    """Remove subpastas vazias em pós-ordem (a raiz é mantida); memória ~ profundidade."""
+    removed = 0
+    stack = [(root, os.scandir(root))]
+    while stack:
+        path, it = stack[-1]
+        entry = next(it, None)
+        if entry is not None:
+            try:
+                if entry.is_dir(follow_symlinks=False) and not is_link(entry):
+                    stack.append((entry.path, os.scandir(entry.path)))
+            except OSError:
+                pass
+            continue
+        it.close()
+        stack.pop()
+        if stack:
+            try:
+                os.rmdir(path)
+                removed += 1
+            except OSError:
+                pass
+    return removed
+
+
+# Filtro por regras
+def _rules_by_folder(folders: List[str], policies: List[CleanupPolicy]) -> Dict[str, List[CleanupPolicy]]:
+    return {f: [p for p in policies if p.covers(f)] for f in folders}
+
+
+def _select(candidates: Iterable[Candidate], rules: Dict[str, List[CleanupPolicy]], now: float) -> Iterator[Candidate]:
+    """Deixa passar só os candidatos que casam com alguma regra da pasta raiz."""
+    for cand in candidates:
+        folder_rules = rules[cand.root]
+        if folder_rules[0].matches_all:
+            yield cand
+            continue
+        name = os.path.basename(cand.path)
+        if any(p.matches(name, cand.size, cand.mtime, cand.atime, now) for p in folder_rules):
+            yield cand
+
+
+def _verifier(rules: Dict[str, List[CleanupPolicy]], now: float) -> Callable[[Candidate], Optional[int]]:
+    """Confere o estado atual do arquivo antes de apagar.
+
+    Os metadados podem vir do índice e estar desatualizados (edição no lugar não
+    muda o mtime da pasta), então a regra é reavaliada com um stat novo e, se a
+    regra pedir, arquivos em uso são pulados. Retorna o tamanho atual ou None.
+    """
+    def verify(cand: Candidate) -> Optional[int]:
+        try:
+            st = os.stat(cand.path, follow_symlinks=False)
+        except OSError:
+            return None
+        name = os.path.basename(cand.path)
+        matched = [p for p in rules[cand.root] if p.matches(name, st.st_size, st.st_mtime, st.st_atime, now)]
+        if not matched:
+            return None
+        if any(p.skip_in_use for p in matched) and is_file_in_use(cand.path):
+            return None
+        return st.st_size
+
+    return verify
+
+
+# Estágio 2: exclusão
+def _delete_batch(batch: List[Candidate], verify: Optional[Callable[[Candidate], Optional[int]]] = None) -> Tuple[int, int, int]:
+    freed = removed = skipped = 0
+    for cand in batch:
+        size = cand.size
+        if verify is not None:
+            size = verify(cand)
+            if size is None:
+                skipped += 1
+                continue
+        try:
+            os.remove(cand.path)
+            freed += size
+            removed += 1
+        except FileNotFoundError:
+            pass
+        except OSError:
+            skipped += 1  # Arquivo em uso ou sem permissão
+    return freed, removed, skipped
+
+
+def _delete_candidates(
+    candidates: Iterable[Candidate],
+    progress: "ProgressReporter",
+    max_workers: int = 8,
+    batch_size: int = 256,
+    verify: Optional[Callable[[Candidate], Optional[int]]] = None,
+) -> None:
+    """Consome candidatos e os apaga em lotes num pool limitado (memória constante)."""
+    pending = set()
+
+    def collect(done):
+        for fut in done:
+            freed, removed, skipped = fut.result()
+            progress.add(bytes_freed=freed, files_removed=removed, files_skipped=skipped)
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="cleaner") as pool:
+        batch: List[Candidate] = []
+        last_root = None
+        for cand in candidates:
+            if cand.root != last_root:
+                last_root = cand.root
+                progress.add(current_folder=cand.root)
+            batch.append(cand)
+            progress.add(files_scanned=1, bytes_scanned=cand.size)
+            if len(batch) < batch_size:
+                continue
+            pending.add(pool.submit(_delete_batch, batch, verify))
+            batch = []
+            # Limita lotes em voo para não enfileirar a árvore inteira
+            if len(pending) >= max_workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+        if batch:
+            pending.add(pool.submit(_delete_batch, batch, verify))
+        collect(wait(pending)[0])
+
+
+def _run_per_volume(folders: Iterable[str], target: Callable[[List[str]], None], errors: List[str]) -> None:
+    def run(vol_folders):
+        try:
+            target(vol_folders)
+        except Exception as e:
+            errors.append(f"{', '.join(vol_folders)}: {e}")
+
+    threads = [threading.Thread(target=run, args=(vf,), daemon=True) for vf in _by_volume(folders)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+
+def _source(folders: List[str], index, errors: List[str], stats: Dict[str, int]) -> Iterator[Candidate]:
+    """Candidatos vindos do índice persistente (se houver) ou de uma varredura completa."""
+    if index is None:
+        yield from scan_candidates(folders, errors)
+        return
+    for folder in folders:
+        try:
+            yield from index.iter_files(folder, stats)
+        except Exception as e:
+            errors.append(f"{folder}: {e}")
+
+
+def _policy_folders(policies: Iterable[CleanupPolicy]) -> Tuple[List[CleanupPolicy], List[str]]:
+    policies = [p for p in policies if p.enabled]
+    return policies, unique_folders(f for p in policies for f in p.folders)
+
+
+def _index_report(report: Dict, index, stats: Dict[str, int]) -> Dict:
+    if index is not None:
+        report['dirs_cached'] = stats.get('dirs_cached', 0)
+        report['dirs_scanned'] = stats.get('dirs_scanned', 0)
+    return report
+
+
+def clean_policies(
+    policies: Iterable[CleanupPolicy],
+    index=None,
+    progress: Optional[ProgressCallback] = None,
+    max_workers: int = 8,
+    batch_size: int = 256,
+    interval: float = 0.25,
+) -> Dict:
+    """Apaga os arquivos que casam com as regras de limpeza e retorna um relatório.
+
+    Pipeline por volume: os candidatos vêm de `index.iter_files` (ScanIndex, só
+    as pastas alteradas são relidas) ou de `scan_candidates`, passam pelo filtro
+    das regras e `_delete_candidates` os apaga em lotes num pool de threads
+    limitado (volumes diferentes rodam em paralelo). Antes de apagar, cada
+    arquivo é conferido com um stat novo. `progress` recebe eventos com os
+    contadores, no máximo um a cada `interval` segundos. As próprias pastas são
+    mantidas; subpastas vazias só são removidas em pastas com regra sem filtros.
+    Relatório: bytes_freed, files_removed, files_skipped, dirs_removed, elapsed_s,
+    errors (e dirs_cached/dirs_scanned quando há índice).
+    """
+    started = time.perf_counter()
+    now = time.time()
+    policies, folders = _policy_folders(policies)
+    rules = _rules_by_folder(folders, policies)
+    tracker = ProgressReporter(progress, 'delete', interval)
+    errors: List[str] = []
+    stats: Dict[str, int] = {}
+    # Varredura completa sem filtros: o stat da listagem já é o atual
+    fresh = index is None and all(p.matches_all and not p.skip_in_use for p in policies)
+    verify = None if fresh else _verifier(rules, now)
+    lock = threading.Lock()
+
+    def clean_volume(vol_folders):
+        local: Dict[str, int] = {}
+        candidates = _select(_source(vol_folders, index, errors, local), rules, now)
+        _delete_candidates(candidates, tracker, max_workers, batch_size, verify)
+        for folder in vol_folders:
+            if not any(p.matches_all for p in rules[folder]):
+                continue
+            try:
+                tracker.add(dirs_removed=_remove_empty_dirs(folder))
+            except OSError:
+                pass
+        with lock:
+            for key, value in local.items():
+                stats[key] = stats.get(key, 0) + value
+
+    _run_per_volume(folders, clean_volume, errors)
+    tracker.add(force=True)
+    report = {key: tracker.state[key] for key in ('bytes_freed', 'files_removed', 'files_skipped', 'dirs_removed')}
+    report['elapsed_s'] = time.perf_counter() - started
+    report['errors'] = errors
+    return _index_report(report, index, stats)
+
+
+def preview_policies(
+    policies: Iterable[CleanupPolicy],
+    index=None,
+    progress: Optional[ProgressCallback] = None,
+    interval: float = 0.25,
+) -> Dict:
+    """Simulação (dry-run): soma por pasta o espaço que as regras liberariam, sem apagar nada.
+
+    Retorna {'folders': {pasta: {'files', 'bytes'}}, 'total_files', 'total_bytes',
+    'elapsed_s', 'errors'} (e dirs_cached/dirs_scanned quando há índice).
+    """
+    started = time.perf_counter()
+    now = time.time()
+    policies, folders = _policy_folders(policies)
+    rules = _rules_by_folder(folders, policies)
+    tracker = ProgressReporter(progress, 'scan', interval)
+    errors: List[str] = []
+    totals: Dict[str, Dict[str, int]] = {}
+    stats: Dict[str, int] = {}
+    lock = threading.Lock()
+
+    def scan_volume(vol_folders):
+        local = {f: {'files': 0, 'bytes': 0} for f in vol_folders}
+        local_stats: Dict[str, int] = {}
+        for cand in _select(_source(vol_folders, index, errors, local_stats), rules, now):
+            entry = local[cand.root]
+            entry['files'] += 1
+            entry['bytes'] += cand.size
+            tracker.add(files_scanned=1, bytes_scanned=cand.size, current_folder=cand.root)
+        with lock:
+            totals.update(local)
+            for key, value in local_stats.items():
+                stats[key] = stats.get(key, 0) + value
+
+    _run_per_volume(folders, scan_volume, errors)
+    tracker.add(force=True)
+    report = {
+        'folders': totals,
+        'total_files': sum(v['files'] for v in totals.values()),
+        'total_bytes': sum(v['bytes'] for v in totals.values()),
+        'elapsed_s': time.perf_counter() - started,
+        'errors': errors,
+    }
+    return _index_report(report, index, stats)
+
+
+def clean_folders(
+    folders: Iterable[str],
+    progress: Optional[ProgressCallback] = None,
+    max_workers: int = 8,
+    batch_size: int = 256,
+    interval: float = 0.25,
+) -> Dict:
+    """Apaga todo o conteúdo das pastas informadas (regra única sem filtros)."""
+    policy = CleanupPolicy('Pastas', folders, skip_in_use=False)
+    return clean_policies([policy], None, progress, max_workers, batch_size, interval)
+
+
+def preview_folders(
+    folders: Iterable[str],
+    progress: Optional[ProgressCallback] = None,
+    interval: float = 0.25,
+) -> Dict:
+    """Simulação (dry-run) de `clean_folders`."""
+    policy = CleanupPolicy('Pastas', folders, skip_in_use=False)
+    return preview_policies([policy], None, progress, interval)
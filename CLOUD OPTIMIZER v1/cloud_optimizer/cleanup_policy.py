@@ -0,0 +1,158 @@
+# Date: 19/10/2026
+# DEV: Martinez
+# Cloud Optimizer v1 Free Utility by Martinez
+
+import ctypes
+import fnmatch
+import json
+import os
+import re
+import stat
+from typing import Dict, Iterable, List, Optional
+
+from cloud_optimizer.utils import app_data_dir
+
+__all__ = ["CleanupPolicy", "load_policies", "save_policies", "is_file_in_use"]
+
+_DAY = 86400.0
+
+
+class CleanupPolicy:
+    """Regra de limpeza: quais arquivos de quais pastas podem ser apagados.
+
+    Um arquivo casa com a regra se o nome casar com algum padrão (fnmatch, sem
+    diferenciar maiúsculas) e todos os limites configurados forem atendidos:
+      - min_age_days: modificado há pelo menos N dias
+      - min_size: pelo menos N bytes
+      - untouched_days: nem modificado nem acessado há N dias
+      - skip_in_use: arquivos abertos por outro processo são pulados
+
+    Formato JSON (cleanup_policies.json), por exemplo:
+      {"name": "Logs antigos", "folders": ["%TEMP%"], "patterns": ["*.log"], "min_age_days": 7}
+      {"name": "Grandes parados", "folders": ["D:\\\\Cache"], "min_size_mb": 500, "untouched_days": 30}
+    """
+
+    def __init__(
+        self,
+        name: str,
+        folders: Iterable[str],
+        patterns: Iterable[str] = ('*',),
+        min_age_days: float = 0,
+        min_size: int = 0,
+        untouched_days: float = 0,
+        skip_in_use: bool = True,
+        enabled: bool = True,
+    ) -> None:
+        self.name = name
+        self.folders = [os.path.expanduser(os.path.expandvars(f)) for f in folders if f]
+        self.patterns = list(patterns) or ['*']
+        self.min_age_days = float(min_age_days)
+        self.min_size = int(min_size)
+        self.untouched_days = float(untouched_days)
+        self.skip_in_use = bool(skip_in_use)
+        self.enabled = bool(enabled)
+        if any(p != '*' for p in self.patterns):
+            self._name_re = re.compile('|'.join(fnmatch.translate(p.lower()) for p in self.patterns))
+        else:
+            self._name_re = None
+
+    def matches(self, name: str, size: int, mtime: float, atime: float, now: float) -> bool:
+        """Avalia a regra com os metadados já conhecidos (não toca o disco)."""
+        if self._name_re is not None and not self._name_re.match(name.lower()):
+            return False
+        if self.min_size and size < self.min_size:
+            return False
+        if self.min_age_days and now - mtime < self.min_age_days * _DAY:
+            return False
+        if self.untouched_days and now - max(mtime, atime) < self.untouched_days * _DAY:
+            return False
+        return True
+
+    @property
+    def matches_all(self) -> bool:
+        """Regra sem filtros: a pasta inteira pode ser esvaziada."""
+        return self._name_re is None and not (self.min_size or self.min_age_days or self.untouched_days)
+
+    def covers(self, folder: str) -> bool:
+        key = os.path.normcase(os.path.realpath(folder))
+        return any(os.path.normcase(os.path.realpath(f)) == key for f in self.folders)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "CleanupPolicy":
+        return cls(
+            name=data.get('name', ''),
+            folders=data.get('folders', []),
+            patterns=data.get('patterns', ['*']),
+            min_age_days=data.get('min_age_days', 0),
+            min_size=int(float(data.get('min_size_mb', 0)) * 1024 * 1024),
+            untouched_days=data.get('untouched_days', 0),
+            skip_in_use=data.get('skip_in_use', True),
+            enabled=data.get('enabled', True),
+        )
+
+    def to_dict(self) -> Dict:
+        return {
+            'name': self.name,
+            'folders': self.folders,
+            'patterns': self.patterns,
+            'min_age_days': self.min_age_days,
+            'min_size_mb': self.min_size / (1024 * 1024),
+            'untouched_days': self.untouched_days,
+            'skip_in_use': self.skip_in_use,
+            'enabled': self.enabled,
+        }
+
+
+def _policies_path() -> str:
+    return app_data_dir('cleanup_policies.json')
+
+
+def load_policies(default_folders: Iterable[str], path: Optional[str] = None, **defaults) -> List[CleanupPolicy]:
+    """Carrega as regras do usuário; sem arquivo, limpa as pastas padrão.
+
+    `defaults` são os limites da regra padrão (ex.: min_age_days); sem eles a
+    regra padrão esvazia as pastas.
+    """
+    path = path or _policies_path()
+    try:
+        with open(path, encoding='utf-8') as fh:
+            data = json.load(fh)
+        policies = [CleanupPolicy.from_dict(d) for d in data]
+        return [p for p in policies if p.enabled and p.folders]
+    except FileNotFoundError:
+        return [CleanupPolicy('Temporários', default_folders, **defaults)]
+    except (OSError, ValueError) as e:
+        raise Exception(f"Regras de limpeza inválidas em {path}: {e}")
+
+
+def save_policies(policies: Iterable[CleanupPolicy], path: Optional[str] = None) -> None:
+    path = path or _policies_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as fh:
+        json.dump([p.to_dict() for p in policies], fh, indent=2, ensure_ascii=False)
+
+
+def is_file_in_use(path: str) -> bool:
+    """True se outro processo mantém o arquivo aberto.
+
+    No Windows testa uma abertura exclusiva. Nos demais sistemas só sockets e
+    pipes nomeados (ex.: /tmp/.X11-unix/X0) contam como em uso: são pontos de
+    comunicação de processos, nunca dados temporários.
+    """
+    if os.name != 'nt':
+        try:
+            mode = os.lstat(path).st_mode
+        except OSError:
+            return False
+        return stat.S_ISSOCK(mode) or stat.S_ISFIFO(mode)
+    try:
+        kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+        kernel32.CreateFileW.restype = ctypes.c_void_p
+        # Abertura exclusiva (share mode 0) falha com violação de compartilhamento
+        handle = kernel32.CreateFileW(path, 0x80000000, 0, None, 3, 0x80, None)
+        if handle in (None, ctypes.c_void_p(-1).value):
+            return ctypes.get_last_error() == 32  # ERROR_SHARING_VIOLATION
+        kernel32.CloseHandle(ctypes.c_void_p(handle))
+        return False
+    except Exception:
+        return False
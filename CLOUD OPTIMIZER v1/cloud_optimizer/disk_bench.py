@@ -0,0 +1,321 @@
+# Date: 19/10/2026
+# DEV: Martinez
+# Cloud Optimizer v1 Free Utility by Martinez
+
+import itertools
+import mmap
+import os
+import random
+import shutil
+import tempfile
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+__all__ = ["DiskTest", "MODES", "STANDARD_TESTS", "build_tests", "test_name", "prepare_file", "run_test", "run_disk_bench"]
+
+ProgressCallback = Callable[[Dict], None]
+
+# pattern: 'seq' | 'rand'; op: 'read' | 'write'; block em bytes; qd = requisições simultâneas (threads)
+DiskTest = namedtuple("DiskTest", "pattern op block qd mode")
+
+MODES = ('buffered', 'direct', 'mmap')
+
+_KB = 1024
+_MB = 1024 * _KB
+_ALIGN = 4096  # alinhamento de offset e buffer exigido pelo O_DIRECT
+
+# Bateria padrão (no estilo dos testes de disco conhecidos): sequencial grande e aleatório pequeno, QD1 e QD alto
+STANDARD_TESTS = tuple(
+    DiskTest(pattern, op, block, qd, 'buffered')
+    for op in ('read', 'write')
+    for pattern, block, qd in (('seq', _MB, 8), ('seq', _MB, 1), ('rand', 64 * _KB, 8), ('rand', 4 * _KB, 32), ('rand', 4 * _KB, 1))
+)
+
+
+def build_tests(
+    patterns: Iterable[str] = ('seq', 'rand'),
+    ops: Iterable[str] = ('read', 'write'),
+    blocks: Iterable[int] = (4 * _KB, 64 * _KB, _MB),
+    queue_depths: Iterable[int] = (1, 8, 32),
+    modes: Iterable[str] = ('buffered',),
+) -> List[DiskTest]:
+    """Todas as combinações pedidas, agrupadas por modo e operação (leituras antes das escritas)."""
+    return [DiskTest(p, o, b, q, m) for m in modes for o in ops for p in patterns for b in blocks for q in queue_depths]
+
+
+def test_name(test: DiskTest) -> str:
+    size = f"{test.block // _MB}M" if test.block >= _MB else f"{test.block // _KB}K"
+    return f"{test.pattern}-{test.op} {size} QD{test.qd} {test.mode}"
+
+
+def _drop_cache(path: str) -> bool:
+    """Tira o arquivo do cache de páginas (posix_fadvise). Retorna False onde não há como (Windows)."""
+    advise = getattr(os, 'posix_fadvise', None)
+    if advise is None:
+        return False
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+        advise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        return True
+    except OSError:
+        return False
+    finally:
+        os.close(fd)
+
+
+def _open(path: str, mode: str) -> int:
+    flags = os.O_RDWR | getattr(os, 'O_BINARY', 0)
+    if mode != 'direct':
+        return os.open(path, flags)
+    if hasattr(os, 'O_DIRECT'):
+        try:
+            return os.open(path, flags | os.O_DIRECT)
+        except OSError as e:
+            # tmpfs e alguns sistemas de arquivos recusam O_DIRECT com EINVAL
+            raise Exception(f"O_DIRECT não é suportado neste sistema de arquivos: {e}")
+    try:
+        import fcntl
+        nocache = fcntl.F_NOCACHE  # macOS: equivalente ao O_DIRECT
+    except (ImportError, AttributeError):
+        raise Exception("E/S sem cache (O_DIRECT) não é suportada neste sistema")
+    fd = os.open(path, flags)
+    fcntl.fcntl(fd, nocache, 1)
+    return fd
+
+
+def prepare_file(path: str, size: int, chunk: Optional[bytes] = None) -> int:
+    """Cria o arquivo de teste com dados aleatórios (não compressíveis) e tira do cache.
+
+    O tamanho é arredondado para o maior bloco (1 MB). Retorna o tamanho final.
+    """
+    size = max(_MB, size // _MB * _MB)
+    chunk = chunk or os.urandom(_MB)
+    with open(path, 'wb', buffering=0) as fh:
+        for _ in range(size // _MB):
+            fh.write(chunk)
+        os.fsync(fh.fileno())
+    _drop_cache(path)
+    return size
+
+
+def _percentiles(latencies: List[int]) -> Dict[str, float]:
+    if not latencies:
+        return {}
+    latencies.sort()
+    n = len(latencies)
+
+    def at(q):
+        return latencies[min(n - 1, int(q * n))] / 1000.0
+
+    return {'p50': at(0.50), 'p90': at(0.90), 'p99': at(0.99), 'p99.9': at(0.999), 'max': latencies[-1] / 1000.0}
+
+
+def run_test(
+    path: str,
+    test: DiskTest,
+    duration: float = 3.0,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[threading.Event] = None,
+    seed: int = 0,
+) -> Dict:
+    """Roda um teste sobre um arquivo já preparado (`prepare_file`) por até `duration` segundos.
+
+    `test.qd` threads fazem as requisições ao mesmo tempo, cada uma com seu
+    próprio descritor; no sequencial elas dividem um contador de blocos (o
+    arquivo é percorrido em ordem e recomeça no fim). Escritas terminam com
+    fsync (ou flush do mmap) dentro do tempo medido, então o cache de escrita
+    não infla o resultado; leituras começam com o arquivo fora do cache onde
+    o sistema permite ('cache_dropped'). Latência é medida por requisição.
+
+    Retorna {'name', 'test', 'ops', 'bytes', 'elapsed_s', 'mb_s', 'iops',
+    'latency_us': {'p50', 'p90', 'p99', 'p99.9', 'max'}, 'cache_dropped'}.
+    `progress` recebe {'name', 'elapsed_s', 'ops', 'mb_s'} a cada ~0,25 s.
+    """
+    if test.mode not in MODES:
+        raise Exception(f"Modo de E/S desconhecido: {test.mode}")
+    if test.block % _ALIGN:
+        raise Exception(f"Bloco deve ser múltiplo de {_ALIGN} bytes: {test.block}")
+    cancel = cancel or threading.Event()
+    size = os.path.getsize(path)
+    blocks = size // test.block
+    if not blocks:
+        raise Exception(f"Arquivo de teste menor que o bloco ({size} < {test.block})")
+    name = test_name(test)
+    cache_dropped = _drop_cache(path) if test.op == 'read' and test.mode != 'direct' else test.mode == 'direct'
+
+    shared_map = None
+    if test.mode == 'mmap':
+        with open(path, 'r+b') as fh:
+            shared_map = mmap.mmap(fh.fileno(), size)
+        if test.pattern == 'rand' and hasattr(shared_map, 'madvise') and hasattr(mmap, 'MADV_RANDOM'):
+            shared_map.madvise(mmap.MADV_RANDOM)
+    counter = itertools.count()  # next() é atômico no CPython: blocos sequenciais sem lock
+    stop = threading.Event()
+    totals = [0] * test.qd
+    pattern = os.urandom(test.block)
+
+    def worker(index: int) -> List[int]:
+        rng = random.Random(seed * 1000 + index)
+        latencies: List[int] = []
+        fd = None
+        buf = None
+        try:
+            if test.mode == 'mmap':
+                buf = bytearray(test.block)
+                view = memoryview(shared_map)
+            else:
+                fd = _open(path, test.mode)
+                # buffer anônimo do mmap é alinhado à página, como o O_DIRECT exige
+                buf = mmap.mmap(-1, test.block)
+                if test.op == 'write':
+                    buf[:] = pattern
+            clock = time.perf_counter_ns
+            while not stop.is_set():
+                block = next(counter) % blocks if test.pattern == 'seq' else rng.randrange(blocks)
+                offset = block * test.block
+                t0 = clock()
+                if test.mode == 'mmap':
+                    if test.op == 'read':
+                        buf[:] = view[offset:offset + test.block]
+                    else:
+                        view[offset:offset + test.block] = pattern
+                elif test.op == 'read':
+                    _pread(fd, buf, offset)
+                else:
+                    _pwrite(fd, buf, offset)
+                latencies.append(clock() - t0)
+                totals[index] += 1
+            if test.op == 'write' and fd is not None:
+                os.fsync(fd)
+        finally:
+            if test.mode == 'mmap' and buf is not None:
+                view.release()
+            elif buf is not None:
+                buf.close()
+            if fd is not None:
+                os.close(fd)
+        return latencies
+
+    started = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=test.qd, thread_name_prefix="disk-bench") as pool:
+            futures = [pool.submit(worker, i) for i in range(test.qd)]
+            deadline = started + duration
+            while not stop.is_set():
+                now = time.perf_counter()
+                if now >= deadline or cancel.is_set() or any(f.done() for f in futures):
+                    stop.set()
+                    break
+                time.sleep(min(0.25, deadline - now))
+                if progress is not None:
+                    ops = sum(totals)
+                    elapsed = time.perf_counter() - started
+                    try:
+                        progress({'name': name, 'elapsed_s': elapsed, 'ops': ops, 'mb_s': ops * test.block / _MB / elapsed})
+                    except Exception:
+                        pass
+            latencies = [lat for f in futures for lat in f.result()]
+            if test.op == 'write' and shared_map is not None:
+                shared_map.flush()
+            elapsed = time.perf_counter() - started
+    finally:
+        if shared_map is not None:
+            shared_map.close()
+
+    ops = len(latencies)
+    return {
+        'name': name,
+        'test': test._asdict(),
+        'ops': ops,
+        'bytes': ops * test.block,
+        'elapsed_s': elapsed,
+        'mb_s': ops * test.block / _MB / elapsed if elapsed else 0.0,
+        'iops': ops / elapsed if elapsed else 0.0,
+        'latency_us': _percentiles(latencies),
+        'cache_dropped': cache_dropped,
+    }
+
+
+def _pread(fd: int, buf, offset: int) -> None:
+    if hasattr(os, 'preadv'):
+        os.preadv(fd, [buf], offset)
+    else:
+        # Windows: sem pread; cada thread tem seu descritor, então seek+read é seguro
+        os.lseek(fd, offset, os.SEEK_SET)
+        data = os.read(fd, len(buf))
+        buf[:len(data)] = data
+
+
+def _pwrite(fd: int, buf, offset: int) -> None:
+    if hasattr(os, 'pwritev'):
+        os.pwritev(fd, [buf], offset)
+    else:
+        os.lseek(fd, offset, os.SEEK_SET)
+        os.write(fd, buf)
+
+
+def _bounded_size(folder: str, size: int) -> int:
+    """Limita o arquivo de teste a 1/4 do espaço livre (mínimo de 16 MB)."""
+    free = shutil.disk_usage(folder).free
+    size = min(size, free // 4)
+    if size < 16 * _MB:
+        raise Exception(f"Espaço livre insuficiente em {folder} para o teste de disco")
+    return size
+
+
+def run_disk_bench(
+    folder: Optional[str] = None,
+    tests: Optional[Sequence[DiskTest]] = None,
+    file_size: int = 256 * _MB,
+    duration: float = 3.0,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[threading.Event] = None,
+) -> Dict:
+    """Roda a bateria de testes de disco numa pasta e retorna {'folder', 'file_size', 'results', 'elapsed_s', 'cancelled'}.
+
+    Usa um único arquivo temporário de até `file_size` (limitado a 1/4 do espaço
+    livre), numa pasta própria que é apagada no fim mesmo com erro ou
+    cancelamento. Cada item de 'results' é o retorno de `run_test` ou
+    {'name', 'test', 'error'} quando o teste não pôde rodar (ex.: O_DIRECT em
+    tmpfs). `progress` recebe os eventos de `run_test` com 'index' e 'total'
+    e, ao fim de cada teste, um evento com 'result'.
+    """
+    started = time.perf_counter()
+    tests = list(tests or STANDARD_TESTS)
+    cancel = cancel or threading.Event()
+    folder = folder or tempfile.gettempdir()
+    size = _bounded_size(folder, file_size)
+    workdir = tempfile.mkdtemp(prefix='cloudopt-diskbench-', dir=folder)
+    results = []
+    try:
+        path = os.path.join(workdir, 'bench.bin')
+        if progress is not None:
+            progress({'name': "Preparando arquivo de teste", 'index': 0, 'total': len(tests), 'elapsed_s': 0.0, 'ops': 0, 'mb_s': 0.0})
+        size = prepare_file(path, size)
+        for index, test in enumerate(tests, 1):
+            if cancel.is_set():
+                break
+
+            def on_progress(ev, index=index):
+                if progress is not None:
+                    progress(dict(ev, index=index, total=len(tests)))
+
+            try:
+                results.append(run_test(path, test, duration, on_progress, cancel, seed=index))
+            except Exception as e:
+                results.append({'name': test_name(test), 'test': test._asdict(), 'error': str(e)})
+            if progress is not None:
+                progress({'name': results[-1]['name'], 'index': index, 'total': len(tests), 'result': results[-1]})
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return {
+        'folder': folder,
+        'file_size': size,
+        'results': results,
+        'elapsed_s': time.perf_counter() - started,
+        'cancelled': cancel.is_set(),
+    }
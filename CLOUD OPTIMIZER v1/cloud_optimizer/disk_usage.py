@@ -0,0 +1,312 @@
+# Date: 19/10/2026
+# DEV: Martinez
+# Cloud Optimizer v1 Free Utility by Martinez
+
+import hashlib
+import json
+import os
+import queue
+import threading
+import time
+from array import array
+from typing import Callable, Dict, List, Optional
+
+from cloud_optimizer.utils import app_data_dir, is_link
+
+__all__ = ["DiskUsageTree", "build_tree", "analyze_disk_usage", "cache_path"]
+
+_CACHE_VERSION = 1
+_UNREADABLE = -1  # mtime_ns de pastas sem acesso: nunca reaproveitadas do cache
+
+ProgressCallback = Callable[[Dict], None]
+
+
+class DiskUsageTree:
+    """Árvore de tamanhos de pastas em arrays compactos (só pastas, sem arquivos).
+
+    O nó 0 é a raiz; cada nó tem nome, pai, bytes/quantidade dos arquivos que
+    estão diretamente nele e o mtime da pasta. Filhos sempre têm índice maior
+    que o pai, então os totais são somados numa única passada de trás para a
+    frente. Depois de `finish()` os filhos ficam num índice CSR (offsets +
+    índices), e a navegação (drill-down) nunca volta ao disco.
+    """
+
+    def __init__(self, root: str) -> None:
+        self.root = root
+        self.names: List[str] = []
+        self.parent = array('i')
+        self.own_size = array('q')
+        self.own_files = array('q')
+        self.mtime_ns = array('q')
+        self.total_size = array('q')
+        self.total_files = array('q')
+        self._child_off = array('i')
+        self._child_idx = array('i')
+        self.errors = 0
+        self.dirs_scanned = 0
+        self.dirs_reused = 0
+        self.elapsed_s = 0.0
+        self.created = time.time()
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def add(self, name: str, parent: int) -> int:
+        """Reserva um nó (não é thread-safe: o walker chama sob lock)."""
+        self.names.append(name)
+        self.parent.append(parent)
+        self.own_size.append(0)
+        self.own_files.append(0)
+        self.mtime_ns.append(_UNREADABLE)
+        return len(self.names) - 1
+
+    def finish(self) -> None:
+        """Soma os totais de baixo para cima e monta o índice de filhos."""
+        n = len(self.names)
+        total_size = array('q', self.own_size)
+        total_files = array('q', self.own_files)
+        parent = self.parent
+        for i in range(n - 1, 0, -1):
+            p = parent[i]
+            total_size[p] += total_size[i]
+            total_files[p] += total_files[i]
+        self.total_size = total_size
+        self.total_files = total_files
+
+        counts = array('i', bytes(4 * (n + 1)))
+        for i in range(1, n):
+            counts[parent[i] + 1] += 1
+        for i in range(n):
+            counts[i + 1] += counts[i]
+        fill = array('i', counts)
+        child_idx = array('i', bytes(4 * max(0, n - 1)))
+        for i in range(1, n):
+            p = parent[i]
+            child_idx[fill[p]] = i
+            fill[p] += 1
+        self._child_off = counts
+        self._child_idx = child_idx
+
+    def children(self, idx: int) -> List[int]:
+        """Subpastas de `idx`, da maior para a menor."""
+        kids = self._child_idx[self._child_off[idx]:self._child_off[idx + 1]].tolist()
+        kids.sort(key=self.total_size.__getitem__, reverse=True)
+        return kids
+
+    def child_count(self, idx: int) -> int:
+        return self._child_off[idx + 1] - self._child_off[idx]
+
+    def path(self, idx: int) -> str:
+        parts = []
+        while idx > 0:
+            parts.append(self.names[idx])
+            idx = self.parent[idx]
+        return os.path.join(self.root, *reversed(parts)) if parts else self.root
+
+    # Cache em disco
+    def save(self, path: str) -> None:
+        header = {
+            'version': _CACHE_VERSION,
+            'root': self.root,
+            'count': len(self.names),
+            'errors': self.errors,
+            'created': self.created,
+        }
+        names = '\0'.join(self.names).encode('utf-8', 'surrogatepass')
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + '.tmp'
+        with open(tmp, 'wb') as fh:
+            fh.write(json.dumps(header).encode('utf-8') + b'\n')
+            for arr in (self.parent, self.own_size, self.own_files, self.mtime_ns):
+                arr.tofile(fh)
+            fh.write(names)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional["DiskUsageTree"]:
+        """Lê uma árvore salva; None se o arquivo não existir ou for incompatível."""
+        try:
+            with open(path, 'rb') as fh:
+                header = json.loads(fh.readline())
+                if header.get('version') != _CACHE_VERSION:
+                    return None
+                n = header['count']
+                tree = cls(header['root'])
+                for arr in (tree.parent, tree.own_size, tree.own_files, tree.mtime_ns):
+                    arr.fromfile(fh, n)
+                names = fh.read().decode('utf-8', 'surrogatepass')
+        except (OSError, ValueError, KeyError, EOFError):
+            return None
+        tree.names = names.split('\0') if n else []
+        if len(tree.names) != n:
+            return None
+        tree.errors = header.get('errors', 0)
+        tree.created = header.get('created', 0.0)
+        tree.finish()
+        return tree
+
+
+class _Walker:
+    """Percorre a árvore com `workers` threads consumindo uma fila de pastas.
+
+    Cada item da fila é (nó novo, caminho, nó correspondente na árvore anterior).
+    Pastas com o mesmo mtime da árvore anterior não são listadas: os tamanhos
+    delas são copiados e só as subpastas conhecidas são visitadas (um stat por
+    pasta). As demais são relidas com os.scandir.
+    """
+
+    def __init__(self, tree: DiskUsageTree, previous: Optional[DiskUsageTree], progress, interval, cancel) -> None:
+        self.tree = tree
+        self.previous = previous
+        self.progress = progress
+        self.interval = interval
+        self.cancel = cancel or threading.Event()
+        self.lock = threading.Lock()
+        self.queue: "queue.Queue" = queue.Queue()
+        self._next_emit = 0.0
+        self._files = 0
+        self._bytes = 0
+
+    def run(self, workers: int) -> None:
+        self.queue.put((self.tree.add(self.tree.root, -1), self.tree.root, 0 if self.previous else None))
+        threads = [threading.Thread(target=self._worker, name=f"DiskUsage-{i}", daemon=True) for i in range(workers)]
+        for t in threads:
+            t.start()
+        self.queue.join()
+        for _ in threads:
+            self.queue.put(None)
+        for t in threads:
+            t.join()
+        self._emit(force=True)
+
+    def _worker(self) -> None:
+        while True:
+            item = self.queue.get()
+            if item is None:
+                self.queue.task_done()
+                return
+            try:
+                if not self.cancel.is_set():
+                    self._visit(*item)
+            except Exception:
+                with self.lock:
+                    self.tree.errors += 1
+            finally:
+                self.queue.task_done()
+
+    def _visit(self, idx: int, path: str, old: Optional[int]) -> None:
+        tree, prev = self.tree, self.previous
+        try:
+            mtime_ns = os.stat(path, follow_symlinks=False).st_mtime_ns
+        except OSError:
+            with self.lock:
+                tree.errors += 1
+            return
+
+        if old is not None and prev.mtime_ns[old] == mtime_ns:
+            size, files = prev.own_size[old], prev.own_files[old]
+            subdirs = [(prev.names[c], c) for c in prev._child_idx[prev._child_off[old]:prev._child_off[old + 1]]]
+            reused = True
+        else:
+            size = files = 0
+            names = []
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False) and not is_link(entry):
+                                names.append(entry.name)
+                                continue
+                            size += entry.stat(follow_symlinks=False).st_size
+                            files += 1
+                        except OSError:
+                            continue
+            except OSError:
+                with self.lock:
+                    tree.errors += 1
+                    tree.dirs_scanned += 1
+                return
+            known = {}
+            if old is not None:
+                known = {prev.names[c]: c for c in prev._child_idx[prev._child_off[old]:prev._child_off[old + 1]]}
+            subdirs = [(name, known.get(name)) for name in names]
+            reused = False
+
+        with self.lock:
+            tree.own_size[idx] = size
+            tree.own_files[idx] = files
+            tree.mtime_ns[idx] = mtime_ns
+            if reused:
+                tree.dirs_reused += 1
+            else:
+                tree.dirs_scanned += 1
+            children = [(tree.add(name, idx), name, c) for name, c in subdirs]
+            self._files += files
+            self._bytes += size
+        for child, name, c in children:
+            self.queue.put((child, os.path.join(path, name), c))
+        self._emit()
+
+    def _emit(self, force: bool = False) -> None:
+        if self.progress is None:
+            return
+        now = time.monotonic()
+        if not force and now < self._next_emit:
+            return
+        self._next_emit = now + self.interval
+        tree = self.tree
+        try:
+            self.progress({
+                'dirs': len(tree), 'files': self._files, 'bytes': self._bytes,
+                'dirs_reused': tree.dirs_reused, 'dirs_scanned': tree.dirs_scanned,
+            })
+        except Exception:
+            pass
+
+
+def build_tree(
+    root: str,
+    previous: Optional[DiskUsageTree] = None,
+    workers: int = 8,
+    progress: Optional[ProgressCallback] = None,
+    interval: float = 0.25,
+    cancel: Optional[threading.Event] = None,
+) -> DiskUsageTree:
+    """Mede o uso de disco de `root` com várias threads de os.scandir.
+
+    Com `previous` (árvore anterior da mesma raiz), só as pastas cujo mtime mudou
+    são relidas. O mtime de uma pasta não muda quando um arquivo dentro dela é
+    editado no lugar; para pegar essas mudanças, analise sem cache.
+    """
+    started = time.perf_counter()
+    tree = DiskUsageTree(root)
+    if previous is not None and (previous.root != root or not len(previous)):
+        previous = None
+    _Walker(tree, previous, progress, interval, cancel).run(max(1, workers))
+    tree.finish()
+    tree.elapsed_s = time.perf_counter() - started
+    return tree
+
+
+def cache_path(root: str) -> str:
+    key = hashlib.sha1(os.path.normcase(os.path.abspath(root)).encode('utf-8', 'surrogatepass')).hexdigest()[:16]
+    return app_data_dir('disk_usage', f'{key}.bin')
+
+
+def analyze_disk_usage(
+    root: str,
+    use_cache: bool = True,
+    workers: int = 8,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[threading.Event] = None,
+) -> DiskUsageTree:
+    """Analisa `root` reaproveitando a última análise salva e atualiza o cache."""
+    path = cache_path(root)
+    previous = DiskUsageTree.load(path) if use_cache else None
+    tree = build_tree(root, previous, workers, progress, cancel=cancel)
+    if cancel is None or not cancel.is_set():
+        try:
+            tree.save(path)
+        except OSError:
+            pass
+    return tree
@@ -0,0 +1,239 @@
+# Date: 19/10/2026
+# DEV: Martinez
+# Cloud Optimizer v1 Free Utility by Martinez
+
+import hashlib
+import mmap
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from cloud_optimizer.cleaner import ProgressReporter, scan_candidates, unique_folders
+
+__all__ = ["find_duplicates", "EDGE_BYTES"]
+
+EDGE_BYTES = 64 * 1024  # bytes lidos do início e do fim no hash parcial
+_CHUNK = 8 * 1024 * 1024
+
+GroupCallback = Callable[[Dict], None]
+
+
+def _new_hash():
+    return hashlib.blake2b(digest_size=20)
+
+
+def _hash_edges(path: str, size: int) -> Optional[bytes]:
+    """Hash do início e do fim do arquivo (o arquivo inteiro se for pequeno).
+
+    Retorna None se o arquivo sumiu ou mudou de tamanho desde a varredura.
+    """
+    h = _new_hash()
+    try:
+        with open(path, 'rb', buffering=0) as fh:
+            if size <= 2 * EDGE_BYTES:
+                data = fh.read(size)
+                if len(data) != size or fh.read(1):
+                    return None
+                h.update(data)
+            else:
+                head = fh.read(EDGE_BYTES)
+                fh.seek(size - EDGE_BYTES)
+                tail = fh.read(EDGE_BYTES)
+                if len(head) != EDGE_BYTES or len(tail) != EDGE_BYTES or fh.read(1):
+                    return None
+                h.update(head)
+                h.update(tail)
+    except OSError:
+        return None
+    return h.digest()
+
+
+def _hash_middle(path: str, size: int) -> Optional[bytes]:
+    """Hash do miolo [EDGE, size - EDGE), a parte que o hash parcial não leu.
+
+    Roda nos processos do pool. Usa mmap (sem cópia para o hashlib) e cai para
+    leituras grandes com buffer quando o mapeamento não é possível.
+    """
+    start, end = EDGE_BYTES, size - EDGE_BYTES
+    h = _new_hash()
+    try:
+        with open(path, 'rb', buffering=0) as fh:
+            if os.fstat(fh.fileno()).st_size != size:
+                return None
+            try:
+                mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                mm = None
+            if mm is not None:
+                with mm, memoryview(mm) as view:
+                    for pos in range(start, end, _CHUNK):
+                        h.update(view[pos:min(end, pos + _CHUNK)])
+            else:
+                fh.seek(start)
+                remaining = end - start
+                while remaining > 0:
+                    data = fh.read(min(_CHUNK, remaining))
+                    if not data:
+                        return None
+                    h.update(data)
+                    remaining -= len(data)
+    except OSError:
+        return None
+    return h.digest()
+
+
+def _full_hash_pool(workers: int):
+    """Pool de processos para os hashes completos; threads se processos não estiverem disponíveis."""
+    try:
+        # spawn em todas as plataformas: fork de um processo com Qt e threads não é seguro
+        return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+    except (OSError, NotImplementedError, ImportError):
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dup-hash")
+
+
+def find_duplicates(
+    folders: Iterable[str],
+    min_size: int = 1,
+    on_group: Optional[GroupCallback] = None,
+    progress: Optional[Callable[[Dict], None]] = None,
+    workers: Optional[int] = None,
+    interval: float = 0.25,
+    cancel: Optional[threading.Event] = None,
+) -> Dict:
+    """Procura arquivos duplicados nas pastas informadas.
+
+    Etapas:
+      1. varredura (só stat): agrupa por tamanho; tamanhos únicos são descartados
+         sem ler nenhum byte;
+      2. hash parcial dos primeiros e últimos EDGE_BYTES (threads). Arquivos de
+         até 2*EDGE_BYTES já são lidos inteiros e confirmados aqui;
+      3. hash do miolo, só para quem ainda colide, num pool de processos (mmap).
+    Cada byte é lido e hasheado no máximo uma vez. Cada grupo confirmado é
+    entregue a `on_group` assim que fica pronto: {'size', 'paths', 'wasted'}.
+
+    Retorna {'groups', 'duplicate_files', 'wasted_bytes', 'files_scanned',
+    'bytes_hashed', 'elapsed_s', 'errors'}.
+    """
+    started = time.perf_counter()
+    cancel = cancel or threading.Event()
+    workers = workers or min(8, os.cpu_count() or 2)
+    tracker = ProgressReporter(progress, 'scan', interval)
+    tracker.state.update(files_hashed=0, bytes_hashed=0, bytes_to_hash=0, groups=0)
+    errors: List[str] = []
+    groups: List[Dict] = []
+
+    def confirm(size: int, paths: List[str]) -> None:
+        group = {'size': size, 'paths': sorted(paths), 'wasted': size * (len(paths) - 1)}
+        groups.append(group)
+        tracker.add(groups=1)
+        if on_group is not None:
+            try:
+                on_group(group)
+            except Exception:
+                pass
+
+    # 1. Varredura: tamanho -> caminhos
+    by_size: Dict[int, List[str]] = {}
+    for cand in scan_candidates(unique_folders(folders), errors):
+        if cancel.is_set():
+            break
+        tracker.add(files_scanned=1, bytes_scanned=cand.size, current_folder=cand.root)
+        if cand.size >= min_size:
+            by_size.setdefault(cand.size, []).append(cand.path)
+    buckets = [(size, paths) for size, paths in by_size.items() if len(paths) > 1]
+    del by_size
+    # Maiores primeiro: os grupos que mais liberam espaço aparecem antes
+    buckets.sort(key=lambda b: b[0], reverse=True)
+    tracker.add(force=True, phase='partial', bytes_to_hash=sum(min(s, 2 * EDGE_BYTES) * len(p) for s, p in buckets))
+
+    # 2. Hash parcial (bordas)
+    pending_full: List[Tuple[int, List[str]]] = []
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dup-edges") as pool:
+        for size, paths in buckets:
+            if cancel.is_set():
+                break
+            by_edges: Dict[bytes, List[str]] = {}
+            for path, digest in zip(paths, pool.map(lambda p, s=size: _hash_edges(p, s), paths)):
+                if digest is not None:
+                    by_edges.setdefault(digest, []).append(path)
+            tracker.add(files_hashed=len(paths), bytes_hashed=min(size, 2 * EDGE_BYTES) * len(paths))
+            for same in by_edges.values():
+                if len(same) < 2:
+                    continue
+                if size <= 2 * EDGE_BYTES:
+                    confirm(size, same)
+                else:
+                    pending_full.append((size, same))
+
+    # 3. Hash do miolo, só para o que ainda colide
+    tracker.add(force=True, phase='full', bytes_to_hash=sum((s - 2 * EDGE_BYTES) * len(p) for s, p in pending_full))
+    if pending_full and not cancel.is_set():
+        pool = _full_hash_pool(workers)
+        in_flight = {}
+        results: Dict[int, Dict[str, Optional[bytes]]] = {}
+        jobs = ((gi, size, path) for gi, (size, paths) in enumerate(pending_full) for path in paths)
+
+        def submit(size, path):
+            # Processos indisponíveis (ex.: módulo principal sem guarda): segue com threads
+            nonlocal pool
+            try:
+                return pool.submit(_hash_middle, path, size)
+            except BrokenProcessPool:
+                pool.shutdown(wait=False)
+                pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dup-hash")
+                return pool.submit(_hash_middle, path, size)
+
+        def collect(done):
+            for fut in done:
+                gi, path = in_flight.pop(fut)
+                size, paths = pending_full[gi]
+                try:
+                    digest = fut.result()
+                except BrokenProcessPool:
+                    digest = _hash_middle(path, size)
+                except Exception as e:
+                    digest = None
+                    if not fut.cancelled():
+                        errors.append(f"{path}: {e}")
+                got = results.setdefault(gi, {})
+                got[path] = digest
+                tracker.add(files_hashed=1, bytes_hashed=size - 2 * EDGE_BYTES)
+                if len(got) < len(paths):
+                    continue
+                by_full: Dict[bytes, List[str]] = {}
+                for p, d in results.pop(gi).items():
+                    if d is not None:
+                        by_full.setdefault(d, []).append(p)
+                for same in by_full.values():
+                    if len(same) > 1:
+                        confirm(size, same)
+
+        try:
+            for gi, size, path in jobs:
+                if cancel.is_set():
+                    break
+                in_flight[submit(size, path)] = (gi, path)
+                # Limita o que fica enfileirado para a memória não crescer com a varredura
+                if len(in_flight) >= workers * 4:
+                    collect(wait(in_flight, return_when=FIRST_COMPLETED)[0])
+            if cancel.is_set():
+                for fut in in_flight:
+                    fut.cancel()
+            collect(wait(in_flight)[0])
+        finally:
+            pool.shutdown(wait=True)
+
+    tracker.add(force=True, phase='done')
+    return {
+        'groups': groups,
+        'duplicate_files': sum(len(g['paths']) - 1 for g in groups),
+        'wasted_bytes': sum(g['wasted'] for g in groups),
+        'files_scanned': tracker.state['files_scanned'],
+        'bytes_hashed': tracker.state['bytes_hashed'],
+        'elapsed_s': time.perf_counter() - started,
+        'errors': errors,
+    }
@@ -0,0 +1,308 @@
+# Date: 19/10/2026
+# DEV: Martinez
+# Cloud Optimizer v1 Free Utility by Martinez
+
+import contextlib
+import json
+import os
+import threading
+import time
+import uuid
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from cloud_optimizer.system_backend import POWER_TIMEOUT_SUBGROUPS, POWER_TIMEOUTS, get_backend
+from cloud_optimizer.utils import app_data_dir
+
+__all__ = ["Journal", "get_journal", "undo"]
+
+# Código do sc -> valor de `sc config start=`
+_SC_START_NAMES = {0: 'boot', 1: 'system', 2: 'auto', 3: 'demand', 4: 'disabled'}
+_SC_RUNNING = 4
+
+# Campos que identificam o alvo de cada tipo de registro (o que é restaurado)
+_TARGETS = {
+    'registry': ('hive', 'path', 'name'),
+    'service_start': ('service',),
+    'service_state': ('service',),
+    'power_plan': (),
+    'power_timeout': ('option',),
+    'tcp': ('option',),
+    'task': ('path',),
+    'file_move': ('src', 'dst'),
+    'file': ('path',),
+    'mask': ('unit',),
+}
+
+
+def undo(kind: str, absent_ok: bool = False, **target) -> Callable[[object], Optional[Dict]]:
+    """Fábrica do `undo` de Setting: recebe o valor atual lido e devolve o registro.
+
+    Valor desconhecido (None) não tem como ser restaurado e não gera registro,
+    exceto com `absent_ok` (ex.: valor do registro ausente: desfazer = apagar).
+    """
+    def entry(current):
+        if current is None and not absent_ok:
+            return None
+        return dict(target, kind=kind, prior=current)
+    return entry
+
+
+def _encode(value):
+    return {'hex': value.hex()} if isinstance(value, (bytes, bytearray)) else value
+
+
+def _decode(value):
+    return bytes.fromhex(value['hex']) if isinstance(value, dict) and set(value) == {'hex'} else value
+
+
+def _target(entry: Dict) -> Tuple:
+    return (entry['kind'],) + tuple(str(entry.get(f, '')).lower() for f in _TARGETS.get(entry['kind'], ()))
+
+
+class Journal:
+    """Diário de alterações só de acréscimo (JSON Lines) para desfazer ajustes.
+
+    Antes de escrever, cada ajuste anexa o valor anterior de tudo o que vai
+    tocar (registro, tipo de início e estado de serviços, plano e timeouts de
+    energia, TCP, tarefas, arquivos movidos, sysfs/procfs, unidades do systemd),
+    num único write com fsync. As linhas levam a sessão (um clique de ajuste ou
+    um perfil) e o ajuste, então dá para desfazer só um ajuste ou a sessão toda.
+
+    `rollback` restaura, para cada alvo, o valor mais antigo do escopo, do mais
+    recente para o mais antigo: valores do registro e arquivos que já estão no
+    original são pulados e todos os comandos (sc, powercfg, netsh, schtasks,
+    systemctl) rodam num só lote. Alvos desfeitos são marcados com uma linha
+    'reverted'; nada é reescrito.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path or app_data_dir('journal.jsonl')
+        self._lock = threading.Lock()
+        self._session: Optional[Tuple[str, str]] = None
+
+    # Sessões
+    def begin(self, label: str) -> str:
+        """Inicia uma sessão; registros feitos a partir daqui (em qualquer thread) ficam nela."""
+        with self._lock:
+            self._session = (time.strftime('%Y%m%d-%H%M%S-') + uuid.uuid4().hex[:6], label)
+            return self._session[0]
+
+    def end(self) -> None:
+        with self._lock:
+            self._session = None
+
+    @contextlib.contextmanager
+    def session(self, label: str):
+        previous = self._session
+        session_id = self.begin(label)
+        try:
+            yield session_id
+        finally:
+            with self._lock:
+                self._session = previous
+
+    # Escrita
+    def _append(self, lines: List[Dict]) -> None:
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        data = ''.join(json.dumps(line, ensure_ascii=False) + '\n' for line in lines)
+        with open(self.path, 'a', encoding='utf-8') as fh:
+            fh.write(data)
+            fh.flush()
+            os.fsync(fh.fileno())
+
+    def record(self, tweak: str, entries: Iterable[Optional[Dict]]) -> List[str]:
+        """Anexa os valores anteriores (antes da escrita) e retorna os ids.
+
+        Sem sessão aberta, os registros formam uma sessão própria com o nome do ajuste.
+        """
+        entries = [e for e in entries if e]
+        if not entries:
+            return []
+        with self._lock:
+            session, label = self._session or (time.strftime('%Y%m%d-%H%M%S-') + uuid.uuid4().hex[:6], tweak)
+            now = time.time()
+            lines = []
+            for entry in entries:
+                line = {k: _encode(v) for k, v in entry.items()}
+                line.update(id=uuid.uuid4().hex[:12], session=session, label=label, tweak=tweak, ts=now)
+                lines.append(line)
+            self._append(lines)
+        return [line['id'] for line in lines]
+
+    # Leitura
+    def _load(self) -> Tuple[List[Dict], set]:
+        entries, reverted = [], set()
+        try:
+            with open(self.path, encoding='utf-8') as fh:
+                for line in fh:
+                    try:
+                        data = json.loads(line)
+                    except ValueError:
+                        continue  # linha incompleta de uma gravação interrompida
+                    if 'reverted' in data:
+                        reverted.update(data['reverted'])
+                    elif 'kind' in data:
+                        entries.append(data)
+        except FileNotFoundError:
+            pass
+        return entries, reverted
+
+    def sessions(self) -> List[Dict]:
+        """Sessões da mais recente para a mais antiga: {'session', 'label', 'started', 'tweaks', 'entries', 'pending'}."""
+        entries, reverted = self._load()
+        found: Dict[str, Dict] = {}
+        for e in entries:
+            s = found.setdefault(e['session'], {'session': e['session'], 'label': e['label'], 'started': e['ts'],
+                                                'tweaks': [], 'entries': 0, 'pending': 0})
+            if e['tweak'] not in s['tweaks']:
+                s['tweaks'].append(e['tweak'])
+            s['entries'] += 1
+            s['pending'] += e['id'] not in reverted
+        return sorted(found.values(), key=lambda s: s['started'], reverse=True)
+
+    def pending(self, session: Optional[str] = None, tweak: Optional[str] = None, all_sessions: bool = False) -> List[Dict]:
+        """Registros ainda não desfeitos do escopo (sessão mais recente com pendências, por padrão)."""
+        entries, reverted = self._load()
+        entries = [e for e in entries if e['id'] not in reverted]
+        if not all_sessions:
+            if session is None:
+                candidates = [e for e in entries if tweak is None or e['tweak'] == tweak]
+                session = candidates[-1]['session'] if candidates else None
+            entries = [e for e in entries if e['session'] == session]
+        if tweak is not None:
+            entries = [e for e in entries if e['tweak'] == tweak]
+        return entries
+
+    # Desfazer
+    def rollback(self, session: Optional[str] = None, tweak: Optional[str] = None, all_sessions: bool = False,
+                 timeout: float = 60.0) -> Dict:
+        """Desfaz um escopo num lote só e retorna {'session', 'reverted', 'skipped', 'errors', 'elapsed_s'}.
+
+        Escopo: a sessão informada (ou a mais recente com pendências), só um
+        ajuste dela com `tweak`, ou tudo com `all_sessions`.
+        """
+        started = time.perf_counter()
+        entries = self.pending(session, tweak, all_sessions)
+        report = {'session': None if all_sessions or not entries else entries[0]['session'],
+                  'reverted': 0, 'skipped': 0, 'errors': [], 'elapsed_s': 0.0}
+        if not entries:
+            return report
+
+        # Por alvo vale o valor mais antigo do escopo; os mais novos são intermediários
+        by_target: Dict[Tuple, List[Dict]] = {}
+        for e in entries:
+            by_target.setdefault(_target(e), []).append(e)
+        position = {e['id']: i for i, e in enumerate(entries)}
+        targets = sorted(by_target.values(), key=lambda group: position[group[0]['id']], reverse=True)
+
+        backend = get_backend()
+        done: List[str] = []
+        commands: List[List[str]] = []
+        owners: List[List[Dict]] = []
+        reload_units = False
+        for group in targets:
+            entry = dict(group[0], prior=_decode(group[0].get('prior')))
+            try:
+                cmds, skipped = self._undo(backend, entry)
+            except Exception as e:
+                report['errors'].append(f"{entry['kind']} {' '.join(str(entry.get(f, '')) for f in _TARGETS.get(entry['kind'], ()))}: {e}")
+                continue
+            reload_units = reload_units or (entry['kind'] == 'mask' and not skipped)
+            if cmds:
+                commands.extend(cmds)
+                owners.extend([group] * len(cmds))
+                continue
+            report['skipped' if skipped else 'reverted'] += 1
+            done.extend(e['id'] for e in group)
+        if reload_units:
+            commands.append(['systemctl', 'daemon-reload'])
+            owners.append([])
+
+        if commands:
+            failed = set()
+            for group, result in zip(owners, backend.run_commands(commands, timeout=timeout)):
+                if group and result.returncode != 0:
+                    failed.add(id(group))
+                    report['errors'].append(f"Comando falhou: {' '.join(result.args)}: {(result.stderr or result.stdout or '').strip()}")
+            for group in {id(g): g for g in owners if g}.values():
+                if id(group) not in failed:
+                    report['reverted'] += 1
+                    done.extend(e['id'] for e in group)
+        if done:
+            with self._lock:
+                self._append([{'reverted': done, 'ts': time.time()}])
+        report['elapsed_s'] = time.perf_counter() - started
+        return report
+
+    @staticmethod
+    def _undo(backend, entry: Dict) -> Tuple[List[List[str]], bool]:
+        """Restaura um alvo: escritas diretas agora; comandos voltam para o lote.
+
+        Retorna (comandos, já_estava_no_original).
+        """
+        kind, prior = entry['kind'], entry['prior']
+        if kind == 'registry':
+            try:
+                current = backend.reg_read(entry['hive'], entry['path'], entry['name'])[0]
+            except FileNotFoundError:
+                current = None
+            if current == prior:
+                return [], True
+            if prior is None:
+                backend.reg_delete(entry['hive'], entry['path'], entry['name'])
+            else:
+                backend.reg_set(entry['hive'], entry['path'], entry['name'], entry['type'], prior)
+            return [], False
+        if kind == 'file':
+            try:
+                current = ' '.join(backend.read_text(entry['path']).split())
+            except OSError:
+                current = None
+            if current == prior:
+                return [], True
+            backend.write_text(entry['path'], prior)
+            return [], False
+        if kind == 'file_move':
+            if backend.exists(entry['src']) or not backend.exists(entry['dst']):
+                return [], True
+            backend.move_file(entry['dst'], entry['src'])
+            return [], False
+        if kind == 'mask':
+            link = f"{entry['dir']}/{entry['unit']}"
+            if backend.readlink(link) != '/dev/null':
+                return [], True
+            backend.remove(link)
+            return [], False
+        if kind == 'service_start':
+            return [['sc', 'config', entry['service'], f"start={_SC_START_NAMES.get(prior, 'demand')}"]], False
+        if kind == 'service_state':
+            return ([['sc', 'start', entry['service']]], False) if prior == _SC_RUNNING else ([], True)
+        if kind == 'power_plan':
+            return [['powercfg', '/setactive', prior]], False
+        if kind == 'power_timeout':
+            # /change só aceita minutos inteiros (90 s viraria 1 min, 30 s viraria "nunca");
+            # o índice AC grava os segundos exatos e /setactive aplica ao plano em uso
+            option = entry['option']
+            return [
+                ['powercfg', '/setacvalueindex', entry.get('scheme', 'SCHEME_CURRENT'), POWER_TIMEOUT_SUBGROUPS[option],
+                 POWER_TIMEOUTS[option], str(int(prior))],
+                ['powercfg', '/setactive', 'SCHEME_CURRENT'],
+            ], False
+        if kind == 'tcp':
+            return [['netsh', 'int', 'tcp', 'set', 'global', f"{entry['option']}={prior}"]], False
+        if kind == 'task':
+            return [['schtasks', '/change', '/tn', entry['path'], '/enable']], False
+        raise Exception(f"Tipo de registro desconhecido: {kind}")
+
+
+_journal: Optional[Journal] = None
+_journal_lock = threading.Lock()
+
+
+def get_journal() -> Journal:
+    """Diário padrão (journal.jsonl na pasta de dados do app)."""
+    global _journal
+    with _journal_lock:
+        if _journal is None:
+            _journal = Journal()
+        return _journal
@@ -4,19 +4,32 @@
 
 import os
 import sys
+import tempfile
 import threading
+import time
 from collections import deque
 from datetime import datetime
 from PyQt6 import QtCore, QtGui, QtWidgets
 
 # Monitor/Startup modularizados
-from cloud_optimizer.monitor import Monitor
+from cloud_optimizer.activity_log import ActivityLog
+from cloud_optimizer.disk_bench import STANDARD_TESTS, build_tests, run_disk_bench
+from cloud_optimizer.disk_usage import analyze_disk_usage
+from cloud_optimizer.net_bench import compare_runs, load_history as load_net_history, measure_tweak, parse_target, run_net_bench, save_run
+from cloud_optimizer.journal import get_journal
+from cloud_optimizer.maintenance import MaintenanceScheduler, load_config as load_maintenance_config, save_config as save_maintenance_config
+from cloud_optimizer.duplicates import find_duplicates
+from cloud_optimizer.monitor import PRESSURE_LABELS, PRESSURE_THRESHOLDS, THROTTLE_REASONS, Monitor
 from cloud_optimizer.startup import (
     list_startup_programs,
     disable_startup_item,
     list_disabled_startup_items,
     restore_startup_item,
 )
+from cloud_optimizer.search_index import StartupSearchIndex
+from cloud_optimizer.utils import format_bytes
+from cloud_optimizer.watchdog import UiStallWatchdog
+from cloud_optimizer.widgets.duplicates_dialog import DuplicatesDialog
 from cloud_optimizer.widgets.log_panel import LogPanelWidget
 
 # Gráficos em tempo real (opcional)
@@ -33,9 +46,19 @@ from cloud_optimizer.tweaks import (
     disable_visual_effects,
     disable_useless_programs,
     is_admin,
+    profile_steps,
+    profile_groups,
+    preview_profile,
+    rollback,
 )
+from cloud_optimizer.tweak_engine import TweakEngine
+from cloud_optimizer.perf_bench import measure_impact
+from cloud_optimizer.process_rules import ProcessRulesEngine, load_rules
+from cloud_optimizer.runaway import RunawayDetector
 
 ROOT_DIR = os.path.dirname(os.path.dirname(__file__))  # base do projeto (onde está assets/)
+MONITOR_ALERT_PCT = 95.0  # CPU/RAM acima disso gera evento de anomalia no log
+DISK_TREE_MAX_CHILDREN = 500  # subpastas exibidas por nível na página Disco
 
 
 class RestorePointWarningDialog(QtWidgets.QDialog):
@@ -44,7 +67,7 @@ class RestorePointWarningDialog(QtWidgets.QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("⚠️ AVISO IMPORTANTE")
-        self.setFixedSize(520, 280)
+        self.setFixedSize(520, 300)
         self.setModal(True)
         
         # Remove bordas padrão para aplicar estilo customizado e permitir cantos arredondados reais
@@ -135,6 +158,7 @@ class RestorePointWarningDialog(QtWidgets.QDialog):
             "• Crie um Ponto de Restauração do Windows\n"
             "• Certifique-se de ter backups importantes\n"
             "• Aceite a responsabilidade por quaisquer mudanças\n\n"
+            "Os valores anteriores ficam registrados e o botão DESFAZER volta a última execução.\n\n"
             "<span style='color:#7d7d85; font-size:11px;'>"
             "O desenvolvedor não se responsabiliza por problemas causados pelas otimizações."
             "</span>"
@@ -194,8 +218,27 @@ class MainWindow(QtWidgets.QMainWindow):
         self._nav_anim_map = {}
         self._press_anims = []
         self._startup_data = []
+        self._startup_index = None
+        self._startup_items = []  # um QListWidgetItem por entrada de _startup_data
+        self._startup_placeholder = None  # (item, rótulo) de "Carregando"/"Nenhum resultado"
         self._startup_loading = False
         self._restore_warning_shown = False  # Controla se o aviso já foi exibido
+        self._monitor_alerts = set()  # métricas atualmente acima do limite
+        self._throttle_interval = None  # intervalo de clock limitado em andamento
+        self._temp_preview_bytes = 0  # total da última prévia da limpeza (barra determinada)
+        self._disk_tree = None  # última DiskUsageTree analisada
+        self._disk_cancel = None
+        self._bench_cancel = None  # Event do benchmark de disco em execução
+        self._net_bench_cancel = None  # Event do benchmark de rede em execução
+        self._profile_cancel = None  # Event do perfil em execução (botão Aplicar perfil)
+        self._process_rules = None  # ProcessRulesEngine ativo (modo desempenho)
+        self._process_rules_stopping = None  # thread que desliga e restaura o modo desempenho
+        self.maintenance = None  # MaintenanceScheduler (manutenção automática quando ocioso)
+        self.runaway = None  # RunawayDetector da página de monitoramento
+        self.activity_log = ActivityLog()
+        # Mede a latência do event loop e registra travamentos da UI no log
+        self.ui_watchdog = UiStallWatchdog(self.activity_log, parent=self)
+        self.ui_watchdog.start()
         
         # Para arrastar a janela
         self._drag_pos = None
@@ -271,7 +314,8 @@ class MainWindow(QtWidgets.QMainWindow):
         content_v.setContentsMargins(12, 12, 12, 0)
         content_v.setSpacing(12)
 
-        self.log_panel = LogPanelWidget(self)
+        self.log_panel = LogPanelWidget(self, activity_log=self.activity_log)
+        self.log_panel.load_previous_session()
 
         content_h = QtWidgets.QHBoxLayout(); content_h.setSpacing(12)
         content_h.addWidget(self._create_sidebar())
@@ -279,6 +323,11 @@ class MainWindow(QtWidgets.QMainWindow):
         self.stack = QtWidgets.QStackedWidget()
         # Inicializa monitor e página de monitoramento
         self.monitor = Monitor()
+        # Um detector por janela: a página pode ser reconstruída sem abrir outra thread de leitura
+        self.runaway = RunawayDetector()
+        queued = QtCore.Qt.ConnectionType.QueuedConnection
+        self.runaway.start(interval=5.0, on_events=lambda events: QtCore.QMetaObject.invokeMethod(
+            self, "_handle_runaway_events", queued, QtCore.Q_ARG(object, events)))
         self.page_monitor = self.build_monitor_page()
         self.stack.addWidget(self.page_monitor)
         self.nav_buttons["Monitoramento"].setChecked(True)
@@ -306,7 +355,7 @@ class MainWindow(QtWidgets.QMainWindow):
         v.addWidget(logo); v.addSpacing(32)
 
         self.nav_buttons = {}
-        for name in ["Monitoramento", "Otimização", "inicialização"]:
+        for name in ["Monitoramento", "Otimização", "inicialização", "Disco", "Benchmark"]:
             btn = QtWidgets.QPushButton(name); btn.setFixedHeight(48); btn.setFlat(True); btn.setCheckable(True)
             btn.setStyleSheet("""
                 QPushButton{color:#cfcfcf;padding:12px 24px;text-align:left;font-size:15px;font-weight:500;border-radius:10px;margin:2px 16px;background:transparent;border:none;letter-spacing:0.3px;}
@@ -355,18 +404,20 @@ class MainWindow(QtWidgets.QMainWindow):
         pages = {
             'Monitoramento': ('page_monitor', self.build_monitor_page),
             'inicialização': ('page_startup', self.build_startup_page),
-            'Otimização': ('page_tweaks', self.build_tweaks_page)
+            'Otimização': ('page_tweaks', self.build_tweaks_page),
+            'Disco': ('page_disk', self.build_disk_page),
+            'Benchmark': ('page_bench', self.build_bench_page),
         }
         attr, builder = pages[name]
         if not hasattr(self, attr):
             try:
                 page_obj = builder(); setattr(self, attr, page_obj); self.stack.addWidget(page_obj)
             except Exception as e:
-                self.log_panel.append(f"Falha ao construir página '{name}': {e}"); return
+                self.log_panel.append(f"Falha ao construir página '{name}': {e}", event='error', page=name); return
         try:
             self.animate_stack_change(getattr(self, attr))
         except Exception as e:
-            self.log_panel.append(f"Falha ao trocar página '{name}': {e}")
+            self.log_panel.append(f"Falha ao trocar página '{name}': {e}", event='error', page=name)
 
     def animate_stack_change(self, widget):
         try:
@@ -394,6 +445,52 @@ class MainWindow(QtWidgets.QMainWindow):
         header_wrap.addWidget(header); header_wrap.addWidget(subtitle); header_wrap.addWidget(deco)
         root.addLayout(header_wrap)
 
+        # Perfil: todos os ajustes num só grafo de passos, executados em paralelo
+        profile_row = QtWidgets.QHBoxLayout(); profile_row.setSpacing(10)
+        self.btn_apply_profile = QtWidgets.QPushButton("⚡  APLICAR PERFIL"); self.btn_apply_profile.setCursor(QtCore.Qt.CursorShape.PointingHandCursor); self.btn_apply_profile.setFixedHeight(38)
+        self.btn_apply_profile.setToolTip("Executa todos os ajustes de uma vez; passos independentes rodam em paralelo")
+        self.btn_apply_profile.setStyleSheet(
+            "QPushButton{background:qlineargradient(x1:0,y1:0,x2:1,y2:0, stop:0 #c66bff, stop:1 #9f59ff);color:#fff;border:none;border-radius:11px;font-weight:600;letter-spacing:0.4px;font-size:13px;padding:8px 22px;}"
+            "QPushButton:hover{background:qlineargradient(x1:0,y1:0,x2:1,y2:0, stop:0 #d488ff, stop:1 #ae72ff);}"
+            "QPushButton:disabled{background:#2f2f33;color:#777;}"
+        )
+        self.btn_apply_profile.clicked.connect(self._apply_profile)
+        self.btn_cancel_profile = QtWidgets.QPushButton("CANCELAR"); self.btn_cancel_profile.setCursor(QtCore.Qt.CursorShape.PointingHandCursor); self.btn_cancel_profile.setFixedHeight(38); self.btn_cancel_profile.setEnabled(False)
+        self.btn_cancel_profile.setStyleSheet(
+            "QPushButton{background:rgba(255,255,255,0.06);color:#e7e7e9;font-weight:600;font-size:13px;border:1px solid rgba(255,255,255,0.10);padding:8px 18px;border-radius:11px;}"
+            "QPushButton:hover{background:rgba(255,255,255,0.10);} QPushButton:disabled{color:#666;}"
+        )
+        self.btn_cancel_profile.clicked.connect(self._cancel_profile)
+        self.btn_preview_profile = QtWidgets.QPushButton("PRÉVIA"); self.btn_preview_profile.setCursor(QtCore.Qt.CursorShape.PointingHandCursor); self.btn_preview_profile.setFixedHeight(38)
+        self.btn_preview_profile.setToolTip("Lê o estado atual e mostra no log o que o perfil mudaria, sem alterar nada")
+        self.btn_preview_profile.setStyleSheet(self.btn_cancel_profile.styleSheet())
+        self.btn_preview_profile.clicked.connect(self._preview_profile)
+        self.btn_undo_profile = QtWidgets.QPushButton("DESFAZER"); self.btn_undo_profile.setCursor(QtCore.Qt.CursorShape.PointingHandCursor); self.btn_undo_profile.setFixedHeight(38)
+        self.btn_undo_profile.setToolTip("Volta ao valor anterior tudo o que a última execução (perfil ou ajuste) alterou")
+        self.btn_undo_profile.setStyleSheet(self.btn_cancel_profile.styleSheet())
+        self.btn_undo_profile.clicked.connect(self._undo_last_session)
+        self.btn_measure_profile = QtWidgets.QPushButton("MEDIR IMPACTO"); self.btn_measure_profile.setCursor(QtCore.Qt.CursorShape.PointingHandCursor); self.btn_measure_profile.setFixedHeight(38)
+        self.btn_measure_profile.setToolTip("Aplica o perfil um ajuste por vez, medindo CPU, memória, disco e rede antes e depois de cada um")
+        self.btn_measure_profile.setStyleSheet(self.btn_cancel_profile.styleSheet())
+        self.btn_measure_profile.clicked.connect(self._measure_profile)
+        self.profile_status = QtWidgets.QLabel(""); self.profile_status.setStyleSheet("color:#7d7d85;font-size:12px;")
+        profile_row.addWidget(self.btn_apply_profile); profile_row.addWidget(self.btn_preview_profile); profile_row.addWidget(self.btn_undo_profile); profile_row.addWidget(self.btn_measure_profile); profile_row.addWidget(self.btn_cancel_profile); profile_row.addWidget(self.profile_status, 1)
+        root.addLayout(profile_row)
+
+        # Modo desempenho: prioridade/afinidade por regra nos processos que forem abrindo
+        perf_row = QtWidgets.QHBoxLayout(); perf_row.setSpacing(10)
+        self.btn_perf_mode = QtWidgets.QPushButton("MODO DESEMPENHO"); self.btn_perf_mode.setCursor(QtCore.Qt.CursorShape.PointingHandCursor); self.btn_perf_mode.setFixedHeight(38)
+        self.btn_perf_mode.setCheckable(True)
+        self.btn_perf_mode.setToolTip("Aplica as regras de prioridade e núcleos (process_rules.json) aos processos que abrirem; desligar desfaz tudo")
+        self.btn_perf_mode.setStyleSheet(self.btn_cancel_profile.styleSheet() + "QPushButton:checked{background:rgba(159,89,255,0.35);border:1px solid #9f59ff;}")
+        self.btn_perf_mode.toggled.connect(self._toggle_performance_mode)
+        self.perf_boost = QtWidgets.QCheckBox("Impulsionar app em primeiro plano")
+        self.perf_boost.setToolTip("Sobe a prioridade do programa com a janela ativa enquanto ele estiver em foco")
+        self.perf_boost.setStyleSheet("QCheckBox{color:#b9b9c5;font-size:12px;background:transparent;border:none;}")
+        self.perf_status = QtWidgets.QLabel(""); self.perf_status.setStyleSheet("color:#7d7d85;font-size:12px;")
+        perf_row.addWidget(self.btn_perf_mode); perf_row.addWidget(self.perf_boost); perf_row.addWidget(self.perf_status, 1)
+        root.addLayout(perf_row)
+
         scroll = QtWidgets.QScrollArea(); scroll.setWidgetResizable(True); scroll.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
         scroll.setStyleSheet("QScrollArea{background:transparent;border:none;} QScrollBar:vertical{background:transparent;width:10px;margin:0;} QScrollBar::handle:vertical{background:rgba(159,89,255,0.45);min-height:26px;border-radius:5px;} QScrollBar::handle:vertical:hover{background:rgba(159,89,255,0.75);} QScrollBar::add-line:vertical,QScrollBar::sub-line:vertical{height:0;} QScrollBar::add-page:vertical,QScrollBar::sub-page:vertical{background:transparent;}")
         inner = QtWidgets.QWidget(); inner.setStyleSheet("background:transparent;")
@@ -409,6 +506,7 @@ class MainWindow(QtWidgets.QMainWindow):
             ("Otimizar Serviços", "Desativa serviços pouco usados", optimize_services, "🛠"),
             ("Reduzir Efeitos Visuais", "Simplifica animações e transparências", disable_visual_effects, "🎨"),
             ("Desativar Programas Inúteis", "Remove inicialização de apps comuns", disable_useless_programs, "🚫"),
+            ("Arquivos Duplicados", "Encontra cópias idênticas e libera espaço", find_duplicates, "🗂"),
         ]
 
         col_count = 3
@@ -441,7 +539,23 @@ class MainWindow(QtWidgets.QMainWindow):
             progress_lbl = QtWidgets.QLabel("")
             progress_lbl.setStyleSheet("color:#7d7d85;font-size:11px;")
 
-            def make_runner(f, t, b, pl):
+            # Limpeza: barra de progresso e prévia (dry-run) por pasta
+            progress_bar = None
+            preview_btn = None
+            if func is clean_temp_files:
+                progress_bar = QtWidgets.QProgressBar(); progress_bar.setFixedHeight(6); progress_bar.setTextVisible(False); progress_bar.setVisible(False)
+                progress_bar.setStyleSheet(
+                    "QProgressBar{background:rgba(255,255,255,0.06);border:none;border-radius:3px;}"
+                    "QProgressBar::chunk{background:qlineargradient(x1:0,y1:0,x2:1,y2:0, stop:0 #c66bff, stop:1 #9f59ff);border-radius:3px;}"
+                )
+                preview_btn = QtWidgets.QPushButton("PRÉ-VISUALIZAR")
+                preview_btn.setCursor(QtCore.Qt.CursorShape.PointingHandCursor); preview_btn.setFixedHeight(30)
+                preview_btn.setStyleSheet(
+                    "QPushButton{background:rgba(255,255,255,0.05);color:#cfcfcf;border:1px solid rgba(255,255,255,0.10);border-radius:9px;font-weight:600;letter-spacing:0.4px;font-size:11px;}"
+                    "QPushButton:hover{background:rgba(255,255,255,0.09);color:#fff;} QPushButton:disabled{color:#666;}"
+                )
+
+            def make_runner(f, t, b, pl, pb=None):
                 def run():
                     if b.isEnabled():
                         # Verificar se é admin
@@ -464,26 +578,50 @@ class MainWindow(QtWidgets.QMainWindow):
                         b.setEnabled(False)
                         pl.setText("Executando...")
                         pl.setStyleSheet("color:#7d7d85;font-size:11px;")
-                        self.log_panel.append(f"Iniciando: {t}")
+                        self.log_panel.append(f"Iniciando: {t}", event='tweak_start', tweak=t)
+                        if pb is not None:
+                            # Com prévia feita a barra é proporcional; sem ela fica indeterminada
+                            pb.setRange(0, 1000 if self._temp_preview_bytes else 0); pb.setValue(0); pb.setVisible(True)
                         
                         def job():
                             try:
-                                f()
-                                self.log_panel.append(f"✓ Concluído: {t}")
+                                # Cada clique é uma sessão do diário (desfeita pelo DESFAZER)
+                                with get_journal().session(t):
+                                    result = f(progress=self._cleanup_progress_callback(pb, pl)) if pb is not None else f()
+                                self.log_panel.append(f"✓ Concluído: {t}", event='tweak_finish', tweak=t, ok=True)
+                                if isinstance(result, dict) and 'bytes_freed' in result:
+                                    self.log_panel.append(
+                                        f"  {format_bytes(result['bytes_freed'])} liberados • {result['files_removed']} arquivos removidos • "
+                                        f"{result['files_skipped']} em uso • {result['elapsed_s']:.1f}s",
+                                        event='cleanup_report', tweak=t, **{k: v for k, v in result.items() if k != 'errors'},
+                                    )
                                 QtCore.QMetaObject.invokeMethod(pl, 'setText', QtCore.Qt.ConnectionType.QueuedConnection, QtCore.Q_ARG(str, "✓ Concluído"))
                                 QtCore.QMetaObject.invokeMethod(pl, 'setStyleSheet', QtCore.Qt.ConnectionType.QueuedConnection, QtCore.Q_ARG(str, "color:#00ff88;font-size:11px;font-weight:600;"))
                             except Exception as e:
                                 error_msg = str(e)
-                                self.log_panel.append(f"✗ Erro em {t}: {error_msg}")
+                                self.log_panel.append(f"✗ Erro em {t}: {error_msg}", event='tweak_finish', tweak=t, ok=False, error=error_msg)
                                 QtCore.QMetaObject.invokeMethod(pl, 'setText', QtCore.Qt.ConnectionType.QueuedConnection, QtCore.Q_ARG(str, f"✗ Erro: {error_msg[:30]}..."))
                                 QtCore.QMetaObject.invokeMethod(pl, 'setStyleSheet', QtCore.Qt.ConnectionType.QueuedConnection, QtCore.Q_ARG(str, "color:#ff4444;font-size:11px;font-weight:600;"))
                             finally:
+                                if pb is not None:
+                                    self._temp_preview_bytes = 0
+                                    QtCore.QMetaObject.invokeMethod(pb, 'setVisible', QtCore.Qt.ConnectionType.QueuedConnection, QtCore.Q_ARG(bool, False))
                                 QtCore.QMetaObject.invokeMethod(b, 'setEnabled', QtCore.Qt.ConnectionType.QueuedConnection, QtCore.Q_ARG(bool, True))
                         threading.Thread(target=job, daemon=True).start()
                 return run
-            btn.clicked.connect(make_runner(func, title, btn, progress_lbl))
+            if func is find_duplicates:
+                # Não é um ajuste do sistema: abre o localizador (sem exigir admin)
+                btn.setText("PROCURAR")
+                btn.clicked.connect(self._open_duplicates_dialog)
+            else:
+                btn.clicked.connect(make_runner(func, title, btn, progress_lbl, progress_bar))
 
             v.addWidget(btn)
+            if preview_btn is not None:
+                preview_btn.clicked.connect(lambda _=False, pb=preview_btn, bar=progress_bar, pl=progress_lbl: self._preview_temp_cleanup(pb, bar, pl))
+                v.addWidget(preview_btn)
+            if progress_bar is not None:
+                v.addWidget(progress_bar)
             v.addWidget(progress_lbl)
             inner_layout.addWidget(card, r, c)
             self._tweak_buttons[title] = (btn, progress_lbl)
@@ -492,11 +630,387 @@ class MainWindow(QtWidgets.QMainWindow):
         inner_layout.setColumnStretch(col_count, 1)
         return page
 
+    def _confirm_profile_run(self):
+        """Checagens antes de aplicar o perfil: administrador e aviso do ponto de restauração."""
+        if self._profile_cancel is not None:
+            return False
+        if not is_admin():
+            QtWidgets.QMessageBox.warning(
+                self,
+                "Permissão Necessária",
+                "Esta otimização requer privilégios de administrador.\n\n"
+                "Por favor, execute o Cloud Optimizer como administrador."
+            )
+            return False
+        if not self._restore_warning_shown:
+            dialog = RestorePointWarningDialog(self)
+            if dialog.exec() != QtWidgets.QDialog.DialogCode.Accepted:
+                return False
+            self._restore_warning_shown = True
+        return True
+
+    def _apply_profile(self):
+        if not self._confirm_profile_run():
+            return
+        try:
+            steps = profile_steps()
+        except Exception as e:
+            self.log_panel.append(f"Erro ao montar perfil: {e}", event='error'); return
+        self._profile_cancel = threading.Event(); cancel = self._profile_cancel
+        self.btn_apply_profile.setEnabled(False); self.btn_cancel_profile.setEnabled(True)
+        self.profile_status.setText(f"Executando 0/{len(steps)} passos...")
+        self.log_panel.append(f"Aplicando perfil ({len(steps)} passos)...", event='profile_start', steps=len(steps))
+        queued = QtCore.Qt.ConnectionType.QueuedConnection
+
+        def on_progress(ev):
+            if ev['status'] == 'start':
+                return
+            text = f"Executando {ev['done']}/{ev['total']} passos • {ev['elapsed_s']:.1f}s"
+            QtCore.QMetaObject.invokeMethod(self.profile_status, 'setText', queued, QtCore.Q_ARG(str, text))
+
+        def job():
+            try:
+                with get_journal().session("Perfil"):
+                    result = TweakEngine(max_workers=8).run(steps, on_progress, cancel)
+            except Exception as exc:
+                result = {"error": exc}
+            QtCore.QMetaObject.invokeMethod(self, "_handle_profile_result", queued, QtCore.Q_ARG(object, result))
+
+        threading.Thread(target=job, daemon=True).start()
+
+    def _measure_profile(self):
+        if not self._confirm_profile_run():
+            return
+        try:
+            groups = profile_groups()
+        except Exception as e:
+            self.log_panel.append(f"Erro ao montar perfil: {e}", event='error'); return
+        answer = QtWidgets.QMessageBox.question(
+            self,
+            "Medir impacto",
+            f"O perfil será aplicado um ajuste por vez ({len(groups)} ajustes), com uma bateria de testes "
+            f"antes e depois de cada um. Leva cerca de {len(groups) + 1} × 10 segundos; "
+            "feche outros programas para não atrapalhar a medição.\n\nContinuar?",
+        )
+        if answer != QtWidgets.QMessageBox.StandardButton.Yes:
+            return
+        self._profile_cancel = threading.Event(); cancel = self._profile_cancel
+        self.btn_apply_profile.setEnabled(False); self.btn_measure_profile.setEnabled(False); self.btn_cancel_profile.setEnabled(True)
+        self.profile_status.setText("Medindo: linha de base...")
+        self.log_panel.append(f"Medindo impacto do perfil ({len(groups)} ajustes)...", event='impact_start', tweaks=[name for name, _ in groups])
+        queued = QtCore.Qt.ConnectionType.QueuedConnection
+
+        def on_progress(ev):
+            stage = "linha de base" if ev['stage'] == 'baseline' else ev['stage']
+            text = f"Medindo: {stage} • {ev['done']}/{ev['total']} testes" if ev['total'] else f"Aplicando: {stage}..."
+            QtCore.QMetaObject.invokeMethod(self.profile_status, 'setText', queued, QtCore.Q_ARG(str, text))
+
+        def job():
+            engine = TweakEngine(max_workers=8)
+            stages = [(name, lambda steps=steps: engine.run(steps, cancel=cancel)) for name, steps in groups]
+            try:
+                with get_journal().session("Perfil (medido)"):
+                    result = measure_impact(stages, progress=on_progress, cancel=cancel)
+            except Exception as exc:
+                result = {"error": exc}
+            QtCore.QMetaObject.invokeMethod(self, "_handle_impact_result", queued, QtCore.Q_ARG(object, result))
+
+        threading.Thread(target=job, daemon=True).start()
+
+    @QtCore.pyqtSlot(object)
+    def _handle_impact_result(self, report):
+        self._profile_cancel = None
+        self.btn_apply_profile.setEnabled(True); self.btn_measure_profile.setEnabled(True); self.btn_cancel_profile.setEnabled(False)
+        if report.get("error"):
+            self.profile_status.setText(f"✗ Erro: {report['error']}")
+            self.log_panel.append(f"✗ Erro ao medir impacto: {report['error']}", event='error'); return
+
+        def line(cmp):
+            return (f"{cmp['description']}: {cmp['before']:.1f} → {cmp['after']:.1f} {cmp['unit']} "
+                    f"({cmp['change_pct']:+.1f}%, IC 95% {cmp['ci_low']:+.1f}% a {cmp['ci_high']:+.1f}%) {cmp['verdict']}")
+
+        for stage in report['stages']:
+            result = stage['result'] or {}
+            failed = stage['error'] or ', '.join(result.get('failed', []))
+            gains = {k: c for k, c in stage['comparison'].items() if c['verdict'] != 'sem diferença'}
+            note = f" (falhas: {failed})" if failed else ""
+            self.log_panel.append(f"Impacto de {stage['name']}{note}: " + (f"{len(gains)} testes mudaram" if gains else "nenhuma diferença medida"),
+                                  event='impact_tweak', tweak=stage['name'], error=failed or None,
+                                  changes={k: round(c['change_pct'], 2) for k, c in gains.items()})
+            for name, cmp in gains.items():
+                self.log_panel.append(f"  • {line(cmp)}", event='impact_metric', tweak=stage['name'], metric=name,
+                                      change_pct=round(cmp['change_pct'], 2), ci_low=round(cmp['ci_low'], 2),
+                                      ci_high=round(cmp['ci_high'], 2), verdict=cmp['verdict'])
+        self.log_panel.append("Impacto total do perfil:", event='impact_total_start')
+        for name, cmp in report['total'].items():
+            self.log_panel.append(f"  • {line(cmp)}", event='impact_metric', tweak=None, metric=name, change_pct=round(cmp['change_pct'], 2),
+                                  ci_low=round(cmp['ci_low'], 2), ci_high=round(cmp['ci_high'], 2), verdict=cmp['verdict'])
+        better = sum(c['verdict'] == 'melhor' for c in report['total'].values())
+        worse = sum(c['verdict'] == 'pior' for c in report['total'].values())
+        cancelled = report['baseline']['cancelled'] or any(s['suite']['cancelled'] for s in report['stages'])
+        summary = f"{better} melhores • {worse} piores • {len(report['total']) - better - worse} sem diferença • {report['elapsed_s']:.0f}s"
+        prefix = "Cancelado" if cancelled else "✓ Impacto medido"
+        self.profile_status.setText(f"{prefix}: {summary}")
+        self.log_panel.append(f"{prefix}: {summary}", event='impact_finish', better=better, worse=worse, cancelled=cancelled,
+                              elapsed_s=round(report['elapsed_s'], 3))
+
+    def _toggle_performance_mode(self, enabled):
+        if not enabled:
+            if self._process_rules is None:
+                return
+            engine, self._process_rules = self._process_rules, None
+            # stop() espera a rodada em andamento e restaura processo por processo: fora da UI thread
+            self.btn_perf_mode.setEnabled(False)
+            self.perf_status.setText("Desligando e restaurando processos...")
+            queued = QtCore.Qt.ConnectionType.QueuedConnection
+
+            def job():
+                try:
+                    result = dict(engine.stop(restore=True), stats=dict(engine.stats), error=None)
+                except Exception as e:
+                    result = {"restored": 0, "failed": [], "stats": dict(engine.stats), "error": e}
+                QtCore.QMetaObject.invokeMethod(self, "_handle_performance_mode_stopped", queued, QtCore.Q_ARG(object, result))
+
+            self._process_rules_stopping = threading.Thread(target=job, daemon=True)
+            self._process_rules_stopping.start()
+            return
+        try:
+            rules = load_rules()
+            engine = ProcessRulesEngine(rules, foreground_boost=self.perf_boost.isChecked())
+        except Exception as e:
+            self.log_panel.append(f"Erro ao iniciar modo desempenho: {e}", event='error')
+            self.btn_perf_mode.blockSignals(True); self.btn_perf_mode.setChecked(False); self.btn_perf_mode.blockSignals(False)
+            return
+        self._process_rules = engine
+        self.perf_boost.setEnabled(False)
+        self.perf_status.setText(f"Ativo • {len(engine.rules)} regras")
+        self.log_panel.append(f"Modo desempenho ligado ({len(engine.rules)} regras" + (", impulso em primeiro plano)" if engine.foreground_boost else ")"),
+                              event='process_rules_start', rules=[r.name for r in engine.rules], foreground_boost=engine.foreground_boost)
+        lowering = [r.name for r in engine.rules if r.priority in ('idle', 'below_normal')]
+        if lowering and os.name != 'nt' and hasattr(os, 'geteuid') and os.geteuid() != 0:
+            # Sem root o kernel só deixa aumentar o nice: o que for rebaixado não volta ao desligar
+            self.log_panel.append(f"Aviso: sem root, a prioridade rebaixada por {', '.join(lowering)} não poderá ser restaurada ao desligar",
+                                  event='process_rules_warning', rules=lowering)
+        queued = QtCore.Qt.ConnectionType.QueuedConnection
+
+        def on_events(events):
+            QtCore.QMetaObject.invokeMethod(self, "_handle_process_rule_events", queued, QtCore.Q_ARG(object, events))
+
+        engine.start(interval=2.0, on_events=on_events)
+
+    @QtCore.pyqtSlot(object)
+    def _handle_performance_mode_stopped(self, result):
+        self._process_rules_stopping = None
+        self.btn_perf_mode.setEnabled(True)
+        self.perf_boost.setEnabled(True)
+        if result["error"] is not None:
+            self.perf_status.setText("Desligado • erro ao restaurar")
+            self.log_panel.append(f"Erro ao restaurar processos do modo desempenho: {result['error']}", event='error')
+            return
+        restored, failed, stats = result["restored"], result["failed"], result["stats"]
+        for f in failed:
+            self.log_panel.append(f"Não foi possível restaurar {f['name']} (PID {f['pid']}): {f['error']}", event='process_rules_restore_failed',
+                                  pid=f['pid'], name=f['name'], error=f['error'])
+        status = f"Desligado • {restored} processos restaurados"
+        if failed:
+            status += f", {len(failed)} sem restaurar (veja o log)"
+        self.perf_status.setText(status)
+        self.log_panel.append(f"Modo desempenho desligado: {restored} processos voltaram ao original" + (f", {len(failed)} falharam" if failed else ""),
+                              event='process_rules_stop', restored=restored, failed=len(failed), applied=stats['applied'], ticks=stats['ticks'])
+
+    @QtCore.pyqtSlot(object)
+    def _handle_process_rule_events(self, events):
+        engine = self._process_rules
+        if engine is None:
+            return
+        # A primeira rodada pega todos os processos já abertos: resume em vez de uma linha por processo
+        initial = [ev for ev in events if ev.get('initial')]
+        if len(initial) > 10:
+            failed = sum(bool(ev['errors']) for ev in initial)
+            self.log_panel.append(f"  • Regras aplicadas a {len(initial)} processos já abertos ({failed} com erro)",
+                                  event='process_rule_applied', count=len(initial), failed=failed)
+            events = [ev for ev in events if not ev.get('initial')]
+        for ev in events:
+            errors = "; ".join(ev.get('errors') or [])
+            if ev['event'] == 'process_rule_applied':
+                what = ", ".join(x for x in (ev['priority'] and f"prioridade {ev['priority']}",
+                                             ev['cores'] is not None and f"núcleos {ev['cores']}") if x)
+                text = f"  • {ev['name']} ({ev['pid']}) → {ev['rule']}: {what}" + (f" ✗ {errors}" if errors else "")
+            elif ev['event'] == 'foreground_boost':
+                text = f"  • Primeiro plano: {ev['name']} ({ev['pid']})" + (f" ✗ {errors}" if errors else " impulsionado")
+            elif ev['event'] == 'foreground_unboost':
+                text = f"  • {ev['name']} ({ev['pid']}) saiu do primeiro plano"
+            else:
+                text = f"  ✗ Modo desempenho: {errors}"
+            self.log_panel.append(text, **{k: v for k, v in ev.items() if k != 'errors'}, error=errors or None)
+        self.perf_status.setText(f"Ativo • {len(engine.rules)} regras • {engine.stats['applied']} ajustes • {engine.stats['processes']} processos")
+
+    def _preview_profile(self):
+        if self._profile_cancel is not None:
+            return
+        self.btn_preview_profile.setEnabled(False)
+        self.profile_status.setText("Lendo estado atual...")
+        queued = QtCore.Qt.ConnectionType.QueuedConnection
+
+        def job():
+            try:
+                result = {"preview": preview_profile()}
+            except Exception as exc:
+                result = {"error": exc}
+            QtCore.QMetaObject.invokeMethod(self, "_handle_profile_preview", queued, QtCore.Q_ARG(object, result))
+
+        threading.Thread(target=job, daemon=True).start()
+
+    @QtCore.pyqtSlot(object)
+    def _handle_profile_preview(self, result):
+        self.btn_preview_profile.setEnabled(True)
+        if result.get("error"):
+            self.profile_status.setText(f"✗ Erro: {result['error']}")
+            self.log_panel.append(f"✗ Erro na prévia do perfil: {result['error']}", event='error'); return
+        def show(value):
+            if value is None:
+                return "desconhecido"
+            return value.hex(' ') if isinstance(value, bytes) else str(value)
+
+        total = 0
+        self.log_panel.append("Prévia do perfil (nada foi alterado):", event='profile_preview_start')
+        for tweak, changes in result["preview"].items():
+            if isinstance(changes, dict):
+                self.log_panel.append(f"  ? {tweak}: leitura falhou ({changes['error']})", event='profile_preview_error', tweak=tweak, error=changes['error'])
+                continue
+            for change in changes:
+                self.log_panel.append(f"  • {change['description']}: {show(change['current'])} → {show(change['desired'])}", event='profile_preview_change',
+                                      tweak=tweak, key=change['key'], current=show(change['current']), desired=show(change['desired']))
+            total += len(changes)
+        summary = f"{total} configurações a alterar" if total else "Nada a alterar: o sistema já está no perfil"
+        self.profile_status.setText(f"Prévia: {summary}")
+        self.log_panel.append(f"Prévia: {summary}", event='profile_preview', changes=total)
+
+    def _undo_last_session(self):
+        if self._profile_cancel is not None:
+            return
+        sessions = [s for s in get_journal().sessions() if s['pending']]
+        if not sessions:
+            self.profile_status.setText("Nada para desfazer")
+            return
+        last = sessions[0]
+        answer = QtWidgets.QMessageBox.question(
+            self,
+            "Desfazer alterações",
+            f"Voltar os valores anteriores de {last['pending']} alterações de \"{last['label']}\" "
+            f"({', '.join(last['tweaks'])})?",
+        )
+        if answer != QtWidgets.QMessageBox.StandardButton.Yes:
+            return
+        self.btn_undo_profile.setEnabled(False)
+        self.profile_status.setText("Desfazendo...")
+        self.log_panel.append(f"Desfazendo: {last['label']}", event='rollback_start', session=last['session'], entries=last['pending'])
+        queued = QtCore.Qt.ConnectionType.QueuedConnection
+
+        def job():
+            try:
+                result = rollback(last['session'])
+            except Exception as exc:
+                result = {"error": exc}
+            QtCore.QMetaObject.invokeMethod(self, "_handle_rollback_result", queued, QtCore.Q_ARG(object, result))
+
+        threading.Thread(target=job, daemon=True).start()
+
+    @QtCore.pyqtSlot(object)
+    def _handle_rollback_result(self, report):
+        self.btn_undo_profile.setEnabled(True)
+        if report.get("error"):
+            self.profile_status.setText(f"✗ Erro: {report['error']}")
+            self.log_panel.append(f"✗ Erro ao desfazer: {report['error']}", event='error'); return
+        for error in report['errors']:
+            self.log_panel.append(f"  ✗ {error}", event='rollback_error', error=error)
+        summary = f"{report['reverted']} restaurados • {report['skipped']} já no original • {report['elapsed_s']:.1f}s"
+        prefix = "✓ Desfeito" if not report['errors'] else "Desfeito com falhas"
+        self.profile_status.setText(f"{prefix}: {summary}")
+        self.log_panel.append(f"{prefix}: {summary}", event='rollback_finish', session=report['session'], reverted=report['reverted'],
+                              skipped=report['skipped'], errors=len(report['errors']), elapsed_s=round(report['elapsed_s'], 3))
+
+    def _cancel_profile(self):
+        if self._profile_cancel is not None:
+            self._profile_cancel.set()
+            self.btn_cancel_profile.setEnabled(False)
+            self.profile_status.setText("Cancelando (aguardando passos em andamento)...")
+
+    @QtCore.pyqtSlot(object)
+    def _handle_profile_result(self, report):
+        self._profile_cancel = None
+        self.btn_apply_profile.setEnabled(True); self.btn_cancel_profile.setEnabled(False)
+        if report.get("error"):
+            self.profile_status.setText(f"✗ Erro: {report['error']}")
+            self.log_panel.append(f"✗ Erro ao aplicar perfil: {report['error']}", event='error'); return
+        counts = {}
+        for step in report['steps'].values():
+            counts[step['status']] = counts.get(step['status'], 0) + 1
+        parts = [f"{counts.get('ok', 0)} ok"] + [f"{n} {k}" for k, n in sorted(counts.items()) if k != 'ok']
+        summary = f"{' • '.join(parts)} • {report['elapsed_s']:.1f}s"
+        prefix = "Cancelado" if report['cancelled'] else ("✓ Perfil aplicado" if report['ok'] else "Perfil com falhas")
+        self.profile_status.setText(f"{prefix}: {summary}")
+        for name in report['failed']:
+            step = report['steps'][name]
+            self.log_panel.append(f"  ✗ {name}: {step['error'] or step['status']}", event='profile_step_failed', step=name,
+                                  status=step['status'], error=step['error'])
+        self.log_panel.append(f"{prefix}: {summary}", event='profile_finish', ok=report['ok'], cancelled=report['cancelled'],
+                              elapsed_s=round(report['elapsed_s'], 3), statuses=counts)
+
+    def _cleanup_progress_callback(self, bar, label):
+        """Callback (chamado em threads de trabalho) que atualiza barra e texto do cartão."""
+        queued = QtCore.Qt.ConnectionType.QueuedConnection
+
+        def on_progress(ev):
+            total = self._temp_preview_bytes
+            if ev.get('phase') == 'delete':
+                text = f"{format_bytes(ev['bytes_freed'])} liberados • {ev['files_removed']} arquivos"
+                if total and bar is not None:
+                    QtCore.QMetaObject.invokeMethod(bar, 'setValue', queued, QtCore.Q_ARG(int, min(1000, int(ev['bytes_scanned'] * 1000 / total))))
+            else:
+                text = f"Analisando: {ev['files_scanned']} arquivos • {format_bytes(ev['bytes_scanned'])}"
+            QtCore.QMetaObject.invokeMethod(label, 'setText', queued, QtCore.Q_ARG(str, text))
+        return on_progress
+
+    def _preview_temp_cleanup(self, btn, bar, label):
+        """Simula a limpeza e mostra quanto cada pasta liberaria, sem apagar nada."""
+        if not btn.isEnabled():
+            return
+        btn.setEnabled(False)
+        bar.setRange(0, 0); bar.setVisible(True)
+        label.setStyleSheet("color:#7d7d85;font-size:11px;")
+        self.log_panel.append("Pré-visualizando limpeza de temporários...", event='cleanup_preview_start')
+        queued = QtCore.Qt.ConnectionType.QueuedConnection
+
+        def job():
+            try:
+                preview = clean_temp_files(dry_run=True, progress=self._cleanup_progress_callback(bar, label))
+                for folder, totals in sorted(preview['folders'].items(), key=lambda kv: -kv[1]['bytes']):
+                    self.log_panel.append(f"  {folder}: {format_bytes(totals['bytes'])} em {totals['files']} arquivos",
+                                          event='cleanup_preview', folder=folder, **totals)
+                self._temp_preview_bytes = preview['total_bytes']
+                summary = f"Recuperável: {format_bytes(preview['total_bytes'])} ({preview['total_files']} arquivos)"
+                self.log_panel.append(summary, event='cleanup_preview_total', bytes=preview['total_bytes'], files=preview['total_files'])
+                QtCore.QMetaObject.invokeMethod(label, 'setText', queued, QtCore.Q_ARG(str, summary))
+            except Exception as e:
+                self.log_panel.append(f"Erro na pré-visualização da limpeza: {e}", event='error')
+            finally:
+                QtCore.QMetaObject.invokeMethod(bar, 'setVisible', queued, QtCore.Q_ARG(bool, False))
+                QtCore.QMetaObject.invokeMethod(btn, 'setEnabled', queued, QtCore.Q_ARG(bool, True))
+
+        threading.Thread(target=job, daemon=True).start()
+
+    def _open_duplicates_dialog(self):
+        try:
+            DuplicatesDialog(self, self.log_panel).exec()
+        except Exception as e:
+            self.log_panel.append(f"Erro ao abrir localizador de duplicados: {e}", event='error')
+
     def _run_tweak_safe(self, func, title):
         try:
-            func(); self.log_panel.append(f"Concluído: {title}")
+            func(); self.log_panel.append(f"Concluído: {title}", event='tweak_finish', tweak=title, ok=True)
         except Exception as e:
-            self.log_panel.append(f"Erro em {title}: {e}")
+            self.log_panel.append(f"Erro em {title}: {e}", event='tweak_finish', tweak=title, ok=False, error=str(e))
 
     def build_monitor_page(self):
         # Wrapper com scroll
@@ -511,7 +1025,22 @@ class MainWindow(QtWidgets.QMainWindow):
         scroll.setWidget(content_widget); outer_layout.addWidget(scroll)
         header = QtWidgets.QHBoxLayout(); header.setContentsMargins(0,0,0,24)
         title = QtWidgets.QLabel("MONITORAMENTO <span style='color:#9900ff;'>DO PC</span>"); title.setTextFormat(QtCore.Qt.TextFormat.RichText); title.setStyleSheet("font-size:26px;font-weight:600;color:#e6e6e6;")
-        header.addWidget(title); header.addStretch(); layout.addLayout(header)
+        header.addWidget(title); header.addStretch()
+        # Manutenção automática: limpeza, índice e duplicados quando o PC fica ocioso
+        self.maintenance_status = QtWidgets.QLabel(""); self.maintenance_status.setStyleSheet("color:#7d7d85;font-size:12px;")
+        self.maintenance_toggle = QtWidgets.QCheckBox("Manutenção automática quando ocioso")
+        config = load_maintenance_config()
+        self.maintenance_toggle.setToolTip(
+            f"Com CPU abaixo de {config['cpu_pct']:.0f}% e disco abaixo de {config['disk_mb_s']:.0f} MB/s por "
+            f"{config['idle_for_s']:.0f} s, limpa temporários, reconstrói o índice e procura duplicados em prioridade baixa; "
+            "pausa assim que o PC volta a ser usado"
+        )
+        self.maintenance_toggle.setStyleSheet("QCheckBox{color:#b9b9c5;font-size:12px;background:transparent;border:none;}")
+        self.maintenance_toggle.setChecked(config['enabled'])
+        self.maintenance_toggle.toggled.connect(self._toggle_maintenance)
+        header.addWidget(self.maintenance_status); header.addWidget(self.maintenance_toggle); layout.addLayout(header)
+        if config['enabled']:
+            self._toggle_maintenance(True, save=False)
         # Removidos cards de CPU e RAM - agora mostrados no gráfico
         grid = QtWidgets.QGridLayout()
         grid.setSpacing(14)
@@ -521,6 +1050,9 @@ class MainWindow(QtWidgets.QMainWindow):
             ("Temp", "0°C", "Temperatura CPU"),
             ("Disco", "0 MB/s", "Atividade do disco"),
             ("Rede", "0 Mb/s", "Uso de rede"),
+            ("Memória", "0 GB livres", "Memória disponível"),
+            ("Swap", "0 MB/s", "Troca com o disco"),
+            ("Clock", "0 GHz", "Clock da CPU"),
         ]
         self.monitor_values = {}
         self.monitor_cards = {}
@@ -611,6 +1143,39 @@ class MainWindow(QtWidgets.QMainWindow):
         grid.setColumnStretch(2, 1)
         layout.addLayout(grid)
 
+        # Processos descontrolados: memória crescendo sem parar ou CPU presa no máximo
+        runaway_wrap = QtWidgets.QHBoxLayout(); runaway_wrap.setContentsMargins(12,0,12,0)
+        runaway_card = QtWidgets.QFrame(); runaway_card.setObjectName("runawayCard")
+        runaway_card.setStyleSheet("QFrame#runawayCard{background:#0f1113;border-radius:12px;}")
+        runaway_layout = QtWidgets.QVBoxLayout(runaway_card); runaway_layout.setContentsMargins(18,14,18,14); runaway_layout.setSpacing(10)
+        runaway_top = QtWidgets.QHBoxLayout(); runaway_top.setSpacing(8)
+        runaway_title = QtWidgets.QLabel("PROCESSOS DESCONTROLADOS"); runaway_title.setStyleSheet("color:#e6e6e6;font-size:13px;font-weight:600;letter-spacing:0.4px;")
+        self.runaway_status = QtWidgets.QLabel("Nenhum processo suspeito"); self.runaway_status.setStyleSheet("color:#7d7d85;font-size:12px;")
+        runaway_top.addWidget(runaway_title); runaway_top.addWidget(self.runaway_status, 1)
+        small_btn = ("QPushButton{background:rgba(255,255,255,0.06);color:#e7e7e9;font-weight:600;font-size:12px;border:1px solid rgba(255,255,255,0.10);padding:6px 12px;border-radius:9px;}"
+                     "QPushButton:hover{background:rgba(255,255,255,0.10);} QPushButton:disabled{color:#666;}")
+        for label, action, tip in (
+            ("SUSPENDER", 'suspend', "Congela o processo até ser retomado"),
+            ("RETOMAR", 'resume', "Continua um processo suspenso"),
+            ("BAIXAR PRIORIDADE", 'lower_priority', "Deixa o processo só com a CPU que sobrar"),
+            ("ENCERRAR", 'terminate', "Fecha o processo (dados não salvos são perdidos)"),
+        ):
+            btn = QtWidgets.QPushButton(label); btn.setCursor(QtCore.Qt.CursorShape.PointingHandCursor); btn.setToolTip(tip); btn.setStyleSheet(small_btn)
+            btn.clicked.connect(lambda _=False, a=action: self._runaway_action(a)); runaway_top.addWidget(btn)
+        runaway_layout.addLayout(runaway_top)
+        self.runaway_table = QtWidgets.QTreeWidget(); self.runaway_table.setColumnCount(5); self.runaway_table.setRootIsDecorated(False)
+        self.runaway_table.setHeaderLabels(["Processo", "PID", "Motivo", "Memória", "CPU"]); self.runaway_table.setUniformRowHeights(True)
+        self.runaway_table.header().setSectionResizeMode(0, QtWidgets.QHeaderView.ResizeMode.Stretch)
+        for col in range(1, 5):
+            self.runaway_table.header().setSectionResizeMode(col, QtWidgets.QHeaderView.ResizeMode.ResizeToContents)
+        self.runaway_table.setMaximumHeight(150)
+        self.runaway_table.setStyleSheet("""
+            QTreeWidget{background:transparent;border:none;outline:0;color:#e7e7e9;font-size:12px;} QTreeWidget::item{padding:3px 0;} QTreeWidget::item:selected{background:rgba(198,107,255,0.18);}
+            QHeaderView::section{background:transparent;color:#9aa0a6;border:none;border-bottom:1px solid rgba(255,255,255,0.08);padding:4px;font-weight:600;}
+        """)
+        runaway_layout.addWidget(self.runaway_table)
+        runaway_wrap.addWidget(runaway_card); layout.addSpacing(14); layout.addLayout(runaway_wrap)
+
         # Área de gráficos em tempo real com PyQtGraph
         self._chart_points = 60  # 60 amostras
         if HAS_PG:
@@ -663,6 +1228,15 @@ class MainWindow(QtWidgets.QMainWindow):
                 legend_ram.setAlignment(QtCore.Qt.AlignmentFlag.AlignVCenter)
                 header_layout.addWidget(legend_ram)
 
+                legend_clock = QtWidgets.QLabel(
+                    "<span style='font-size:15px;vertical-align:middle;'>●</span> <span style='color:#fab005;'>Clock (% da base)</span> "
+                    "<span style='color:#ff6b6b;'>▮ Limitação</span>"
+                )
+                legend_clock.setTextFormat(QtCore.Qt.TextFormat.RichText)
+                legend_clock.setStyleSheet("font-size:13px;color:#e6e6e6;background:transparent;border:none;padding:0px 8px;vertical-align:middle;")
+                legend_clock.setAlignment(QtCore.Qt.AlignmentFlag.AlignVCenter)
+                header_layout.addWidget(legend_clock)
+
                 charts_layout.addLayout(header_layout)
                 
                 # Widget de plotagem
@@ -686,6 +1260,14 @@ class MainWindow(QtWidgets.QMainWindow):
                 self.plot_widget.getAxis('left').setTextPen('#9aa0a6')
                 self.plot_widget.getAxis('bottom').setTextPen('#9aa0a6')
                 
+                # Faixas vermelhas onde a CPU estava limitada (throttling), atrás das curvas
+                self._clock_series = deque([float('nan')]*self._chart_points, maxlen=self._chart_points)
+                self._throttle_series = deque([0]*self._chart_points, maxlen=self._chart_points)
+                self.throttle_fill = self.plot_widget.plot(pen=None, fillLevel=0, brush=pg.mkBrush(255, 107, 107, 60))
+                self.clock_curve = self.plot_widget.plot(
+                    pen=pg.mkPen(color=(250, 176, 5), width=1.5, style=QtCore.Qt.PenStyle.DashLine), connect='finite'
+                )
+
                 # Curvas de CPU (azul) e RAM (verde)
                 self.cpu_curve = self.plot_widget.plot(
                     pen=pg.mkPen(color=(77, 171, 247), width=2.5),  # Azul #4dabf7
@@ -697,6 +1279,50 @@ class MainWindow(QtWidgets.QMainWindow):
                 )
                 
                 charts_layout.addWidget(self.plot_widget)
+
+                # Pressão (PSI) e swap: pegam lentidão que o % de uso não mostra
+                self._psi_series = {key: deque([0]*self._chart_points, maxlen=self._chart_points)
+                                    for key in ('psi_memory_some', 'psi_io_some', 'psi_cpu_some')}
+                self._swap_series = {key: deque([0]*self._chart_points, maxlen=self._chart_points)
+                                     for key in ('swap_in_mb_s', 'swap_out_mb_s')}
+                pressure_header = QtWidgets.QHBoxLayout(); pressure_header.setSpacing(16)
+                pressure_title = QtWidgets.QLabel("PRESSÃO <span style='color:#9900ff;'>E SWAP</span>")
+                pressure_title.setTextFormat(QtCore.Qt.TextFormat.RichText)
+                pressure_title.setStyleSheet("font-size:16px;font-weight:600;color:#e6e6e6;background:transparent;border:none;")
+                pressure_header.addWidget(pressure_title); pressure_header.addStretch()
+                self.pressure_note = QtWidgets.QLabel("")
+                self.pressure_note.setStyleSheet("font-size:11px;color:#f0ad4e;background:transparent;border:none;")
+                pressure_header.addWidget(self.pressure_note)
+                for color, text in (('#ff6b6b', 'Memória'), ('#ffa94d', 'I/O'), ('#4dabf7', 'CPU'), ('#b197fc', 'Swap in'), ('#63e6be', 'Swap out')):
+                    legend = QtWidgets.QLabel(f"<span style='font-size:15px;'>●</span> <span style='color:{color};'>{text}</span>")
+                    legend.setTextFormat(QtCore.Qt.TextFormat.RichText)
+                    legend.setStyleSheet("font-size:12px;color:#e6e6e6;background:transparent;border:none;padding:0px 4px;")
+                    pressure_header.addWidget(legend)
+                charts_layout.addLayout(pressure_header)
+                pressure_row = QtWidgets.QHBoxLayout(); pressure_row.setSpacing(14)
+                self.pressure_plot = pg.PlotWidget(); self.swap_plot = pg.PlotWidget()
+                for plot, left in ((self.pressure_plot, 'Tempo parado (%)'), (self.swap_plot, 'Swap (MB/s)')):
+                    plot.setBackground('#07080d'); plot.setMinimumHeight(100); plot.setMaximumHeight(220)
+                    plot.showGrid(x=True, y=True, alpha=0.15)
+                    plot.setXRange(-self._chart_points + 1, 0); plot.setLimits(xMin=-self._chart_points + 1, xMax=0, yMin=0)
+                    plot.setLabel('left', left, color='#9aa0a6', size='10pt')
+                    plot.getAxis('left').setTextPen('#9aa0a6'); plot.getAxis('bottom').setTextPen('#9aa0a6')
+                    pressure_row.addWidget(plot, 1)
+                self.pressure_plot.setYRange(0, 100)
+                self.psi_curves = {
+                    'psi_memory_some': self.pressure_plot.plot(pen=pg.mkPen(color=(255, 107, 107), width=2)),
+                    'psi_io_some': self.pressure_plot.plot(pen=pg.mkPen(color=(255, 169, 77), width=2)),
+                    'psi_cpu_some': self.pressure_plot.plot(pen=pg.mkPen(color=(77, 171, 247), width=2)),
+                }
+                self.swap_curves = {
+                    'swap_in_mb_s': self.swap_plot.plot(pen=pg.mkPen(color=(177, 151, 252), width=2)),
+                    'swap_out_mb_s': self.swap_plot.plot(pen=pg.mkPen(color=(99, 230, 190), width=2)),
+                }
+                # Linhas tracejadas nos limites que geram alerta
+                for plot, key, color in ((self.pressure_plot, 'psi_memory_some', (255, 107, 107)), (self.pressure_plot, 'psi_io_some', (255, 169, 77)),
+                                         (self.pressure_plot, 'psi_cpu_some', (77, 171, 247)), (self.swap_plot, 'swap_mb_s', (177, 151, 252))):
+                    plot.addItem(pg.InfiniteLine(pos=PRESSURE_THRESHOLDS[key], angle=0, pen=pg.mkPen(color=color, width=1, style=QtCore.Qt.PenStyle.DashLine)))
+                charts_layout.addLayout(pressure_row)
                 layout.addSpacing(18)
                 layout.addWidget(charts_frame)
                 
@@ -754,14 +1380,19 @@ class MainWindow(QtWidgets.QMainWindow):
         self._monitor_fetching = False
         if isinstance(payload, dict) and payload:
             self._apply_monitor_metrics(payload)
+            if self.maintenance is not None:
+                self.maintenance.feed(payload)
+                self._update_maintenance_status()
 
     def _apply_monitor_metrics(self, metrics: dict):
         try:
             fmt = metrics.get('formatted', {})
 
-            for key in ['GPU', 'Temp', 'Disco', 'Rede']:
+            for key in ['GPU', 'Temp', 'Disco', 'Rede', 'Memória', 'Swap', 'Clock']:
                 if key in self.monitor_values:
                     self.monitor_values[key].setText(fmt.get(key, 'N/A'))
+            self._update_memory_tooltips(metrics)
+            self._update_clock_card(metrics)
 
             if hasattr(self, 'plot_widget') and self.plot_widget is not None:
                 cpu_val = metrics.get('cpu_pct', 0.0)
@@ -773,9 +1404,273 @@ class MainWindow(QtWidgets.QMainWindow):
                 xs = list(range(-len(self._cpu_series) + 1, 1))
                 self.cpu_curve.setData(xs, list(self._cpu_series))
                 self.ram_curve.setData(xs, list(self._ram_series))
+
+                clock_pct = metrics.get('cpu_freq_pct')
+                self._clock_series.append(min(105.0, clock_pct) if clock_pct is not None else float('nan'))
+                self._throttle_series.append(105 if metrics.get('throttled') else 0)
+                self.clock_curve.setData(xs, list(self._clock_series))
+                self.throttle_fill.setData(xs, list(self._throttle_series))
+
+                has_psi = metrics.get('psi_memory_some') is not None
+                for key, curve in self.psi_curves.items():
+                    self._psi_series[key].append(metrics.get(key) or 0.0)
+                    curve.setData(xs, list(self._psi_series[key]))
+                for key, curve in self.swap_curves.items():
+                    self._swap_series[key].append(metrics.get(key) or 0.0)
+                    curve.setData(xs, list(self._swap_series[key]))
+                self.pressure_note.setText("" if has_psi else "PSI indisponível (só Linux 4.20+)")
+
+            self._check_monitor_anomalies(metrics)
         except Exception:
             pass
 
+    def _update_memory_tooltips(self, metrics: dict):
+        if 'Memória' in self.monitor_cards:
+            lines = [f"Disponível: {metrics.get('mem_available_gb', 0):.2f} GB",
+                     f"Cache: {metrics.get('mem_cached_gb', 0):.2f} GB",
+                     f"Buffers: {metrics.get('mem_buffers_gb', 0):.2f} GB"]
+            if metrics.get('commit_pct') is not None:
+                lines.append(f"Comprometida: {metrics['commit_pct']:.0f}% do limite")
+            if metrics.get('psi_memory_some') is not None:
+                lines.append(f"Pressão (PSI): {metrics['psi_memory_some']:.1f}% some • {metrics['psi_memory_full']:.1f}% full")
+            self.monitor_cards['Memória'].setToolTip("\n".join(lines))
+        if 'Swap' in self.monitor_cards:
+            faults = metrics.get('major_faults_s')
+            lines = [f"Em uso: {metrics.get('swap_used_gb', 0):.2f} GB ({metrics.get('swap_pct', 0):.0f}%)",
+                     f"Entrada: {metrics.get('swap_in_mb_s', 0):.2f} MB/s • Saída: {metrics.get('swap_out_mb_s', 0):.2f} MB/s",
+                     f"Falhas de página maiores: {faults:.0f}/s" if faults is not None else "Falhas de página maiores: N/A"]
+            self.monitor_cards['Swap'].setToolTip("\n".join(lines))
+
+    def _update_clock_card(self, metrics: dict):
+        if 'Clock' not in self.monitor_cards:
+            return
+        if metrics.get('throttled') and 'Clock' in self.monitor_values:
+            self.monitor_values['Clock'].setText(f"⚠ {metrics['formatted'].get('Clock', 'N/A')}")
+        lines = []
+        if metrics.get('cpu_freq_mhz'):
+            lines.append(f"Média: {metrics['cpu_freq_mhz'] / 1000:.2f} GHz • Núcleo mais lento: {metrics['cpu_freq_min_mhz'] / 1000:.2f} GHz")
+        if metrics.get('cpu_freq_base_mhz'):
+            pct = metrics.get('cpu_freq_pct')
+            lines.append(f"Base: {metrics['cpu_freq_base_mhz'] / 1000:.2f} GHz" + (f" ({pct:.0f}% da base)" if pct is not None else ""))
+        else:
+            lines.append("Clock base desconhecido: limitação só pelos contadores do kernel")
+        if metrics.get('temp_max_c') is not None:
+            lines.append(f"Sensor mais quente: {metrics['temp_max_c']:.0f}°C")
+        if metrics.get('throttled'):
+            lines.append(f"Limitada agora: {THROTTLE_REASONS.get(metrics.get('throttle_reason'), '')}")
+        self.monitor_cards['Clock'].setToolTip("\n".join(lines))
+
+    def _check_throttle(self, metrics: dict):
+        """Junta amostras limitadas (throttling) em intervalos: um evento no começo e outro no fim."""
+        freq, temp = metrics.get('cpu_freq_mhz'), metrics.get('temp_max_c')
+        interval = self._throttle_interval
+        if metrics.get('throttled'):
+            if interval is None:
+                reason = metrics.get('throttle_reason')
+                interval = self._throttle_interval = {'start': time.monotonic(), 'reason': reason, 'min_mhz': freq,
+                                                      'max_temp_c': temp, 'kernel_events': 0}
+                details = [f"{freq / 1000:.2f} GHz" if freq else None,
+                           f"{metrics['cpu_freq_pct']:.0f}% da base" if metrics.get('cpu_freq_pct') is not None else None,
+                           f"{temp:.0f}°C" if temp is not None else None, f"CPU {metrics.get('cpu_pct', 0.0):.0f}%"]
+                self.log_panel.append(f"⚠ CPU limitando o clock ({THROTTLE_REASONS.get(reason, reason)}): "
+                                      + ", ".join(d for d in details if d),
+                                      event='cpu_throttle_start', reason=reason, freq_mhz=freq, freq_pct=metrics.get('cpu_freq_pct'),
+                                      temp_c=temp, cpu_pct=metrics.get('cpu_pct'))
+            else:
+                if freq and (interval['min_mhz'] is None or freq < interval['min_mhz']):
+                    interval['min_mhz'] = freq
+                if temp is not None and (interval['max_temp_c'] is None or temp > interval['max_temp_c']):
+                    interval['max_temp_c'] = temp
+            interval['kernel_events'] += metrics.get('throttle_events') or 0
+        elif interval is not None:
+            self._throttle_interval = None
+            duration = time.monotonic() - interval['start']
+            details = [f"mínimo {interval['min_mhz'] / 1000:.2f} GHz" if interval['min_mhz'] else None,
+                       f"pico {interval['max_temp_c']:.0f}°C" if interval['max_temp_c'] is not None else None,
+                       f"{interval['kernel_events']} eventos do kernel" if interval['kernel_events'] else None]
+            details = [d for d in details if d]
+            self.log_panel.append(f"Clock da CPU normalizado após {duration:.0f} s" + (f" ({', '.join(details)})" if details else ""),
+                                  event='cpu_throttle_end', reason=interval['reason'], duration_s=round(duration, 1),
+                                  min_freq_mhz=interval['min_mhz'], max_temp_c=interval['max_temp_c'],
+                                  kernel_events=interval['kernel_events'])
+
+    def _check_monitor_anomalies(self, metrics: dict):
+        """Registra no log quando CPU/RAM, pressão ou swap cruzam o limite (só na transição)."""
+        for key, label in (('cpu_pct', 'CPU'), ('ram_pct', 'RAM')):
+            value = float(metrics.get(key, 0.0) or 0.0)
+            if value >= MONITOR_ALERT_PCT and key not in self._monitor_alerts:
+                self._monitor_alerts.add(key)
+                self.log_panel.append(f"⚠ {label} em {value:.0f}%", event='monitor_anomaly', metric=key, value=value)
+            elif value < MONITOR_ALERT_PCT - 5 and key in self._monitor_alerts:
+                self._monitor_alerts.discard(key)
+                self.log_panel.append(f"{label} normalizada ({value:.0f}%)", event='monitor_recovered', metric=key, value=value)
+        values = dict(metrics, swap_mb_s=metrics.get('swap_in_mb_s', 0.0) + metrics.get('swap_out_mb_s', 0.0))
+        for key, limit in PRESSURE_THRESHOLDS.items():
+            value = values.get(key)
+            if value is None:
+                continue
+            unit = " MB/s" if key == 'swap_mb_s' else "/s" if key == 'major_faults_s' else "%"
+            if value >= limit and key not in self._monitor_alerts:
+                self._monitor_alerts.add(key)
+                self.log_panel.append(f"⚠ {PRESSURE_LABELS[key]} em {value:.1f}{unit} (limite {limit:g}{unit})",
+                                      event='monitor_anomaly', metric=key, value=round(value, 2), limit=limit)
+            elif value < limit * 0.7 and key in self._monitor_alerts:
+                self._monitor_alerts.discard(key)
+                self.log_panel.append(f"{PRESSURE_LABELS[key]} normalizada ({value:.1f}{unit})", event='monitor_recovered',
+                                      metric=key, value=round(value, 2))
+        self._check_throttle(metrics)
+
+    def _toggle_maintenance(self, enabled, save=True):
+        config = load_maintenance_config()
+        if save:
+            config['enabled'] = bool(enabled)
+            try:
+                save_maintenance_config(config)
+            except OSError as e:
+                self.log_panel.append(f"Aviso: não foi possível salvar a configuração da manutenção: {e}", event='error')
+        if not enabled:
+            if self.maintenance is not None:
+                self.maintenance.stop(timeout=0)
+                self.maintenance = None
+                self.log_panel.append("Manutenção automática desligada", event='maintenance_disabled')
+            self.maintenance_status.setText("")
+            return
+        if self.maintenance is not None:
+            return
+        queued = QtCore.Qt.ConnectionType.QueuedConnection
+
+        def on_event(ev):
+            QtCore.QMetaObject.invokeMethod(self, "_handle_maintenance_event", queued, QtCore.Q_ARG(object, ev))
+
+        self.maintenance = MaintenanceScheduler.from_config(config, on_event=on_event)
+        if save:
+            self.log_panel.append("Manutenção automática ligada: roda quando o PC ficar ocioso", event='maintenance_enabled',
+                                  cpu_pct=config['cpu_pct'], disk_mb_s=config['disk_mb_s'], idle_for_s=config['idle_for_s'])
+        self._update_maintenance_status()
+
+    def _update_maintenance_status(self):
+        status = self.maintenance.status()
+        if status['state'] == 'running':
+            progress = status['progress'] or {}
+            done = progress.get('files_removed', progress.get('files_hashed'))
+            text = f"Manutenção: {status['job']}" + (f" • {done} arquivos" if done else "")
+        elif status['state'] == 'paused':
+            text = f"Manutenção pausada: {status['job']}"
+        elif status['idle_s'] >= status['idle_for']:
+            text = "Manutenção em dia"
+        elif status['idle_s'] > 0:
+            text = f"Ocioso há {status['idle_s']:.0f}/{status['idle_for']:.0f} s"
+        else:
+            text = "Aguardando ociosidade"
+        self.maintenance_status.setText(text)
+
+    @QtCore.pyqtSlot(object)
+    def _handle_maintenance_event(self, ev):
+        kind = ev['event']
+        if kind == 'maintenance_start':
+            self.log_panel.append(f"Manutenção: PC ocioso, iniciando {len(ev['jobs'])} tarefas", event=kind, jobs=ev['jobs'])
+        elif kind == 'maintenance_job_start':
+            self.log_panel.append(f"  • {ev['label']}" + (" (retomando do checkpoint)" if ev['resumed'] else "") + "...",
+                                  event=kind, job=ev['job'], resumed=ev['resumed'])
+        elif kind == 'maintenance_pause':
+            self.log_panel.append(f"  ⏸ Manutenção pausada: PC em uso (CPU {ev['cpu_pct']:.0f}%, disco {ev['disk_mb_s']:.1f} MB/s)",
+                                  event=kind, job=ev['job'], cpu_pct=ev['cpu_pct'], disk_mb_s=ev['disk_mb_s'])
+        elif kind == 'maintenance_resume':
+            self.log_panel.append("  ▶ Manutenção retomada", event=kind, job=ev['job'])
+        elif kind == 'maintenance_job_finish':
+            report = ev['report']
+            if ev['job'] == 'temp_cleanup':
+                detail = f"{report['files_removed']} arquivos, {format_bytes(report['bytes_freed'])} liberados"
+            elif ev['job'] == 'duplicates':
+                detail = f"{report['groups']} grupos, {format_bytes(report['wasted_bytes'])} em cópias"
+            elif ev['job'] == 'index_rebuild':
+                detail = f"{report['files']} arquivos em {report['folders']} pastas"
+            else:
+                detail = ""
+            self.log_panel.append(f"  ✓ {ev['label']}" + (f": {detail}" if detail else "") + f" ({ev['elapsed_s']:.0f}s)",
+                                  event=kind, job=ev['job'], report=report, elapsed_s=round(ev['elapsed_s'], 3))
+        elif kind == 'maintenance_job_error':
+            self.log_panel.append(f"  ✗ {ev['label']}: {ev['error']}", event=kind, job=ev['job'], error=ev['error'])
+        elif kind == 'maintenance_finish':
+            if not ev['stopped']:
+                self.log_panel.append(f"✓ Manutenção concluída: {ev['completed']}/{ev['total']} tarefas", event=kind,
+                                      completed=ev['completed'], total=ev['total'], elapsed_s=round(ev['elapsed_s'], 3))
+        if self.maintenance is not None:
+            self._update_maintenance_status()
+
+    @QtCore.pyqtSlot(object)
+    def _handle_runaway_events(self, events):
+        for ev in events:
+            if ev['event'] == 'runaway_detected' and ev['kind'] == 'memory':
+                self.log_panel.append(f"⚠ {ev['name']} ({ev['pid']}) com memória crescendo {ev['slope_mb_min']:.1f} MB/min "
+                                      f"(+{ev['growth_mb']:.0f} MB, agora {format_bytes(ev['mem'])})", event='runaway_detected',
+                                      pid=ev['pid'], name=ev['name'], kind='memory', slope_mb_min=round(ev['slope_mb_min'], 2),
+                                      growth_mb=round(ev['growth_mb'], 1), mem=int(ev['mem']), fit=round(ev['fit'], 3))
+            elif ev['event'] == 'runaway_detected':
+                self.log_panel.append(f"⚠ {ev['name']} ({ev['pid']}) usando {ev['cpu_pct']:.0f}% de um núcleo sem parar",
+                                      event='runaway_detected', pid=ev['pid'], name=ev['name'], kind='cpu', cpu_pct=round(ev['cpu_pct'], 1))
+            elif ev['event'] == 'runaway_cleared':
+                reason = "encerrado" if ev['reason'] == 'exited' else "normalizado"
+                what = "memória" if ev['kind'] == 'memory' else "CPU"
+                self.log_panel.append(f"{ev['name']} ({ev['pid']}) {reason} ({what})", event='runaway_cleared',
+                                      pid=ev['pid'], name=ev['name'], kind=ev['kind'], reason=ev['reason'])
+            elif ev['event'] == 'runaway_error':
+                self.log_panel.append(f"Erro no detector de processos: {ev['error']}", event='error')
+        self._refresh_runaway_table()
+
+    def _refresh_runaway_table(self):
+        selected = self.runaway_table.currentItem()
+        selected_pid = selected.data(0, QtCore.Qt.ItemDataRole.UserRole) if selected is not None else None
+        rows = self.runaway.flagged()
+        self.runaway_table.clear()
+        for row in sorted(rows, key=lambda r: r['mem'], reverse=True):
+            reasons = []
+            if 'memory' in row['kinds']:
+                reasons.append(f"memória +{row['slope_mb_min']:.1f} MB/min")
+            if 'cpu' in row['kinds']:
+                reasons.append("CPU presa")
+            if row['suspended']:
+                reasons.append("suspenso")
+            item = QtWidgets.QTreeWidgetItem([row['name'], str(row['pid']), ", ".join(reasons), format_bytes(row['mem']), f"{row['cpu_pct']:.0f}%"])
+            item.setData(0, QtCore.Qt.ItemDataRole.UserRole, row['pid'])
+            for col in (1, 3, 4):
+                item.setTextAlignment(col, QtCore.Qt.AlignmentFlag.AlignRight | QtCore.Qt.AlignmentFlag.AlignVCenter)
+            self.runaway_table.addTopLevelItem(item)
+            if row['pid'] == selected_pid:
+                self.runaway_table.setCurrentItem(item)
+        self.runaway_status.setText(f"{len(rows)} suspeitos" if rows else "Nenhum processo suspeito")
+
+    def _runaway_action(self, action):
+        item = self.runaway_table.currentItem()
+        if item is None:
+            self.runaway_status.setText("Selecione um processo na lista"); return
+        pid, name = item.data(0, QtCore.Qt.ItemDataRole.UserRole), item.text(0)
+        if action == 'terminate':
+            answer = QtWidgets.QMessageBox.question(self, "Encerrar processo", f"Encerrar {name} ({pid})? Dados não salvos serão perdidos.")
+            if answer != QtWidgets.QMessageBox.StandardButton.Yes:
+                return
+        queued = QtCore.Qt.ConnectionType.QueuedConnection
+
+        def job():
+            try:
+                result = self.runaway.act(pid, action)
+            except Exception as exc:
+                result = {'error': str(exc), 'pid': pid, 'name': name, 'action': action}
+            QtCore.QMetaObject.invokeMethod(self, "_handle_runaway_action_result", queued, QtCore.Q_ARG(object, result))
+
+        threading.Thread(target=job, daemon=True).start()
+
+    @QtCore.pyqtSlot(object)
+    def _handle_runaway_action_result(self, result):
+        labels = {'suspend': "suspenso", 'resume': "retomado", 'lower_priority': "com prioridade baixa", 'terminate': "encerrado"}
+        if result.get('error'):
+            self.log_panel.append(f"✗ {result['error']}", event='runaway_action', pid=result['pid'], name=result['name'],
+                                  action=result['action'], error=result['error'])
+        else:
+            self.log_panel.append(f"✓ {result['name']} ({result['pid']}) {labels[result['action']]}", event='runaway_action',
+                                  pid=result['pid'], name=result['name'], action=result['action'], error=None)
+        self._refresh_runaway_table()
+
     def build_startup_page(self):
         page = QtWidgets.QWidget(); root = QtWidgets.QVBoxLayout(page); root.setContentsMargins(0,0,0,0); root.setSpacing(18)
         header_wrap = QtWidgets.QVBoxLayout(); header_wrap.setSpacing(6)
@@ -788,11 +1683,17 @@ class MainWindow(QtWidgets.QMainWindow):
         deco = QtWidgets.QFrame(); deco.setFixedHeight(3); deco.setStyleSheet("background:qlineargradient(x1:0,y1:0,x2:1,y2:0,stop:0 #c66bff, stop:1 #8f54ff);border-radius:2px;"); header_wrap.addWidget(deco); root.addLayout(header_wrap)
         card = QtWidgets.QFrame(); card.setStyleSheet("QFrame{background:rgba(255,255,255,0.02);border:1px solid rgba(198,107,255,0.12);border-radius:14px;}"); card_layout = QtWidgets.QVBoxLayout(card); card_layout.setContentsMargins(18,18,18,18); card_layout.setSpacing(14)
         top_row = QtWidgets.QHBoxLayout(); top_row.setSpacing(10)
-        self.startup_search = QtWidgets.QLineEdit(); self.startup_search.setPlaceholderText("Buscar programa (nome ou executável)..."); self.startup_search.textChanged.connect(self.filter_startup_list); self.startup_search.setClearButtonEnabled(True)
+        # Busca com debounce: filtra só depois que o usuário para de digitar
+        self._startup_search_timer = QtCore.QTimer(self); self._startup_search_timer.setSingleShot(True); self._startup_search_timer.setInterval(150)
+        self._startup_search_timer.timeout.connect(self.filter_startup_list)
+        self.startup_search = QtWidgets.QLineEdit(); self.startup_search.setPlaceholderText("Buscar programa (nome ou executável)..."); self.startup_search.textChanged.connect(self._startup_search_timer.start); self.startup_search.setClearButtonEnabled(True)
         self.startup_search.setStyleSheet("""
             QLineEdit{background:rgba(255,255,255,0.05);border:1px solid rgba(255,255,255,0.08);border-radius:10px;padding:8px 12px;color:#e7e7e9;font-size:13px;}
             QLineEdit:focus{border:1px solid #b987ff;background:rgba(255,255,255,0.07);}
         """); top_row.addWidget(self.startup_search,1)
+        self.startup_fuzzy = QtWidgets.QCheckBox("Busca aproximada"); self.startup_fuzzy.setToolTip("Tolera erros de digitação quando não há resultado exato")
+        self.startup_fuzzy.setStyleSheet("QCheckBox{color:#b9b9c5;font-size:12px;background:transparent;border:none;}")
+        self.startup_fuzzy.toggled.connect(self.filter_startup_list); top_row.addWidget(self.startup_fuzzy)
         self.btn_refresh_startup = QtWidgets.QPushButton("⟳  ATUALIZAR LISTA"); self.btn_refresh_startup.clicked.connect(self.update_startup_programs); self.btn_refresh_startup.setCursor(QtCore.Qt.CursorShape.PointingHandCursor); self.btn_refresh_startup.setFixedHeight(38)
         self.btn_refresh_startup.setStyleSheet("""
             QPushButton{background:qlineargradient(x1:0,y1:0,x2:1,y2:0, stop:0 #c66bff, stop:1 #9f59ff);color:#ffffff;font-weight:600;font-size:13px;border:none;padding:8px 22px;border-radius:11px;letter-spacing:0.4px;}
@@ -821,18 +1722,34 @@ class MainWindow(QtWidgets.QMainWindow):
         card_layout.addWidget(info)
         root.addWidget(card,1); self.update_startup_programs(); return page
 
-    def filter_startup_list(self):
-        term = self.startup_search.text().strip().lower(); self.startup_list.clear(); data = self._startup_data
-
-        if self._startup_loading and not data:
-            item = QtWidgets.QListWidgetItem(); lbl = QtWidgets.QLabel("Carregando itens..."); lbl.setStyleSheet("color:#b987ff;font-size:13px;padding:24px;"); lbl.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter); item.setSizeHint(QtCore.QSize(0,80)); self.startup_list.addItem(item); self.startup_list.setItemWidget(item,lbl); return
-
-        filtered = data if not term else [d for d in data if term in (d['name'] + ' ' + d['exe'] + ' ' + d.get('value', '')).lower()]
-        if not filtered:
-            msg = "Nenhum resultado." if not self._startup_loading else "Carregando itens..."
-            item = QtWidgets.QListWidgetItem(); lbl = QtWidgets.QLabel(msg); lbl.setStyleSheet("color:#7d7d89;font-size:13px;padding:24px;"); lbl.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter); item.setSizeHint(QtCore.QSize(0,80)); self.startup_list.addItem(item); self.startup_list.setItemWidget(item,lbl); return
-        for d in filtered:
+    def _populate_startup_list(self):
+        """Cria os widgets da lista uma vez por carga; a busca só mostra/esconde itens."""
+        self.startup_list.clear(); self._startup_items = []
+        item = QtWidgets.QListWidgetItem(); lbl = QtWidgets.QLabel(); lbl.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter); item.setSizeHint(QtCore.QSize(0,80)); self.startup_list.addItem(item); self.startup_list.setItemWidget(item,lbl)
+        self._startup_placeholder = (item, lbl)
+        for d in self._startup_data:
             it = QtWidgets.QListWidgetItem(); w = self._create_startup_item_widget(d['name'], d['exe'], d, d['source']); it.setSizeHint(w.sizeHint()); self.startup_list.addItem(it); self.startup_list.setItemWidget(it,w)
+            self._startup_items.append(it)
+
+    def filter_startup_list(self):
+        term = self.startup_search.text().strip(); data = self._startup_data
+        if self.startup_list.count() != len(self._startup_items) + 1:
+            # Página recriada: a lista nova ainda não tem os widgets
+            self._populate_startup_list()
+        if self._startup_index is None or len(self._startup_index) != len(data):
+            self._startup_index = StartupSearchIndex(data)
+        matches = set(self._startup_index.search(term, fuzzy=self.startup_fuzzy.isChecked())) if data else set()
+
+        self.startup_list.setUpdatesEnabled(False)
+        for i, it in enumerate(self._startup_items):
+            it.setHidden(i not in matches)
+        item, lbl = self._startup_placeholder
+        if self._startup_loading:
+            lbl.setText("Carregando itens..."); lbl.setStyleSheet("color:#b987ff;font-size:13px;padding:24px;")
+        else:
+            lbl.setText("Nenhum resultado."); lbl.setStyleSheet("color:#7d7d89;font-size:13px;padding:24px;")
+        item.setHidden(bool(matches))
+        self.startup_list.setUpdatesEnabled(True)
 
     def update_startup_programs(self):
         if self._startup_loading:
@@ -846,9 +1763,10 @@ class MainWindow(QtWidgets.QMainWindow):
         def job():
             try:
                 data = list_startup_programs()
-                result = {"data": data, "error": None}
+                # Índice de busca montado fora da UI thread
+                result = {"data": data, "index": StartupSearchIndex(data), "error": None}
             except Exception as exc:
-                result = {"data": [], "error": exc}
+                result = {"data": [], "index": None, "error": exc}
 
             QtCore.QMetaObject.invokeMethod(
                 self,
@@ -869,15 +1787,19 @@ class MainWindow(QtWidgets.QMainWindow):
 
         if isinstance(payload, dict):
             data = payload.get("data", [])
+            index = payload.get("index")
             error = payload.get("error")
         else:
             data = []
+            index = None
             error = None
 
         if error:
-            self.log_panel.append(f"Erro ao carregar itens de inicialização: {error}")
+            self.log_panel.append(f"Erro ao carregar itens de inicialização: {error}", event='error')
 
         self._startup_data = data or []
+        self._startup_index = index if index is not None else StartupSearchIndex(self._startup_data)
+        self._populate_startup_list()
         self.filter_startup_list()
 
     def _create_startup_item_widget(self, name, exe, data, source):
@@ -947,19 +1869,19 @@ class MainWindow(QtWidgets.QMainWindow):
             if not btn.isEnabled():
                 return
             btn.setEnabled(False)
-            self.log_panel.append(f"Desativando da inicialização: {name}")
+            self.log_panel.append(f"Desativando da inicialização: {name}", event='startup_disable', item=name, source=source)
 
             def job():
                 try:
                     disable_startup_item(data)
-                    self.log_panel.append(f"Concluído: {name} desativado")
+                    self.log_panel.append(f"Concluído: {name} desativado", event='startup_disabled', item=name, source=source)
                     # Atualiza a lista de forma segura na UI thread
                     QtCore.QTimer.singleShot(0, self.update_startup_programs)
                 except PermissionError as e:
                     QtCore.QMetaObject.invokeMethod(btn, 'setEnabled', QtCore.Qt.ConnectionType.QueuedConnection, QtCore.Q_ARG(bool, True))
                     # Log e aviso na UI thread
                     def _show_warn():
-                        self.log_panel.append(f"Permissão necessária: {e}")
+                        self.log_panel.append(f"Permissão necessária: {e}", event='error', item=name)
                         QtWidgets.QMessageBox.warning(
                             self,
                             'Permissão necessária',
@@ -968,7 +1890,7 @@ class MainWindow(QtWidgets.QMainWindow):
                     QtCore.QTimer.singleShot(0, _show_warn)
                 except Exception as e:
                     QtCore.QMetaObject.invokeMethod(btn, 'setEnabled', QtCore.Qt.ConnectionType.QueuedConnection, QtCore.Q_ARG(bool, True))
-                    self.log_panel.append(f"Erro ao desativar {name}: {e}")
+                    self.log_panel.append(f"Erro ao desativar {name}: {e}", event='error', item=name)
                 
             threading.Thread(target=job, daemon=True).start()
 
@@ -1068,15 +1990,15 @@ class MainWindow(QtWidgets.QMainWindow):
                     def make_restore(entry, btn_ref=restore_btn):
                         def do_restore():
                             btn_ref.setEnabled(False)
-                            self.log_panel.append(f"Restaurando: {entry['name']}")
+                            self.log_panel.append(f"Restaurando: {entry['name']}", event='startup_restore', item=entry['name'], source=entry.get('source'))
                             def job():
                                 try:
                                     restore_startup_item(entry)
-                                    self.log_panel.append(f"Concluído: {entry['name']} restaurado")
+                                    self.log_panel.append(f"Concluído: {entry['name']} restaurado", event='startup_restored', item=entry['name'], source=entry.get('source'))
                                     QtCore.QTimer.singleShot(0, self.update_startup_programs)
                                     QtCore.QTimer.singleShot(0, lambda: refresh_list(listw))
                                 except Exception as e:
-                                    self.log_panel.append(f"Erro ao restaurar {entry['name']}: {e}")
+                                    self.log_panel.append(f"Erro ao restaurar {entry['name']}: {e}", event='error', item=entry['name'])
                                     QtCore.QTimer.singleShot(0, lambda: btn_ref.setEnabled(True))
                             threading.Thread(target=job, daemon=True).start()
                         return do_restore
@@ -1096,7 +2018,414 @@ class MainWindow(QtWidgets.QMainWindow):
             dlg.setMinimumWidth(480)
             dlg.exec()
         except Exception as e:
-            self.log_panel.append(f"Erro ao abrir diálogo de itens desativados: {e}")
+            self.log_panel.append(f"Erro ao abrir diálogo de itens desativados: {e}", event='error')
+
+    # ----------------- Uso de disco -----------------
+    def build_disk_page(self):
+        page = QtWidgets.QWidget(); root = QtWidgets.QVBoxLayout(page); root.setContentsMargins(0,0,0,0); root.setSpacing(18)
+        header_wrap = QtWidgets.QVBoxLayout(); header_wrap.setSpacing(6)
+        title = QtWidgets.QLabel("USO DE DISCO")
+        title.setStyleSheet("font-size:25px;font-weight:600;color:#f2f2f5;letter-spacing:0.6px;background:transparent;border:none;")
+        header_wrap.addWidget(title)
+        subtitle = QtWidgets.QLabel("Descubra quais pastas ocupam mais espaço. Análises seguintes só relêem as pastas alteradas.")
+        subtitle.setStyleSheet("color:#b9b9c5;font-size:13px;letter-spacing:0.3px;background:transparent;border:none;")
+        header_wrap.addWidget(subtitle)
+        deco = QtWidgets.QFrame(); deco.setFixedHeight(3); deco.setStyleSheet("background:qlineargradient(x1:0,y1:0,x2:1,y2:0,stop:0 #c66bff, stop:1 #8f54ff);border-radius:2px;"); header_wrap.addWidget(deco); root.addLayout(header_wrap)
+        card = QtWidgets.QFrame(); card.setStyleSheet("QFrame{background:rgba(255,255,255,0.02);border:1px solid rgba(198,107,255,0.12);border-radius:14px;}"); card_layout = QtWidgets.QVBoxLayout(card); card_layout.setContentsMargins(18,18,18,18); card_layout.setSpacing(14)
+        top_row = QtWidgets.QHBoxLayout(); top_row.setSpacing(10)
+        default_root = (os.environ.get('SystemDrive', 'C:') + os.sep) if os.name == 'nt' else os.path.expanduser('~')
+        self.disk_path = QtWidgets.QLineEdit(default_root); self.disk_path.setPlaceholderText("Pasta ou unidade para analisar...")
+        self.disk_path.setStyleSheet("""
+            QLineEdit{background:rgba(255,255,255,0.05);border:1px solid rgba(255,255,255,0.08);border-radius:10px;padding:8px 12px;color:#e7e7e9;font-size:13px;}
+            QLineEdit:focus{border:1px solid #b987ff;background:rgba(255,255,255,0.07);}
+        """); top_row.addWidget(self.disk_path,1)
+        self.disk_full_rescan = QtWidgets.QCheckBox("Ignorar cache"); self.disk_full_rescan.setToolTip("Relê todas as pastas (pega arquivos editados sem mudar a pasta)")
+        self.disk_full_rescan.setStyleSheet("QCheckBox{color:#b9b9c5;font-size:12px;background:transparent;border:none;}"); top_row.addWidget(self.disk_full_rescan)
+        self.btn_disk_analyze = QtWidgets.QPushButton("ANALISAR"); self.btn_disk_analyze.clicked.connect(self.start_disk_analysis); self.btn_disk_analyze.setCursor(QtCore.Qt.CursorShape.PointingHandCursor); self.btn_disk_analyze.setFixedHeight(38)
+        self.btn_disk_analyze.setStyleSheet("""
+            QPushButton{background:qlineargradient(x1:0,y1:0,x2:1,y2:0, stop:0 #c66bff, stop:1 #9f59ff);color:#ffffff;font-weight:600;font-size:13px;border:none;padding:8px 22px;border-radius:11px;letter-spacing:0.4px;}
+            QPushButton:hover{background:qlineargradient(x1:0,y1:0,x2:1,y2:0, stop:0 #d488ff, stop:1 #ae72ff);} QPushButton:pressed{background:qlineargradient(x1:0,y1:0,x2:1,y2:0, stop:0 #ad55ff, stop:1 #8a3de6);}
+            QPushButton:disabled{background:#2f2f33;color:#777;}
+        """); top_row.addWidget(self.btn_disk_analyze)
+        card_layout.addLayout(top_row)
+        self.disk_status = QtWidgets.QLabel(""); self.disk_status.setStyleSheet("color:#7d7d85;font-size:12px;background:transparent;border:none;")
+        card_layout.addWidget(self.disk_status)
+        # Itens são criados sob demanda ao expandir: a árvore inteira fica só nos arrays
+        self.disk_tree_widget = QtWidgets.QTreeWidget(); self.disk_tree_widget.setColumnCount(4)
+        self.disk_tree_widget.setHeaderLabels(["Pasta", "Tamanho", "%", "Arquivos"]); self.disk_tree_widget.setUniformRowHeights(True)
+        self.disk_tree_widget.header().setSectionResizeMode(0, QtWidgets.QHeaderView.ResizeMode.Stretch)
+        for col in (1, 2, 3):
+            self.disk_tree_widget.header().setSectionResizeMode(col, QtWidgets.QHeaderView.ResizeMode.ResizeToContents)
+        self.disk_tree_widget.setStyleSheet("""
+            QTreeWidget{background:transparent;border:none;outline:0;color:#e7e7e9;font-size:13px;} QTreeWidget::item{padding:4px 0;} QTreeWidget::item:selected{background:rgba(198,107,255,0.18);}
+            QHeaderView::section{background:transparent;color:#9aa0a6;border:none;border-bottom:1px solid rgba(255,255,255,0.08);padding:6px;font-weight:600;}
+            QScrollBar:vertical{background:transparent;width:10px;margin:2px;} QScrollBar::handle:vertical{background:rgba(198,107,255,0.5);min-height:24px;border-radius:5px;} QScrollBar::add-line:vertical,QScrollBar::sub-line:vertical{height:0;}
+        """)
+        self.disk_tree_widget.itemExpanded.connect(self._populate_disk_item)
+        card_layout.addWidget(self.disk_tree_widget,1)
+        root.addWidget(card,1); return page
+
+    def start_disk_analysis(self):
+        if self._disk_cancel is not None:
+            # Segundo clique cancela a análise em andamento
+            self._disk_cancel.set(); return
+        path = self.disk_path.text().strip()
+        if not path or not os.path.isdir(path):
+            self.disk_status.setText("Pasta inválida."); return
+        self._disk_cancel = threading.Event(); cancel = self._disk_cancel
+        use_cache = not self.disk_full_rescan.isChecked()
+        self.btn_disk_analyze.setText("CANCELAR"); self.disk_status.setText("Analisando...")
+        self.log_panel.append(f"Analisando uso de disco em {path}...", event='disk_usage_start', path=path, cache=use_cache)
+        queued = QtCore.Qt.ConnectionType.QueuedConnection
+
+        def on_progress(ev):
+            text = f"Analisando: {ev['dirs']} pastas • {ev['files']} arquivos • {format_bytes(ev['bytes'])}"
+            QtCore.QMetaObject.invokeMethod(self.disk_status, 'setText', queued, QtCore.Q_ARG(str, text))
+
+        def job():
+            try:
+                tree = analyze_disk_usage(path, use_cache=use_cache, progress=on_progress, cancel=cancel)
+                result = {"tree": tree, "cancelled": cancel.is_set(), "error": None}
+            except Exception as exc:
+                result = {"tree": None, "cancelled": False, "error": exc}
+            QtCore.QMetaObject.invokeMethod(self, "_handle_disk_usage_result", queued, QtCore.Q_ARG(object, result))
+
+        threading.Thread(target=job, daemon=True).start()
+
+    @QtCore.pyqtSlot(object)
+    def _handle_disk_usage_result(self, payload):
+        self._disk_cancel = None
+        self.btn_disk_analyze.setText("ANALISAR")
+        if payload.get("error"):
+            self.disk_status.setText(f"Erro: {payload['error']}")
+            self.log_panel.append(f"Erro na análise de disco: {payload['error']}", event='error'); return
+        if payload.get("cancelled"):
+            self.disk_status.setText("Análise cancelada.")
+            self.log_panel.append("Análise de disco cancelada.", event='disk_usage_cancelled'); return
+        tree = payload["tree"]; self._disk_tree = tree
+        summary = (f"{format_bytes(tree.total_size[0])} em {tree.total_files[0]} arquivos e {len(tree)} pastas • "
+                   f"{tree.dirs_scanned} lidas, {tree.dirs_reused} do cache • {tree.elapsed_s:.1f}s")
+        if tree.errors:
+            summary += f" • {tree.errors} sem acesso"
+        self.disk_status.setText(summary)
+        self.log_panel.append(f"Uso de disco: {summary}", event='disk_usage_finish', path=tree.root, bytes=tree.total_size[0],
+                              files=tree.total_files[0], dirs=len(tree), dirs_scanned=tree.dirs_scanned,
+                              dirs_reused=tree.dirs_reused, errors=tree.errors, elapsed_s=round(tree.elapsed_s, 3))
+        self.disk_tree_widget.clear()
+        item = self._make_disk_item(0, tree.total_size[0])
+        self.disk_tree_widget.addTopLevelItem(item); item.setExpanded(True)
+
+    def _make_disk_item(self, idx, parent_total):
+        tree = self._disk_tree
+        name = tree.root if idx == 0 else tree.names[idx]
+        pct = (tree.total_size[idx] * 100.0 / parent_total) if parent_total else 0.0
+        item = QtWidgets.QTreeWidgetItem([name, format_bytes(tree.total_size[idx]), f"{pct:.1f}%", str(tree.total_files[idx])])
+        item.setData(0, QtCore.Qt.ItemDataRole.UserRole, idx)
+        item.setToolTip(0, tree.path(idx))
+        for col in (1, 2, 3):
+            item.setTextAlignment(col, QtCore.Qt.AlignmentFlag.AlignRight | QtCore.Qt.AlignmentFlag.AlignVCenter)
+        if tree.child_count(idx) or tree.own_files[idx]:
+            item.setChildIndicatorPolicy(QtWidgets.QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator)
+        return item
+
+    def _populate_disk_item(self, item):
+        idx = item.data(0, QtCore.Qt.ItemDataRole.UserRole)
+        tree = self._disk_tree
+        if tree is None or idx is None or item.childCount():
+            return
+        total = tree.total_size[idx]
+        kids = tree.children(idx)
+        items = [self._make_disk_item(k, total) for k in kids[:DISK_TREE_MAX_CHILDREN]]
+        if len(kids) > DISK_TREE_MAX_CHILDREN:
+            rest = kids[DISK_TREE_MAX_CHILDREN:]
+            items.append(QtWidgets.QTreeWidgetItem([f"… mais {len(rest)} pastas", format_bytes(sum(tree.total_size[k] for k in rest)), "", ""]))
+        if tree.own_files[idx]:
+            pct = (tree.own_size[idx] * 100.0 / total) if total else 0.0
+            files = QtWidgets.QTreeWidgetItem(["(arquivos nesta pasta)", format_bytes(tree.own_size[idx]), f"{pct:.1f}%", str(tree.own_files[idx])])
+            files.setForeground(0, QtGui.QBrush(QtGui.QColor("#9aa0a6")))
+            items.append(files)
+        item.addChildren(items)
+
+    def build_bench_page(self):
+        page = QtWidgets.QWidget(); root = QtWidgets.QVBoxLayout(page); root.setContentsMargins(0,0,0,0); root.setSpacing(18)
+        header_wrap = QtWidgets.QVBoxLayout(); header_wrap.setSpacing(6)
+        title = QtWidgets.QLabel("BENCHMARK DE DISCO")
+        title.setStyleSheet("font-size:25px;font-weight:600;color:#f2f2f5;letter-spacing:0.6px;background:transparent;border:none;")
+        header_wrap.addWidget(title)
+        subtitle = QtWidgets.QLabel("Leitura e escrita sequencial e aleatória (4K, 64K, 1M) com várias requisições simultâneas. Usa um arquivo temporário que é apagado no fim.")
+        subtitle.setStyleSheet("color:#b9b9c5;font-size:13px;letter-spacing:0.3px;background:transparent;border:none;"); subtitle.setWordWrap(True)
+        header_wrap.addWidget(subtitle)
+        deco = QtWidgets.QFrame(); deco.setFixedHeight(3); deco.setStyleSheet("background:qlineargradient(x1:0,y1:0,x2:1,y2:0,stop:0 #c66bff, stop:1 #8f54ff);border-radius:2px;"); header_wrap.addWidget(deco); root.addLayout(header_wrap)
+        card = QtWidgets.QFrame(); card.setStyleSheet("QFrame{background:rgba(255,255,255,0.02);border:1px solid rgba(198,107,255,0.12);border-radius:14px;}"); card_layout = QtWidgets.QVBoxLayout(card); card_layout.setContentsMargins(18,18,18,18); card_layout.setSpacing(14)
+        top_row = QtWidgets.QHBoxLayout(); top_row.setSpacing(10)
+        self.bench_path = QtWidgets.QLineEdit(tempfile.gettempdir()); self.bench_path.setPlaceholderText("Pasta no disco a testar...")
+        self.bench_path.setStyleSheet("""
+            QLineEdit{background:rgba(255,255,255,0.05);border:1px solid rgba(255,255,255,0.08);border-radius:10px;padding:8px 12px;color:#e7e7e9;font-size:13px;}
+            QLineEdit:focus{border:1px solid #b987ff;background:rgba(255,255,255,0.07);}
+        """); top_row.addWidget(self.bench_path,1)
+        combo_style = "QComboBox{background:rgba(255,255,255,0.05);border:1px solid rgba(255,255,255,0.08);border-radius:10px;padding:7px 10px;color:#e7e7e9;font-size:12px;}"
+        self.bench_mode = QtWidgets.QComboBox(); self.bench_mode.setStyleSheet(combo_style)
+        for label, mode in (("Com cache", 'buffered'), ("Sem cache (O_DIRECT)", 'direct'), ("Mapeado (mmap)", 'mmap')):
+            self.bench_mode.addItem(label, mode)
+        self.bench_mode.setToolTip("Com cache mede o que os programas costumam ver; sem cache mede o disco em si")
+        top_row.addWidget(self.bench_mode)
+        self.bench_suite = QtWidgets.QComboBox(); self.bench_suite.setStyleSheet(combo_style)
+        self.bench_suite.addItem(f"Padrão ({len(STANDARD_TESTS)} testes)", 'standard')
+        self.bench_suite.addItem(f"Completa ({len(build_tests())} testes: QD 1, 8 e 32)", 'full')
+        top_row.addWidget(self.bench_suite)
+        self.bench_size = QtWidgets.QComboBox(); self.bench_size.setStyleSheet(combo_style)
+        for size_mb in (64, 256, 1024):
+            self.bench_size.addItem(f"Arquivo de {size_mb} MB", size_mb * 1024 * 1024)
+        self.bench_size.setCurrentIndex(1); top_row.addWidget(self.bench_size)
+        self.btn_bench_start = QtWidgets.QPushButton("INICIAR"); self.btn_bench_start.clicked.connect(self.start_disk_bench); self.btn_bench_start.setCursor(QtCore.Qt.CursorShape.PointingHandCursor); self.btn_bench_start.setFixedHeight(38)
+        self.btn_bench_start.setStyleSheet("""
+            QPushButton{background:qlineargradient(x1:0,y1:0,x2:1,y2:0, stop:0 #c66bff, stop:1 #9f59ff);color:#ffffff;font-weight:600;font-size:13px;border:none;padding:8px 22px;border-radius:11px;letter-spacing:0.4px;}
+            QPushButton:hover{background:qlineargradient(x1:0,y1:0,x2:1,y2:0, stop:0 #d488ff, stop:1 #ae72ff);} QPushButton:pressed{background:qlineargradient(x1:0,y1:0,x2:1,y2:0, stop:0 #ad55ff, stop:1 #8a3de6);}
+            QPushButton:disabled{background:#2f2f33;color:#777;}
+        """); top_row.addWidget(self.btn_bench_start)
+        card_layout.addLayout(top_row)
+        self.bench_progress = QtWidgets.QProgressBar(); self.bench_progress.setRange(0, 1000); self.bench_progress.setValue(0); self.bench_progress.setTextVisible(False); self.bench_progress.setFixedHeight(6)
+        self.bench_progress.setStyleSheet("QProgressBar{background:rgba(255,255,255,0.06);border:none;border-radius:3px;} QProgressBar::chunk{background:qlineargradient(x1:0,y1:0,x2:1,y2:0,stop:0 #c66bff, stop:1 #8f54ff);border-radius:3px;}")
+        card_layout.addWidget(self.bench_progress)
+        self.bench_status = QtWidgets.QLabel(""); self.bench_status.setStyleSheet("color:#7d7d85;font-size:12px;background:transparent;border:none;")
+        card_layout.addWidget(self.bench_status)
+        self.bench_table = QtWidgets.QTreeWidget(); self.bench_table.setColumnCount(7); self.bench_table.setRootIsDecorated(False)
+        self.bench_table.setHeaderLabels(["Teste", "MB/s", "IOPS", "p50 (µs)", "p99 (µs)", "p99.9 (µs)", "máx (µs)"]); self.bench_table.setUniformRowHeights(True)
+        self.bench_table.header().setSectionResizeMode(0, QtWidgets.QHeaderView.ResizeMode.Stretch)
+        for col in range(1, 7):
+            self.bench_table.header().setSectionResizeMode(col, QtWidgets.QHeaderView.ResizeMode.ResizeToContents)
+        self.bench_table.setStyleSheet("""
+            QTreeWidget{background:transparent;border:none;outline:0;color:#e7e7e9;font-size:13px;} QTreeWidget::item{padding:4px 0;} QTreeWidget::item:selected{background:rgba(198,107,255,0.18);}
+            QHeaderView::section{background:transparent;color:#9aa0a6;border:none;border-bottom:1px solid rgba(255,255,255,0.08);padding:6px;font-weight:600;}
+        """)
+        card_layout.addWidget(self.bench_table,1)
+        root.addWidget(card,1)
+
+        net_card = QtWidgets.QFrame(); net_card.setStyleSheet(card.styleSheet()); net_layout = QtWidgets.QVBoxLayout(net_card); net_layout.setContentsMargins(18,18,18,18); net_layout.setSpacing(14)
+        net_title = QtWidgets.QLabel("REDE • vazão, latência e abertura de conexões (TCP)")
+        net_title.setStyleSheet("color:#e7e7e9;font-size:14px;font-weight:600;background:transparent;border:none;"); net_layout.addWidget(net_title)
+        net_row = QtWidgets.QHBoxLayout(); net_row.setSpacing(10)
+        self.net_target = QtWidgets.QLineEdit(); self.net_target.setPlaceholderText("Servidor host:porta (vazio = loopback nesta máquina)")
+        self.net_target.setToolTip("Na outra máquina da rede: python benchmarks/bench_net.py --serve 0.0.0.0:5201")
+        self.net_target.setStyleSheet(self.bench_path.styleSheet()); net_row.addWidget(self.net_target,1)
+        self.net_with_tweak = QtWidgets.QCheckBox("Aplicar Otimizar Rede entre as medições")
+        self.net_with_tweak.setToolTip("Mede, aplica a otimização de rede e mede de novo; as duas execuções ficam no histórico")
+        self.net_with_tweak.setStyleSheet("QCheckBox{color:#b9b9c5;font-size:12px;background:transparent;border:none;}"); net_row.addWidget(self.net_with_tweak)
+        self.btn_net_bench = QtWidgets.QPushButton("MEDIR REDE"); self.btn_net_bench.clicked.connect(self.start_net_bench); self.btn_net_bench.setCursor(QtCore.Qt.CursorShape.PointingHandCursor); self.btn_net_bench.setFixedHeight(38)
+        self.btn_net_bench.setStyleSheet(self.btn_bench_start.styleSheet()); net_row.addWidget(self.btn_net_bench)
+        net_layout.addLayout(net_row)
+        self.net_status = QtWidgets.QLabel(""); self.net_status.setStyleSheet(self.bench_status.styleSheet()); net_layout.addWidget(self.net_status)
+        self.net_table = QtWidgets.QTreeWidget(); self.net_table.setColumnCount(5); self.net_table.setRootIsDecorated(False)
+        self.net_table.setHeaderLabels(["Teste", "Resultado", "p50 (µs)", "p99 (µs)", "vs. anterior"]); self.net_table.setUniformRowHeights(True)
+        self.net_table.header().setSectionResizeMode(0, QtWidgets.QHeaderView.ResizeMode.Stretch)
+        for col in range(1, 5):
+            self.net_table.header().setSectionResizeMode(col, QtWidgets.QHeaderView.ResizeMode.ResizeToContents)
+        self.net_table.setStyleSheet(self.bench_table.styleSheet())
+        net_layout.addWidget(self.net_table,1)
+        root.addWidget(net_card,1); return page
+
+    def start_disk_bench(self):
+        if self._bench_cancel is not None:
+            # Segundo clique cancela o benchmark em andamento
+            self._bench_cancel.set(); self.bench_status.setText("Cancelando..."); return
+        path = self.bench_path.text().strip()
+        if not path or not os.path.isdir(path):
+            self.bench_status.setText("Pasta inválida."); return
+        mode = self.bench_mode.currentData()
+        if self.bench_suite.currentData() == 'full':
+            tests = build_tests(modes=(mode,))
+        else:
+            tests = [test._replace(mode=mode) for test in STANDARD_TESTS]
+        size = self.bench_size.currentData()
+        self._bench_cancel = threading.Event(); cancel = self._bench_cancel
+        self.btn_bench_start.setText("CANCELAR"); self.bench_table.clear(); self.bench_progress.setValue(0)
+        self.bench_status.setText("Preparando arquivo de teste...")
+        self.log_panel.append(f"Benchmark de disco em {path} ({len(tests)} testes, {format_bytes(size)})...", event='disk_bench_start',
+                              path=path, mode=mode, tests=len(tests), file_size=size)
+        queued = QtCore.Qt.ConnectionType.QueuedConnection
+
+        def on_progress(ev):
+            QtCore.QMetaObject.invokeMethod(self, "_handle_disk_bench_progress", queued, QtCore.Q_ARG(object, ev))
+
+        def job():
+            try:
+                result = run_disk_bench(path, tests, file_size=size, progress=on_progress, cancel=cancel)
+            except Exception as exc:
+                result = {"error": exc}
+            QtCore.QMetaObject.invokeMethod(self, "_handle_disk_bench_result", queued, QtCore.Q_ARG(object, result))
+
+        threading.Thread(target=job, daemon=True).start()
+
+    @QtCore.pyqtSlot(object)
+    def _handle_disk_bench_progress(self, ev):
+        if self._bench_cancel is None:
+            return
+        total = max(1, ev['total'])
+        result = ev.get('result')
+        if result is None:
+            if ev['index']:
+                self.bench_status.setText(f"{ev['index']}/{ev['total']} • {ev['name']}: {ev['mb_s']:.0f} MB/s • {ev['elapsed_s']:.1f}s")
+                self.bench_progress.setValue(int((ev['index'] - 1 + min(1.0, ev['elapsed_s'] / 3.0)) * 1000 / total))
+            else:
+                self.bench_status.setText(ev['name'] + "...")
+            return
+        self.bench_progress.setValue(int(ev['index'] * 1000 / total))
+        if result.get('error'):
+            row = QtWidgets.QTreeWidgetItem([result['name'], "—", "—", "", "", "", ""])
+            row.setToolTip(0, result['error']); row.setForeground(0, QtGui.QBrush(QtGui.QColor("#9aa0a6")))
+        else:
+            lat = result['latency_us']
+            row = QtWidgets.QTreeWidgetItem([result['name'], f"{result['mb_s']:.1f}", f"{result['iops']:.0f}"] +
+                                            [f"{lat.get(k, 0):.0f}" for k in ('p50', 'p99', 'p99.9', 'max')])
+            if not result['cache_dropped'] and result['test']['op'] == 'read':
+                row.setToolTip(0, "Este sistema não permite tirar o arquivo do cache: leituras podem vir da memória")
+        for col in range(1, 7):
+            row.setTextAlignment(col, QtCore.Qt.AlignmentFlag.AlignRight | QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.bench_table.addTopLevelItem(row)
+
+    @QtCore.pyqtSlot(object)
+    def _handle_disk_bench_result(self, report):
+        self._bench_cancel = None
+        self.btn_bench_start.setText("INICIAR")
+        if report.get("error"):
+            self.bench_status.setText(f"Erro: {report['error']}")
+            self.log_panel.append(f"Erro no benchmark de disco: {report['error']}", event='error'); return
+        for result in report['results']:
+            if result.get('error'):
+                self.log_panel.append(f"  ✗ {result['name']}: {result['error']}", event='disk_bench_error', test=result['name'], error=result['error'])
+            else:
+                self.log_panel.append(f"  • {result['name']}: {result['mb_s']:.1f} MB/s • {result['iops']:.0f} IOPS • p99 {result['latency_us']['p99']:.0f} µs",
+                                      event='disk_bench_test', test=result['name'], mb_s=round(result['mb_s'], 2), iops=round(result['iops']),
+                                      latency_us={k: round(v, 1) for k, v in result['latency_us'].items()})
+        done = sum(1 for r in report['results'] if not r.get('error'))
+        prefix = "Cancelado" if report['cancelled'] else "✓ Benchmark concluído"
+        summary = f"{done}/{len(report['results'])} testes • arquivo de {format_bytes(report['file_size'])} • {report['elapsed_s']:.0f}s"
+        self.bench_status.setText(f"{prefix}: {summary}")
+        if not report['cancelled']:
+            self.bench_progress.setValue(1000)
+        self.log_panel.append(f"{prefix}: {summary}", event='disk_bench_finish', cancelled=report['cancelled'], tests=done,
+                              elapsed_s=round(report['elapsed_s'], 3))
+
+    def start_net_bench(self):
+        if self._net_bench_cancel is not None:
+            self._net_bench_cancel.set(); self.net_status.setText("Cancelando..."); return
+        text = self.net_target.text().strip()
+        try:
+            target = parse_target(text) if text else None
+        except ValueError:
+            self.net_status.setText("Servidor inválido: use host:porta."); return
+        with_tweak = self.net_with_tweak.isChecked()
+        if with_tweak and not is_admin():
+            QtWidgets.QMessageBox.warning(
+                self,
+                "Permissão Necessária",
+                "Esta otimização requer privilégios de administrador.\n\n"
+                "Por favor, execute o Cloud Optimizer como administrador."
+            )
+            return
+        label = f"{target[0]}:{target[1]}" if target else "loopback"
+        self._net_bench_cancel = threading.Event(); cancel = self._net_bench_cancel
+        self.btn_net_bench.setText("CANCELAR"); self.net_table.clear(); self.net_status.setText(f"Conectando a {label}...")
+        self.log_panel.append(f"Benchmark de rede ({label}{', com Otimizar Rede' if with_tweak else ''})...", event='net_bench_start',
+                              target=label, with_tweak=with_tweak)
+        queued = QtCore.Qt.ConnectionType.QueuedConnection
+
+        def on_progress(ev):
+            if 'result' in ev:
+                return
+            phase = f"{ev['phase']} • " if ev.get('phase') else ""
+            rate = f": {ev['mb_s']:.0f} MB/s" if ev.get('mb_s') else ""
+            text = f"{phase}{ev['index']}/{ev['total']} • {ev['name']}{rate}"
+            QtCore.QMetaObject.invokeMethod(self.net_status, 'setText', queued, QtCore.Q_ARG(str, text))
+
+        def job():
+            try:
+                if with_tweak:
+                    def tweak():
+                        with get_journal().session("Otimizar Rede (medido)"):
+                            optimize_network()
+                    result = measure_tweak(tweak, "Otimizar Rede", target, progress=on_progress, cancel=cancel)
+                else:
+                    previous = load_net_history(label, limit=1)
+                    run = save_run(run_net_bench(target, progress=on_progress, cancel=cancel))
+                    result = {'before': previous[-1] if previous else None, 'after': run, 'error': None,
+                              'comparison': compare_runs(previous[-1], run) if previous else []}
+            except Exception as exc:
+                result = {"error": exc, "fatal": True}
+            QtCore.QMetaObject.invokeMethod(self, "_handle_net_bench_result", queued, QtCore.Q_ARG(object, result))
+
+        threading.Thread(target=job, daemon=True).start()
+
+    @QtCore.pyqtSlot(object)
+    def _handle_net_bench_result(self, report):
+        self._net_bench_cancel = None
+        self.btn_net_bench.setText("MEDIR REDE")
+        if report.get("fatal"):
+            self.net_status.setText(f"Erro: {report['error']}")
+            self.log_panel.append(f"Erro no benchmark de rede: {report['error']}", event='error'); return
+        if report['error']:
+            self.log_panel.append(f"  ✗ Otimizar Rede falhou: {report['error']}", event='net_bench_tweak_error', error=report['error'])
+        run = report['after'] or report['before']
+        changes = {c['key']: c['change_pct'] for c in report['comparison']}
+        self.net_table.clear()
+        for result in run['results']:
+            if result.get('error'):
+                row = QtWidgets.QTreeWidgetItem([result['key'], "erro", "", "", ""]); row.setToolTip(0, result['error'])
+            elif result['test'] == 'throughput':
+                row = QtWidgets.QTreeWidgetItem([result['key'], f"{result['mbit_s']:.0f} Mbit/s", "", "", ""])
+            elif result['test'] == 'latency':
+                row = QtWidgets.QTreeWidgetItem([f"ida e volta ({result['samples']} mensagens)", f"p90 {result.get('p90', 0):.0f} µs",
+                                                 f"{result.get('p50', 0):.1f}", f"{result.get('p99', 0):.1f}", ""])
+            else:
+                row = QtWidgets.QTreeWidgetItem([f"abrir conexões ({result['connections']})", f"{result['rate']:.0f}/s",
+                                                 f"{result.get('p50', 0):.1f}", f"{result.get('p99', 0):.1f}", ""])
+            if result['key'] in changes:
+                row.setText(4, f"{changes[result['key']]:+.1f}%")
+            for col in range(1, 5):
+                row.setTextAlignment(col, QtCore.Qt.AlignmentFlag.AlignRight | QtCore.Qt.AlignmentFlag.AlignVCenter)
+            self.net_table.addTopLevelItem(row)
+            if result.get('error'):
+                self.log_panel.append(f"  ✗ {result['key']}: {result['error']}", event='net_bench_error', target=run['target'],
+                                      test=result['key'], error=result['error'])
+            else:
+                self.log_panel.append(f"  • {row.text(0)}: {row.text(1)}" + (f" ({row.text(4)} vs. anterior)" if row.text(4) else ""),
+                                      event='net_bench_test', target=run['target'], test=result['key'],
+                                      change_pct=round(changes[result['key']], 2) if result['key'] in changes else None)
+        prefix = "Cancelado" if run['cancelled'] else "✓ Rede medida"
+        summary = f"{run['target']} • {len(run['results'])} testes • {run['elapsed_s']:.0f}s"
+        if report['comparison']:
+            better = sum(c['change_pct'] > 0 for c in report['comparison'])
+            summary += f" • {better}/{len(report['comparison'])} melhores que a medição anterior"
+        self.net_status.setText(f"{prefix}: {summary}")
+        self.log_panel.append(f"{prefix}: {summary}", event='net_bench_finish', target=run['target'], cancelled=run['cancelled'],
+                              tweak_error=report['error'], elapsed_s=round(run['elapsed_s'], 3))
+
+    def closeEvent(self, event):
+        """Garante que o log de atividades seja gravado antes de sair."""
+        try:
+            if self._disk_cancel is not None:
+                self._disk_cancel.set()
+            if self._bench_cancel is not None:
+                self._bench_cancel.set()
+            if self._net_bench_cancel is not None:
+                self._net_bench_cancel.set()
+            if self._profile_cancel is not None:
+                self._profile_cancel.set()
+            if self._process_rules is not None:
+                self._process_rules.stop(restore=True)
+            if self._process_rules_stopping is not None:
+                # Desligado pouco antes de fechar: a restauração termina antes de sair
+                self._process_rules_stopping.join(15)
+            if self.maintenance is not None:
+                self.maintenance.stop(timeout=2)
+            if self.runaway is not None:
+                self.runaway.stop()
+            self.ui_watchdog.stop()
+            self.activity_log.record('app_exit')
+            self.activity_log.close()
+        except Exception:
+            pass
+        super().closeEvent(event)
 
     # ----------------- Arrastar janela -----------------
     def _is_in_top_bar(self, global_pos: QtCore.QPoint) -> bool:
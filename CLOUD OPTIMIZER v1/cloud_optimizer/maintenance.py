@@ -0,0 +1,485 @@
+# Date: 19/10/2026
+# DEV: Martinez
+# Cloud Optimizer v1 Free Utility by Martinez
+
+import abc
+import ctypes
+import json
+import os
+import sys
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+import psutil
+
+from cloud_optimizer.cleaner import clean_policies, unique_folders
+from cloud_optimizer.cleanup_policy import CleanupPolicy
+from cloud_optimizer.duplicates import find_duplicates
+from cloud_optimizer.scan_index import ScanIndex
+from cloud_optimizer.tweaks import temp_policies
+from cloud_optimizer.utils import app_data_dir
+
+__all__ = [
+    "IdleDetector",
+    "JobContext",
+    "MaintenanceJob",
+    "TempCleanupJob",
+    "IndexRebuildJob",
+    "DuplicateScanJob",
+    "MaintenanceScheduler",
+    "default_jobs",
+    "load_config",
+    "save_config",
+]
+
+# Ocioso = CPU abaixo de cpu_pct e disco abaixo de disk_mb_s por idle_for_s segundos seguidos
+DEFAULT_CONFIG = {'enabled': False, 'cpu_pct': 10.0, 'disk_mb_s': 5.0, 'idle_for_s': 120.0, 'every_h': 24.0}
+
+_MB = 1024 ** 2
+_THREAD_MODE_BACKGROUND_BEGIN = 0x00010000
+
+EventCallback = Callable[[Dict], None]
+
+
+def _config_path() -> str:
+    return app_data_dir('maintenance.json')
+
+
+def load_config(path: Optional[str] = None) -> Dict:
+    path = path or _config_path()
+    config = dict(DEFAULT_CONFIG)
+    try:
+        with open(path, encoding='utf-8') as fh:
+            config.update({k: v for k, v in json.load(fh).items() if k in DEFAULT_CONFIG})
+    except (OSError, ValueError):
+        pass
+    return config
+
+
+def save_config(config: Dict, path: Optional[str] = None) -> None:
+    path = path or _config_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as fh:
+        json.dump({k: config[k] for k in DEFAULT_CONFIG if k in config}, fh, indent=2)
+
+
+def _background_priority() -> None:
+    """Baixa a prioridade de CPU e de I/O da thread atual.
+
+    No Linux nice e ioprio valem por thread e são herdados pelas threads (e
+    processos) que ela criar, então os pools da limpeza e dos duplicados também
+    rodam em segundo plano. No Windows usa o modo background da thread.
+    """
+    try:
+        if os.name == 'nt':
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetThreadPriority(kernel32.GetCurrentThread(), _THREAD_MODE_BACKGROUND_BEGIN)
+        elif sys.platform.startswith('linux'):
+            tid = threading.get_native_id()
+            os.setpriority(os.PRIO_PROCESS, tid, 19)
+            psutil.Process(tid).ionice(psutil.IOPRIO_CLASS_IDLE)
+    except (OSError, psutil.Error, AttributeError):
+        pass
+
+
+class IdleDetector:
+    """Decide, amostra a amostra do `Monitor`, se o PC está ocioso.
+
+    O consumo do próprio processo (a manutenção rodando, o coletor do monitor)
+    é descontado de CPU e disco, senão a manutenção se pausaria sozinha.
+    """
+
+    def __init__(self, cpu_pct: float = 10.0, disk_mb_s: float = 5.0, idle_for: float = 120.0, subtract_own: bool = True) -> None:
+        self.cpu_pct = cpu_pct
+        self.disk_mb_s = disk_mb_s
+        self.idle_for = idle_for
+        self.subtract_own = subtract_own
+        self.idle_since: Optional[float] = None
+        self.last = {'cpu_pct': 0.0, 'disk_mb_s': 0.0}
+        self._proc = psutil.Process()
+        self._own = None  # (instante, segundos de CPU, bytes de I/O)
+
+    def _own_usage(self, now: float):
+        try:
+            times = self._proc.cpu_times()
+            cpu = times.user + times.system
+            io = self._proc.io_counters()
+            io_bytes = io.read_bytes + io.write_bytes
+        except (psutil.Error, AttributeError):
+            return 0.0, 0.0
+        prev, self._own = self._own, (now, cpu, io_bytes)
+        if prev is None:
+            return 0.0, 0.0
+        dt = max(0.001, now - prev[0])
+        return (cpu - prev[1]) / dt / (psutil.cpu_count() or 1) * 100, (io_bytes - prev[2]) / dt / _MB
+
+    def feed(self, metrics: Dict, now: Optional[float] = None) -> bool:
+        """Registra uma amostra; True quando o PC está ocioso há `idle_for` segundos."""
+        now = time.monotonic() if now is None else now
+        own_cpu, own_disk = self._own_usage(now) if self.subtract_own else (0.0, 0.0)
+        cpu = max(0.0, float(metrics.get('cpu_pct', 0.0) or 0.0) - own_cpu)
+        disk = max(0.0, float(metrics.get('disk_mb_s', 0.0) or 0.0) - own_disk)
+        self.last = {'cpu_pct': cpu, 'disk_mb_s': disk}
+        if cpu >= self.cpu_pct or disk >= self.disk_mb_s:
+            self.idle_since = None
+            return False
+        if self.idle_since is None:
+            self.idle_since = now
+        return now - self.idle_since >= self.idle_for
+
+    @property
+    def busy(self) -> bool:
+        return self.idle_since is None
+
+    def idle_seconds(self, now: Optional[float] = None) -> float:
+        if self.idle_since is None:
+            return 0.0
+        return (time.monotonic() if now is None else now) - self.idle_since
+
+
+class JobContext:
+    """O que uma tarefa recebe do agendador: estado salvo, checkpoints e pausa.
+
+    `state` é o último checkpoint (vazio numa execução nova). A tarefa chama
+    `checkpoint(...)` sempre que terminar uma parte que não precisa ser refeita
+    e `pause_point()` (ou passa `progress` como callback de progresso) para
+    parar enquanto o PC estiver em uso. `pause_point()` retorna False quando o
+    agendador está parando: a tarefa deve sair sem marcar nada como feito.
+    """
+
+    def __init__(self, scheduler: "MaintenanceScheduler", job: "MaintenanceJob", state: Dict) -> None:
+        self._scheduler = scheduler
+        self.job = job
+        self.state = state
+        self.cancel = scheduler._stop
+
+    def checkpoint(self, **updates) -> None:
+        self.state.update(updates)
+        self._scheduler._save(self.job.name, {'state': self.state, 'finished_at': None})
+
+    def should_pause(self) -> bool:
+        return not self._scheduler._gate.is_set() or self.cancel.is_set()
+
+    def pause_point(self) -> bool:
+        gate = self._scheduler._gate
+        while not gate.wait(0.5):
+            if self.cancel.is_set():
+                return False
+        return not self.cancel.is_set()
+
+    def progress(self, event: Dict) -> None:
+        self._scheduler.progress = event
+        self.pause_point()
+
+
+class MaintenanceJob(abc.ABC):
+    """Tarefa de manutenção: `run(ctx)` retorna o relatório ou None se foi interrompida."""
+
+    name = ''
+    label = ''
+
+    @abc.abstractmethod
+    def run(self, ctx: JobContext) -> Optional[Dict]:
+        """Executa a tarefa chamando `ctx.pause_point()` entre etapas."""
+
+
+class TempCleanupJob(MaintenanceJob):
+    """Limpeza de temporários pelas regras de `cleanup_policies.json`, uma pasta por vez.
+
+    Cada pasta concluída vai para o checkpoint com os totais acumulados; uma
+    limpeza interrompida recomeça na primeira pasta que faltou. Dentro de uma
+    pasta o que já foi apagado não volta, então refazê-la só relê o que sobrou.
+    """
+
+    name = 'temp_cleanup'
+    label = 'Limpeza de temporários'
+
+    def __init__(self, policies: Optional[List[CleanupPolicy]] = None) -> None:
+        self._policies = policies
+
+    def run(self, ctx: JobContext) -> Optional[Dict]:
+        policies = self._policies if self._policies is not None else temp_policies()
+        done = set(ctx.state.get('done', []))
+        totals = ctx.state.get('totals') or {'bytes_freed': 0, 'files_removed': 0, 'files_skipped': 0, 'dirs_removed': 0}
+        errors: List[str] = list(ctx.state.get('errors', []))
+        for policy in policies:
+            for folder in unique_folders(policy.folders):
+                key = f"{policy.name}|{folder}"
+                if key in done:
+                    continue
+                if not ctx.pause_point():
+                    return None
+                one = CleanupPolicy.from_dict(dict(policy.to_dict(), folders=[folder]))
+                report = clean_policies([one], progress=ctx.progress, interval=0.1)
+                for field in totals:
+                    totals[field] += report[field]
+                errors.extend(report['errors'][:20])
+                done.add(key)
+                ctx.checkpoint(done=sorted(done), totals=totals, errors=errors[-50:])
+        return dict(totals, folders=len(done), errors=errors)
+
+
+class IndexRebuildJob(MaintenanceJob):
+    """Reconstrói do zero o índice de varredura (ScanIndex) das pastas de limpeza.
+
+    O índice só relê pastas cujo mtime mudou, então arquivos editados no lugar
+    ficam com tamanho/data antigos; a reconstrução periódica corrige isso. O
+    índice grava a cada lote de pastas, então uma reconstrução interrompida
+    continua de onde parou (pastas já gravadas vêm do índice). Ao pausar, a
+    varredura é fechada para não segurar o banco enquanto espera.
+    """
+
+    name = 'index_rebuild'
+    label = 'Reconstrução do índice de varredura'
+
+    def __init__(self, folders: Optional[Iterable[str]] = None, index: Optional[ScanIndex] = None) -> None:
+        self._folders = folders
+        self._index = index
+
+    def run(self, ctx: JobContext) -> Optional[Dict]:
+        index = self._index or ScanIndex()
+        if self._folders is not None:
+            folders = unique_folders(self._folders)
+        else:
+            folders = unique_folders(f for p in temp_policies() for f in p.folders)
+        if not ctx.state.get('cleared'):
+            index.clear()
+            ctx.checkpoint(cleared=True, done=[], files=0)
+        done = set(ctx.state.get('done', []))
+        files = ctx.state.get('files', 0)
+        for folder in folders:
+            if folder in done:
+                continue
+            while True:
+                if not ctx.pause_point():
+                    return None
+                count, stats, finished = 0, {}, True
+                walk = index.iter_files(folder, stats)
+                try:
+                    for _ in walk:
+                        count += 1
+                        if ctx.should_pause():
+                            finished = False
+                            break
+                finally:
+                    walk.close()
+                if finished:
+                    break
+            files += count
+            done.add(folder)
+            ctx.checkpoint(done=sorted(done), files=files)
+        return {'folders': len(done), 'files': files}
+
+
+def _user_folders() -> List[str]:
+    home = os.path.expanduser('~')
+    return [os.path.join(home, name) for name in ('Downloads', 'Documents', 'Desktop')]
+
+
+class DuplicateScanJob(MaintenanceJob):
+    """Procura duplicados (a partir de 1 MB) nas pastas do usuário e salva os grupos.
+
+    A busca compara todas as pastas entre si, então não há ponto intermediário
+    que valha para uma nova execução: pausar mantém o progresso em memória e
+    só fechar o programa no meio faz a busca recomeçar. O resultado fica em
+    maintenance/duplicate_groups.json.
+    """
+
+    name = 'duplicates'
+    label = 'Procura de arquivos duplicados'
+
+    def __init__(self, folders: Optional[Iterable[str]] = None, min_size: int = 1 * _MB) -> None:
+        self._folders = folders
+        self.min_size = min_size
+
+    def run(self, ctx: JobContext) -> Optional[Dict]:
+        folders = list(self._folders) if self._folders is not None else _user_folders()
+        if not ctx.pause_point():
+            return None
+        result = find_duplicates(folders, min_size=self.min_size, progress=ctx.progress, cancel=ctx.cancel, interval=0.1)
+        if ctx.cancel.is_set():
+            return None
+        path = app_data_dir('maintenance', 'duplicate_groups.json')
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as fh:
+            json.dump({'ts': time.time(), 'folders': folders, 'groups': result['groups']}, fh, ensure_ascii=False)
+        return {
+            'groups': len(result['groups']),
+            'duplicate_files': result['duplicate_files'],
+            'wasted_bytes': result['wasted_bytes'],
+            'files_scanned': result['files_scanned'],
+            'errors': result['errors'][:20],
+            'path': path,
+        }
+
+
+def default_jobs() -> List[MaintenanceJob]:
+    # Limpa antes de indexar: o índice reconstruído já reflete o que sobrou
+    return [TempCleanupJob(), IndexRebuildJob(), DuplicateScanJob()]
+
+
+class MaintenanceScheduler:
+    """Roda tarefas de manutenção nas janelas em que o PC fica ocioso.
+
+    `feed(metrics)` recebe cada amostra do `Monitor`. Depois de `idle_for`
+    segundos ociosos, as tarefas vencidas (nunca rodadas, interrompidas ou
+    concluídas há mais de `every_s`) rodam uma por vez numa thread com
+    prioridade baixa de CPU e I/O. Na primeira amostra com atividade a tarefa
+    é pausada no próximo `pause_point` e só continua depois de outro período
+    ocioso completo. Checkpoints ficam em maintenance/<tarefa>.json.
+
+    Eventos vão para `on_event` (de qualquer thread): maintenance_start,
+    maintenance_job_start, maintenance_pause, maintenance_resume,
+    maintenance_job_finish, maintenance_job_error, maintenance_finish.
+    """
+
+    def __init__(
+        self,
+        jobs: Iterable[MaintenanceJob],
+        detector: Optional[IdleDetector] = None,
+        every_s: float = 24 * 3600,
+        state_dir: Optional[str] = None,
+        on_event: Optional[EventCallback] = None,
+        recheck_s: float = 600.0,
+    ) -> None:
+        self.jobs = list(jobs)
+        self.detector = detector or IdleDetector()
+        self.every_s = every_s
+        self.state_dir = state_dir or app_data_dir('maintenance')
+        self.on_event = on_event
+        self.recheck_s = recheck_s
+        self.current: Optional[MaintenanceJob] = None
+        self.progress: Optional[Dict] = None
+        self._gate = threading.Event()  # set = pode rodar
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._next_check = 0.0
+
+    @classmethod
+    def from_config(cls, config: Dict, **kwargs) -> "MaintenanceScheduler":
+        detector = IdleDetector(config['cpu_pct'], config['disk_mb_s'], config['idle_for_s'])
+        return cls(default_jobs(), detector=detector, every_s=config['every_h'] * 3600, **kwargs)
+
+    # ----- checkpoints -----
+    def _path(self, name: str) -> str:
+        return os.path.join(self.state_dir, f'{name}.json')
+
+    def _load(self, name: str) -> Dict:
+        try:
+            with open(self._path(name), encoding='utf-8') as fh:
+                return json.load(fh)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self, name: str, data: Dict) -> None:
+        os.makedirs(self.state_dir, exist_ok=True)
+        tmp = self._path(name) + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as fh:
+            json.dump(data, fh, ensure_ascii=False)
+        os.replace(tmp, self._path(name))
+
+    def due(self) -> List[MaintenanceJob]:
+        now = time.time()
+        out = []
+        for job in self.jobs:
+            finished = self._load(job.name).get('finished_at')
+            if finished is None or now - finished >= self.every_s:
+                out.append(job)
+        return out
+
+    # ----- controle -----
+    def _emit(self, event: str, **fields) -> None:
+        if self.on_event is None:
+            return
+        try:
+            self.on_event(dict(fields, event=event))
+        except Exception:
+            pass
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def paused(self) -> bool:
+        return self.running and not self._gate.is_set()
+
+    def feed(self, metrics: Dict, now: Optional[float] = None) -> None:
+        """Uma amostra do Monitor: inicia, pausa ou retoma a manutenção."""
+        idle = self.detector.feed(metrics, now)
+        with self._lock:
+            if self._stop.is_set():
+                return
+            if self.running:
+                if self._gate.is_set() and self.detector.busy:
+                    self._gate.clear()
+                    self._emit('maintenance_pause', job=self.current and self.current.name, **self._rounded())
+                elif not self._gate.is_set() and idle:
+                    self._gate.set()
+                    self._emit('maintenance_resume', job=self.current and self.current.name)
+                return
+            if not idle or time.monotonic() < self._next_check:
+                return
+            jobs = self.due()
+            if not jobs:
+                self._next_check = time.monotonic() + self.recheck_s
+                return
+            self._gate.set()
+            self._thread = threading.Thread(target=self._worker, args=(jobs,), name="Maintenance", daemon=True)
+            self._thread.start()
+            self._emit('maintenance_start', jobs=[j.name for j in jobs])
+
+    def _rounded(self) -> Dict:
+        return {k: round(v, 1) for k, v in self.detector.last.items()}
+
+    def _worker(self, jobs: List[MaintenanceJob]) -> None:
+        _background_priority()
+        started = time.perf_counter()
+        completed = 0
+        for job in jobs:
+            if self._stop.is_set():
+                break
+            saved = self._load(job.name)
+            state = (saved.get('state') or {}) if saved.get('finished_at') is None else {}
+            self.current, self.progress = job, None
+            self._emit('maintenance_job_start', job=job.name, label=job.label, resumed=bool(state))
+            job_started = time.perf_counter()
+            try:
+                report = job.run(JobContext(self, job, state))
+            except Exception as e:
+                # Não insiste a cada janela ociosa: tenta de novo no próximo ciclo
+                self._save(job.name, {'state': {}, 'finished_at': time.time(), 'error': str(e)})
+                self._emit('maintenance_job_error', job=job.name, label=job.label, error=str(e))
+                continue
+            if report is None:
+                break
+            self._save(job.name, {'state': {}, 'finished_at': time.time(), 'report': report})
+            completed += 1
+            self._emit('maintenance_job_finish', job=job.name, label=job.label, report=report,
+                       elapsed_s=time.perf_counter() - job_started)
+        self.current, self.progress = None, None
+        self._next_check = time.monotonic() + self.recheck_s
+        self._emit('maintenance_finish', completed=completed, total=len(jobs), stopped=self._stop.is_set(),
+                   elapsed_s=time.perf_counter() - started)
+
+    def status(self) -> Dict:
+        if self.running:
+            state = 'paused' if not self._gate.is_set() else 'running'
+        else:
+            state = 'waiting'
+        return {
+            'state': state,
+            'job': self.current.label if self.current else None,
+            'idle_s': self.detector.idle_seconds(),
+            'idle_for': self.detector.idle_for,
+            'progress': self.progress,
+        }
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Interrompe a tarefa atual (o checkpoint fica salvo para a próxima vez)."""
+        self._stop.set()
+        self._gate.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
@@ -2,12 +2,201 @@
 # DEV: Martinez
 # Cloud Optimizer v1 Free Utility by Martinez
 
+import ctypes
+import glob
+import os
+import re
 import shutil
 import time
 import psutil
 
 from cloud_optimizer.utils import run_hidden_command
 
+_GB = 1024 ** 3
+_MB = 1024 ** 2
+
+# Limites de pressão/swap que geram evento no log: valor ao cruzar para cima;
+# o alerta some quando o valor cai abaixo de 70% do limite.
+PRESSURE_THRESHOLDS = {
+    'psi_memory_some': 10.0,   # % do tempo com alguma tarefa esperando memória
+    'psi_memory_full': 5.0,    # % do tempo com todas as tarefas paradas por memória
+    'psi_io_some': 25.0,       # % do tempo com tarefas esperando disco
+    'psi_cpu_some': 50.0,      # % do tempo com tarefas prontas sem CPU livre
+    'swap_mb_s': 10.0,         # swap in + out
+    'major_faults_s': 500.0,   # falhas de página que precisaram ler do disco
+    'commit_pct': 90.0,        # memória comprometida / limite (Windows; Linux só com overcommit estrito)
+}
+PRESSURE_LABELS = {
+    'psi_memory_some': 'Pressão de memória',
+    'psi_memory_full': 'Travamento por memória',
+    'psi_io_some': 'Pressão de I/O',
+    'psi_cpu_some': 'Pressão de CPU',
+    'swap_mb_s': 'Swap',
+    'major_faults_s': 'Falhas de página',
+    'commit_pct': 'Memória comprometida',
+}
+
+# Clock abaixo da base só conta como limitação (throttling) com a CPU quente ou
+# ocupada; clock baixo com a máquina parada é economia de energia normal.
+THROTTLE_FREQ_PCT = 90.0   # clock médio abaixo desse % do clock base
+THROTTLE_TEMP_C = 85.0     # sensor mais quente da CPU
+THROTTLE_CPU_PCT = 80.0    # uso total da CPU
+THROTTLE_REASONS = {
+    'thermal_counter': 'limitação térmica registrada pelo kernel',
+    'temperature': 'temperatura alta',
+    'power_limit': 'limite de energia sob carga',
+}
+
+_PSI_FIELDS = (('memory', 'some'), ('memory', 'full'), ('io', 'some'), ('io', 'full'), ('cpu', 'some'))
+
+
+def _read_psi() -> dict:
+    """Tempo total (µs) parado por recurso em /proc/pressure (Linux 4.20+); vazio se não houver."""
+    totals = {}
+    for resource in ('memory', 'io', 'cpu'):
+        try:
+            with open(f'/proc/pressure/{resource}', encoding='ascii') as fh:
+                for line in fh:
+                    kind, *fields = line.split()
+                    values = dict(f.split('=', 1) for f in fields)
+                    totals[f'psi_{resource}_{kind}'] = int(values['total'])
+        except (OSError, ValueError, KeyError):
+            continue
+    return totals
+
+
+def _read_linux_vm() -> dict:
+    """Falhas de página maiores (/proc/vmstat) e memória comprometida (/proc/meminfo)."""
+    out = {}
+    try:
+        with open('/proc/vmstat', encoding='ascii') as fh:
+            for line in fh:
+                if line.startswith('pgmajfault '):
+                    out['major_faults'] = int(line.split()[1])
+                    break
+        with open('/proc/meminfo', encoding='ascii') as fh:
+            for line in fh:
+                key, _, rest = line.partition(':')
+                if key in ('Committed_AS', 'CommitLimit'):
+                    out[key] = int(rest.split()[0]) * 1024
+        with open('/proc/sys/vm/overcommit_memory', encoding='ascii') as fh:
+            out['strict_commit'] = fh.read().strip() == '2'
+    except (OSError, ValueError, IndexError):
+        pass
+    return out
+
+
+def _read_throttle_counters(root: str = '/sys/devices/system/cpu') -> dict:
+    """Soma dos contadores de limitação térmica do kernel (Linux, Intel); vazio se não houver.
+
+    core_throttle_count é por núcleo; package_throttle_count se repete em cada
+    CPU do mesmo pacote, então conta uma vez por physical_package_id.
+    """
+    core, packages = 0, {}
+    found = False
+    for path in glob.glob(os.path.join(root, 'cpu[0-9]*', 'thermal_throttle')):
+        try:
+            with open(os.path.join(path, 'core_throttle_count'), encoding='ascii') as fh:
+                core += int(fh.read())
+            found = True
+            with open(os.path.join(path, 'package_throttle_count'), encoding='ascii') as fh:
+                count = int(fh.read())
+            with open(os.path.join(path, '..', 'topology', 'physical_package_id'), encoding='ascii') as fh:
+                packages[fh.read().strip()] = count
+        except (OSError, ValueError):
+            continue
+    return {'core': core, 'package': sum(packages.values())} if found else {}
+
+
+def _base_frequency_mhz():
+    """Clock base (nominal) da CPU em MHz, ou None se o sistema não informar.
+
+    Ordem: base_frequency do intel_pstate, "@ 3.00GHz" no nome do modelo e,
+    por último, o máximo do psutil (no Windows é o clock nominal; no Linux
+    pode ser o turbo, o que só deixa a detecção mais sensível).
+    """
+    try:
+        with open('/sys/devices/system/cpu/cpu0/cpufreq/base_frequency', encoding='ascii') as fh:
+            return int(fh.read()) / 1000.0
+    except (OSError, ValueError):
+        pass
+    try:
+        with open('/proc/cpuinfo', encoding='utf-8', errors='replace') as fh:
+            for line in fh:
+                if line.startswith('model name'):
+                    match = re.search(r'@\s*([\d.]+)\s*GHz', line)
+                    if match:
+                        return float(match.group(1)) * 1000.0
+                    break
+    except OSError:
+        pass
+    try:
+        freq = psutil.cpu_freq()
+        if freq and freq.max:
+            return float(freq.max)
+    except Exception:
+        pass
+    return None
+
+
+class _PERFORMANCE_INFORMATION(ctypes.Structure):
+    _fields_ = [
+        ('cb', ctypes.c_ulong), ('CommitTotal', ctypes.c_size_t), ('CommitLimit', ctypes.c_size_t),
+        ('CommitPeak', ctypes.c_size_t), ('PhysicalTotal', ctypes.c_size_t), ('PhysicalAvailable', ctypes.c_size_t),
+        ('SystemCache', ctypes.c_size_t), ('KernelTotal', ctypes.c_size_t), ('KernelPaged', ctypes.c_size_t),
+        ('KernelNonpaged', ctypes.c_size_t), ('PageSize', ctypes.c_size_t), ('HandleCount', ctypes.c_ulong),
+        ('ProcessCount', ctypes.c_ulong), ('ThreadCount', ctypes.c_ulong),
+    ]
+
+
+class _PDH_FMT_COUNTERVALUE(ctypes.Structure):
+    _fields_ = [('CStatus', ctypes.c_ulong), ('doubleValue', ctypes.c_double)]
+
+
+class _WindowsCounters:
+    """Contadores do Windows (PDH): paginação, falhas maiores e desempenho da CPU em % do clock base."""
+
+    _COUNTERS = {
+        'pages_in_s': '\\Memory\\Pages Input/sec',
+        'pages_out_s': '\\Memory\\Pages Output/sec',
+        'major_faults_s': '\\Memory\\Page Reads/sec',
+        'cpu_performance_pct': '\\Processor Information(_Total)\\% Processor Performance',
+    }
+
+    def __init__(self) -> None:
+        self._pdh = ctypes.windll.pdh
+        self._query = ctypes.c_void_p()
+        if self._pdh.PdhOpenQueryW(None, None, ctypes.byref(self._query)) != 0:
+            raise OSError("PdhOpenQueryW falhou")
+        self._counters = {}
+        for key, path in self._COUNTERS.items():
+            handle = ctypes.c_void_p()
+            if self._pdh.PdhAddEnglishCounterW(self._query, path, None, ctypes.byref(handle)) == 0:
+                self._counters[key] = handle
+        self._pdh.PdhCollectQueryData(self._query)  # taxas precisam de duas coletas
+
+    def read(self) -> dict:
+        if self._pdh.PdhCollectQueryData(self._query) != 0:
+            return {}
+        out = {}
+        for key, handle in self._counters.items():
+            value = _PDH_FMT_COUNTERVALUE()
+            if self._pdh.PdhGetFormattedCounterValue(handle, 0x00000200, None, ctypes.byref(value)) == 0:  # PDH_FMT_DOUBLE
+                out[key] = value.doubleValue
+        return out
+
+    @staticmethod
+    def commit() -> dict:
+        info = _PERFORMANCE_INFORMATION()
+        info.cb = ctypes.sizeof(info)
+        if not ctypes.windll.psapi.GetPerformanceInfo(ctypes.byref(info), info.cb):
+            return {}
+        return {
+            'Committed_AS': info.CommitTotal * info.PageSize,
+            'CommitLimit': info.CommitLimit * info.PageSize,
+            'cached': info.SystemCache * info.PageSize,
+        }
+
 
 class Monitor:
     """Coletor de métricas do sistema com estado para deltas (disco/rede)."""
@@ -18,6 +207,15 @@ class Monitor:
         self._prev_ts = None
         self._gpu_cli = self._detect_gpu_cli()
         self._last_cpu_pct = 0.0
+        self._prev_mem = None  # (instante, contadores acumulados de swap/falhas/PSI)
+        self._win_counters = None
+        if os.name == 'nt':
+            try:
+                self._win_counters = _WindowsCounters()
+            except Exception:
+                self._win_counters = None
+        self._base_mhz = _base_frequency_mhz()
+        self._prev_throttle = None
 
     def get_metrics(self) -> dict:
         """Retorna um dicionário com métricas atuais e strings formatadas.
@@ -27,9 +225,20 @@ class Monitor:
           - ram_pct (float)
           - gpu_txt (str)
           - temp_txt (str)
+          - temp_c, temp_max_c (float, média e sensor mais quente; None sem sensor)
+          - clock: cpu_freq_mhz (média), cpu_freq_min_mhz (núcleo mais lento),
+            cpu_freq_base_mhz, cpu_freq_pct (% da base), throttle_events
+            (limitações térmicas novas no kernel, Linux; None sem contadores),
+            throttled (bool) e throttle_reason (chave de THROTTLE_REASONS)
           - disk_mb_s (float)
           - net_mbit_s (float)
-          - formatted: {CPU,RAM,GPU,Temp,Disco,Rede}
+          - memória: mem_available_gb, mem_cached_gb, mem_buffers_gb,
+            swap_used_gb, swap_pct, swap_in_mb_s, swap_out_mb_s,
+            major_faults_s, commit_pct (None onde o sistema não informa)
+          - pressão (Linux, PSI): psi_memory_some, psi_memory_full,
+            psi_io_some, psi_io_full, psi_cpu_some em % do tempo parado
+            desde a amostra anterior (None sem /proc/pressure)
+          - formatted: {CPU,RAM,GPU,Temp,Disco,Rede,Memória,Swap,Clock}
         """
         out = {
             'cpu_pct': 0.0,
@@ -39,7 +248,26 @@ class Monitor:
             'temp_txt': 'N/A',
             'disk_mb_s': 0.0,
             'net_mbit_s': 0.0,
+            'mem_available_gb': 0.0,
+            'mem_cached_gb': 0.0,
+            'mem_buffers_gb': 0.0,
+            'swap_used_gb': 0.0,
+            'swap_pct': 0.0,
+            'swap_in_mb_s': 0.0,
+            'swap_out_mb_s': 0.0,
+            'major_faults_s': None,
+            'commit_pct': None,
+            'temp_c': None,
+            'temp_max_c': None,
+            'cpu_freq_mhz': None,
+            'cpu_freq_min_mhz': None,
+            'cpu_freq_base_mhz': self._base_mhz,
+            'cpu_freq_pct': None,
+            'throttle_events': None,
+            'throttled': False,
+            'throttle_reason': None,
         }
+        out.update({f'psi_{r}_{k}': None for r, k in _PSI_FIELDS})
         try:
             # CPU
             cpu_times = psutil.cpu_times_percent(interval=0.3, percpu=False)
@@ -56,9 +284,11 @@ class Monitor:
             out['cpu_pct'] = self._last_cpu_pct
 
             # RAM
+            win = self._win_counters.read() if self._win_counters is not None else {}
             vm = psutil.virtual_memory()
             out['ram_used_gb'] = vm.used / (1024 ** 3)
             out['ram_pct'] = float(vm.percent)
+            self._read_memory(out, vm, win)
 
             # GPU
             out['gpu_txt'] = self._read_gpu_usage()
@@ -68,12 +298,14 @@ class Monitor:
             try:
                 temps = psutil.sensors_temperatures()
                 if temps:
-                    for key in ['coretemp', 'cpu-thermal', 'Package id 0']:
+                    for key in ['coretemp', 'k10temp', 'cpu-thermal', 'Package id 0']:
                         arr = temps.get(key)
                         if arr:
                             vals = [t.current for t in arr if getattr(t, 'current', None)]
                             if vals:
-                                temp_txt = f"{sum(vals) / len(vals):.0f}°C"
+                                out['temp_c'] = sum(vals) / len(vals)
+                                out['temp_max_c'] = max(vals)
+                                temp_txt = f"{out['temp_c']:.0f}°C"
                                 break
             except Exception:
                 pass
@@ -87,11 +319,15 @@ class Monitor:
                         # WMI retorna temperatura em décimos de Kelvin
                         kelvin = sensors[0].CurrentTemperature
                         celsius = kelvin / 10.0 - 273.15
+                        out['temp_c'] = out['temp_max_c'] = celsius
                         temp_txt = f"{celsius:.0f}°C"
                 except Exception:
                     pass
             out['temp_txt'] = temp_txt
 
+            # Clock e limitação (throttling)
+            self._read_clock(out, win)
+
             # Disco e Rede (delta por segundo)
             now = time.time()
             if self._prev_disk is None:
@@ -124,9 +360,98 @@ class Monitor:
             'Temp': out['temp_txt'],
             'Disco': f"{out['disk_mb_s']:.1f} MB/s",
             'Rede': f"{out['net_mbit_s']:.2f} Mb/s",
+            'Memória': f"{out['mem_available_gb']:.1f} GB livres",
+            'Swap': f"{out['swap_in_mb_s'] + out['swap_out_mb_s']:.1f} MB/s",
+            'Clock': f"{out['cpu_freq_mhz'] / 1000:.2f} GHz" if out['cpu_freq_mhz'] else 'N/A',
         }
         return out
 
+    def _read_clock(self, out: dict, win: dict) -> None:
+        """Clock atual contra o clock base e marca a amostra como limitada (throttled).
+
+        Limitada = clock médio abaixo de THROTTLE_FREQ_PCT da base com a CPU
+        quente ou ocupada, ou contadores térmicos do kernel subindo.
+        """
+        base = self._base_mhz
+        try:
+            freqs = [f.current for f in (psutil.cpu_freq(percpu=True) or []) if f.current]
+        except Exception:
+            freqs = []
+        if freqs:
+            out['cpu_freq_mhz'] = sum(freqs) / len(freqs)
+            out['cpu_freq_min_mhz'] = min(freqs)
+        if base and win.get('cpu_performance_pct'):
+            # No Windows o psutil devolve o clock nominal; o contador PDH traz o real
+            out['cpu_freq_mhz'] = out['cpu_freq_min_mhz'] = base * win['cpu_performance_pct'] / 100.0
+        if base and out['cpu_freq_mhz']:
+            out['cpu_freq_pct'] = out['cpu_freq_mhz'] / base * 100.0
+
+        counters = _read_throttle_counters() if os.name != 'nt' else {}
+        prev, self._prev_throttle = self._prev_throttle, counters
+        if counters and prev:
+            out['throttle_events'] = sum(max(0, counters[k] - prev.get(k, counters[k])) for k in counters)
+
+        below = out['cpu_freq_pct'] is not None and out['cpu_freq_pct'] < THROTTLE_FREQ_PCT
+        hot = out['temp_max_c'] is not None and out['temp_max_c'] >= THROTTLE_TEMP_C
+        busy = out['cpu_pct'] >= THROTTLE_CPU_PCT
+        if out['throttle_events']:
+            out['throttle_reason'] = 'thermal_counter'
+        elif below and hot:
+            out['throttle_reason'] = 'temperature'
+        elif below and busy:
+            out['throttle_reason'] = 'power_limit'
+        out['throttled'] = out['throttle_reason'] is not None
+
+    def _read_memory(self, out: dict, vm, win: dict) -> None:
+        """Detalhe da memória, taxas de swap/falhas de página e PSI (deltas desde a amostra anterior)."""
+        now = time.monotonic()
+        out['mem_available_gb'] = vm.available / _GB
+        out['mem_cached_gb'] = getattr(vm, 'cached', 0) / _GB
+        out['mem_buffers_gb'] = getattr(vm, 'buffers', 0) / _GB
+        try:
+            swap = psutil.swap_memory()
+            out['swap_used_gb'] = swap.used / _GB
+            out['swap_pct'] = float(swap.percent)
+            counters = {'sin': swap.sin, 'sout': swap.sout}
+        except Exception:
+            counters = {}
+
+        if self._win_counters is not None:
+            page = 4096
+            out['swap_in_mb_s'] = win.get('pages_in_s', 0.0) * page / _MB
+            out['swap_out_mb_s'] = win.get('pages_out_s', 0.0) * page / _MB
+            out['major_faults_s'] = win.get('major_faults_s')
+            vm_info = _WindowsCounters.commit()
+            out['mem_cached_gb'] = vm_info.get('cached', 0) / _GB
+            strict = True  # no Windows o limite de commit é sempre aplicado
+        else:
+            vm_info = _read_linux_vm()
+            strict = vm_info.get('strict_commit', False)
+            if 'major_faults' in vm_info:
+                counters['major_faults'] = vm_info['major_faults']
+            counters.update(_read_psi())
+        if strict and vm_info.get('CommitLimit'):
+            out['commit_pct'] = vm_info['Committed_AS'] / vm_info['CommitLimit'] * 100
+
+        prev, self._prev_mem = self._prev_mem, (now, counters)
+        if prev is None:
+            return
+        dt = max(0.001, now - prev[0])
+        old = prev[1]
+
+        def rate(key):
+            return max(0, counters[key] - old[key]) / dt if key in counters and key in old else None
+
+        if self._win_counters is None:
+            if rate('sin') is not None:
+                out['swap_in_mb_s'] = rate('sin') / _MB
+                out['swap_out_mb_s'] = rate('sout') / _MB
+            out['major_faults_s'] = rate('major_faults')
+        for resource, kind in _PSI_FIELDS:
+            stalled = rate(f'psi_{resource}_{kind}')  # µs parados por segundo
+            if stalled is not None:
+                out[f'psi_{resource}_{kind}'] = min(100.0, stalled / 1e4)
+
     def _detect_gpu_cli(self):
         try:
             return shutil.which('nvidia-smi')
@@ -0,0 +1,490 @@
+# Date: 19/10/2026
+# DEV: Martinez
+# Cloud Optimizer v1 Free Utility by Martinez
+
+import asyncio
+import json
+import os
+import socket
+import struct
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from cloud_optimizer.utils import app_data_dir
+
+__all__ = [
+    "NetServer",
+    "throughput",
+    "latency",
+    "connect_rate",
+    "run_net_bench",
+    "compare_runs",
+    "measure_tweak",
+    "save_run",
+    "load_history",
+    "parse_target",
+]
+
+ProgressCallback = Callable[[Dict], None]
+Address = Tuple[str, int]
+
+_KB = 1024
+_MB = 1024 * _KB
+_CHUNK = 256 * _KB
+_MAX_CONNECTS = 1000  # por teste: evita esgotar portas efêmeras com conexões em TIME_WAIT
+
+# Cabeçalho de cada conexão: modo (1 byte) + buffer de socket pedido ao servidor (uint32, 0 = padrão)
+_HEADER = struct.Struct('!cI')
+_SINK, _SOURCE, _ECHO = b'S', b'D', b'E'
+
+
+class NetServer:
+    """Servidor de teste (asyncio) numa thread própria: recebe, envia e ecoa.
+
+    Cada conexão começa com o cabeçalho `_HEADER`: 'S' descarta tudo e, no fim,
+    responde quantos bytes recebeu; 'D' envia dados até o cliente fechar; 'E'
+    devolve o que chegar. Conexões fechadas sem cabeçalho (teste de conexão)
+    são só aceitas. O mesmo servidor roda em outra máquina para testar a rede
+    de verdade (benchmarks/bench_net.py --serve).
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0) -> None:
+        self.host = host
+        self.port = port
+        self.address: Optional[Address] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._server = None
+        self._writers = set()
+
+    def start(self) -> Address:
+        ready = threading.Event()
+        errors: List[BaseException] = []
+
+        def run():
+            loop = asyncio.new_event_loop()
+            self._loop = loop
+            try:
+                # Fila de accept grande: o teste de conexão abre centenas seguidas
+                self._server = loop.run_until_complete(
+                    asyncio.start_server(self._handle, self.host, self.port, backlog=_MAX_CONNECTS))
+                self.address = self._server.sockets[0].getsockname()[:2]
+            except BaseException as e:
+                errors.append(e)
+                ready.set()
+                loop.close()
+                return
+            ready.set()
+            try:
+                loop.run_forever()
+            finally:
+                self._server.close()
+                # Derruba as conexões abertas e deixa cada tarefa terminar sozinha
+                # (cancelar no 3.11 faz o StreamReaderProtocol logar CancelledError)
+                for writer in list(self._writers):
+                    writer.transport.abort()
+                pending = asyncio.all_tasks(loop)
+                if pending:
+                    loop.run_until_complete(asyncio.wait(pending, timeout=5))
+                loop.run_until_complete(self._server.wait_closed())
+                loop.close()
+
+        self._thread = threading.Thread(target=run, name="net-bench-server", daemon=True)
+        self._thread.start()
+        ready.wait(10)
+        if errors:
+            raise Exception(f"Não foi possível abrir o servidor de teste em {self.host}:{self.port}: {errors[0]}")
+        return self.address
+
+    def stop(self) -> None:
+        if self._loop is not None and self._thread is not None and self._thread.is_alive():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(10)
+        self._thread = None
+
+    def __enter__(self) -> 'NetServer':
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._writers.add(writer)
+        try:
+            header = await reader.readexactly(_HEADER.size)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            self._writers.discard(writer)
+            writer.close()
+            return
+        mode, buffer = _HEADER.unpack(header)
+        sock = writer.get_extra_info('socket')
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            if buffer:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF if mode == _SINK else socket.SO_SNDBUF, buffer)
+            if mode == _SINK:
+                total = 0
+                while True:
+                    data = await reader.read(_CHUNK)
+                    if not data:
+                        break
+                    total += len(data)
+                writer.write(struct.pack('!Q', total))
+                await writer.drain()
+            elif mode == _SOURCE:
+                chunk = os.urandom(_CHUNK)
+                while not reader.at_eof():
+                    writer.write(chunk)
+                    await writer.drain()
+            elif mode == _ECHO:
+                while True:
+                    data = await reader.read(64 * _KB)
+                    if not data:
+                        break
+                    writer.write(data)
+                    await writer.drain()
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+
+def parse_target(text: str, default_port: int = 5201) -> Address:
+    """'host', 'host:porta' ou '[ipv6]:porta' -> (host, porta)."""
+    text = text.strip()
+    if text.startswith('['):
+        host, _, rest = text[1:].partition(']')
+        return host, int(rest.lstrip(':') or default_port)
+    if text.count(':') == 1:
+        host, port = text.split(':')
+        return host, int(port)
+    return text, default_port
+
+
+def _connect(address: Address, buffer: Optional[int], option: int, timeout: float) -> socket.socket:
+    sock = socket.socket(socket.getaddrinfo(*address, type=socket.SOCK_STREAM)[0][0], socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    if buffer:
+        # Precisa vir antes do connect para valer na janela anunciada
+        sock.setsockopt(socket.SOL_SOCKET, option, buffer)
+    sock.connect(address)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return sock
+
+
+def _percentiles(samples: List[float]) -> Dict[str, float]:
+    if not samples:
+        return {}
+    samples = sorted(samples)
+    n = len(samples)
+
+    def at(q):
+        return samples[min(n - 1, int(q * n))]
+
+    return {'p50': at(0.50), 'p90': at(0.90), 'p99': at(0.99), 'max': samples[-1]}
+
+
+def throughput(
+    address: Address,
+    direction: str = 'upload',
+    streams: int = 1,
+    buffer: Optional[int] = None,
+    duration: float = 2.0,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[threading.Event] = None,
+    timeout: float = 10.0,
+) -> Dict:
+    """Vazão TCP com `streams` conexões paralelas por `duration` segundos.
+
+    'upload' envia para o servidor e conta o que ele confirmou ter recebido;
+    'download' conta o que chega dele. `buffer` define SO_SNDBUF/SO_RCVBUF dos
+    dois lados (None = autoajuste do sistema). Retorna {'key', 'test',
+    'direction', 'streams', 'buffer', 'bytes', 'elapsed_s', 'mb_s', 'mbit_s'}.
+    """
+    if direction not in ('upload', 'download'):
+        raise Exception(f"Direção desconhecida: {direction}")
+    cancel = cancel or threading.Event()
+    upload = direction == 'upload'
+    counts = [0] * streams
+    stop = threading.Event()
+    chunk = os.urandom(_CHUNK)
+
+    def stream(index: int) -> int:
+        option = socket.SO_SNDBUF if upload else socket.SO_RCVBUF
+        with _connect(address, buffer, option, timeout) as sock:
+            sock.sendall(_HEADER.pack(_SINK if upload else _SOURCE, buffer or 0))
+            if upload:
+                while not stop.is_set():
+                    sock.sendall(chunk)
+                    counts[index] += len(chunk)
+                sock.shutdown(socket.SHUT_WR)
+                ack = b''
+                while len(ack) < 8:
+                    data = sock.recv(8 - len(ack))
+                    if not data:
+                        raise Exception("Servidor fechou a conexão sem confirmar o recebimento")
+                    ack += data
+                return struct.unpack('!Q', ack)[0]
+            buf = bytearray(_CHUNK)
+            while not stop.is_set():
+                n = sock.recv_into(buf)
+                if not n:
+                    break
+                counts[index] += n
+            return counts[index]
+
+    key = f"{direction} {streams}x buf={_size_label(buffer)}"
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=streams, thread_name_prefix="net-bench") as pool:
+        futures = [pool.submit(stream, i) for i in range(streams)]
+        deadline = started + duration
+        while True:
+            now = time.perf_counter()
+            if now >= deadline or cancel.is_set() or any(f.done() for f in futures):
+                break
+            time.sleep(min(0.25, deadline - now))
+            if progress is not None:
+                elapsed = time.perf_counter() - started
+                try:
+                    progress({'name': key, 'elapsed_s': elapsed, 'mb_s': sum(counts) / _MB / elapsed})
+                except Exception:
+                    pass
+        stop.set()
+        total = sum(f.result() for f in futures)
+    elapsed = time.perf_counter() - started
+    return {
+        'key': key,
+        'test': 'throughput',
+        'direction': direction,
+        'streams': streams,
+        'buffer': buffer,
+        'bytes': total,
+        'elapsed_s': elapsed,
+        'mb_s': total / _MB / elapsed,
+        'mbit_s': total * 8 / 1e6 / elapsed,
+    }
+
+
+def latency(address: Address, count: int = 1000, payload: int = 1, duration: float = 2.0,
+            cancel: Optional[threading.Event] = None, timeout: float = 10.0) -> Dict:
+    """Tempo de ida e volta (µs) de `count` mensagens pequenas numa conexão com TCP_NODELAY.
+
+    Para no que vier primeiro: `count` mensagens ou `duration` segundos.
+    Retorna {'key', 'test', 'samples', 'p50', 'p90', 'p99', 'max'}.
+    """
+    cancel = cancel or threading.Event()
+    message = b'p' * payload
+    rtts: List[float] = []
+    with _connect(address, None, socket.SO_SNDBUF, timeout) as sock:
+        sock.sendall(_HEADER.pack(_ECHO, 0))
+        deadline = time.perf_counter() + duration
+        for _ in range(count):
+            if cancel.is_set() or time.perf_counter() > deadline:
+                break
+            t0 = time.perf_counter()
+            sock.sendall(message)
+            got = 0
+            while got < payload:
+                data = sock.recv(payload - got)
+                if not data:
+                    raise Exception("Servidor fechou a conexão no teste de latência")
+                got += len(data)
+            rtts.append((time.perf_counter() - t0) * 1e6)
+    return dict(_percentiles(rtts), key=f"rtt {payload}B", test='latency', samples=len(rtts))
+
+
+def connect_rate(address: Address, duration: float = 1.0, cancel: Optional[threading.Event] = None,
+                 timeout: float = 10.0) -> Dict:
+    """Conexões TCP abertas e fechadas por segundo (até `_MAX_CONNECTS`) e o tempo de cada uma (µs).
+
+    Retorna {'key', 'test', 'connections', 'rate', 'p50', 'p90', 'p99', 'max'}.
+    """
+    cancel = cancel or threading.Event()
+    family = socket.getaddrinfo(*address, type=socket.SOCK_STREAM)[0][0]
+    times: List[float] = []
+    started = time.perf_counter()
+    deadline = started + duration
+    while len(times) < _MAX_CONNECTS and time.perf_counter() < deadline and not cancel.is_set():
+        t0 = time.perf_counter()
+        with socket.socket(family, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(address)
+        times.append((time.perf_counter() - t0) * 1e6)
+    elapsed = time.perf_counter() - started
+    return dict(_percentiles(times), key='connect', test='connect', connections=len(times),
+                rate=len(times) / elapsed if elapsed else 0.0)
+
+
+def _size_label(buffer: Optional[int]) -> str:
+    if not buffer:
+        return 'auto'
+    return f"{buffer // _MB}M" if buffer >= _MB and buffer % _MB == 0 else f"{buffer // _KB}K"
+
+
+def run_net_bench(
+    target: Optional[Address] = None,
+    buffers: Iterable[Optional[int]] = (None, 64 * _KB, 4 * _MB),
+    streams: Iterable[int] = (1, 4),
+    directions: Iterable[str] = ('upload', 'download'),
+    duration: float = 2.0,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[threading.Event] = None,
+) -> Dict:
+    """Bateria de rede: vazão (direção × buffer × conexões), latência e taxa de conexão.
+
+    Sem `target` sobe um `NetServer` local (loopback: mede a pilha TCP do
+    sistema, não a placa); com `target` testa contra um servidor rodando em
+    outra máquina (inacessível = exceção antes de começar). Retorna {'target', 'local', 'results', 'elapsed_s',
+    'cancelled'}; testes que falharem viram {'key', 'test', 'error'}.
+    `progress` recebe {'name', 'index', 'total', ...} durante os testes e
+    {'name', 'index', 'total', 'result'} ao fim de cada um.
+    """
+    started = time.perf_counter()
+    cancel = cancel or threading.Event()
+    if target:
+        try:
+            socket.create_connection(target, timeout=5).close()
+        except OSError as e:
+            raise Exception(f"Servidor de teste {target[0]}:{target[1]} inacessível: {e}")
+    server = None if target else NetServer()
+    address = target or server.start()
+    plan: List[Tuple[str, Callable[[Callable], Dict]]] = []
+    for direction in directions:
+        for buffer in buffers:
+            for count in streams:
+                plan.append((f"{direction} {count}x buf={_size_label(buffer)}",
+                             lambda on, d=direction, b=buffer, c=count: throughput(address, d, c, b, duration, on, cancel)))
+    plan.append(("rtt 1B", lambda on: latency(address, duration=duration, cancel=cancel)))
+    plan.append(("connect", lambda on: connect_rate(address, duration=min(duration, 1.0), cancel=cancel)))
+
+    results = []
+    try:
+        for index, (name, run) in enumerate(plan, 1):
+            if cancel.is_set():
+                break
+
+            def on_progress(ev, index=index):
+                if progress is not None:
+                    progress(dict(ev, index=index, total=len(plan)))
+
+            if progress is not None:
+                progress({'name': name, 'index': index, 'total': len(plan), 'elapsed_s': 0.0, 'mb_s': 0.0})
+            try:
+                results.append(run(on_progress))
+            except Exception as e:
+                results.append({'key': name, 'test': name.split()[0], 'error': str(e)})
+            if progress is not None:
+                progress({'name': name, 'index': index, 'total': len(plan), 'result': results[-1]})
+    finally:
+        if server is not None:
+            server.stop()
+    return {
+        'target': f"{address[0]}:{address[1]}" if target else 'loopback',
+        'local': target is None,
+        'results': results,
+        'elapsed_s': time.perf_counter() - started,
+        'cancelled': cancel.is_set(),
+    }
+
+
+def _value(result: Dict) -> Tuple[Optional[float], bool]:
+    """(métrica principal, maior é melhor) de um resultado."""
+    if result.get('error'):
+        return None, True
+    if result['test'] == 'throughput':
+        return result['mb_s'], True
+    if result['test'] == 'latency':
+        return result.get('p50'), False
+    return result.get('rate'), True
+
+
+def compare_runs(before: Dict, after: Dict) -> List[Dict]:
+    """Compara duas execuções teste a teste: [{'key', 'before', 'after', 'change_pct'}].
+
+    `change_pct` já vem orientado (positivo = melhor, inclusive na latência).
+    """
+    previous = {r['key']: r for r in before['results']}
+    out = []
+    for result in after['results']:
+        old = previous.get(result['key'])
+        if old is None:
+            continue
+        a, higher = _value(result)
+        b, _ = _value(old)
+        if a is None or not b:
+            continue
+        sign = 1 if higher else -1
+        out.append({'key': result['key'], 'before': b, 'after': a, 'change_pct': sign * (a - b) / b * 100})
+    return out
+
+
+def _history_path() -> str:
+    return app_data_dir('net_history.jsonl')
+
+
+def save_run(run: Dict, label: str = '', path: Optional[str] = None) -> Dict:
+    """Anexa uma execução ao histórico (net_history.jsonl) e retorna o registro gravado."""
+    record = dict(run, label=label, ts=time.time())
+    path = path or _history_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'a', encoding='utf-8') as fh:
+        fh.write(json.dumps(record, ensure_ascii=False) + '\n')
+    return record
+
+
+def load_history(target: Optional[str] = None, limit: int = 50, path: Optional[str] = None) -> List[Dict]:
+    """Execuções gravadas (mais recentes no fim), só do `target` informado se houver."""
+    try:
+        with open(path or _history_path(), encoding='utf-8') as fh:
+            lines = fh.readlines()
+    except OSError:
+        return []
+    runs = []
+    for line in lines:
+        try:
+            run = json.loads(line)
+        except ValueError:
+            continue
+        if target is None or run.get('target') == target:
+            runs.append(run)
+    return runs[-limit:]
+
+
+def measure_tweak(
+    tweak: Callable[[], object],
+    name: str,
+    target: Optional[Address] = None,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[threading.Event] = None,
+    **options,
+) -> Dict:
+    """Mede a rede, aplica `tweak` e mede de novo; grava as duas execuções no histórico.
+
+    Retorna {'before', 'after', 'comparison', 'error'}; se o ajuste falhar,
+    'after' fica None e 'error' traz a mensagem. `progress` recebe os eventos
+    de `run_net_bench` com 'phase' ('antes' ou 'depois'); `options` vão para
+    `run_net_bench` (buffers, streams, directions, duration).
+    """
+    cancel = cancel or threading.Event()
+
+    def bench(phase):
+        def on_progress(ev):
+            if progress is not None:
+                progress(dict(ev, phase=phase))
+        return save_run(run_net_bench(target, progress=on_progress, cancel=cancel, **options), f"{phase}: {name}")
+
+    report = {'before': bench('antes'), 'after': None, 'comparison': [], 'error': None}
+    if cancel.is_set():
+        return report
+    try:
+        tweak()
+    except Exception as e:
+        report['error'] = str(e)
+        return report
+    report['after'] = bench('depois')
+    report['comparison'] = compare_runs(report['before'], report['after'])
+    return report
@@ -0,0 +1,340 @@
+# Date: 19/10/2026
+# DEV: Martinez
+# Cloud Optimizer v1 Free Utility by Martinez
+
+import hashlib
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from cloud_optimizer.disk_bench import DiskTest, prepare_file, run_test
+from cloud_optimizer.net_bench import NetServer, latency as net_latency, throughput as net_throughput
+from cloud_optimizer.utils import app_data_dir
+
+__all__ = ["METRICS", "run_suite", "compare", "measure_impact", "load_history"]
+
+ProgressCallback = Callable[[Dict], None]
+
+_MB = 1024 * 1024
+_SAMPLE_S = 0.2  # duração alvo de cada amostra dos testes por tempo
+_DISK_FILE = 32 * _MB  # arquivo do teste de disco (o único temporário grande)
+_FILES = 300
+_PINGS = 500
+
+
+def _hash_for(deadline: float, data: bytes) -> int:
+    # hashlib solta o GIL em blocos grandes: as threads rodam em paralelo de verdade
+    done = 0
+    while time.perf_counter() < deadline:
+        hashlib.sha256(data).digest()
+        done += len(data)
+    return done
+
+
+def _cpu_single(ctx: Dict) -> float:
+    start = time.perf_counter()
+    done = _hash_for(start + _SAMPLE_S, ctx['block'])
+    return done / _MB / (time.perf_counter() - start)
+
+
+def _cpu_multi(ctx: Dict) -> float:
+    workers = ctx['threads']
+    start = time.perf_counter()
+    deadline = start + _SAMPLE_S
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bench-cpu") as pool:
+        done = sum(pool.map(lambda _: _hash_for(deadline, ctx['block']), range(workers)))
+    return done / _MB / (time.perf_counter() - start)
+
+
+def _memory(ctx: Dict) -> float:
+    src, dst = ctx['mem_src'], ctx['mem_dst']
+    copied = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < _SAMPLE_S:
+        dst[:] = src  # memcpy entre dois buffers maiores que o cache
+        copied += len(src)
+    return copied / _MB / (time.perf_counter() - start)
+
+
+def _file_ops(ctx: Dict) -> float:
+    folder = os.path.join(ctx['workdir'], 'files')
+    os.makedirs(folder, exist_ok=True)
+    start = time.perf_counter()
+    paths = [os.path.join(folder, f'f{i}.tmp') for i in range(_FILES)]
+    for path in paths:
+        with open(path, 'wb') as fh:
+            fh.write(b'x')
+    for path in paths:
+        os.remove(path)
+    return _FILES / (time.perf_counter() - start)
+
+
+def _disk(pattern: str, op: str, block: int, field: str) -> Callable[[Dict], float]:
+    """Teste de disco da suíte: um `disk_bench.run_test` curto sobre o arquivo de 32 MB.
+
+    Usa O_DIRECT onde o sistema de arquivos aceita (senão o arquivo pequeno
+    fica todo no cache e o teste mede a RAM); se não aceitar, cai para E/S com cache.
+    """
+    def measure(ctx: Dict) -> float:
+        path = os.path.join(ctx['workdir'], 'disk.bin')
+        if not os.path.exists(path):
+            prepare_file(path, _DISK_FILE, ctx['chunk'])
+        if ctx.get('disk_mode') is None:
+            try:
+                result = run_test(path, DiskTest(pattern, op, block, 1, 'direct'), _SAMPLE_S)
+                ctx['disk_mode'] = 'direct'
+                return result[field]
+            except Exception:
+                ctx['disk_mode'] = 'buffered'
+        return run_test(path, DiskTest(pattern, op, block, 1, ctx['disk_mode']), _SAMPLE_S)[field]
+    return measure
+
+
+def _net_address(ctx: Dict):
+    if 'net' not in ctx:
+        ctx['net'] = NetServer()
+        ctx['net'].start()
+    return ctx['net'].address
+
+
+def _tcp_throughput(ctx: Dict) -> float:
+    return net_throughput(_net_address(ctx), 'upload', 1, None, _SAMPLE_S)['mb_s']
+
+
+def _tcp_latency(ctx: Dict) -> float:
+    return net_latency(_net_address(ctx), count=_PINGS)['p50']
+
+
+# Testes da suíte: nome -> (função, unidade, maior é melhor, descrição)
+METRICS = {
+    'cpu_single': (_cpu_single, 'MB/s', True, "CPU, 1 thread (SHA-256)"),
+    'cpu_multi': (_cpu_multi, 'MB/s', True, "CPU, todas as threads (SHA-256)"),
+    'memory': (_memory, 'MB/s', True, "Memória (cópia de 64 MB)"),
+    'file_ops': (_file_ops, 'arq/s', True, "Criar e apagar arquivos"),
+    'disk_seq_write': (_disk('seq', 'write', _MB, 'mb_s'), 'MB/s', True, "Disco, escrita sequencial"),
+    'disk_seq_read': (_disk('seq', 'read', _MB, 'mb_s'), 'MB/s', True, "Disco, leitura sequencial"),
+    'disk_rand_read': (_disk('rand', 'read', 4096, 'iops'), 'IOPS', True, "Disco, leitura aleatória 4K"),
+    'tcp_throughput': (_tcp_throughput, 'MB/s', True, "TCP loopback, vazão"),
+    'tcp_latency': (_tcp_latency, 'µs', False, "TCP loopback, latência (ida e volta)"),
+}
+
+
+def _bootstrap(values: Sequence[float], stat: Callable[[List[float]], float], rng: random.Random, rounds: int) -> Tuple[float, float]:
+    """Intervalo de 95% de `stat` por reamostragem (percentis 2,5 e 97,5)."""
+    n = len(values)
+    estimates = sorted(stat([values[rng.randrange(n)] for _ in range(n)]) for _ in range(rounds))
+    return estimates[int(rounds * 0.025)], estimates[min(rounds - 1, int(rounds * 0.975))]
+
+
+def _summary(samples: List[float], rng: random.Random, rounds: int) -> Dict:
+    low, high = _bootstrap(samples, statistics.median, rng, rounds) if len(samples) > 1 else (samples[0], samples[0])
+    return {'median': statistics.median(samples), 'ci_low': low, 'ci_high': high, 'samples': samples}
+
+
+def run_suite(
+    samples: int = 5,
+    metrics: Optional[Iterable[str]] = None,
+    workdir: Optional[str] = None,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[threading.Event] = None,
+    label: str = '',
+    rounds: int = 2000,
+) -> Dict:
+    """Roda a suíte `samples` vezes e retorna {'label', 'ts', 'host', 'metrics', 'elapsed_s', 'cancelled'}.
+
+    As rodadas são intercaladas (todos os testes, depois todos de novo), então
+    uma variação lenta da máquina afeta todos igualmente. Cada teste em
+    `metrics` vira {'unit', 'higher_is_better', 'description', 'median',
+    'ci_low', 'ci_high', 'samples'} (IC de 95% da mediana por bootstrap).
+    Os temporários (um arquivo de 32 MB e arquivos pequenos) ficam numa pasta
+    própria em `workdir` que é apagada no fim. `progress` recebe {'metric',
+    'round', 'done', 'total'} a cada teste.
+    """
+    started = time.perf_counter()
+    names = [m for m in (metrics or METRICS) if m in METRICS]
+    cancel = cancel or threading.Event()
+    folder = tempfile.mkdtemp(prefix='cloudopt-bench-', dir=workdir)
+    ctx = {
+        'workdir': folder,
+        'threads': os.cpu_count() or 2,
+        'block': os.urandom(_MB),
+        'chunk': os.urandom(_MB),
+    }
+    if 'memory' in names:
+        ctx['mem_src'] = bytearray(os.urandom(_MB)) * 64
+        ctx['mem_dst'] = bytearray(len(ctx['mem_src']))
+    values: Dict[str, List[float]] = {m: [] for m in names}
+    errors: Dict[str, str] = {}
+    total, done = samples * len(names), 0
+    try:
+        for round_ in range(samples):
+            for name in names:
+                if cancel.is_set():
+                    break
+                if name not in errors:
+                    try:
+                        values[name].append(METRICS[name][0](ctx))
+                    except Exception as e:
+                        errors[name] = str(e)
+                done += 1
+                if progress is not None:
+                    try:
+                        progress({'metric': name, 'round': round_ + 1, 'done': done, 'total': total})
+                    except Exception:
+                        pass
+    finally:
+        if 'net' in ctx:
+            ctx['net'].stop()
+        ctx.pop('mem_src', None)
+        ctx.pop('mem_dst', None)
+        shutil.rmtree(folder, ignore_errors=True)
+
+    summary_rng = random.Random(1)
+    result = {}
+    for name in names:
+        _, unit, higher, desc = METRICS[name]
+        entry = {'unit': unit, 'higher_is_better': higher, 'description': desc}
+        if values[name]:
+            entry.update(_summary(values[name], summary_rng, rounds))
+        if name in errors:
+            entry['error'] = errors[name]
+        result[name] = entry
+    return {
+        'label': label,
+        'ts': time.time(),
+        'host': {'system': platform.system(), 'release': platform.release(), 'machine': platform.machine(),
+                 'cpus': os.cpu_count()},
+        'metrics': result,
+        'elapsed_s': time.perf_counter() - started,
+        'cancelled': cancel.is_set(),
+    }
+
+
+def compare(before: Dict, after: Dict, rounds: int = 2000, min_effect_pct: float = 2.0) -> Dict:
+    """Compara duas execuções da suíte teste a teste.
+
+    Para cada teste presente nas duas: {'before', 'after', 'change_pct',
+    'ci_low', 'ci_high', 'verdict'}. `change_pct` é a variação da mediana já
+    orientada (positivo = melhor, inclusive na latência); o IC de 95% vem de
+    reamostrar as duas execuções. O veredito só é 'melhor' ou 'pior' quando o
+    intervalo não inclui zero e a variação passa de `min_effect_pct` (abaixo
+    disso a diferença não importa na prática); senão é 'sem diferença'.
+    """
+    rng = random.Random(2)
+    out = {}
+    for name, b in before['metrics'].items():
+        a = after['metrics'].get(name)
+        if not a or not b.get('samples') or not a.get('samples'):
+            continue
+        sign = 1 if b['higher_is_better'] else -1
+        xs, ys = b['samples'], a['samples']
+
+        def change(bx, ay):
+            base = statistics.median(bx)
+            return sign * (statistics.median(ay) - base) / base * 100 if base else 0.0
+
+        estimates = sorted(
+            change([xs[rng.randrange(len(xs))] for _ in xs], [ys[rng.randrange(len(ys))] for _ in ys])
+            for _ in range(rounds)
+        )
+        low, high = estimates[int(rounds * 0.025)], estimates[min(rounds - 1, int(rounds * 0.975))]
+        pct = change(xs, ys)
+        verdict = 'sem diferença'
+        if abs(pct) >= min_effect_pct:
+            verdict = 'melhor' if low > 0 else 'pior' if high < 0 else verdict
+        out[name] = {'before': b['median'], 'after': a['median'], 'unit': b['unit'], 'description': b['description'],
+                     'change_pct': pct, 'ci_low': low, 'ci_high': high, 'verdict': verdict}
+    return out
+
+
+def _history_path() -> str:
+    return app_data_dir('bench_history.jsonl')
+
+
+def _append_history(record: Dict, path: Optional[str] = None) -> None:
+    path = path or _history_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'a', encoding='utf-8') as fh:
+        fh.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+
+def load_history(limit: int = 50, path: Optional[str] = None) -> List[Dict]:
+    """Últimas medições de impacto gravadas (mais recentes no fim)."""
+    try:
+        with open(path or _history_path(), encoding='utf-8') as fh:
+            lines = fh.readlines()[-limit:]
+    except OSError:
+        return []
+    records = []
+    for line in lines:
+        try:
+            records.append(json.loads(line))
+        except ValueError:
+            continue
+    return records
+
+
+def measure_impact(
+    stages: Sequence[Tuple[str, Callable[[], object]]],
+    samples: int = 5,
+    metrics: Optional[Iterable[str]] = None,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[threading.Event] = None,
+    history: Optional[str] = None,
+) -> Dict:
+    """Mede a suíte antes de tudo e depois de cada etapa (ex.: cada ajuste de um perfil).
+
+    Cada etapa é comparada com a medição anterior, então o ganho (ou perda) de
+    cada ajuste aparece separado; 'total' compara a primeira com a última.
+    O resultado vai para bench_history.jsonl e é retornado:
+    {'baseline', 'stages': [{'name', 'result', 'error', 'suite', 'comparison'}], 'total', 'elapsed_s'}.
+    `progress` recebe os eventos da suíte com 'stage' (nome da etapa ou 'baseline').
+    """
+    started = time.perf_counter()
+    cancel = cancel or threading.Event()
+
+    def suite(stage):
+        def on_progress(ev):
+            if progress is not None:
+                progress(dict(ev, stage=stage))
+        return run_suite(samples, metrics, progress=on_progress, cancel=cancel, label=stage)
+
+    baseline = suite('baseline')
+    previous = baseline
+    report = {'baseline': baseline, 'stages': [], 'total': {}, 'elapsed_s': 0.0}
+    for name, run in stages:
+        if cancel.is_set():
+            break
+        if progress is not None:
+            try:
+                progress({'stage': name, 'metric': None, 'done': 0, 'total': 0})
+            except Exception:
+                pass
+        stage = {'name': name, 'result': None, 'error': None}
+        try:
+            stage['result'] = run()
+        except Exception as e:
+            stage['error'] = str(e)
+        stage['suite'] = suite(name)
+        stage['comparison'] = compare(previous, stage['suite'])
+        previous = stage['suite']
+        report['stages'].append(stage)
+    report['total'] = compare(baseline, previous)
+    report['elapsed_s'] = time.perf_counter() - started
+    _append_history({
+        'ts': time.time(),
+        'host': baseline['host'],
+        'samples': samples,
+        'stages': [{'name': s['name'], 'error': s['error'], 'comparison': s['comparison']} for s in report['stages']],
+        'total': report['total'],
+        'cancelled': cancel.is_set(),
+    }, history)
+    return report
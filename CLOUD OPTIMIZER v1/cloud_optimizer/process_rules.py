@@ -0,0 +1,461 @@
+# Date: 19/10/2026
+# DEV: Martinez
+# Cloud Optimizer v1 Free Utility by Martinez
+
+import ctypes
+import fnmatch
+import functools
+import glob
+import json
+import os
+import re
+import shutil
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+import psutil
+
+from cloud_optimizer.process_table import ProcessEntry, ProcessTable
+from cloud_optimizer.utils import app_data_dir, run_hidden_command
+
+__all__ = [
+    "PRIORITIES",
+    "ProcessRule",
+    "ProcessRulesEngine",
+    "load_rules",
+    "save_rules",
+    "core_classes",
+    "parse_cores",
+    "foreground_pid",
+    "priority_value",
+]
+
+# Níveis de prioridade, do mais baixo para o mais alto (tempo real fica de fora de propósito)
+PRIORITIES = ('idle', 'below_normal', 'normal', 'above_normal', 'high')
+# Equivalente em nice no Linux/macOS (subir acima de normal exige root)
+_NICE = {'idle': 19, 'below_normal': 10, 'normal': 0, 'above_normal': -5, 'high': -10}
+
+CoreSpec = Union[None, str, Sequence[int]]
+
+
+def priority_value(level: str) -> int:
+    """Valor do sistema para o nível (classe de prioridade no Windows, nice nos demais)."""
+    if level not in PRIORITIES:
+        raise Exception(f"Prioridade desconhecida: {level}")
+    if os.name == 'nt':
+        return getattr(psutil, f"{level.upper()}_PRIORITY_CLASS")
+    return _NICE[level]
+
+
+def _priority_rank(value: int) -> int:
+    """Posição em PRIORITIES de um valor lido com nice() (desconhecido = normal)."""
+    if os.name == 'nt':
+        for i, level in enumerate(PRIORITIES):
+            if getattr(psutil, f"{level.upper()}_PRIORITY_CLASS") == value:
+                return i
+        return PRIORITIES.index('normal')
+    return sum(1 for level in PRIORITIES if value <= _NICE[level]) - 1
+
+
+def _parse_cpu_list(text: str) -> List[int]:
+    """'0-3,8,10-11' -> [0, 1, 2, 3, 8, 10, 11] (formato do sysfs e das regras)."""
+    cpus: List[int] = []
+    for part in text.replace(' ', '').split(','):
+        if not part:
+            continue
+        if '-' in part:
+            low, high = part.split('-', 1)
+            cpus.extend(range(int(low), int(high) + 1))
+        else:
+            cpus.append(int(part))
+    return cpus
+
+
+def _windows_core_classes() -> Dict[int, int]:
+    """CPU lógica -> EfficiencyClass (maior = núcleo de desempenho) via GetSystemCpuSetInformation."""
+    kernel32 = ctypes.windll.kernel32
+    length = ctypes.c_ulong(0)
+    kernel32.GetSystemCpuSetInformation(None, 0, ctypes.byref(length), None, 0)
+    buf = ctypes.create_string_buffer(length.value)
+    if not kernel32.GetSystemCpuSetInformation(buf, length, ctypes.byref(length), None, 0):
+        return {}
+    classes, offset, raw = {}, 0, buf.raw
+    while offset < length.value:
+        size = int.from_bytes(raw[offset:offset + 4], 'little')
+        if size == 0:
+            break
+        # SYSTEM_CPU_SET_INFORMATION: Size, Type, Id, Group, LogicalProcessorIndex(14), ..., EfficiencyClass(18)
+        group = int.from_bytes(raw[offset + 12:offset + 14], 'little')
+        if group == 0:
+            classes[raw[offset + 14]] = raw[offset + 18]
+        offset += size
+    return classes
+
+
+@functools.lru_cache(maxsize=1)
+def core_classes() -> Dict[str, List[int]]:
+    """Núcleos de desempenho e de eficiência: {'performance': [...], 'efficiency': [...]}.
+
+    Linux: cpu_core/cpu_atom do sysfs (Intel híbrido) ou, em big.LITTLE, a
+    frequência máxima de cada CPU. Windows: EfficiencyClass dos CPU sets. Sem
+    distinção (CPU comum), as duas listas trazem todas as CPUs e regras por
+    tipo de núcleo não restringem nada.
+    """
+    every = list(range(psutil.cpu_count() or 1))
+    try:
+        if os.name == 'nt':
+            by_cpu = _windows_core_classes()
+        else:
+            by_cpu = {}
+            for class_id, kind in ((1, 'cpu_core'), (0, 'cpu_atom')):
+                try:
+                    with open(f'/sys/devices/{kind}/cpus', encoding='ascii') as fh:
+                        by_cpu.update((cpu, class_id) for cpu in _parse_cpu_list(fh.read().strip()))
+                except OSError:
+                    pass
+            if not by_cpu:
+                for path in glob.glob('/sys/devices/system/cpu/cpu[0-9]*/cpufreq/cpuinfo_max_freq'):
+                    with open(path, encoding='ascii') as fh:
+                        by_cpu[int(os.path.basename(os.path.dirname(os.path.dirname(path)))[3:])] = int(fh.read())
+    except (OSError, ValueError, AttributeError):
+        by_cpu = {}
+    if len(set(by_cpu.values())) < 2:
+        return {'performance': every, 'efficiency': every}
+    top = max(by_cpu.values())
+    return {
+        'performance': sorted(cpu for cpu, c in by_cpu.items() if c == top),
+        'efficiency': sorted(cpu for cpu, c in by_cpu.items() if c != top),
+    }
+
+
+def parse_cores(spec: CoreSpec) -> Optional[List[int]]:
+    """Converte a afinidade de uma regra numa lista de CPUs (None = não mexer).
+
+    Aceita lista de números, faixas em texto ('0-7', '0,2,4') ou o tipo de
+    núcleo ('performance', 'efficiency'). CPUs inexistentes são ignoradas.
+    """
+    if spec is None or spec == '' or spec == []:
+        return None
+    if isinstance(spec, str):
+        key = spec.strip().lower()
+        cpus = core_classes()[key] if key in ('performance', 'efficiency') else _parse_cpu_list(key)
+    else:
+        cpus = [int(c) for c in spec]
+    count = psutil.cpu_count() or 1
+    cpus = sorted({c for c in cpus if 0 <= c < count})
+    if not cpus:
+        raise Exception(f"Afinidade sem nenhuma CPU válida: {spec}")
+    return cpus
+
+
+class ProcessRule:
+    """Regra de processo: nome casa com algum padrão -> prioridade e/ou afinidade.
+
+    Padrões são fnmatch sem diferenciar maiúsculas, comparados com o nome do
+    processo (ex.: 'chrome.exe', 'onedrive*', '*update*'). Formato JSON
+    (process_rules.json), por exemplo:
+      {"name": "Render", "patterns": ["blender*"], "priority": "high", "cores": "0-7"}
+      {"name": "Atualizadores", "patterns": ["*update*"], "priority": "idle", "cores": "efficiency"}
+    """
+
+    def __init__(
+        self,
+        name: str,
+        patterns: Iterable[str],
+        priority: Optional[str] = None,
+        cores: CoreSpec = None,
+        enabled: bool = True,
+    ) -> None:
+        self.name = name
+        self.patterns = [p for p in patterns if p]
+        if not self.patterns:
+            raise Exception(f"Regra de processo sem padrões: {name}")
+        if priority is not None and priority not in PRIORITIES:
+            raise Exception(f"Prioridade desconhecida na regra {name}: {priority}")
+        self.priority = priority
+        self.cores = cores
+        self.enabled = bool(enabled)
+        self._name_re = re.compile('|'.join(fnmatch.translate(p.lower()) for p in self.patterns))
+
+    def matches(self, name: str) -> bool:
+        return bool(name) and self._name_re.match(name.lower()) is not None
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ProcessRule":
+        return cls(
+            name=data.get('name', ''),
+            patterns=data.get('patterns', []),
+            priority=data.get('priority'),
+            cores=data.get('cores'),
+            enabled=data.get('enabled', True),
+        )
+
+    def to_dict(self) -> Dict:
+        return {
+            'name': self.name,
+            'patterns': self.patterns,
+            'priority': self.priority,
+            'cores': self.cores,
+            'enabled': self.enabled,
+        }
+
+
+DEFAULT_RULES = (
+    ProcessRule(
+        'Atualizadores em segundo plano',
+        ['*updater*', '*update.exe', 'googleupdate*', 'msedgeupdate*', 'onedrive*', 'packagekitd', 'unattended-upgr*', 'fwupd'],
+        priority='idle', cores='efficiency',
+    ),
+    ProcessRule(
+        'Indexação',
+        ['searchindexer.exe', 'searchprotocolhost.exe', 'searchfilterhost.exe', 'tracker-miner-*', 'baloo_file*'],
+        priority='idle', cores='efficiency',
+    ),
+)
+
+
+def _rules_path() -> str:
+    return app_data_dir('process_rules.json')
+
+
+def load_rules(path: Optional[str] = None) -> List[ProcessRule]:
+    """Carrega as regras do usuário; sem arquivo, usa DEFAULT_RULES."""
+    path = path or _rules_path()
+    try:
+        with open(path, encoding='utf-8') as fh:
+            data = json.load(fh)
+        rules = [ProcessRule.from_dict(d) for d in data]
+        return [r for r in rules if r.enabled]
+    except FileNotFoundError:
+        return list(DEFAULT_RULES)
+    except (OSError, ValueError) as e:
+        raise Exception(f"Regras de processos inválidas em {path}: {e}")
+
+
+def save_rules(rules: Iterable[ProcessRule], path: Optional[str] = None) -> None:
+    path = path or _rules_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as fh:
+        json.dump([r.to_dict() for r in rules], fh, indent=2, ensure_ascii=False)
+
+
+def foreground_pid() -> Optional[int]:
+    """PID da janela em primeiro plano (Windows; X11 com xprop). None onde não há como saber (ex.: Wayland)."""
+    try:
+        if os.name == 'nt':
+            user32 = ctypes.windll.user32
+            hwnd = user32.GetForegroundWindow()
+            if not hwnd:
+                return None
+            pid = ctypes.c_ulong(0)
+            user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+            return pid.value or None
+        if not os.environ.get('DISPLAY') or not shutil.which('xprop'):
+            return None
+        active = run_hidden_command(['xprop', '-root', '_NET_ACTIVE_WINDOW'], capture_output=True, text=True, timeout=2)
+        match = re.search(r'window id # (0x[0-9a-f]+)', active.stdout)
+        if not match or int(match.group(1), 16) == 0:
+            return None
+        owner = run_hidden_command(['xprop', '-id', match.group(1), '_NET_WM_PID'], capture_output=True, text=True, timeout=2)
+        match = re.search(r'=\s*(\d+)', owner.stdout)
+        return int(match.group(1)) if match else None
+    except Exception:
+        return None
+
+
+class ProcessRulesEngine:
+    """Aplica regras de prioridade/afinidade só aos processos que surgem ("modo desempenho").
+
+    A cada `tick()` a `ProcessTable` informa os processos novos e só eles são
+    comparados com as regras (a primeira que casar vale); processos já
+    ajustados não são tocados de novo. Antes da primeira mudança em um
+    processo guardamos prioridade e afinidade originais, e `restore()` (ou
+    `stop()`) devolve tudo aos processos que ainda existem.
+
+    Com `foreground_boost`, o processo da janela em primeiro plano recebe a
+    prioridade `boost` enquanto estiver em foco e volta à anterior ao perder o
+    foco. `foreground` permite trocar a detecção (ex.: testes).
+    """
+
+    def __init__(
+        self,
+        rules: Iterable[ProcessRule],
+        table: Optional[ProcessTable] = None,
+        foreground_boost: bool = False,
+        foreground: Callable[[], Optional[int]] = foreground_pid,
+        boost: str = 'above_normal',
+    ) -> None:
+        self.rules = [r for r in rules if r.enabled]
+        self.table = table or ProcessTable()
+        self.foreground_boost = foreground_boost
+        self._foreground = foreground
+        self._boost_value = priority_value(boost)
+        self._boost_rank = PRIORITIES.index(boost)
+        self._cores = {id(r): parse_cores(r.cores) for r in self.rules}
+        self._original: Dict[int, Dict] = {}  # pid -> {'create_time', 'nice', 'affinity', 'entry'}
+        self._boosted: Optional[ProcessEntry] = None
+        self._boost_prior: Optional[int] = None
+        self._own_pid = os.getpid()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.stats = {'ticks': 0, 'applied': 0, 'errors': 0, 'last_tick_s': 0.0, 'processes': 0}
+
+    def match(self, entry: ProcessEntry) -> Optional[ProcessRule]:
+        for rule in self.rules:
+            if rule.matches(entry.name):
+                return rule
+        return None
+
+    def _remember(self, entry: ProcessEntry) -> None:
+        if entry.pid in self._original:
+            return
+        proc = entry.process
+        saved = {'create_time': entry.create_time, 'entry': entry, 'nice': None, 'affinity': None}
+        try:
+            saved['nice'] = proc.nice()
+        except psutil.Error:
+            pass
+        if hasattr(proc, 'cpu_affinity'):
+            try:
+                saved['affinity'] = proc.cpu_affinity()
+            except psutil.Error:
+                pass
+        self._original[entry.pid] = saved
+
+    def _apply(self, entry: ProcessEntry, rule: ProcessRule) -> Dict:
+        event = {'event': 'process_rule_applied', 'pid': entry.pid, 'name': entry.name, 'rule': rule.name,
+                 'priority': rule.priority, 'cores': self._cores[id(rule)], 'errors': []}
+        self._remember(entry)
+        proc = entry.process
+        if rule.priority is not None:
+            try:
+                proc.nice(priority_value(rule.priority))
+            except psutil.AccessDenied:
+                event['errors'].append("prioridade: acesso negado")
+            except psutil.Error as e:
+                event['errors'].append(f"prioridade: {e}")
+        cores = self._cores[id(rule)]
+        if cores is not None:
+            if not hasattr(proc, 'cpu_affinity'):
+                event['errors'].append("afinidade não suportada neste sistema")
+            else:
+                try:
+                    proc.cpu_affinity(cores)
+                except psutil.AccessDenied:
+                    event['errors'].append("afinidade: acesso negado")
+                except (psutil.Error, ValueError) as e:
+                    event['errors'].append(f"afinidade: {e}")
+        return event
+
+    def _update_boost(self) -> List[Dict]:
+        events = []
+        pid = self._foreground()
+        current = self._boosted
+        if current is not None and current.pid == pid and self.table.alive(current):
+            return events
+        if current is not None:
+            if self._boost_prior is not None and self.table.alive(current):
+                try:
+                    current.process.nice(self._boost_prior)
+                    events.append({'event': 'foreground_unboost', 'pid': current.pid, 'name': current.name})
+                except psutil.Error:
+                    pass
+            self._boosted = self._boost_prior = None
+        entry = self.table.get(pid) if pid else None
+        if entry is None or entry.process is None or pid == self._own_pid:
+            return events
+        try:
+            prior = entry.process.nice()
+            if _priority_rank(prior) >= self._boost_rank:
+                return events  # já está nesse nível ou acima (ex.: regra 'high')
+            self._remember(entry)
+            entry.process.nice(self._boost_value)
+        except psutil.AccessDenied:
+            events.append({'event': 'foreground_boost', 'pid': pid, 'name': entry.name, 'errors': ["prioridade: acesso negado"]})
+            return events
+        except psutil.Error:
+            return events
+        self._boosted, self._boost_prior = entry, prior
+        events.append({'event': 'foreground_boost', 'pid': pid, 'name': entry.name, 'errors': []})
+        return events
+
+    def tick(self) -> List[Dict]:
+        """Uma rodada: lê a diferença da tabela, aplica as regras aos novos e atualiza o impulso."""
+        started = time.perf_counter()
+        events: List[Dict] = []
+        with self._lock:
+            diff = self.table.refresh()
+            for entry in diff['removed']:
+                self._original.pop(entry.pid, None)
+            for entry in diff['added']:
+                if entry.process is None or entry.pid == self._own_pid:
+                    continue
+                rule = self.match(entry)
+                if rule is not None:
+                    event = self._apply(entry, rule)
+                    event['initial'] = self.table.ticks == 1  # processo já aberto quando o motor ligou
+                    self.stats['applied'] += 1
+                    self.stats['errors'] += bool(event['errors'])
+                    events.append(event)
+            if self.foreground_boost:
+                events.extend(self._update_boost())
+            self.stats['ticks'] += 1
+            self.stats['processes'] = len(self.table)
+            self.stats['last_tick_s'] = time.perf_counter() - started
+        return events
+
+    def restore(self) -> Dict:
+        """Devolve prioridade e afinidade originais aos processos ajustados que ainda existem.
+
+        Retorna `{'restored': n, 'failed': [...]}`; cada falha traz `pid`, `name`
+        e `error` (ex.: sem root no Linux não dá para baixar o nice de volta a 0).
+        """
+        restored, failed = 0, []
+        with self._lock:
+            for pid, saved in list(self._original.items()):
+                entry = saved['entry']
+                if not self.table.alive(entry):
+                    continue
+                try:
+                    if saved['nice'] is not None:
+                        entry.process.nice(saved['nice'])
+                    if saved['affinity'] is not None:
+                        entry.process.cpu_affinity(saved['affinity'])
+                    restored += 1
+                except psutil.Error as e:
+                    failed.append({'pid': pid, 'name': entry.name, 'error': str(e) or type(e).__name__})
+            self._original.clear()
+            self._boosted = self._boost_prior = None
+        return {'restored': restored, 'failed': failed}
+
+    def start(self, interval: float = 2.0, on_events: Optional[Callable[[List[Dict]], None]] = None) -> None:
+        """Roda `tick()` numa thread a cada `interval` segundos; eventos vão para `on_events`."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+
+        def loop():
+            while not self._stop.is_set():
+                try:
+                    events = self.tick()
+                except Exception as e:
+                    events = [{'event': 'process_rules_error', 'errors': [str(e)]}]
+                if events and on_events is not None:
+                    try:
+                        on_events(events)
+                    except Exception:
+                        pass
+                self._stop.wait(interval)
+
+        self._thread = threading.Thread(target=loop, name="ProcessRules", daemon=True)
+        self._thread.start()
+
+    def stop(self, restore: bool = True) -> Dict:
+        """Para a thread e, por padrão, desfaz os ajustes. Retorna o mesmo dict de `restore()`."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join(10)
+            self._thread = None
+        return self.restore() if restore else {'restored': 0, 'failed': []}
@@ -0,0 +1,94 @@
+# Date: 19/10/2026
+# DEV: Martinez
+# Cloud Optimizer v1 Free Utility by Martinez
+
+import time
+from collections import namedtuple
+from typing import Dict, Iterable, List, Optional
+
+import psutil
+
+__all__ = ["ProcessEntry", "ProcessTable"]
+
+# process: psutil.Process já criado (reaproveitado nas ações e nas leituras seguintes)
+ProcessEntry = namedtuple("ProcessEntry", "pid name exe create_time process")
+
+
+class ProcessTable:
+    """Tabela de processos mantida por diferença entre leituras.
+
+    `refresh()` lista só os PIDs (uma leitura de diretório no Linux, uma
+    chamada no Windows) e compara com a leitura anterior: apenas os processos
+    novos são abertos e lidos (nome, executável, início), os que sumiram saem
+    da tabela. Quem consome a tabela (regras de prioridade, detector de
+    processos descontrolados) trabalha em cima de 'added'/'removed' em vez de
+    percorrer todos os processos a cada tick.
+
+    Um PID reaproveitado entre duas leituras é detectado pelo horário de início
+    quando o processo é consultado de novo (`alive`), não a cada tick.
+    """
+
+    def __init__(self) -> None:
+        self.entries: Dict[int, ProcessEntry] = {}
+        self.ticks = 0
+        self.last_refresh_s = 0.0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(list(self.entries.values()))
+
+    def get(self, pid: int) -> Optional[ProcessEntry]:
+        return self.entries.get(pid)
+
+    @staticmethod
+    def _read(pid: int) -> Optional[ProcessEntry]:
+        try:
+            proc = psutil.Process(pid)
+            with proc.oneshot():
+                name = proc.name()
+                create_time = proc.create_time()
+                try:
+                    exe = proc.exe()
+                except (psutil.AccessDenied, psutil.ZombieProcess, OSError):
+                    exe = ''
+        except (psutil.NoSuchProcess, psutil.ZombieProcess):
+            return None
+        except psutil.AccessDenied:
+            return ProcessEntry(pid, '', '', 0.0, None)
+        return ProcessEntry(pid, name, exe, create_time, proc)
+
+    def refresh(self, pids: Optional[Iterable[int]] = None) -> Dict[str, List[ProcessEntry]]:
+        """Atualiza a tabela e retorna {'added': [...], 'removed': [...]}.
+
+        Na primeira chamada todos os processos existentes vêm em 'added'.
+        `pids` permite passar a lista já obtida (ex.: testes).
+        """
+        started = time.perf_counter()
+        current = set(psutil.pids() if pids is None else pids)
+        known = self.entries.keys()
+        removed = [self.entries.pop(pid) for pid in known - current]
+        added = []
+        for pid in current - known:
+            entry = self._read(pid)
+            if entry is not None:
+                self.entries[pid] = entry
+                added.append(entry)
+        self.ticks += 1
+        self.last_refresh_s = time.perf_counter() - started
+        return {'added': added, 'removed': removed}
+
+    def alive(self, entry: ProcessEntry) -> bool:
+        """O processo da entrada ainda existe (e o PID não foi reaproveitado)?"""
+        if entry.process is None:
+            return False
+        try:
+            return entry.process.is_running()
+        except psutil.Error:
+            return False
+
+    def find(self, name: str) -> List[ProcessEntry]:
+        """Entradas cujo nome (sem diferenciar maiúsculas) é `name`."""
+        key = name.lower()
+        return [e for e in self.entries.values() if e.name.lower() == key]
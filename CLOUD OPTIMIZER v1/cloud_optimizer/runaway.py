@@ -0,0 +1,330 @@
+# Date: 19/10/2026
+# DEV: Martinez
+# Cloud Optimizer v1 Free Utility by Martinez
+
+import os
+import threading
+import time
+from array import array
+from collections import deque
+from typing import Callable, Dict, List, Optional
+
+import psutil
+
+from cloud_optimizer.process_rules import priority_value
+from cloud_optimizer.process_table import ProcessEntry, ProcessTable
+
+__all__ = ["ACTIONS", "ProcessHistory", "RunawayDetector"]
+
+ACTIONS = ('suspend', 'resume', 'lower_priority', 'terminate')
+
+_MB = 1024 ** 2
+
+
+def _memory(info) -> float:
+    # Windows: bytes privados (o working set é aparado pelo sistema e esconde vazamentos)
+    return float(getattr(info, 'private', info.rss))
+
+
+class ProcessHistory:
+    """Histórico de um processo num anel de tamanho fixo: instante, memória e tempo de CPU.
+
+    Três `array('d')` pré-alocados (24 bytes por amostra); amostras novas
+    sobrescrevem as mais antigas.
+    """
+
+    __slots__ = ('entry', 'size', 'times', 'mem', 'cpu', 'pos', 'count', 'flags', 'gone')
+
+    def __init__(self, entry: ProcessEntry, size: int) -> None:
+        self.entry = entry
+        self.size = size
+        self.times = array('d', bytes(8 * size))
+        self.mem = array('d', bytes(8 * size))
+        self.cpu = array('d', bytes(8 * size))
+        self.pos = 0
+        self.count = 0
+        self.flags: Dict[str, Dict] = {}  # tipo -> dados do alerta ativo
+        self.gone = False
+
+    def add(self, t: float, mem: float, cpu: float) -> None:
+        i = self.pos
+        self.times[i], self.mem[i], self.cpu[i] = t, mem, cpu
+        self.pos = (i + 1) % self.size
+        self.count = min(self.count + 1, self.size)
+
+    def _index(self, age: int) -> int:
+        """Posição da amostra `age` passos atrás (0 = a mais recente)."""
+        return (self.pos - 1 - age) % self.size
+
+    @property
+    def last_mem(self) -> float:
+        return self.mem[self._index(0)] if self.count else 0.0
+
+    def recent_cpu_pct(self) -> float:
+        """CPU entre as duas últimas amostras, em % de um núcleo."""
+        if self.count < 2:
+            return 0.0
+        a, b = self._index(1), self._index(0)
+        return (self.cpu[b] - self.cpu[a]) / max(1e-6, self.times[b] - self.times[a]) * 100
+
+    def cpu_pct(self, window: float) -> Optional[float]:
+        """CPU média (% de um núcleo) nos últimos `window` segundos; None sem histórico suficiente."""
+        last = self._index(0)
+        for age in range(1, self.count):
+            i = self._index(age)
+            if self.times[last] - self.times[i] >= window:
+                return (self.cpu[last] - self.cpu[i]) / (self.times[last] - self.times[i]) * 100
+        return None
+
+    def memory_trend(self):
+        """Regressão linear da memória no anel: (bytes/s, R², duração em s, crescimento em bytes)."""
+        n = self.count
+        idx = [self._index(age) for age in range(n - 1, -1, -1)]
+        t0 = self.times[idx[0]]
+        xs = [self.times[i] - t0 for i in idx]
+        ys = [self.mem[i] for i in idx]
+        mx, my = sum(xs) / n, sum(ys) / n
+        sxx = sum((x - mx) ** 2 for x in xs)
+        syy = sum((y - my) ** 2 for y in ys)
+        if sxx <= 0:
+            return 0.0, 0.0, 0.0, 0.0
+        sxy = sum((x - mx) * (y - my) for x, y in zip(xs, ys))
+        slope = sxy / sxx
+        fit = (sxy * sxy) / (sxx * syy) if syy > 0 else 0.0
+        return slope, fit, xs[-1], ys[-1] - ys[0]
+
+
+class RunawayDetector:
+    """Detecta processos com vazamento de memória ou presos em uso alto de CPU.
+
+    Cada `tick()` custa O(processos que mudaram), não O(processos abertos):
+      * a `ProcessTable` entrega só os PIDs novos e os que saíram (o
+        histórico de quem saiu é descartado na hora);
+      * processos "quentes" (alerta ativo, memória subindo ou CPU alta na
+        última leitura) são lidos a cada tick;
+      * os demais entram num rodízio com no máximo `sample_budget` leituras
+        por tick; o histórico guarda o instante real de cada amostra, então
+        tendências continuam corretas mesmo com amostras espaçadas.
+    Listar os PIDs é o único passo proporcional ao total de processos.
+
+    Alertas (evento 'runaway_detected', uma vez por transição):
+      * 'memory': regressão da memória com inclinação >= `growth_mb_min`
+        MB/min, ajuste R² >= `min_fit`, em pelo menos `min_span_s` segundos e
+        crescimento total >= `min_growth_mb`;
+      * 'cpu': média >= `cpu_pct` (% de um núcleo) por `hog_for_s` segundos.
+    'runaway_cleared' avisa quando o alerta some (ou o processo fecha).
+    """
+
+    def __init__(
+        self,
+        table: Optional[ProcessTable] = None,
+        history: int = 60,
+        sample_budget: int = 256,
+        growth_mb_min: float = 5.0,
+        min_growth_mb: float = 50.0,
+        min_span_s: float = 120.0,
+        min_fit: float = 0.8,
+        cpu_pct: float = 90.0,
+        hog_for_s: float = 60.0,
+    ) -> None:
+        self.table = table or ProcessTable()
+        self.history = history
+        self.sample_budget = sample_budget
+        self.growth_mb_min = growth_mb_min
+        self.min_growth_mb = min_growth_mb
+        self.min_span_s = min_span_s
+        self.min_fit = min_fit
+        self.cpu_pct = cpu_pct
+        self.hog_for_s = hog_for_s
+        self.histories: Dict[int, ProcessHistory] = {}
+        self._hot: Dict[int, ProcessHistory] = {}
+        self.suspended: Dict[int, ProcessHistory] = {}  # suspensos por `act`, para poder retomar
+        self._rotation: deque = deque()
+        self._own_pid = os.getpid()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.stats = {'ticks': 0, 'processes': 0, 'sampled': 0, 'hot': 0, 'last_tick_s': 0.0}
+
+    # ----- coleta -----
+    def _sample(self, hist: ProcessHistory, now: float) -> bool:
+        proc = hist.entry.process
+        try:
+            with proc.oneshot():
+                mem = _memory(proc.memory_info())
+                times = proc.cpu_times()
+        except psutil.Error:
+            return False
+        hist.add(now, mem, times.user + times.system)
+        return True
+
+    def _is_hot(self, hist: ProcessHistory) -> bool:
+        if hist.flags:
+            return True
+        if hist.count < 2:
+            return False
+        grew = hist.mem[hist._index(0)] - hist.mem[hist._index(1)] >= _MB
+        return grew or hist.recent_cpu_pct() >= self.cpu_pct / 2
+
+    def _evaluate(self, hist: ProcessHistory) -> List[Dict]:
+        events = []
+        entry = hist.entry
+        found: Dict[str, Dict] = {}
+        if hist.count >= 5:
+            slope, fit, span, growth = hist.memory_trend()
+            if (span >= self.min_span_s and slope * 60 >= self.growth_mb_min * _MB
+                    and fit >= self.min_fit and growth >= self.min_growth_mb * _MB):
+                found['memory'] = {'mem': hist.last_mem, 'slope_mb_min': slope * 60 / _MB, 'growth_mb': growth / _MB, 'fit': fit}
+        cpu = hist.cpu_pct(self.hog_for_s)
+        if cpu is not None and cpu >= self.cpu_pct:
+            found['cpu'] = {'mem': hist.last_mem, 'cpu_pct': cpu}
+        for kind, data in found.items():
+            if kind not in hist.flags:
+                events.append(dict(data, event='runaway_detected', kind=kind, pid=entry.pid, name=entry.name))
+            hist.flags[kind] = data
+        for kind in [k for k in hist.flags if k not in found]:
+            del hist.flags[kind]
+            events.append({'event': 'runaway_cleared', 'kind': kind, 'pid': entry.pid, 'name': entry.name, 'reason': 'normal'})
+        return events
+
+    def tick(self, now: Optional[float] = None) -> List[Dict]:
+        started = time.perf_counter()
+        now = time.monotonic() if now is None else now
+        events: List[Dict] = []
+        with self._lock:
+            diff = self.table.refresh()
+            for entry in diff['removed']:
+                hist = self.histories.pop(entry.pid, None)
+                if hist is None:
+                    continue
+                hist.gone = True
+                self._hot.pop(entry.pid, None)
+                self.suspended.pop(entry.pid, None)
+                for kind in hist.flags:
+                    events.append({'event': 'runaway_cleared', 'kind': kind, 'pid': entry.pid, 'name': entry.name, 'reason': 'exited'})
+            first = self.stats['ticks'] == 0
+            to_sample: List[ProcessHistory] = []
+            for entry in diff['added']:
+                if entry.process is None or entry.pid == self._own_pid:
+                    continue
+                hist = ProcessHistory(entry, self.history)
+                self.histories[entry.pid] = hist
+                self._rotation.append(hist)
+                if not first:
+                    to_sample.append(hist)  # processo novo: primeira leitura já
+            budget = self.sample_budget - len(to_sample)
+            hot = list(self._hot.values())[:max(0, budget // 2)]
+            to_sample.extend(hot)
+            budget -= len(hot)
+            seen = {id(h) for h in to_sample}
+            while budget > 0 and self._rotation:
+                hist = self._rotation.popleft()
+                if hist.gone:
+                    continue  # descartado sem remover do meio da fila
+                self._rotation.append(hist)
+                if id(hist) in seen:
+                    if len(seen) >= len(self.histories):
+                        break
+                    continue
+                seen.add(id(hist))
+                to_sample.append(hist)
+                budget -= 1
+            for hist in to_sample:
+                if not self._sample(hist, now):
+                    continue
+                events.extend(self._evaluate(hist))
+                if self._is_hot(hist):
+                    # Reinsere no fim: os quentes também giram se passarem do limite
+                    self._hot.pop(hist.entry.pid, None)
+                    self._hot[hist.entry.pid] = hist
+                else:
+                    self._hot.pop(hist.entry.pid, None)
+            self.stats['ticks'] += 1
+            self.stats['processes'] = len(self.histories)
+            self.stats['sampled'] = len(to_sample)
+            self.stats['hot'] = len(self._hot)
+            self.stats['last_tick_s'] = time.perf_counter() - started
+        return events
+
+    def flagged(self) -> List[Dict]:
+        """Processos com alerta ativo ou suspensos: pid, name, kinds, mem, cpu_pct, slope_mb_min, suspended."""
+        with self._lock:
+            out = []
+            for pid, hist in self.histories.items():
+                if not hist.flags and pid not in self.suspended:
+                    continue
+                row = {'pid': pid, 'name': hist.entry.name, 'kinds': sorted(hist.flags), 'mem': hist.last_mem,
+                       'cpu_pct': hist.recent_cpu_pct(), 'slope_mb_min': hist.flags.get('memory', {}).get('slope_mb_min'),
+                       'suspended': pid in self.suspended}
+                out.append(row)
+            return out
+
+    # ----- ações -----
+    def act(self, pid: int, action: str) -> Dict:
+        """Suspende, retoma, baixa a prioridade ou encerra um processo acompanhado.
+
+        Usa o `psutil.Process` guardado na tabela, então um PID reaproveitado
+        por outro programa nunca é afetado.
+        """
+        if action not in ACTIONS:
+            raise Exception(f"Ação desconhecida: {action}")
+        with self._lock:
+            hist = self.histories.get(pid)
+        if hist is None or not self.table.alive(hist.entry):
+            raise Exception(f"Processo {pid} não existe mais")
+        if pid == self._own_pid:
+            raise Exception("O Cloud Optimizer não age sobre si mesmo")
+        proc, name = hist.entry.process, hist.entry.name
+        try:
+            if action == 'suspend':
+                proc.suspend()
+            elif action == 'resume':
+                proc.resume()
+            elif action == 'lower_priority':
+                proc.nice(priority_value('idle'))
+            else:
+                if pid in self.suspended:
+                    proc.resume()  # parado, o processo não trataria o pedido de encerramento
+                proc.terminate()
+                _, alive = psutil.wait_procs([proc], timeout=3)
+                if alive:
+                    proc.kill()
+        except psutil.NoSuchProcess:
+            raise Exception(f"{name} ({pid}) já foi encerrado")
+        except psutil.AccessDenied:
+            raise Exception(f"Acesso negado a {name} ({pid}); execute como administrador")
+        with self._lock:
+            if action == 'suspend':
+                self.suspended[pid] = hist
+            elif action in ('resume', 'terminate'):
+                self.suspended.pop(pid, None)
+        return {'event': 'runaway_action', 'pid': pid, 'name': name, 'action': action}
+
+    # ----- thread -----
+    def start(self, interval: float = 5.0, on_events: Optional[Callable[[List[Dict]], None]] = None) -> None:
+        """Roda `tick()` numa thread a cada `interval` segundos; eventos vão para `on_events`."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+
+        def loop():
+            while not self._stop.is_set():
+                try:
+                    events = self.tick()
+                except Exception as e:
+                    events = [{'event': 'runaway_error', 'error': str(e)}]
+                if events and on_events is not None:
+                    try:
+                        on_events(events)
+                    except Exception:
+                        pass
+                self._stop.wait(interval)
+
+        self._thread = threading.Thread(target=loop, name="RunawayDetector", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join(10)
+            self._thread = None
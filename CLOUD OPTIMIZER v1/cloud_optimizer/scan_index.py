@@ -0,0 +1,151 @@
+# Date: 19/10/2026
+# DEV: Martinez
+# Cloud Optimizer v1 Free Utility by Martinez
+
+import os
+import sqlite3
+from typing import Dict, Iterator, List, Optional
+
+from cloud_optimizer.cleaner import Candidate
+from cloud_optimizer.utils import app_data_dir, is_link
+
+__all__ = ["ScanIndex"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS dirs (
+    path TEXT PRIMARY KEY,
+    parent TEXT,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS dirs_parent ON dirs(parent);
+CREATE TABLE IF NOT EXISTS files (
+    dir TEXT NOT NULL,
+    name TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime REAL NOT NULL,
+    atime REAL NOT NULL,
+    PRIMARY KEY (dir, name)
+) WITHOUT ROWID;
+"""
+
+
+class ScanIndex:
+    """Índice persistente (SQLite) das pastas varridas pela limpeza.
+
+    Guarda, por pasta, o mtime e a lista de arquivos (nome, tamanho, mtime,
+    atime). Na varredura seguinte só as pastas cujo mtime mudou são relidas do
+    disco; as demais vêm do índice. O mtime da pasta muda quando um arquivo é
+    criado, apagado ou renomeado, mas não quando um arquivo é editado no lugar,
+    então quem apaga deve conferir o stat atual de cada candidato antes.
+    """
+
+    def __init__(self, path: Optional[str] = None, commit_every: int = 200) -> None:
+        self.path = path or app_data_dir('scan_index.sqlite3')
+        self.commit_every = commit_every
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        # Uma conexão por varredura: as threads por volume não compartilham cursor
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+
+    def iter_files(self, root: str, stats: Optional[Dict[str, int]] = None) -> Iterator[Candidate]:
+        """Gera os arquivos de `root` relendo do disco só as pastas alteradas.
+
+        `stats`, se informado, recebe 'dirs_cached' e 'dirs_scanned'.
+        """
+        if stats is not None:
+            stats.setdefault('dirs_cached', 0)
+            stats.setdefault('dirs_scanned', 0)
+        conn = self._connect()
+        dirty = 0
+        try:
+            stack = [(root, None)]
+            while stack:
+                current, parent = stack.pop()
+                try:
+                    mtime_ns = os.stat(current).st_mtime_ns
+                except OSError:
+                    self._forget(conn, current)
+                    continue
+                row = conn.execute('SELECT mtime_ns FROM dirs WHERE path = ?', (current,)).fetchone()
+                if row is not None and row[0] == mtime_ns:
+                    if stats is not None:
+                        stats['dirs_cached'] += 1
+                    files = conn.execute('SELECT name, size, mtime, atime FROM files WHERE dir = ?', (current,)).fetchall()
+                    subdirs = conn.execute('SELECT path FROM dirs WHERE parent = ?', (current,)).fetchall()
+                    for name, size, mtime, atime in files:
+                        yield Candidate(os.path.join(current, name), size, mtime, root, atime)
+                    stack.extend((p, current) for (p,) in subdirs)
+                    continue
+
+                if stats is not None:
+                    stats['dirs_scanned'] += 1
+                listing = self._scan_dir(current)
+                if listing is None:
+                    # Sem acesso: não grava nada, para tentar de novo na próxima vez
+                    continue
+                files, subdirs = listing
+                known = {p for (p,) in conn.execute('SELECT path FROM dirs WHERE parent = ?', (current,))}
+                for gone in known.difference(subdirs):
+                    self._forget(conn, gone)
+                conn.execute('DELETE FROM files WHERE dir = ?', (current,))
+                conn.executemany(
+                    'INSERT INTO files (dir, name, size, mtime, atime) VALUES (?, ?, ?, ?, ?)',
+                    [(current, name, size, mtime, atime) for name, size, mtime, atime in files],
+                )
+                conn.execute(
+                    'INSERT OR REPLACE INTO dirs (path, parent, mtime_ns) VALUES (?, ?, ?)',
+                    (current, parent, mtime_ns),
+                )
+                dirty += 1
+                if dirty >= self.commit_every:
+                    conn.commit()
+                    dirty = 0
+                for name, size, mtime, atime in files:
+                    yield Candidate(os.path.join(current, name), size, mtime, root, atime)
+                stack.extend((p, current) for p in subdirs)
+        finally:
+            conn.commit()
+            conn.close()
+
+    @staticmethod
+    def _scan_dir(path: str) -> Optional[tuple]:
+        files: List[tuple] = []
+        subdirs: List[str] = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False) and not is_link(entry):
+                            subdirs.append(entry.path)
+                            continue
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    files.append((entry.name, st.st_size, st.st_mtime, st.st_atime))
+        except OSError:
+            return None
+        return files, subdirs
+
+    @staticmethod
+    def _forget(conn: sqlite3.Connection, path: str) -> None:
+        """Remove a pasta e tudo abaixo dela do índice.
+
+        Subárvore por intervalo de texto ([prefixo+sep, prefixo+chr(sep+1))), que
+        diferencia maiúsculas e usa o índice; LIKE ignora maiúsculas em ASCII e
+        apagaria também uma pasta irmã como /x/Foo ao esquecer /x/foo.
+        """
+        prefix = path.rstrip('\\/')
+        low, high = prefix + os.sep, prefix + chr(ord(os.sep) + 1)
+        conn.execute("DELETE FROM files WHERE dir = ? OR (dir >= ? AND dir < ?)", (path, low, high))
+        conn.execute("DELETE FROM dirs WHERE path = ? OR (path >= ? AND path < ?)", (path, low, high))
+
+    def clear(self) -> None:
+        with self._connect() as conn:
+            conn.execute('DELETE FROM files')
+            conn.execute('DELETE FROM dirs')
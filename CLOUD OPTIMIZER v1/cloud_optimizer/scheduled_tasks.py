@@ -0,0 +1,173 @@
+# Date: 19/10/2026
+# DEV: Martinez
+# Cloud Optimizer v1 Free Utility by Martinez
+
+import csv
+import ntpath
+import re
+import threading
+import time
+from collections import namedtuple
+from typing import Callable, Dict, Iterable, List, Optional
+
+from cloud_optimizer.journal import get_journal
+from cloud_optimizer.system_backend import get_backend
+
+__all__ = ["ScheduledTask", "TaskInventory", "parse_schtasks_csv"]
+
+# Tarefa do Agendador: caminho completo (\Pasta\Nome), nome, estado e executável da ação
+ScheduledTask = namedtuple("ScheduledTask", "path name status enabled action executable")
+
+# Colunas de `schtasks /query /fo CSV /v /nh`. Os cabeçalhos mudam com o idioma do
+# Windows, então as colunas são lidas pela posição.
+_COL_NAME, _COL_STATUS, _COL_ACTION, _COL_STATE = 1, 3, 8, 11
+
+# Estado "desabilitada" nos idiomas mais comuns (coluna Status / Scheduled Task State)
+_DISABLED = {'disabled', 'desabilitado', 'desabilitada', 'deshabilitado', 'deshabilitada', 'désactivé', 'deaktiviert'}
+
+_CONTROL_RE = re.compile(r'[\x00-\x1f\x7f]')
+
+_EXE_RE = re.compile(r'^\s*"([^"]+)"|^\s*(.+?\.(?:exe|bat|cmd|com|ps1|vbs|js))\b', re.IGNORECASE)
+
+
+def _action_executable(action: str) -> str:
+    """Executável da linha de comando da ação (com ou sem aspas, com espaços no caminho)."""
+    m = _EXE_RE.match(action or '')
+    if m:
+        return m.group(1) or m.group(2)
+    return (action or '').split(' ', 1)[0]
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Regex em forma de trie: em cada posição só o ramo do próximo caractere é testado.
+
+    Com uma alternação simples (a|b|c...) o custo por caractere cresce com a
+    quantidade de alvos; na trie ele depende só do comprimento dos alvos.
+    """
+    trie: Dict = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = True
+
+    def build(node: Dict) -> str:
+        end = '' in node
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # Alvo que é prefixo de outro: o mais longo tem preferência
+        return f'(?:{body})?' if end else body
+
+    return build(trie)
+
+
+def parse_schtasks_csv(text: str) -> List[ScheduledTask]:
+    """Converte a saída CSV detalhada do schtasks em tarefas, uma por caminho.
+
+    O formato detalhado repete a tarefa para cada gatilho e, sem /nh, repete o
+    cabeçalho a cada pasta; as repetições são descartadas.
+    """
+    tasks: Dict[str, ScheduledTask] = {}
+    for row in csv.reader(line for line in text.splitlines() if line.strip()):
+        if len(row) <= _COL_ACTION or not row[_COL_NAME].startswith('\\'):
+            # Cabeçalho, linha de aviso ("INFO: ...") ou linha incompleta
+            continue
+        path = row[_COL_NAME]
+        if path in tasks:
+            continue
+        status = row[_COL_STATUS].strip()
+        state = row[_COL_STATE].strip() if len(row) > _COL_STATE else status
+        action = row[_COL_ACTION].strip()
+        enabled = status.lower() not in _DISABLED and state.lower() not in _DISABLED
+        tasks[path] = ScheduledTask(path, path.rsplit('\\', 1)[-1], status, enabled, action, _action_executable(action))
+    return list(tasks.values())
+
+
+def _query_schtasks(timeout: float) -> str:
+    result = get_backend().run_commands([['schtasks', '/query', '/fo', 'CSV', '/v', '/nh']], timeout=timeout)[0]
+    if result.returncode != 0:
+        raise Exception(f"schtasks /query falhou: {(result.stderr or result.stdout or '').strip()}")
+    return result.stdout
+
+
+class TaskInventory:
+    """Índice das tarefas agendadas, consultado uma vez e guardado por `ttl` segundos.
+
+    `match` procura qualquer quantidade de alvos numa única passada pelo índice
+    (uma regex em trie com todos os alvos contra o nome e o executável de cada tarefa),
+    e `disable` desativa as tarefas pelo caminho exato, num lote só. `query`
+    permite trocar a consulta ao schtasks (deve devolver o CSV detalhado).
+    """
+
+    def __init__(self, ttl: float = 300.0, query: Optional[Callable[[float], str]] = None, timeout: float = 60.0) -> None:
+        self.ttl = ttl
+        self.timeout = timeout
+        self._query = query or _query_schtasks
+        self._tasks: Optional[List[ScheduledTask]] = None
+        self._loaded = 0.0
+        self._lock = threading.Lock()
+        self.queries = 0  # consultas feitas ao schtasks (para medições)
+
+    def tasks(self, refresh: bool = False) -> List[ScheduledTask]:
+        with self._lock:
+            if refresh or self._tasks is None or time.monotonic() - self._loaded > self.ttl:
+                self._tasks = parse_schtasks_csv(self._query(self.timeout))
+                self._loaded = time.monotonic()
+                self.queries += 1
+            return self._tasks
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._tasks = None
+
+    def match(self, targets: Iterable[str], refresh: bool = False) -> Dict[str, List[ScheduledTask]]:
+        """{alvo: tarefas} para os alvos encontrados no nome ou no executável (sem diferenciar maiúsculas)."""
+        targets = [t for t in dict.fromkeys(targets) if t]
+        found: Dict[str, List[ScheduledTask]] = {}
+        if not targets:
+            return found
+        by_lower = {t.lower(): t for t in targets}
+        pattern = re.compile(_trie_pattern(by_lower))
+        for task in self.tasks(refresh):
+            text = f"{task.name}\n{ntpath.basename(task.executable)}".lower()
+            hits = {m.group(0) for m in pattern.finditer(text)}
+            for hit in hits:
+                found.setdefault(by_lower[hit], []).append(task)
+        return found
+
+    def disable(self, tasks: Iterable[ScheduledTask]) -> Dict[str, List[str]]:
+        """Desativa as tarefas pelo caminho exato; as já desativadas são puladas.
+
+        Qualquer usuário pode criar tarefa com qualquer nome, então só vale
+        caminho idêntico a um do inventário e sem caracteres de controle; os
+        demais viram erro. Caminho com metacaracteres do cmd (`&`, `%`...) não
+        entra na sessão de shell em lote: roda num processo próprio, sem shell
+        (ver ShellSession.accepts). As tarefas a desativar vão para o diário
+        antes (desfazer = /enable).
+
+        Retorna {'disabled', 'already_disabled', 'errors'}.
+        """
+        report = {'disabled': [], 'already_disabled': [], 'errors': []}
+        known = {t.path for t in self.tasks()}
+        pending = []
+        for task in {t.path: t for t in tasks}.values():
+            if task.path not in known or _CONTROL_RE.search(task.path):
+                report['errors'].append(f"{task.path!r}: caminho fora do inventário ou inválido")
+                continue
+            (pending if task.enabled else report['already_disabled']).append(task.path)
+        if not pending:
+            return report
+        get_journal().record('startup.scheduled_tasks', [{'kind': 'task', 'path': path, 'prior': 'enabled'} for path in pending])
+        results = get_backend().run_commands([['schtasks', '/change', '/tn', path, '/disable'] for path in pending], timeout=self.timeout)
+        for path, result in zip(pending, results):
+            if result.returncode == 0:
+                report['disabled'].append(path)
+            else:
+                report['errors'].append(f"{path}: {(result.stderr or result.stdout or '').strip()}")
+        with self._lock:
+            if self._tasks is not None:
+                done = set(report['disabled'])
+                self._tasks = [t._replace(enabled=False) if t.path in done else t for t in self._tasks]
+        return report
@@ -0,0 +1,92 @@
+# Date: 19/10/2026
+# DEV: Martinez
+# Cloud Optimizer v1 Free Utility by Martinez
+
+import unicodedata
+from collections import Counter
+from typing import Dict, List, Optional, Sequence
+
+__all__ = ["normalize_text", "StartupSearchIndex"]
+
+_GRAM_SIZES = (1, 2, 3)
+
+
+def normalize_text(text: str) -> str:
+    """Normaliza texto para busca: remove acentos e aplica casefold."""
+    if not text:
+        return ''
+    decomposed = unicodedata.normalize('NFKD', text)
+    return ''.join(ch for ch in decomposed if not unicodedata.combining(ch)).casefold()
+
+
+class StartupSearchIndex:
+    """Índice de busca pré-calculado para as entradas de inicialização.
+
+    Mantém uma chave normalizada (sem acentos) por entrada e listas invertidas de
+    n-gramas (1 a 3 caracteres). Consultas de até 3 caracteres são respondidas direto
+    pela lista do n-grama; consultas maiores partem do trigrama mais raro e só
+    confirmam os candidatos. Se a nova consulta contém a anterior, apenas o
+    resultado anterior é refinado.
+    """
+
+    def __init__(self, entries: Sequence[Dict[str, str]]) -> None:
+        self._keys: List[str] = []
+        self._postings: Dict[str, List[int]] = {}
+        self._last_query: Optional[str] = None
+        self._last_result: List[int] = []
+        for i, entry in enumerate(entries):
+            key = normalize_text(' '.join((entry.get('name', ''), entry.get('exe', ''), entry.get('value', ''))))
+            self._keys.append(key)
+            grams = {key[j:j + n] for n in _GRAM_SIZES for j in range(len(key) - n + 1)}
+            for g in grams:
+                posting = self._postings.get(g)
+                if posting is None:
+                    self._postings[g] = [i]
+                else:
+                    posting.append(i)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def search(self, query: str, fuzzy: bool = False) -> List[int]:
+        """Retorna os índices (na ordem original) das entradas que casam com a consulta."""
+        q = normalize_text(query.strip())
+        if not q:
+            self._last_query, self._last_result = None, []
+            return list(range(len(self._keys)))
+
+        keys = self._keys
+        if len(q) <= _GRAM_SIZES[-1]:
+            candidates, exact = self._postings.get(q, []), True
+        else:
+            candidates, exact = self._rarest_posting(q), False
+        if self._last_query is not None and self._last_query in q and len(self._last_result) < len(candidates):
+            # Consulta estendida: basta refinar o resultado anterior
+            candidates, exact = self._last_result, False
+        result = list(candidates) if exact else [i for i in candidates if q in keys[i]]
+
+        self._last_query, self._last_result = q, result
+        if fuzzy and not result:
+            return self._search_fuzzy(q)
+        return result
+
+    def _rarest_posting(self, q: str) -> List[int]:
+        rarest: List[int] = []
+        for j in range(len(q) - 2):
+            posting = self._postings.get(q[j:j + 3])
+            if posting is None:
+                return []
+            if j == 0 or len(posting) < len(rarest):
+                rarest = posting
+        return rarest
+
+    def _search_fuzzy(self, q: str, min_ratio: float = 0.5) -> List[int]:
+        """Busca aproximada por sobreposição de trigramas (tolera erros de digitação)."""
+        grams = {q[j:j + 3] for j in range(len(q) - 2)} or {q}
+        scores: Counter = Counter()
+        for g in grams:
+            scores.update(self._postings.get(g, ()))
+        needed = max(1, int(len(grams) * min_ratio))
+        ranked = [(-score, i) for i, score in scores.items() if score >= needed]
+        ranked.sort()
+        return [i for _, i in ranked]
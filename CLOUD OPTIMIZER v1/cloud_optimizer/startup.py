@@ -3,11 +3,14 @@
 # Cloud Optimizer v1 Free Utility by Martinez
 
 import os
-import winreg
-import shutil
-import ctypes
 from typing import List, Dict
 
+from cloud_optimizer.journal import get_journal
+from cloud_optimizer.system_backend import HKCU, HKLM, REG_SZ, get_backend
+
+RUN_SUBKEY = r"Software\Microsoft\Windows\CurrentVersion\Run"
+DISABLED_SUBKEY = r"Software\Microsoft\Windows\CurrentVersion\Run\DisabledByCloudOptimizer"
+
 
 def list_startup_programs() -> List[Dict[str, str]]:
     """Lista programas configurados para iniciar com o Windows (registro e pastas Startup)."""
@@ -21,24 +24,18 @@ def list_startup_programs() -> List[Dict[str, str]]:
             'source': source,
         })
 
+    backend = get_backend()
     reg_paths = [
-        (winreg.HKEY_CURRENT_USER, r"Software\Microsoft\Windows\CurrentVersion\Run", "HKCU Run"),
-        (winreg.HKEY_LOCAL_MACHINE, r"Software\Microsoft\Windows\CurrentVersion\Run", "HKLM Run"),
+        (HKCU, RUN_SUBKEY, "HKCU Run"),
+        (HKLM, RUN_SUBKEY, "HKLM Run"),
     ]
     for root, sub, src in reg_paths:
         try:
-            with winreg.OpenKey(root, sub, 0, winreg.KEY_READ | winreg.KEY_WOW64_64KEY) as key:
-                i = 0
-                while True:
-                    try:
-                        name, value, _ = winreg.EnumValue(key, i)
-                        exe = ''
-                        if isinstance(value, str):
-                            exe = value.strip().strip('"')
-                        add_item(name, exe, str(value), src)
-                        i += 1
-                    except OSError:
-                        break
+            for name, value, _ in backend.reg_values(root, sub):
+                exe = ''
+                if isinstance(value, str):
+                    exe = value.strip().strip('"')
+                add_item(name, exe, str(value), src)
         except Exception:
             pass
 
@@ -48,14 +45,11 @@ def list_startup_programs() -> List[Dict[str, str]]:
     ]
     for d in startup_dirs:
         try:
-            if d and os.path.isdir(d):
+            if d and backend.is_dir(d):
                 disabled_dir = r"C:\CloudOptimizerDisabled"
-                for fname in os.listdir(d):
+                # list_dir já pula diretórios (inclusive a pasta de disabled)
+                for fname in backend.list_dir(d):
                     path = os.path.join(d, fname)
-                    # Ignora a pasta de desabilitados
-                    if os.path.isdir(path):
-                        # pula diretórios (inclusive a pasta de disabled)
-                        continue
                     # Ignora tudo que esteja dentro da pasta Disabled
                     if disabled_dir and path.startswith(disabled_dir):
                         continue
@@ -72,7 +66,7 @@ def list_startup_programs() -> List[Dict[str, str]]:
 
 def _is_admin() -> bool:
     try:
-        return ctypes.windll.shell32.IsUserAnAdmin()
+        return get_backend().is_admin()
     except Exception:
         return False
 
@@ -84,81 +78,79 @@ def disable_startup_item(entry: Dict[str, str]) -> bool:
     - HKCU Run: remove o valor do registro (usuário atual)
     - HKLM Run: remove o valor do registro (todos os usuários) [requer admin]
     - Startup Folder: move o atalho/arquivo para a pasta r"C:\CloudOptimizerDisabled"
+    O estado anterior vai para o diário antes da mudança (desfeita por `tweaks.rollback`).
     """
     source = entry.get('source', '')
     name = entry.get('name', '')
     value = entry.get('value', '')
 
     if source in ("HKCU Run", "HKLM Run"):
-        hive = winreg.HKEY_CURRENT_USER if source == "HKCU Run" else winreg.HKEY_LOCAL_MACHINE
-        run_subkey = r"Software\Microsoft\Windows\CurrentVersion\Run"
-        disabled_subkey = r"Software\Microsoft\Windows\CurrentVersion\Run\DisabledByCloudOptimizer"
+        hive = HKCU if source == "HKCU Run" else HKLM
+        backend = get_backend()
 
         # HKLM requer admin
-        if hive == winreg.HKEY_LOCAL_MACHINE and not _is_admin():
+        if hive == HKLM and not _is_admin():
             raise PermissionError("Desabilitar itens em HKLM requer executar como administrador")
 
         try:
-            # Abrir chave Run para ler valor
-            with winreg.OpenKey(hive, run_subkey, 0, winreg.KEY_READ | winreg.KEY_WOW64_64KEY) as key_read:
-                try:
-                    original_name, original_value, val_type = None, None, None
-                    # Tenta ler pelo nome informado
-                    original_value, val_type = winreg.QueryValueEx(key_read, name)
-                    original_name = name
-                except FileNotFoundError:
-                    # Pode ter sido listado com name modificado; procura por valor igual
-                    i = 0
-                    while True:
-                        try:
-                            vname, vdata, vtype = winreg.EnumValue(key_read, i)
-                            if str(vdata).strip() == value.strip():
-                                original_name, original_value, val_type = vname, vdata, vtype
-                                break
-                            i += 1
-                        except OSError:
-                            break
-                    if original_name is None:
-                        # Já não existe
-                        return True
+            # Ler valor da chave Run
+            try:
+                original_name, original_value, val_type = None, None, None
+                # Tenta ler pelo nome informado
+                original_value, val_type = backend.reg_read(hive, RUN_SUBKEY, name)
+                original_name = name
+            except FileNotFoundError:
+                # Pode ter sido listado com name modificado; procura por valor igual
+                for vname, vdata, vtype in backend.reg_values(hive, RUN_SUBKEY):
+                    if str(vdata).strip() == value.strip():
+                        original_name, original_value, val_type = vname, vdata, vtype
+                        break
+                if original_name is None:
+                    # Já não existe
+                    return True
 
+            try:
+                disabled_prior = backend.reg_read(hive, DISABLED_SUBKEY, original_name)[0]
+            except FileNotFoundError:
+                disabled_prior = None
+            get_journal().record('startup.disable', [
+                {'kind': 'registry', 'hive': hive, 'path': RUN_SUBKEY, 'name': original_name, 'type': val_type, 'prior': original_value},
+                {'kind': 'registry', 'hive': hive, 'path': DISABLED_SUBKEY, 'name': original_name, 'type': val_type, 'prior': disabled_prior},
+            ])
             # Cria subchave de Disabled e move o valor para lá
-            with winreg.CreateKeyEx(hive, disabled_subkey, 0, winreg.KEY_SET_VALUE | winreg.KEY_WOW64_64KEY) as key_disabled:
-                winreg.SetValueEx(key_disabled, original_name, 0, val_type, original_value)
-
-            with winreg.OpenKey(hive, run_subkey, 0, winreg.KEY_SET_VALUE | winreg.KEY_WOW64_64KEY) as key_mod:
-                try:
-                    winreg.DeleteValue(key_mod, original_name)
-                except FileNotFoundError:
-                    pass
+            backend.reg_set(hive, DISABLED_SUBKEY, original_name, val_type, original_value)
+            try:
+                backend.reg_delete(hive, RUN_SUBKEY, original_name)
+            except FileNotFoundError:
+                pass
             return True
         except OSError as e:
             raise Exception(f"Falha ao mover valor para Disabled: {e}")
 
     elif source == "Startup Folder":
         path = value
-        if not path or not os.path.exists(path):
+        backend = get_backend()
+        if not path or not backend.exists(path):
             # Já não existe
             return True
-        base_dir = os.path.dirname(path)
         # Se for diretório (pasta) em vez de arquivo, consideramos já desabilitado
-        if os.path.isdir(path):
+        if backend.is_dir(path):
             return True
         target_dir = r"C:\CloudOptimizerDisabled"
         try:
-            os.makedirs(target_dir, exist_ok=True)
             target_path = os.path.join(target_dir, os.path.basename(path))
             # Se já existir, cria um nome alternativo
-            if os.path.exists(target_path):
+            if backend.exists(target_path):
                 name_no_ext, ext = os.path.splitext(os.path.basename(path))
                 i = 1
                 while True:
                     alt = os.path.join(target_dir, f"{name_no_ext} ({i}){ext}")
-                    if not os.path.exists(alt):
+                    if not backend.exists(alt):
                         target_path = alt
                         break
                     i += 1
-            shutil.move(path, target_path)
+            get_journal().record('startup.disable', [{'kind': 'file_move', 'src': path, 'dst': target_path}])
+            backend.move_file(path, target_path)
             return True
         except Exception as e:
             raise Exception(f"Falha ao mover arquivo da pasta Startup: {e}")
@@ -177,18 +169,17 @@ def _startup_dirs() -> List[str]:
 
 def list_disabled_startup_items() -> List[Dict[str, str]]:
     """Lista arquivos e valores de registro desativados."""
+    backend = get_backend()
     items: List[Dict[str, str]] = []
     for base in _startup_dirs():
         try:
-            if not base or not os.path.isdir(base):
+            if not base or not backend.is_dir(base):
                 continue
             disabled_dir = r"C:\CloudOptimizerDisabled"
-            if not os.path.isdir(disabled_dir):
+            if not backend.is_dir(disabled_dir):
                 continue
-            for fname in os.listdir(disabled_dir):
+            for fname in backend.list_dir(disabled_dir):
                 path = os.path.join(disabled_dir, fname)
-                if os.path.isdir(path):
-                    continue
                 items.append({
                     'name': os.path.splitext(fname)[0],
                     'path': path,
@@ -199,27 +190,19 @@ def list_disabled_startup_items() -> List[Dict[str, str]]:
             continue
     # Também lista valores do registro movidos para a subchave DisabledByCloudOptimizer
     for hive, source in [
-        (winreg.HKEY_CURRENT_USER, 'HKCU Run'),
-        (winreg.HKEY_LOCAL_MACHINE, 'HKLM Run'),
+        (HKCU, 'HKCU Run'),
+        (HKLM, 'HKLM Run'),
     ]:
         try:
-            disabled_subkey = r"Software\Microsoft\Windows\CurrentVersion\Run\DisabledByCloudOptimizer"
-            with winreg.OpenKey(hive, disabled_subkey, 0, winreg.KEY_READ | winreg.KEY_WOW64_64KEY) as k:
-                i = 0
-                while True:
-                    try:
-                        vname, vdata, vtype = winreg.EnumValue(k, i)
-                        items.append({
-                            'name': vname,
-                            'path': str(vdata),
-                            'base': disabled_subkey,
-                            'source': source,
-                            'kind': 'registry',
-                            'hive': 'HKCU' if hive == winreg.HKEY_CURRENT_USER else 'HKLM',
-                        })
-                        i += 1
-                    except OSError:
-                        break
+            for vname, vdata, vtype in backend.reg_values(hive, DISABLED_SUBKEY):
+                items.append({
+                    'name': vname,
+                    'path': str(vdata),
+                    'base': DISABLED_SUBKEY,
+                    'source': source,
+                    'kind': 'registry',
+                    'hive': hive,
+                })
         except Exception:
             pass
 
@@ -230,49 +213,45 @@ def list_disabled_startup_items() -> List[Dict[str, str]]:
 def restore_startup_item(entry: Dict[str, str]) -> bool:
     """Restaura arquivo da pasta Disabled ou valor de registro para Run."""
     kind = entry.get('kind', 'file')
+    backend = get_backend()
     if kind == 'registry':
-        hive = winreg.HKEY_CURRENT_USER if entry.get('hive') == 'HKCU' else winreg.HKEY_LOCAL_MACHINE
+        hive = HKCU if entry.get('hive') == 'HKCU' else HKLM
         # HKLM requer admin
-        if hive == winreg.HKEY_LOCAL_MACHINE and not _is_admin():
+        if hive == HKLM and not _is_admin():
             raise PermissionError("Restaurar itens em HKLM requer executar como administrador")
 
-        disabled_subkey = r"Software\Microsoft\Windows\CurrentVersion\Run\DisabledByCloudOptimizer"
-        run_subkey = r"Software\Microsoft\Windows\CurrentVersion\Run"
         name = entry.get('name', '')
         try:
-            with winreg.OpenKey(hive, disabled_subkey, 0, winreg.KEY_READ | winreg.KEY_SET_VALUE | winreg.KEY_WOW64_64KEY) as kd:
-                value, vtype = winreg.QueryValueEx(kd, name)
-                # Escreve de volta em Run
-                with winreg.OpenKey(hive, run_subkey, 0, winreg.KEY_SET_VALUE | winreg.KEY_WOW64_64KEY) as kr:
-                    winreg.SetValueEx(kr, name, 0, vtype, value)
-                # Remove do Disabled
-                try:
-                    winreg.DeleteValue(kd, name)
-                except FileNotFoundError:
-                    pass
+            value, vtype = backend.reg_read(hive, DISABLED_SUBKEY, name)
+            # Escreve de volta em Run
+            backend.reg_set(hive, RUN_SUBKEY, name, vtype, value)
+            # Remove do Disabled
+            try:
+                backend.reg_delete(hive, DISABLED_SUBKEY, name)
+            except FileNotFoundError:
+                pass
             return True
         except OSError as e:
             raise Exception(f"Falha ao restaurar valor do registro: {e}")
     else:
         path = entry.get('path', '')
         base = entry.get('base', '')
-        if not path or not os.path.exists(path):
+        if not path or not backend.exists(path):
             return True
         if not base:
             base = os.path.dirname(os.path.dirname(path))
         try:
-            os.makedirs(base, exist_ok=True)
             target = os.path.join(base, os.path.basename(path))
-            if os.path.exists(target):
+            if backend.exists(target):
                 name_no_ext, ext = os.path.splitext(os.path.basename(path))
                 i = 1
                 while True:
                     alt = os.path.join(base, f"{name_no_ext} (restored {i}){ext}")
-                    if not os.path.exists(alt):
+                    if not backend.exists(alt):
                         target = alt
                         break
                     i += 1
-            shutil.move(path, target)
+            backend.move_file(path, target)
             return True
         except Exception as e:
             raise Exception(f"Falha ao restaurar item: {e}")
@@ -280,19 +259,20 @@ def restore_startup_item(entry: Dict[str, str]) -> bool:
 
 def create_test_startup_entries() -> Dict[str, bool]:
 
+    backend = get_backend()
     results = {"HKCU": False, "HKLM": False}
     try:
-        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Microsoft\Windows\CurrentVersion\Run", 0, winreg.KEY_SET_VALUE | winreg.KEY_WOW64_64KEY) as k:
-            winreg.SetValueEx(k, "CloudOptTest_User", 0, winreg.REG_SZ, "notepad.exe")
-            results["HKCU"] = True
+        backend.reg_values(HKCU, RUN_SUBKEY)
+        backend.reg_set(HKCU, RUN_SUBKEY, "CloudOptTest_User", REG_SZ, "notepad.exe")
+        results["HKCU"] = True
     except OSError:
         pass
 
     if _is_admin():
         try:
-            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"Software\Microsoft\Windows\CurrentVersion\Run", 0, winreg.KEY_SET_VALUE | winreg.KEY_WOW64_64KEY) as k:
-                winreg.SetValueEx(k, "CloudOptTest_System", 0, winreg.REG_SZ, "notepad.exe")
-                results["HKLM"] = True
+            backend.reg_values(HKLM, RUN_SUBKEY)
+            backend.reg_set(HKLM, RUN_SUBKEY, "CloudOptTest_System", REG_SZ, "notepad.exe")
+            results["HKLM"] = True
         except OSError:
             pass
     return results
@@ -300,26 +280,18 @@ def create_test_startup_entries() -> Dict[str, bool]:
 
 def remove_test_startup_entries() -> Dict[str, bool]:
     """Remove entradas de teste criadas por create_test_startup_entries."""
+    backend = get_backend()
     results = {"HKCU": False, "HKLM": False}
     try:
-        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Microsoft\Windows\CurrentVersion\Run", 0, winreg.KEY_SET_VALUE | winreg.KEY_WOW64_64KEY) as k:
-            try:
-                winreg.DeleteValue(k, "CloudOptTest_User")
-                results["HKCU"] = True
-            except FileNotFoundError:
-                pass
+        backend.reg_delete(HKCU, RUN_SUBKEY, "CloudOptTest_User")
+        results["HKCU"] = True
     except OSError:
         pass
 
     if _is_admin():
         try:
-            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"Software\Microsoft\Windows\CurrentVersion\Run", 0, winreg.KEY_SET_VALUE | winreg.KEY_WOW64_64KEY) as k:
-                try:
-                    winreg.DeleteValue(k, "CloudOptTest_System")
-                    results["HKLM"] = True
-                except FileNotFoundError:
-                    pass
+            backend.reg_delete(HKLM, RUN_SUBKEY, "CloudOptTest_System")
+            results["HKLM"] = True
         except OSError:
             pass
     return results
-
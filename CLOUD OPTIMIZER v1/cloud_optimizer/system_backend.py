@@ -0,0 +1,574 @@
+# Date: 19/10/2026
+# DEV: Martinez
+# Cloud Optimizer v1 Free Utility by Martinez
+
+import abc
+import csv
+import glob
+import io
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from cloud_optimizer.utils import is_admin, run_batch
+
+__all__ = [
+    "SystemBackend",
+    "WindowsBackend",
+    "FakeBackend",
+    "LinuxBackend",
+    "get_backend",
+    "set_backend",
+    "HKCU",
+    "HKLM",
+    "REG_SZ",
+    "REG_EXPAND_SZ",
+    "REG_BINARY",
+    "REG_DWORD",
+    "POWER_TIMEOUTS",
+    "POWER_TIMEOUT_SUBGROUPS",
+]
+
+HKCU, HKLM = 'HKCU', 'HKLM'
+# Mesmos códigos do winreg
+REG_SZ, REG_EXPAND_SZ, REG_BINARY, REG_DWORD = 1, 2, 3, 4
+
+# Timeouts de economia de energia: opção do `powercfg /change` -> GUID da configuração no `powercfg /query`
+POWER_TIMEOUTS = {
+    'monitor-timeout-ac': '3c0bc021-c8a8-4e07-a973-6b14cbcb2b7e',
+    'disk-timeout-ac': '6738e2c4-e8a5-4a42-b16a-e040e769756e',
+    'standby-timeout-ac': '29f6c1db-86da-48c5-9fdb-f2b67b1f44da',
+    'hibernate-timeout-ac': '9d7815a6-7ee4-497e-8888-515a05f02364',
+}
+# Subgrupo de cada timeout, para `powercfg /setacvalueindex <plano> <subgrupo> <configuração> <segundos>`
+POWER_TIMEOUT_SUBGROUPS = {
+    'monitor-timeout-ac': '7516b95f-f776-4464-8c53-06167f40cc99',    # vídeo
+    'disk-timeout-ac': '0012ee47-9041-4b5d-9b77-535fba8b1442',       # disco rígido
+    'standby-timeout-ac': '238c9fa8-0aad-41ed-83f4-97be242c8f20',    # suspensão
+    'hibernate-timeout-ac': '238c9fa8-0aad-41ed-83f4-97be242c8f20',  # suspensão
+}
+
+_ERROR_KEY_DELETED = 1018
+
+
+class SystemBackend(abc.ABC):
+    """Acesso ao sistema usado por tweaks e startup: registro, comandos, arquivos.
+
+    Serviços e tarefas agendadas são controlados por comandos (sc, schtasks),
+    que passam todos por `run_commands` em lote. Chaves do registro são
+    identificadas por hive ('HKCU'/'HKLM') e caminho; valores ausentes lançam
+    FileNotFoundError, como no winreg. `platform` diz qual conjunto de ajustes
+    (tweaks do Windows ou tweaks_linux) o backend atende. Todos os métodos,
+    exceto `close`, são abstratos: uma implementação incompleta falha ao ser
+    criada, não no meio de um ajuste.
+    """
+
+    platform = 'windows'
+
+    @abc.abstractmethod
+    def is_admin(self) -> bool:
+        """True se o processo tem privilégios de administrador (root no Linux)."""
+
+    @abc.abstractmethod
+    def reg_read(self, hive: str, path: str, name: str) -> Tuple[object, int]:
+        """(valor, tipo) de um valor do registro."""
+
+    @abc.abstractmethod
+    def reg_values(self, hive: str, path: str) -> List[Tuple[str, object, int]]:
+        """Todos os valores de uma chave: [(nome, valor, tipo)]."""
+
+    @abc.abstractmethod
+    def reg_set(self, hive: str, path: str, name: str, kind: int, value) -> None:
+        """Grava um valor, criando a chave se preciso."""
+
+    @abc.abstractmethod
+    def reg_delete(self, hive: str, path: str, name: str) -> None:
+        """Apaga um valor do registro."""
+
+    @abc.abstractmethod
+    def run_commands(self, commands: Sequence[Sequence[str]], timeout: Optional[float] = None) -> List[subprocess.CompletedProcess]:
+        """Roda os comandos em sequência (um lote) e devolve um CompletedProcess por comando."""
+
+    @abc.abstractmethod
+    def list_dir(self, path: str) -> List[str]:
+        """Nomes dos arquivos (não pastas) de `path`; lista vazia se a pasta não existir."""
+
+    @abc.abstractmethod
+    def exists(self, path: str) -> bool:
+        """True se o caminho existe."""
+
+    @abc.abstractmethod
+    def is_dir(self, path: str) -> bool:
+        """True se o caminho é uma pasta."""
+
+    @abc.abstractmethod
+    def move_file(self, src: str, dst: str) -> None:
+        """Move um arquivo, criando a pasta de destino."""
+
+    def close(self) -> None:
+        pass
+
+
+class WindowsBackend(SystemBackend):
+    """Implementação real: winreg, shell em lote (ShellSession) e sistema de arquivos.
+
+    Os handles das chaves do registro ficam abertos e são reaproveitados entre
+    leituras e escritas (um OpenKey por chave, não por operação); `close()`
+    fecha todos. Um handle de chave apagada por fora é reaberto na hora.
+    """
+
+    def __init__(self) -> None:
+        import winreg
+        self._winreg = winreg
+        self._roots = {HKCU: winreg.HKEY_CURRENT_USER, HKLM: winreg.HKEY_LOCAL_MACHINE}
+        self._handles: Dict[Tuple[str, str, bool], object] = {}
+        self._lock = threading.Lock()
+
+    def is_admin(self) -> bool:
+        return bool(is_admin())
+
+    def _key(self, hive: str, path: str, write: bool, create: bool = False):
+        cache_key = (hive, path.lower(), write)
+        with self._lock:
+            handle = self._handles.get(cache_key)
+            if handle is None:
+                wr = self._winreg
+                access = wr.KEY_READ | wr.KEY_WOW64_64KEY | (wr.KEY_SET_VALUE if write else 0)
+                if create:
+                    handle = wr.CreateKeyEx(self._roots[hive], path, 0, access)
+                else:
+                    handle = wr.OpenKey(self._roots[hive], path, 0, access)
+                self._handles[cache_key] = handle
+            return handle
+
+    def _with_key(self, hive: str, path: str, write: bool, func, create: bool = False):
+        for attempt in (0, 1):
+            handle = self._key(hive, path, write, create)
+            try:
+                return func(handle)
+            except OSError as e:
+                if attempt or getattr(e, 'winerror', None) != _ERROR_KEY_DELETED:
+                    raise
+                with self._lock:
+                    self._handles.pop((hive, path.lower(), write), None)
+
+    def reg_read(self, hive, path, name):
+        return self._with_key(hive, path, False, lambda h: self._winreg.QueryValueEx(h, name))
+
+    def reg_values(self, hive, path):
+        def enum(handle):
+            values = []
+            i = 0
+            while True:
+                try:
+                    values.append(self._winreg.EnumValue(handle, i))
+                except OSError:
+                    return values
+                i += 1
+        return self._with_key(hive, path, False, enum)
+
+    def reg_set(self, hive, path, name, kind, value):
+        self._with_key(hive, path, True, lambda h: self._winreg.SetValueEx(h, name, 0, kind, value), create=True)
+
+    def reg_delete(self, hive, path, name):
+        self._with_key(hive, path, True, lambda h: self._winreg.DeleteValue(h, name))
+
+    def run_commands(self, commands, timeout=None):
+        return run_batch(commands, timeout=timeout)
+
+    def list_dir(self, path):
+        try:
+            return [e.name for e in os.scandir(path) if not e.is_dir()]
+        except OSError:
+            return []
+
+    def exists(self, path):
+        return os.path.exists(path)
+
+    def is_dir(self, path):
+        return os.path.isdir(path)
+
+    def move_file(self, src, dst):
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        shutil.move(src, dst)
+
+    def close(self) -> None:
+        with self._lock:
+            handles, self._handles = list(self._handles.values()), {}
+        for handle in handles:
+            try:
+                self._winreg.CloseKey(handle)
+            except OSError:
+                pass
+
+
+_BALANCED_GUID = '381b4222-f694-41f0-9685-ff5bb260df2e'
+_HIGH_PERF_GUID = '8c5e7fda-e8bf-4a96-9a85-a6e23a8c635c'
+_SC_STATES = {1: 'STOPPED', 2: 'START_PENDING', 3: 'STOP_PENDING', 4: 'RUNNING'}
+_SC_STARTS = {'boot': 0, 'system': 1, 'auto': 2, 'demand': 3, 'disabled': 4}
+
+
+class FakeBackend(SystemBackend):
+    """Sistema em memória para rodar ajustes e inicialização fora do Windows.
+
+    Guarda registro, serviços, planos de energia, TCP, tarefas agendadas e
+    arquivos em dicionários, e responde aos comandos sc, powercfg, netsh,
+    ipconfig e schtasks no mesmo formato do Windows (em inglês), então o
+    código dos ajustes é o mesmo nos dois backends. `latency` (s) é somada a
+    cada operação de registro/arquivo e `command_latency` a cada comando;
+    `calls` conta as operações por tipo e `commands` guarda os comandos rodados.
+    """
+
+    def __init__(self, latency: float = 0.0, command_latency: float = 0.0, admin: bool = True) -> None:
+        self.latency = latency
+        self.command_latency = command_latency
+        self.admin = admin
+        self.calls: Counter = Counter()
+        self.commands: List[List[str]] = []
+        self._lock = threading.RLock()
+        self._keys: Dict[Tuple[str, str], Dict[str, Tuple[str, object, int]]] = {}
+        self._files: Dict[str, str] = {}  # caminho normalizado -> caminho
+        self.services: Dict[str, Dict[str, int]] = {}
+        self.tasks: Dict[str, Dict[str, str]] = {}
+        self.tcp = {'autotuninglevel': 'normal', 'chimney': 'disabled', 'rss': 'enabled'}
+        self.power_active = _BALANCED_GUID
+        self.power_schemes = {
+            _BALANCED_GUID: ('Balanced', {opt: 600 for opt in POWER_TIMEOUTS}),
+            _HIGH_PERF_GUID: ('High performance', {opt: 900 for opt in POWER_TIMEOUTS}),
+        }
+
+    def _tick(self, kind: str, delay: float) -> None:
+        self.calls[kind] += 1
+        if delay:
+            time.sleep(delay)
+
+    def is_admin(self) -> bool:
+        return self.admin
+
+    # Registro
+    def reg_read(self, hive, path, name):
+        self._tick('reg_read', self.latency)
+        with self._lock:
+            entry = self._keys.get((hive, path.lower()), {}).get(name.lower())
+        if entry is None:
+            raise FileNotFoundError(f"{hive}\\{path}\\{name}")
+        return entry[1], entry[2]
+
+    def reg_values(self, hive, path):
+        self._tick('reg_values', self.latency)
+        with self._lock:
+            values = self._keys.get((hive, path.lower()))
+            if values is None:
+                raise FileNotFoundError(f"{hive}\\{path}")
+            return list(values.values())
+
+    def reg_set(self, hive, path, name, kind, value):
+        self._tick('reg_set', self.latency)
+        with self._lock:
+            self._keys.setdefault((hive, path.lower()), {})[name.lower()] = (name, value, kind)
+
+    def reg_delete(self, hive, path, name):
+        self._tick('reg_delete', self.latency)
+        with self._lock:
+            values = self._keys.get((hive, path.lower()), {})
+            if name.lower() not in values:
+                raise FileNotFoundError(f"{hive}\\{path}\\{name}")
+            del values[name.lower()]
+
+    # Arquivos
+    @staticmethod
+    def _norm(path: str) -> str:
+        return os.path.normcase(os.path.normpath(path))
+
+    def add_file(self, path: str) -> None:
+        with self._lock:
+            self._files[self._norm(path)] = path
+
+    def list_dir(self, path):
+        self._tick('list_dir', self.latency)
+        folder = self._norm(path)
+        with self._lock:
+            return [os.path.basename(p) for n, p in self._files.items() if os.path.dirname(n) == folder]
+
+    def exists(self, path):
+        with self._lock:
+            return self._norm(path) in self._files or self.is_dir(path)
+
+    def is_dir(self, path):
+        # Pastas só existem implicitamente, por conterem arquivos
+        prefix = os.path.join(self._norm(path), '')
+        with self._lock:
+            return any(n.startswith(prefix) for n in self._files)
+
+    def move_file(self, src, dst):
+        self._tick('move_file', self.latency)
+        with self._lock:
+            if self._norm(src) not in self._files:
+                raise FileNotFoundError(src)
+            del self._files[self._norm(src)]
+            self._files[self._norm(dst)] = dst
+
+    # Serviços e tarefas (estado inicial dos testes)
+    def add_service(self, name: str, state: int = 4, start: int = 2) -> None:
+        self.services[name.lower()] = {'name': name, 'state': state, 'start': start}
+
+    def add_task(self, path: str, action: str = '', enabled: bool = True) -> None:
+        self.tasks[path.lower()] = {'path': path, 'action': action, 'status': 'Ready' if enabled else 'Disabled'}
+
+    # Comandos
+    def run_commands(self, commands, timeout=None):
+        results = []
+        for cmd in commands:
+            self._tick('command', self.command_latency)
+            cmd = list(cmd)
+            with self._lock:
+                self.commands.append(cmd)
+                prog = os.path.basename(cmd[0]).lower()
+                handler = getattr(self, f"_cmd_{prog[:-4] if prog.endswith('.exe') else prog}", None)
+                if handler is None:
+                    code, out = 1, f"'{cmd[0]}' is not recognized as an internal or external command.\n"
+                else:
+                    code, out = handler(cmd[1:])
+            results.append(subprocess.CompletedProcess(cmd, code, out, ''))
+        return results
+
+    def _cmd_sc(self, args):
+        op = args[0].lower() if args else ''
+        svc = self.services.get(args[1].lower()) if len(args) > 1 else None
+        if svc is None:
+            return 1060, "[SC] OpenService FAILED 1060:\n\nThe specified service does not exist as an installed service.\n"
+        if op == 'query':
+            return 0, f"\nSERVICE_NAME: {svc['name']}\n        TYPE               : 10  WIN32_OWN_PROCESS\n        STATE              : {svc['state']}  {_SC_STATES[svc['state']]}\n"
+        if op == 'qc':
+            kind = {v: k.upper() for k, v in _SC_STARTS.items()}[svc['start']]
+            return 0, f"[SC] QueryServiceConfig SUCCESS\n\nSERVICE_NAME: {svc['name']}\n        START_TYPE         : {svc['start']}   {kind}\n"
+        if op == 'stop':
+            if svc['state'] == 1:
+                return 1062, "[SC] ControlService FAILED 1062:\n\nThe service has not been started.\n"
+            svc['state'] = 1
+            return 0, f"\nSERVICE_NAME: {svc['name']}\n        STATE              : 3  STOP_PENDING\n"
+        if op == 'start':
+            if svc['start'] == 4:
+                return 1058, "[SC] StartService FAILED 1058:\n\nThe service cannot be started, either because it is disabled or because it has no enabled devices associated with it.\n"
+            if svc['state'] == 4:
+                return 1056, "[SC] StartService FAILED 1056:\n\nAn instance of the service is already running.\n"
+            svc['state'] = 4
+            return 0, f"\nSERVICE_NAME: {svc['name']}\n        STATE              : 2  START_PENDING\n"
+        if op == 'config' and len(args) > 2 and args[2].lower().startswith('start='):
+            start = _SC_STARTS.get(args[2].split('=', 1)[1].lower())
+            if start is None:
+                return 87, "[SC] ChangeServiceConfig FAILED 87:\n\nThe parameter is incorrect.\n"
+            svc['start'] = start
+            return 0, "[SC] ChangeServiceConfig SUCCESS\n"
+        return 87, "[SC] FAILED 87:\n\nThe parameter is incorrect.\n"
+
+    def _cmd_powercfg(self, args):
+        op = args[0].lower() if args else ''
+        if op == '/getactivescheme':
+            return 0, f"Power Scheme GUID: {self.power_active}  ({self.power_schemes[self.power_active][0]})\n"
+        if op == '/setactive' and len(args) > 1 and args[1].lower() == 'scheme_current':
+            return 0, ""
+        if op == '/setactive' and len(args) > 1 and args[1].lower() in self.power_schemes:
+            self.power_active = args[1].lower()
+            return 0, ""
+        if op == '/setacvalueindex' and len(args) > 4:
+            scheme = self.power_active if args[1].lower() == 'scheme_current' else args[1].lower()
+            option = next((opt for opt, guid in POWER_TIMEOUTS.items() if guid == args[3].lower()), None)
+            if scheme in self.power_schemes and option and POWER_TIMEOUT_SUBGROUPS[option] == args[2].lower():
+                try:
+                    self.power_schemes[scheme][1][option] = int(args[4], 0)
+                    return 0, ""
+                except ValueError:
+                    pass
+        if op == '/change' and len(args) > 2 and args[1] in POWER_TIMEOUTS and args[2].isdigit():
+            # /change recebe minutos; o /query mostra segundos
+            self.power_schemes[self.power_active][1][args[1]] = int(args[2]) * 60
+            return 0, ""
+        if op == '/query' and len(args) > 1 and args[1].lower() in self.power_schemes:
+            name, values = self.power_schemes[args[1].lower()]
+            out = [f"Power Scheme GUID: {args[1].lower()}  ({name})"]
+            for opt, guid in POWER_TIMEOUTS.items():
+                out += [
+                    f"    Power Setting GUID: {guid}  ({opt})",
+                    "      Minimum Possible Setting: 0x00000000",
+                    "      Maximum Possible Setting: 0xffffffff",
+                    "      Possible Settings increment: 0x00000001",
+                    "      Possible Settings units: Seconds",
+                    f"    Current AC Power Setting Index: 0x{values[opt]:08x}",
+                    "    Current DC Power Setting Index: 0x00000384",
+                    "",
+                ]
+            return 0, "\n".join(out) + "\n"
+        return 1, "Invalid Parameters -- try \"/?\" for help\n"
+
+    def _cmd_netsh(self, args):
+        lowered = [a.lower() for a in args]
+        if lowered[:4] == ['int', 'tcp', 'show', 'global']:
+            return 0, (
+                "Querying active state...\n\nTCP Global Parameters\n----------------------------------------------\n"
+                f"Receive-Side Scaling State          : {self.tcp['rss']}\n"
+                f"Chimney Offload State               : {self.tcp['chimney']}\n"
+                f"Receive Window Auto-Tuning Level    : {self.tcp['autotuninglevel']}\n"
+            )
+        if lowered[:4] == ['int', 'tcp', 'set', 'global'] and len(args) == 5 and '=' in args[4]:
+            key, value = args[4].split('=', 1)
+            if key.lower() in self.tcp:
+                self.tcp[key.lower()] = value.lower()
+                return 0, "Ok.\n"
+        return 1, "The parameter is incorrect.\n"
+
+    def _cmd_ipconfig(self, args):
+        if args and args[0].lower() == '/flushdns':
+            return 0, "\nWindows IP Configuration\n\nSuccessfully flushed the DNS Resolver Cache.\n"
+        return 1, "Error: unrecognized or incomplete command line.\n"
+
+    def _cmd_schtasks(self, args):
+        lowered = [a.lower() for a in args]
+        if lowered[:1] == ['/query']:
+            out = io.StringIO()
+            writer = csv.writer(out, quoting=csv.QUOTE_ALL, lineterminator="\n")
+            for task in self.tasks.values():
+                state = 'Disabled' if task['status'] == 'Disabled' else 'Enabled'
+                writer.writerow(["FAKE", task['path'], "N/A", task['status'], "Interactive/Background", "N/A", "0",
+                                 "Fake", task['action'], "N/A", "N/A", state])
+            return 0, out.getvalue()
+        if lowered[:1] == ['/change'] and '/tn' in lowered and ('/disable' in lowered or '/enable' in lowered):
+            path = args[lowered.index('/tn') + 1] if lowered.index('/tn') + 1 < len(args) else ''
+            task = self.tasks.get(path.lower())
+            if task is None:
+                return 1, "ERROR: The system cannot find the file specified.\n"
+            task['status'] = 'Disabled' if '/disable' in lowered else 'Ready'
+            return 0, f'SUCCESS: The parameters of scheduled task "{path}" have been changed.\n'
+        return 1, "ERROR: Invalid argument/option.\n"
+
+
+class LinuxBackend(SystemBackend):
+    """Linux: arquivos de /sys e /proc, links de unidades do systemd e comandos.
+
+    Todos os caminhos são absolutos do sistema e resolvidos dentro de `root`.
+    Com um `root` diferente de '/' (uma árvore falsa de sysfs/procfs, usada em
+    benchmarks e verificações) os comandos não são executados: ficam em
+    `commands` e retornam código 0. Não há registro: as leituras lançam
+    FileNotFoundError, como uma chave ausente no Windows.
+    """
+
+    platform = 'linux'
+
+    def __init__(self, root: str = '/', admin: Optional[bool] = None) -> None:
+        self.root = os.path.abspath(root)
+        self.live = self.root == os.path.abspath(os.sep)
+        self._admin = admin
+        self.commands: List[List[str]] = []
+
+    def path(self, path: str) -> str:
+        """Caminho real de um caminho do sistema (dentro de `root`)."""
+        return path if self.live else os.path.join(self.root, path.lstrip('/'))
+
+    def is_admin(self) -> bool:
+        if self._admin is not None:
+            return self._admin
+        # Numa árvore falsa as escritas não tocam o sistema
+        return os.geteuid() == 0 if self.live else True
+
+    def reg_read(self, hive, path, name):
+        raise FileNotFoundError(f"Registro indisponível no Linux: {hive}\\{path}")
+
+    def reg_values(self, hive, path):
+        raise FileNotFoundError(f"Registro indisponível no Linux: {hive}\\{path}")
+
+    def reg_set(self, hive, path, name, kind, value):
+        raise FileNotFoundError(f"Registro indisponível no Linux: {hive}\\{path}")
+
+    def reg_delete(self, hive, path, name):
+        raise FileNotFoundError(f"Registro indisponível no Linux: {hive}\\{path}")
+
+    def read_text(self, path: str) -> str:
+        """Conteúdo de um arquivo de sysfs/procfs, sem espaços nas pontas."""
+        with open(self.path(path), encoding='utf-8') as fh:
+            return fh.read().strip()
+
+    def write_text(self, path: str, value: str) -> None:
+        """Grava num arquivo já existente (sysfs/procfs não aceitam criar arquivos)."""
+        with open(self.path(path), 'r+', encoding='utf-8') as fh:
+            fh.write(value)
+            # Árvore falsa: um valor mais curto não pode deixar sobra do anterior
+            fh.truncate()
+
+    def glob(self, pattern: str) -> List[str]:
+        """Caminhos do sistema que casam com o padrão, em ordem."""
+        cut = 0 if self.live else len(self.root)
+        return sorted(p[cut:] for p in glob.glob(self.path(pattern)))
+
+    def readlink(self, path: str) -> Optional[str]:
+        """Destino de um link simbólico; None se não for link."""
+        try:
+            return os.readlink(self.path(path))
+        except OSError:
+            return None
+
+    def symlink(self, target: str, path: str) -> None:
+        os.makedirs(os.path.dirname(self.path(path)), exist_ok=True)
+        os.symlink(target, self.path(path))
+
+    def remove(self, path: str) -> None:
+        os.unlink(self.path(path))
+
+    def run_commands(self, commands, timeout=None):
+        if self.live:
+            return run_batch(commands, timeout=timeout)
+        self.commands.extend(list(c) for c in commands)
+        return [subprocess.CompletedProcess(list(c), 0, '', '') for c in commands]
+
+    def list_dir(self, path):
+        try:
+            return [e.name for e in os.scandir(self.path(path)) if not e.is_dir()]
+        except OSError:
+            return []
+
+    def exists(self, path):
+        return os.path.lexists(self.path(path))
+
+    def is_dir(self, path):
+        return os.path.isdir(self.path(path))
+
+    def move_file(self, src, dst):
+        os.makedirs(os.path.dirname(self.path(dst)), exist_ok=True)
+        shutil.move(self.path(src), self.path(dst))
+
+
+_backend: Optional[SystemBackend] = None
+_backend_lock = threading.Lock()
+
+
+def get_backend() -> SystemBackend:
+    """Backend em uso: Windows no Windows, Linux no Linux, o falso nos demais.
+
+    CLOUD_OPTIMIZER_BACKEND=windows|linux|fake força um deles (fake é útil para
+    testar os ajustes do Windows em qualquer sistema) e CLOUD_OPTIMIZER_SYSROOT
+    aponta o Linux para uma árvore falsa de sysfs/procfs.
+    """
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            default = "windows" if os.name == "nt" else "linux" if sys.platform.startswith("linux") else "fake"
+            name = os.environ.get("CLOUD_OPTIMIZER_BACKEND") or default
+            if name == "windows":
+                _backend = WindowsBackend()
+            elif name == "linux":
+                _backend = LinuxBackend(os.environ.get("CLOUD_OPTIMIZER_SYSROOT") or '/')
+            else:
+                _backend = FakeBackend()
+        return _backend
+
+
+def set_backend(backend: Optional[SystemBackend]) -> Optional[SystemBackend]:
+    """Troca o backend (benchmarks, testes); retorna o anterior. None volta ao padrão."""
+    global _backend
+    with _backend_lock:
+        previous, _backend = _backend, backend
+    return previous
@@ -0,0 +1,214 @@
+# Date: 19/10/2026
+# DEV: Martinez
+# Cloud Optimizer v1 Free Utility by Martinez
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, List, Optional
+
+__all__ = ["Step", "TweakEngine", "run_steps", "raise_on_failure"]
+
+ProgressCallback = Callable[[Dict], None]
+
+# Estados finais de um passo
+OK, ERROR, TIMEOUT, SKIPPED, CANCELLED = 'ok', 'error', 'timeout', 'skipped', 'cancelled'
+
+
+class Step:
+    """Passo de um ajuste: uma função sem argumentos e os passos dos quais depende.
+
+    `timeout` (s) limita o tempo de espera pelo passo; `optional` indica que uma
+    falha não bloqueia os dependentes nem conta como falha do ajuste.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[], object],
+        deps: Iterable[str] = (),
+        timeout: Optional[float] = 30.0,
+        optional: bool = False,
+    ) -> None:
+        self.name = name
+        self.func = func
+        self.deps = tuple(deps)
+        self.timeout = timeout
+        self.optional = optional
+
+    def __repr__(self) -> str:
+        return f"Step({self.name!r}, deps={list(self.deps)!r})"
+
+
+class TweakEngine:
+    """Executa passos respeitando dependências num pool de threads limitado.
+
+    Passos independentes rodam em paralelo, então o tempo total é o da maior
+    cadeia de dependências e não a soma de todos os comandos. Só entram no pool
+    tantos passos quantas threads livres houver, e o timeout conta a partir de
+    quando o passo começa a rodar, não de quando ficou pronto. Um passo que
+    estoura o timeout é dado como perdido (a thread não é interrompida; os
+    comandos recebem o mesmo timeout e terminam sozinhos) e a thread dele só
+    volta a receber passos quando ele termina. Com `cancel` setado
+    nenhum passo novo é iniciado. Dependentes de um passo que falhou são pulados.
+    """
+
+    def __init__(self, max_workers: int = 4) -> None:
+        self.max_workers = max_workers
+
+    def run(
+        self,
+        steps: Iterable[Step],
+        progress: Optional[ProgressCallback] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> Dict:
+        """Roda os passos e retorna {'steps': {nome: {...}}, 'ok', 'failed', 'cancelled', 'elapsed_s'}.
+
+        Cada passo do relatório tem 'status', 'result', 'error' e 'elapsed_s'.
+        `progress` recebe {'step', 'status', 'done', 'total', 'elapsed_s'} a cada
+        início e fim de passo (na thread do motor).
+        """
+        started = time.perf_counter()
+        cancel = cancel or threading.Event()
+        steps = list(steps)
+        by_name = {s.name: s for s in steps}
+        if len(by_name) != len(steps):
+            raise Exception("Passos com nomes repetidos")
+        for s in steps:
+            missing = [d for d in s.deps if d not in by_name]
+            if missing:
+                raise Exception(f"Passo {s.name} depende de passos inexistentes: {', '.join(missing)}")
+        _check_cycles(by_name)
+
+        report: Dict[str, Dict] = {}
+        waiting = {s.name: set(s.deps) for s in steps}
+        dependents: Dict[str, List[str]] = {s.name: [] for s in steps}
+        for s in steps:
+            for d in s.deps:
+                dependents[d].append(s.name)
+
+        def emit(name, status):
+            if progress is None:
+                return
+            try:
+                progress({'step': name, 'status': status, 'done': len(report), 'total': len(steps),
+                          'elapsed_s': time.perf_counter() - started})
+            except Exception:
+                pass
+
+        def finish(name, status, result=None, error=None, elapsed=0.0):
+            report[name] = {'status': status, 'result': result, 'error': error, 'elapsed_s': elapsed}
+            emit(name, status)
+            blocked = status != OK and not by_name[name].optional
+            for child in dependents[name]:
+                if child in report:
+                    continue
+                if blocked:
+                    finish(child, SKIPPED, error=f"dependência {name} não concluída")
+                else:
+                    waiting[child].discard(name)
+
+        started_at: Dict[str, float] = {}  # nome -> instante em que o passo começou na thread
+
+        def timed(step):
+            started_at[step.name] = time.monotonic()
+            t0 = time.perf_counter()
+            try:
+                return OK, step.func(), None, time.perf_counter() - t0
+            except Exception as e:
+                return ERROR, None, str(e), time.perf_counter() - t0
+
+        def deadline(name):
+            # Prazo só existe depois que o passo começou de fato numa thread
+            timeout = by_name[name].timeout
+            return started_at[name] + timeout if timeout and name in started_at else None
+
+        running = {}  # future -> nome
+        lost = set()  # futures que estouraram o tempo e ainda ocupam uma thread
+        pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="tweak")
+        try:
+            while len(report) < len(steps):
+                lost = {f for f in lost if not f.done()}
+                if not cancel.is_set():
+                    free = self.max_workers - len(running) - len(lost)
+                    ready = [n for n, deps in waiting.items() if not deps and n not in report]
+                    for name in ready[:max(0, free)]:
+                        del waiting[name]
+                        running[pool.submit(timed, by_name[name])] = name
+                        emit(name, 'start')
+                elif not running:
+                    for name in [s.name for s in steps if s.name not in report]:
+                        finish(name, CANCELLED)
+                    break
+                if not running and not lost:
+                    # Nada rodando e nada pronto: só sobram passos bloqueados (não deveria ocorrer)
+                    for name in [s.name for s in steps if s.name not in report]:
+                        finish(name, SKIPPED, error="dependências não resolvidas")
+                    break
+                deadlines = [d for d in map(deadline, running.values()) if d is not None]
+                timeout = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+                # Acorda periodicamente para perceber o cancelamento e passos que acabaram de começar
+                timeout = 0.05 if timeout is None else min(timeout, 0.05)
+                done, _ = wait(set(running) | lost, timeout=timeout, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    name = running.pop(fut, None)
+                    if name is not None and name not in report:
+                        finish(name, *fut.result())
+                now = time.monotonic()
+                for fut, name in list(running.items()):
+                    limit = deadline(name)
+                    if limit is not None and now >= limit:
+                        running.pop(fut)
+                        lost.add(fut)
+                        finish(name, TIMEOUT, error=f"tempo limite de {by_name[name].timeout:.0f}s", elapsed=by_name[name].timeout)
+        finally:
+            # Passos que estouraram o tempo continuam nas threads: não espera por eles
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        failed = [n for n, r in report.items() if r['status'] != OK and not by_name[n].optional]
+        return {
+            'steps': report,
+            'ok': not failed,
+            'failed': failed,
+            'cancelled': cancel.is_set(),
+            'elapsed_s': time.perf_counter() - started,
+        }
+
+
+def _check_cycles(by_name: Dict[str, Step]) -> None:
+    state: Dict[str, int] = {}
+    for root in by_name:
+        if root in state:
+            continue
+        stack = [(root, iter(by_name[root].deps))]
+        state[root] = 1
+        while stack:
+            name, it = stack[-1]
+            dep = next(it, None)
+            if dep is None:
+                state[name] = 2
+                stack.pop()
+            elif state.get(dep) == 1:
+                raise Exception(f"Dependência circular entre passos: {dep} ↔ {name}")
+            elif dep not in state:
+                state[dep] = 1
+                stack.append((dep, iter(by_name[dep].deps)))
+
+
+def run_steps(
+    steps: Iterable[Step],
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[threading.Event] = None,
+    max_workers: int = 4,
+) -> Dict:
+    """Atalho para TweakEngine(max_workers).run(...)."""
+    return TweakEngine(max_workers).run(steps, progress, cancel)
+
+
+def raise_on_failure(report: Dict, context: str) -> None:
+    """Converte passos obrigatórios com falha em Exception, no padrão dos ajustes."""
+    if report['cancelled']:
+        raise Exception(f"{context}: cancelado")
+    if report['failed']:
+        details = '; '.join(f"{n}: {report['steps'][n]['error'] or report['steps'][n]['status']}" for n in report['failed'])
+        raise Exception(f"{context}: {details}")
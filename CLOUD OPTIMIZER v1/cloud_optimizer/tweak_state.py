@@ -0,0 +1,118 @@
+# Date: 19/10/2026
+# DEV: Martinez
+# Cloud Optimizer v1 Free Utility by Martinez
+
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+from cloud_optimizer.journal import get_journal
+from cloud_optimizer.system_backend import get_backend
+from cloud_optimizer.tweak_engine import Step
+
+__all__ = ["Setting", "TweakState", "UNKNOWN"]
+
+UNKNOWN = None  # valor lido que não pôde ser determinado: o ajuste é aplicado
+
+Action = Union[Sequence[Sequence[str]], Callable[[], object]]
+
+
+class Setting:
+    """Valor desejado de uma configuração e a ação que o aplica.
+
+    `apply` é uma lista de comandos (rodam no lote do ajuste, na ordem das
+    configurações) ou uma função sem argumentos (ex.: escrita no registro).
+    Falha de uma configuração com `required=False` não vira erro do ajuste.
+    `undo` recebe o valor atual e devolve o registro do diário para desfazer
+    (ver `journal.undo`); sem ele a configuração não é desfeita.
+    """
+
+    def __init__(self, key: str, desired, apply: Action, description: str = "", required: bool = True,
+                 undo: Optional[Callable[[object], Optional[Dict]]] = None) -> None:
+        self.key = key
+        self.desired = desired
+        self.apply = apply
+        self.description = description or key
+        self.required = required
+        self.undo = undo
+
+    def __repr__(self) -> str:
+        return f"Setting({self.key!r}, desired={self.desired!r})"
+
+
+class TweakState:
+    """Estado desejado de um ajuste e a leitura do estado atual.
+
+    `read` lê de uma vez (um lote de comandos, algumas chaves do registro) o
+    valor atual de cada configuração e devolve {key: valor}; chaves ausentes
+    ou UNKNOWN são tratadas como diferentes. `diff` compara com o desejado e
+    `apply` executa só as ações das configurações que diferem, então aplicar
+    de novo numa máquina já otimizada não escreve nada. O diff serve também de
+    prévia (dry-run).
+    """
+
+    def __init__(self, name: str, read: Callable[[], Dict[str, object]], settings: Iterable[Setting], timeout: float = 30.0) -> None:
+        self.name = name
+        self.read = read
+        self.settings = list(settings)
+        self.timeout = timeout
+
+    def diff(self, current: Optional[Dict[str, object]] = None) -> List[Dict]:
+        """Configurações fora do desejado: [{'key', 'description', 'current', 'desired'}]."""
+        if current is None:
+            current = self.read()
+        changes = []
+        for s in self.settings:
+            value = current.get(s.key, UNKNOWN)
+            if value is UNKNOWN or value != s.desired:
+                changes.append({'key': s.key, 'description': s.description, 'current': value, 'desired': s.desired})
+        return changes
+
+    def apply(self) -> Dict:
+        """Lê o estado, aplica só o que difere e retorna {'changed', 'unchanged', 'failed', 'results'}.
+
+        Antes de qualquer escrita os valores atuais vão para o diário (um único
+        registro por ajuste). Os comandos de todas as configurações alteradas
+        rodam num único lote (pelo backend do sistema);
+        as funções, na ordem, depois dele. `failed` é {key: erro} e `results`
+        guarda o CompletedProcess (ou retorno da função) de cada key aplicada.
+        Lança Exception se alguma configuração obrigatória falhar.
+        """
+        current = {c['key']: c['current'] for c in self.diff()}
+        todo = [s for s in self.settings if s.key in current]
+        pending = set(current)
+        get_journal().record(self.name, [s.undo(current[s.key]) for s in todo if s.undo is not None])
+        report = {
+            'changed': [],
+            'unchanged': [s.key for s in self.settings if s.key not in pending],
+            'failed': {},
+            'results': {},
+        }
+        commands, owners = [], []
+        for s in todo:
+            if not callable(s.apply):
+                for cmd in s.apply:
+                    commands.append(list(cmd))
+                    owners.append(s)
+        if commands:
+            results = get_backend().run_commands(commands, timeout=self.timeout)
+            for s, result in zip(owners, results):
+                if s.key in report['failed']:
+                    continue
+                report['results'][s.key] = result
+                if result.returncode != 0:
+                    report['failed'][s.key] = f"Comando falhou: {' '.join(result.args)}: {(result.stderr or result.stdout or '').strip()}"
+        for s in todo:
+            if callable(s.apply):
+                try:
+                    report['results'][s.key] = s.apply()
+                except Exception as e:
+                    report['failed'][s.key] = str(e)
+        report['changed'] = [s.key for s in todo if s.key not in report['failed']]
+
+        required = [s.key for s in todo if s.required and s.key in report['failed']]
+        if required:
+            raise Exception('; '.join(report['failed'][k] for k in required))
+        return report
+
+    def step(self, optional: bool = False) -> Step:
+        """Passo do motor que lê, compara e aplica; o timeout cobre a leitura e todas as ações."""
+        return Step(self.name, self.apply, timeout=self.timeout * (len(self.settings) + 1), optional=optional)
@@ -3,264 +3,458 @@
 # Cloud Optimizer v1 Free Utility by Martinez
 
 import os
-import winreg
-import ctypes
-import shutil
+import re
 
 __all__ = [
     "set_high_performance",
     "clean_temp_files",
+    "temp_policies",
     "optimize_network",
     "optimize_services",
     "disable_visual_effects",
     "disable_useless_programs",
     "is_admin",
+    "PROFILES",
+    "STATES",
+    "profile_steps",
+    "profile_groups",
+    "preview_profile",
+    "rollback",
 ]
-from cloud_optimizer.utils import run_hidden_command
+from cloud_optimizer.cleaner import clean_policies, preview_policies
+from cloud_optimizer.cleanup_policy import load_policies
+from cloud_optimizer.journal import get_journal, undo
+from cloud_optimizer.scan_index import ScanIndex
+from cloud_optimizer.scheduled_tasks import TaskInventory
+from cloud_optimizer.tweak_engine import Step, raise_on_failure, run_steps
+from cloud_optimizer.system_backend import HKCU, HKLM, POWER_TIMEOUTS, REG_BINARY, REG_DWORD, get_backend
+from cloud_optimizer.tweak_state import UNKNOWN, Setting, TweakState
+from cloud_optimizer import tweaks_linux
+
+_CMD_TIMEOUT = 30  # segundos por comando externo
 
 def is_admin():
     """Verifica se o programa está rodando com privilégios de administrador."""
     try:
-        return ctypes.windll.shell32.IsUserAnAdmin()
+        return get_backend().is_admin()
     except Exception:
         return False
 
-def set_high_performance():
+def _linux():
+    """Ajustes do Linux (tweaks_linux) quando o backend em uso é o do Linux."""
+    return get_backend().platform == 'linux'
+
+def _windows_only(name):
+    if _linux():
+        raise Exception(f"{name} está disponível apenas no Windows")
+
+def _run(commands, timeout=_CMD_TIMEOUT):
+    """Roda os comandos em lote pelo backend do sistema."""
+    return get_backend().run_commands(commands, timeout=timeout)
+
+def _batch(commands, timeout=_CMD_TIMEOUT):
+    """Função de passo que roda os comandos em sequência numa única sessão de shell.
+
+    `commands` é uma lista de (cmd, check); com `check`, código != 0 vira erro
+    (depois de todos rodarem). Retorna a lista de CompletedProcess.
+    """
+    def run():
+        results = _run([cmd for cmd, _ in commands], timeout=timeout)
+        failed = [r for r, (_, check) in zip(results, commands) if check and r.returncode != 0]
+        if failed:
+            raise Exception('; '.join(f"Comando falhou: {' '.join(r.args)}: {(r.stderr or r.stdout or '').strip()}" for r in failed))
+        return results
+    return run
+
+def _batch_step(name, commands, optional=False):
+    """Passo com um lote de comandos; o timeout do passo cobre o lote inteiro."""
+    return Step(name, _batch(commands), timeout=_CMD_TIMEOUT * len(commands), optional=optional)
+
+# GUID do plano High Performance
+HIGH_PERF_GUID = '8c5e7fda-e8bf-4a96-9a85-a6e23a8c635c'
+
+_GUID_RE = re.compile(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}', re.IGNORECASE)
+_HEX_RE = re.compile(r'0x([0-9a-f]+)', re.IGNORECASE)
+
+def _power_setting_index(query_output, setting_guid):
+    """Valor AC de uma configuração na saída de `powercfg /query` (os rótulos mudam com o idioma).
+
+    Cada configuração termina com os índices AC e DC atuais, os dois últimos
+    valores hexadecimais do bloco.
+    """
+    text = query_output.lower()
+    start = text.find(setting_guid)
+    if start < 0:
+        return UNKNOWN
+    start += len(setting_guid)
+    following = _GUID_RE.search(text, start)
+    values = _HEX_RE.findall(text[start:following.start() if following else len(text)])
+    return int(values[-2], 16) if len(values) >= 2 else UNKNOWN
+
+def _read_power_state():
+    active, query = _run([['powercfg', '/getactivescheme'], ['powercfg', '/query', HIGH_PERF_GUID]])
+    current = {}
+    if active.returncode == 0:
+        found = _GUID_RE.search(active.stdout)
+        current['power.plan'] = found.group(0).lower() if found else UNKNOWN
+    if query.returncode == 0:
+        for option, guid in POWER_TIMEOUTS.items():
+            current[f'power.{option}'] = _power_setting_index(query.stdout, guid)
+    return current
+
+def high_performance_state():
+    """Estado desejado de `set_high_performance`: plano ativo e timeouts zerados.
+
+    Os timeouts são lidos do próprio plano High Performance, que é o que fica
+    ativo depois do /setactive; o /change vale para o plano ativo.
+    """
+    settings = [Setting('power.plan', HIGH_PERF_GUID, [['powercfg', '/setactive', HIGH_PERF_GUID]], "Plano de energia ativo",
+                        undo=undo('power_plan'))]
+    # Remove timeouts de economia de energia (aplicados ao plano ativo)
+    for option in POWER_TIMEOUTS:
+        settings.append(Setting(f'power.{option}', 0, [['powercfg', '/change', option, '0']], option, required=False,
+                                undo=undo('power_timeout', option=option, scheme=HIGH_PERF_GUID)))
+    return TweakState('power', _read_power_state, settings, timeout=_CMD_TIMEOUT)
+
+def high_performance_steps():
+    """Passo de `set_high_performance`: lê o estado e aplica só o que difere, num só lote."""
+    return [high_performance_state().step()]
+
+def set_high_performance(progress=None, cancel=None):
     """Ativa plano de energia de alto desempenho e remove timeouts."""
+    if _linux():
+        return tweaks_linux.set_high_performance(progress, cancel)
     if not is_admin():
         raise PermissionError("Requer privilégios de administrador")
-    
-    try:
-        # GUID do plano High Performance
-        high_perf_guid = '8c5e7fda-e8bf-4a96-9a85-a6e23a8c635c'
-        result = run_hidden_command(
-            ['powercfg', '/setactive', high_perf_guid],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        
-        if result.returncode != 0:
-            raise Exception(f"Falha ao ativar plano: {result.stderr}")
-        
-        # Remove timeouts de economia de energia
-        for cmd, value in [
-            ('monitor-timeout-ac', '0'),
-            ('disk-timeout-ac', '0'),
-            ('standby-timeout-ac', '0'),
-            ('hibernate-timeout-ac', '0'),
-        ]:
-            run_hidden_command(
-                ['powercfg', '/change', cmd, value],
-                capture_output=True,
-                check=False,
-            )
-        
-        return True
-    except Exception as e:
-        raise Exception(f"Erro ao configurar desempenho máximo: {str(e)}")
-
-def clean_temp_files():
-    """Remove arquivos temporários do sistema (TEMP, TMP, Prefetch, logs)."""
-    deleted = 0
-    errors = []
-    
-    # Pastas a limpar
-    folders = [
+
+    report = run_steps(high_performance_steps(), progress, cancel)
+    raise_on_failure(report, "Erro ao configurar desempenho máximo")
+    return True
+
+def _temp_folders():
+    return [
         os.environ.get('TEMP'),
         os.environ.get('TMP'),
         r'C:\Windows\Temp',
         r'C:\Windows\Prefetch',
         r'C:\Windows\Logs',
     ]
-    
-    for folder in folders:
-        if not folder or not os.path.exists(folder):
-            continue
-        
-        try:
-            for item in os.listdir(folder):
-                item_path = os.path.join(folder, item)
-                try:
-                    if os.path.isfile(item_path):
-                        os.remove(item_path)
-                        deleted += 1
-                    elif os.path.isdir(item_path):
-                        shutil.rmtree(item_path, ignore_errors=True)
-                        deleted += 1
-                except Exception:
-                    pass  # Arquivo em uso, pula
-        except Exception as e:
-            errors.append(f"{folder}: {str(e)}")
-    
-    if deleted == 0 and errors:
-        raise Exception(f"Nenhum arquivo removido. Erros: {'; '.join(errors)}")
-    
-    return True
 
-def optimize_network():
+def temp_policies():
+    """Regras de limpeza das pastas temporárias (as mesmas do botão Limpar Temporários)."""
+    if _linux():
+        return tweaks_linux.temp_policies()
+    return load_policies(_temp_folders())
+
+def clean_temp_files(progress=None, dry_run=False):
+    """Remove arquivos temporários do sistema (TEMP, TMP, Prefetch, logs).
+
+    O que é apagado segue as regras de `cleanup_policies.json` (idade, padrão de
+    nome, tamanho, arquivos em uso); sem o arquivo, as pastas acima são esvaziadas.
+    A varredura usa o índice persistente (ScanIndex), então só as pastas
+    alteradas desde a última execução são relidas do disco.
+
+    Retorna o relatório de `clean_policies` (bytes liberados, arquivos removidos,
+    arquivos pulados por estarem em uso, tempo gasto). `progress` recebe eventos
+    de progresso (limitados a poucos por segundo). Com `dry_run=True` nada é
+    apagado e o retorno é a prévia por pasta de `preview_policies`.
+    """
+    if _linux():
+        return tweaks_linux.clean_temp_files(progress, dry_run)
+    policies = temp_policies()
+    index = ScanIndex()
+    if dry_run:
+        return preview_policies(policies, index, progress=progress)
+
+    report = clean_policies(policies, index, progress=progress)
+    if report['files_removed'] == 0 and report['errors']:
+        raise Exception(f"Nenhum arquivo removido. Erros: {'; '.join(report['errors'])}")
+
+    return report
+
+# Configurações TCP globais: rótulo em `netsh int tcp show global` (Windows em inglês) e valor desejado
+NETWORK_TCP = {
+    # Auto-tuning para melhor throughput
+    'autotuninglevel': ('Receive Window Auto-Tuning Level', 'normal'),
+    # Chimney offload (reduz CPU)
+    'chimney': ('Chimney Offload State', 'enabled'),
+    # RSS (Receive Side Scaling)
+    'rss': ('Receive-Side Scaling State', 'enabled'),
+}
+
+def _read_network_state():
+    result = _run([['netsh', 'int', 'tcp', 'show', 'global']])[0]
+    current = {}
+    if result.returncode != 0:
+        return current
+    for option, (label, _) in NETWORK_TCP.items():
+        # Em outros idiomas o rótulo não casa e a configuração é aplicada sempre
+        found = re.search(rf'^\s*{re.escape(label)}\s*:\s*(\S+)', result.stdout, re.IGNORECASE | re.MULTILINE)
+        current[f'network.{option}'] = found.group(1).lower() if found else UNKNOWN
+    return current
+
+def network_state():
+    """Estado desejado de `optimize_network` (configurações TCP globais)."""
+    settings = [
+        Setting(f'network.{option}', desired, [['netsh', 'int', 'tcp', 'set', 'global', f'{option}={desired}']], label,
+                undo=undo('tcp', option=option))
+        for option, (label, desired) in NETWORK_TCP.items()
+    ]
+    return TweakState('network.tcp', _read_network_state, settings, timeout=_CMD_TIMEOUT)
+
+def network_steps():
+    """Passos de `optimize_network`: TCP pelo estado; a limpeza de DNS (opcional) roda sempre, em paralelo."""
+    return [
+        network_state().step(),
+        # Limpa cache DNS
+        _batch_step('network.flushdns', [(['ipconfig', '/flushdns'], True)], optional=True),
+        # Renova IP (opcional, pode causar breve desconexão)
+        # ['ipconfig', '/release'],
+        # ['ipconfig', '/renew'],
+    ]
+
+def optimize_network(progress=None, cancel=None):
     """Otimiza configurações de rede TCP/IP e limpa cache DNS."""
+    if _linux():
+        return tweaks_linux.optimize_network(progress, cancel)
     if not is_admin():
         raise PermissionError("Requer privilégios de administrador")
-    
-    try:
-        commands = [
-            # Auto-tuning para melhor throughput
-            ['netsh', 'int', 'tcp', 'set', 'global', 'autotuninglevel=normal'],
-            # Chimney offload (reduz CPU)
-            ['netsh', 'int', 'tcp', 'set', 'global', 'chimney=enabled'],
-            # RSS (Receive Side Scaling)
-            ['netsh', 'int', 'tcp', 'set', 'global', 'rss=enabled'],
-            # Limpa cache DNS
-            ['ipconfig', '/flushdns'],
-            # Renova IP (opcional, pode causar breve desconexão)
-            # ['ipconfig', '/release'],
-            # ['ipconfig', '/renew'],
-        ]
-        
-        for cmd in commands:
-            result = run_hidden_command(cmd, capture_output=True, text=True, check=False)
-            if result.returncode != 0 and 'flushdns' not in cmd:
-                raise Exception(f"Comando falhou: {' '.join(cmd)}")
-        
-        return True
-    except Exception as e:
-        raise Exception(f"Erro ao otimizar rede: {str(e)}")
-
-def optimize_services():
+
+    report = run_steps(network_steps(), progress, cancel)
+    raise_on_failure(report, "Erro ao otimizar rede")
+    return True
+
+SERVICES = {
+    'DiagTrack': 'Telemetria do Windows',
+    'dmwappushservice': 'Push de apps da Store',
+    'SysMain': 'SuperFetch/Prefetch',
+    'WSearch': 'Indexação Windows Search',
+}
+
+# Códigos do sc: STATE 1 = STOPPED, START_TYPE 4 = DISABLED
+_SC_STOPPED, _SC_DISABLED = 1, 4
+
+def _read_services_state():
+    commands = []
+    for svc in SERVICES:
+        commands += [['sc', 'query', svc], ['sc', 'qc', svc]]
+    results = _run(commands)
+    current = {}
+    for i, svc in enumerate(SERVICES):
+        query, qc = results[2 * i], results[2 * i + 1]
+        state = re.search(r'STATE\s*:\s*(\d+)', query.stdout) if query.returncode == 0 else None
+        start = re.search(r'START_TYPE\s*:\s*(\d+)', qc.stdout) if qc.returncode == 0 else None
+        current[f'services.{svc}.stop'] = int(state.group(1)) if state else UNKNOWN
+        current[f'services.{svc}.config'] = int(start.group(1)) if start else UNKNOWN
+    return current
+
+def services_state():
+    """Estado desejado de `optimize_services`: cada serviço parado e desabilitado."""
+    settings = []
+    for svc, desc in SERVICES.items():
+        # Para o serviço (falha é ignorada: pode já estar parado)
+        settings.append(Setting(f'services.{svc}.stop', _SC_STOPPED, [['sc', 'stop', svc]], f"{desc} (parado)", required=False,
+                                undo=undo('service_state', service=svc)))
+        # Desabilita inicialização automática (o resultado é conferido por serviço)
+        settings.append(Setting(f'services.{svc}.config', _SC_DISABLED, [['sc', 'config', svc, 'start=disabled']], f"{desc} (desabilitado)", required=False,
+                                undo=undo('service_start', service=svc)))
+    return TweakState('services', _read_services_state, settings, timeout=_CMD_TIMEOUT)
+
+def services_steps():
+    """Passo de `optimize_services`: só para/desabilita os serviços que ainda não estão assim."""
+    return [services_state().step(optional=True)]
+
+def optimize_services(progress=None, cancel=None):
     """Desativa serviços desnecessários (telemetria, indexação, etc)."""
+    if _linux():
+        return tweaks_linux.optimize_services(progress, cancel)
     if not is_admin():
         raise PermissionError("Requer privilégios de administrador")
-    
-    services = {
-        'DiagTrack': 'Telemetria do Windows',
-        'dmwappushservice': 'Push de apps da Store',
-        'SysMain': 'SuperFetch/Prefetch',
-        'WSearch': 'Indexação Windows Search',
-    }
-    
+
+    report = run_steps(services_steps(), progress, cancel)
+    step = report['steps']['services']
+    if step['status'] != 'ok':
+        raise Exception(f"Nenhum serviço desativado. Erros: {step['error'] or step['status']}")
     disabled = []
     errors = []
-    
-    for svc, desc in services.items():
-        try:
-            # Para o serviço
-            run_hidden_command(['sc', 'stop', svc], capture_output=True, check=False)
-            
-            # Desabilita inicialização automática
-            result = run_hidden_command(
-                ['sc', 'config', svc, 'start=disabled'],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-            
-            if result.returncode == 0:
-                disabled.append(desc)
-            else:
-                errors.append(f"{desc}: {result.stderr.strip()}")
-        except Exception as e:
-            errors.append(f"{desc}: {str(e)}")
-    
+    failed = step['result']['failed']
+    for svc, desc in SERVICES.items():
+        # Já desabilitado antes conta como desativado
+        error = failed.get(f'services.{svc}.config')
+        if error is None:
+            disabled.append(desc)
+        else:
+            errors.append(f"{desc}: {error}")
+
     if not disabled and errors:
         raise Exception(f"Nenhum serviço desativado. Erros: {'; '.join(errors)}")
-    
+
     return True
 
-def disable_visual_effects():
+# Valores do registro de `disable_visual_effects`: (chave em HKCU, nome, tipo, valor desejado)
+VISUAL_EFFECTS = [
+    # 2 = Ajustar para melhor desempenho
+    (r"Software\Microsoft\Windows\CurrentVersion\Explorer\VisualEffects", "VisualFXSetting", REG_DWORD, 2),
+    # Desabilita animações e transparências específicas
+    (r"Software\Microsoft\Windows\CurrentVersion\Explorer\Advanced", "TaskbarAnimations", REG_DWORD, 0),    # Sem animações na barra de tarefas
+    (r"Software\Microsoft\Windows\CurrentVersion\Explorer\Advanced", "ListviewAlphaSelect", REG_DWORD, 0),  # Sem seleção com sombra
+    (r"Software\Microsoft\Windows\CurrentVersion\Explorer\Advanced", "ListviewShadow", REG_DWORD, 0),       # Sem sombra em ícones
+    (r"Software\Microsoft\Windows\CurrentVersion\Explorer\Advanced", "TaskbarSmallIcons", REG_DWORD, 1),    # Ícones pequenos (menos espaço)
+    # UserPreferencesMask: desabilita menu de animação e outros efeitos
+    (r"Control Panel\Desktop", "UserPreferencesMask", REG_BINARY, bytes([0x90, 0x12, 0x03, 0x80, 0x10, 0x00, 0x00, 0x00])),
+]
+
+def _read_visual_effects_state():
+    backend = get_backend()
+    current = {}
+    for path, name, _, _ in VISUAL_EFFECTS:
+        try:
+            current[f'visual.{name}'] = backend.reg_read(HKCU, path, name)[0]
+        except OSError:
+            current[f'visual.{name}'] = UNKNOWN
+    return current
+
+def _write_hkcu_value(path, name, kind, value):
+    return lambda: get_backend().reg_set(HKCU, path, name, kind, value)
+
+def visual_effects_state():
+    """Estado desejado de `disable_visual_effects`: só os valores diferentes são escritos."""
+    # Valor ausente antes do ajuste: desfazer = apagar o valor
+    settings = [Setting(f'visual.{name}', value, _write_hkcu_value(path, name, kind, value), name,
+                        undo=undo('registry', absent_ok=True, hive=HKCU, path=path, name=name, type=kind))
+                for path, name, kind, value in VISUAL_EFFECTS]
+    return TweakState('visual', _read_visual_effects_state, settings, timeout=10)
+
+def visual_effects_steps():
+    """Passo de `disable_visual_effects`: leitura e escritas do registro (rápidas, sem lote)."""
+    return [visual_effects_state().step()]
+
+def disable_visual_effects(progress=None, cancel=None):
     """Desativa efeitos visuais do Windows para melhor desempenho."""
-    try:
-        # Chave principal de efeitos visuais
-        key_path = r"Software\Microsoft\Windows\CurrentVersion\Explorer\VisualEffects"
-        key = winreg.CreateKeyEx(winreg.HKEY_CURRENT_USER, key_path, 0, winreg.KEY_ALL_ACCESS)
-        
-        # 2 = Ajustar para melhor desempenho
-        winreg.SetValueEx(key, "VisualFXSetting", 0, winreg.REG_DWORD, 2)
-        winreg.CloseKey(key)
-        
-        # Desabilita animações e transparências específicas
-        adv_key_path = r"Software\Microsoft\Windows\CurrentVersion\Explorer\Advanced"
-        adv_key = winreg.CreateKeyEx(winreg.HKEY_CURRENT_USER, adv_key_path, 0, winreg.KEY_ALL_ACCESS)
-        
-        # Configurações de desempenho
-        settings = {
-            'TaskbarAnimations': 0,        # Sem animações na barra de tarefas
-            'ListviewAlphaSelect': 0,      # Sem seleção com sombra
-            'ListviewShadow': 0,           # Sem sombra em ícones
-            'TaskbarSmallIcons': 1,        # Ícones pequenos (menos espaço)
-        }
-        
-        for name, value in settings.items():
-            winreg.SetValueEx(adv_key, name, 0, winreg.REG_DWORD, value)
-        
-        winreg.CloseKey(adv_key)
-        
-        # UserPreferencesMask para desabilitar mais efeitos
-        dwm_key_path = r"Control Panel\Desktop"
-        dwm_key = winreg.CreateKeyEx(winreg.HKEY_CURRENT_USER, dwm_key_path, 0, winreg.KEY_ALL_ACCESS)
-        
-        # Desabilita menu de animação
-        winreg.SetValueEx(dwm_key, "UserPreferencesMask", 0, winreg.REG_BINARY, 
-                         bytes([0x90, 0x12, 0x03, 0x80, 0x10, 0x00, 0x00, 0x00]))
-        
-        winreg.CloseKey(dwm_key)
-        
-        return True
-    except Exception as e:
-        raise Exception(f"Erro ao desativar efeitos visuais: {str(e)}")
-
-def disable_useless_programs():
-    """Remove programas comuns da inicialização (OneDrive, Skype, Teams, Spotify)."""
-    targets = ['OneDrive', 'Skype', 'Teams', 'Spotify']
+    _windows_only("Desativar efeitos visuais")
+    report = run_steps(visual_effects_steps(), progress, cancel)
+    raise_on_failure(report, "Erro ao desativar efeitos visuais")
+    return True
+
+USELESS_PROGRAMS = ['OneDrive', 'Skype', 'Teams', 'Spotify']
+
+def _remove_run_entries(targets=USELESS_PROGRAMS):
+    """Remove do registro de inicialização as entradas dos programas alvo."""
+    backend = get_backend()
+    lowered = [t.lower() for t in targets]
+    path = r"Software\Microsoft\Windows\CurrentVersion\Run"
+    matches = []
+    for hive in (HKCU, HKLM):
+        try:
+            values = backend.reg_values(hive, path)
+        except Exception:
+            continue
+        matches += [(hive, name, value, kind) for name, value, kind in values
+                    if any(t in name.lower() or t in str(value).lower() for t in lowered)]
+    get_journal().record('startup.run_keys', [
+        {'kind': 'registry', 'hive': hive, 'path': path, 'name': name, 'type': kind, 'prior': value}
+        for hive, name, value, kind in matches
+    ])
     removed = []
-    
-    # Remove do registro de inicialização
-    for hive, path in [
-        (winreg.HKEY_CURRENT_USER, r"Software\Microsoft\Windows\CurrentVersion\Run"),
-        (winreg.HKEY_LOCAL_MACHINE, r"Software\Microsoft\Windows\CurrentVersion\Run"),
-    ]:
+    for hive, name, _, _ in matches:
         try:
-            key = winreg.OpenKey(hive, path, 0, winreg.KEY_ALL_ACCESS)
-            i = 0
-            while True:
-                try:
-                    name, value, _ = winreg.EnumValue(key, i)
-                    if any(t.lower() in name.lower() or t.lower() in str(value).lower() for t in targets):
-                        try:
-                            winreg.DeleteValue(key, name)
-                            removed.append(name)
-                        except Exception:
-                            pass
-                    i += 1
-                except OSError:
-                    break
-            winreg.CloseKey(key)
+            backend.reg_delete(hive, path, name)
+            removed.append(name)
         except Exception:
             pass
-    
-    # Desabilita tarefas agendadas comuns
+    return removed
+
+# Inventário compartilhado das tarefas agendadas (uma consulta ao schtasks a cada 5 min no máximo)
+_TASKS = TaskInventory()
+
+def _disable_scheduled_tasks(targets=USELESS_PROGRAMS):
+    """Desabilita tarefas agendadas comuns (não deleta, apenas desativa).
+
+    Retorna o relatório de `TaskInventory.disable`.
+    """
+    matches = _TASKS.match(targets)
+    return _TASKS.disable(task for tasks in matches.values() for task in tasks)
+
+def useless_programs_steps():
+    """Passos de `disable_useless_programs`: registro e tarefas agendadas em paralelo."""
+    steps = [Step('startup.run_keys', _remove_run_entries, timeout=10)]
     if is_admin():
-        for target in targets:
-            try:
-                # Lista tarefas que contenham o nome do app
-                result = run_hidden_command(
-                    ['schtasks', '/query', '/fo', 'LIST'],
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                )
-                
-                if target.lower() in result.stdout.lower():
-                    # Desabilita a tarefa (não deleta, apenas desativa)
-                    run_hidden_command(
-                        ['schtasks', '/change', '/tn', f'*{target}*', '/disable'],
-                        capture_output=True,
-                        check=False,
-                    )
-            except Exception:
-                pass
-    
-    if not removed:
+        steps.append(Step('startup.scheduled_tasks', _disable_scheduled_tasks, timeout=120, optional=True))
+    return steps
+
+def disable_useless_programs(progress=None, cancel=None):
+    """Remove programas comuns da inicialização (OneDrive, Skype, Teams, Spotify)."""
+    _windows_only("Remover programas da inicialização")
+    report = run_steps(useless_programs_steps(), progress, cancel)
+    raise_on_failure(report, "Erro ao remover programas da inicialização")
+
+    if not report['steps']['startup.run_keys']['result']:
         raise Exception("Nenhum programa encontrado na inicialização")
-    
+
     return True
+
+def cleanup_steps():
+    """Passo único da limpeza de temporários (sem timeout: depende do volume de arquivos)."""
+    return [Step('cleanup.temp', clean_temp_files, timeout=None)]
+
+# Perfis do botão "Aplicar perfil": os passos de todos os ajustes formam um só
+# grafo, então o perfil leva o tempo da maior cadeia e não a soma dos comandos.
+PROFILES = {
+    'Desempenho': (
+        high_performance_steps,
+        network_steps,
+        services_steps,
+        visual_effects_steps,
+        useless_programs_steps,
+        cleanup_steps,
+    ),
+}
+
+# Ajustes com estado desejado: entram na prévia do perfil
+STATES = {
+    high_performance_steps: (high_performance_state,),
+    network_steps: (network_state,),
+    services_steps: (services_state,),
+    visual_effects_steps: (visual_effects_state,),
+}
+
+def _platform_profiles():
+    """(perfis, estados) da plataforma do backend em uso."""
+    if _linux():
+        return tweaks_linux.PROFILES, tweaks_linux.STATES
+    return PROFILES, STATES
+
+def profile_steps(name='Desempenho'):
+    """Todos os passos dos ajustes de um perfil."""
+    return [step for builder in _platform_profiles()[0][name] for step in builder()]
+
+def profile_groups(name='Desempenho'):
+    """Passos de um perfil separados por ajuste: [(nome, passos)], na ordem do perfil."""
+    return [(builder.__name__[:-len('_steps')], builder()) for builder in _platform_profiles()[0][name]]
+
+def preview_profile(name='Desempenho', cancel=None):
+    """Prévia (dry-run) de um perfil: lê o estado de cada ajuste e não altera nada.
+
+    As leituras rodam em paralelo. Retorna {ajuste: [mudanças de TweakState.diff]}
+    (lista vazia = já está como o perfil deixaria); ajustes cuja leitura falhou
+    aparecem como {'error': ...}.
+    """
+    profiles, state_builders = _platform_profiles()
+    states = [build() for builder in profiles[name] for build in state_builders.get(builder, ())]
+    report = run_steps([Step(state.name, state.diff, timeout=state.timeout * 2) for state in states], cancel=cancel)
+    return {
+        name: step['result'] if step['status'] == 'ok' else {'error': step['error'] or step['status']}
+        for name, step in report['steps'].items()
+    }
+
+
+def rollback(session=None, tweak=None, all_sessions=False):
+    """Desfaz pelo diário a última sessão (ou a informada, ou só um ajuste dela) num lote.
+
+    Retorna o relatório de `Journal.rollback`. O inventário de tarefas é
+    descartado, já que tarefas podem ter sido reativadas.
+    """
+    try:
+        return get_journal().rollback(session, tweak, all_sessions)
+    finally:
+        _TASKS.invalidate()
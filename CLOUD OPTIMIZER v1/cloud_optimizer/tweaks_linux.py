@@ -0,0 +1,317 @@
+# Date: 19/10/2026
+# DEV: Martinez
+# Cloud Optimizer v1 Free Utility by Martinez
+
+import os
+import re
+from typing import List
+
+from cloud_optimizer.cleaner import clean_policies, preview_policies
+from cloud_optimizer.cleanup_policy import load_policies
+from cloud_optimizer.journal import undo
+from cloud_optimizer.scan_index import ScanIndex
+from cloud_optimizer.system_backend import get_backend
+from cloud_optimizer.tweak_engine import Step, raise_on_failure, run_steps
+from cloud_optimizer.tweak_state import UNKNOWN, Setting, TweakState
+
+__all__ = [
+    "set_high_performance",
+    "clean_temp_files",
+    "temp_policies",
+    "optimize_network",
+    "optimize_services",
+    "PROFILES",
+    "STATES",
+]
+
+# Ajustes equivalentes aos do Windows (tweaks.py), pelo LinuxBackend: arquivos de
+# /sys e /proc e links de unidades do systemd. Governor, escalonador de I/O e
+# sysctl voltam ao padrão no próximo boot; unidades mascaradas continuam assim.
+# Os valores anteriores vão para o diário (journal), como no Windows.
+
+_CMD_TIMEOUT = 30  # segundos por comando externo
+_FILE_TIMEOUT = 10  # leituras/escritas em sysfs/procfs
+
+CPUFREQ = '/sys/devices/system/cpu/cpufreq'
+
+
+def _read(path: str):
+    try:
+        return ' '.join(get_backend().read_text(path).split())
+    except OSError:
+        return UNKNOWN
+
+
+def _write(path: str, value: str):
+    def apply():
+        get_backend().write_text(path, value)
+        return value
+    return apply
+
+
+def _is_admin() -> bool:
+    try:
+        return get_backend().is_admin()
+    except Exception:
+        return False
+
+
+def _run(commands, timeout=_CMD_TIMEOUT):
+    return get_backend().run_commands(commands, timeout=timeout)
+
+
+def cpu_state() -> TweakState:
+    """Governor `performance` e EPP `performance` em cada política do cpufreq.
+
+    Só entra o que o driver oferece (scaling_available_governors e
+    energy_performance_available_preferences). O EPP é opcional e vem antes
+    do governor: com o governor performance alguns drivers recusam mudar o
+    EPP, e assim o desfazer (em ordem inversa) volta o governor primeiro.
+    """
+    backend = get_backend()
+    settings, paths = [], {}
+    for policy in backend.glob(f'{CPUFREQ}/policy*'):
+        cpu = policy.rsplit('/', 1)[-1]
+        if 'performance' in (_read(f'{policy}/energy_performance_available_preferences') or '').split():
+            path = paths[f'cpu.{cpu}.epp'] = f'{policy}/energy_performance_preference'
+            settings.append(Setting(f'cpu.{cpu}.epp', 'performance', _write(path, 'performance'),
+                                    f"Preferência de energia ({cpu})", required=False, undo=undo('file', path=path)))
+        if 'performance' in (_read(f'{policy}/scaling_available_governors') or '').split():
+            path = paths[f'cpu.{cpu}.governor'] = f'{policy}/scaling_governor'
+            settings.append(Setting(f'cpu.{cpu}.governor', 'performance', _write(path, 'performance'),
+                                    f"Governor ({cpu})", undo=undo('file', path=path)))
+    return TweakState('cpu', lambda: {key: _read(path) for key, path in paths.items()}, settings, timeout=_FILE_TIMEOUT)
+
+
+_SCHEDULER_RE = re.compile(r'\[([^\]]+)\]')
+# Escalonador preferido: SSD/NVMe dispensam reordenação; disco giratório ganha com bfq
+_SCHEDULERS = {'0': ('none', 'mq-deadline'), '1': ('bfq', 'mq-deadline')}
+_SKIP_DEVICES = ('loop', 'ram', 'zram', 'dm-', 'md', 'sr')
+
+
+def _active_scheduler(text: str) -> str:
+    """Escalonador ativo em '[mq-deadline] kyber bfq none' (o que está entre colchetes)."""
+    found = _SCHEDULER_RE.search(text)
+    return found.group(1) if found else text.strip()
+
+
+def io_scheduler_state() -> TweakState:
+    """Escalonador de I/O por disco físico, conforme o disco seja giratório ou não."""
+    backend = get_backend()
+    settings, paths = [], {}
+    for path in backend.glob('/sys/block/*/queue/scheduler'):
+        dev = path.split('/')[3]
+        if dev.startswith(_SKIP_DEVICES):
+            continue
+        available = _read(path)
+        if not available:
+            continue
+        names = available.replace('[', ' ').replace(']', ' ').split()
+        rotational = _read(f'/sys/block/{dev}/queue/rotational') or '0'
+        desired = next((s for s in _SCHEDULERS.get(rotational, _SCHEDULERS['0']) if s in names), None)
+        if desired is None or len(names) < 2:
+            continue
+        paths[f'io.{dev}.scheduler'] = path
+        settings.append(Setting(f'io.{dev}.scheduler', desired, _write(path, desired),
+                                f"Escalonador de I/O ({dev})", required=False, undo=undo('file', path=path)))
+
+    def read():
+        current = {}
+        for key, path in paths.items():
+            text = _read(path)
+            current[key] = _active_scheduler(text) if text else UNKNOWN
+        return current
+    return TweakState('io', read, settings, timeout=_FILE_TIMEOUT)
+
+
+def high_performance_steps() -> List[Step]:
+    """Passos de `set_high_performance`: CPU e discos em paralelo, só o que difere."""
+    return [cpu_state().step(), io_scheduler_state().step(optional=True)]
+
+
+def set_high_performance(progress=None, cancel=None):
+    """Governor e EPP de desempenho máximo e escalonador de I/O por tipo de disco."""
+    if not _is_admin():
+        raise PermissionError("Requer privilégios de administrador")
+
+    report = run_steps(high_performance_steps(), progress, cancel)
+    raise_on_failure(report, "Erro ao configurar desempenho máximo")
+    return True
+
+
+# sysctl de rede: chave -> (valor desejado, obrigatório)
+SYSCTL_NETWORK = {
+    # Buffers de socket maiores: janelas TCP grandes em links rápidos ou distantes
+    'net.core.rmem_max': ('16777216', True),
+    'net.core.wmem_max': ('16777216', True),
+    'net.ipv4.tcp_rmem': ('4096 131072 16777216', True),
+    'net.ipv4.tcp_wmem': ('4096 65536 16777216', True),
+    # Fila de pacotes recebidos à espera do kernel
+    'net.core.netdev_max_backlog': ('16384', True),
+    # Fila fq (pacing) e controle de congestionamento BBR, se o kernel tiver
+    'net.core.default_qdisc': ('fq', False),
+    'net.ipv4.tcp_congestion_control': ('bbr', False),
+    # TCP Fast Open (cliente e servidor) e descoberta de MTU
+    'net.ipv4.tcp_fastopen': ('3', False),
+    'net.ipv4.tcp_mtu_probing': ('1', False),
+}
+
+
+def _sysctl_path(key: str) -> str:
+    return '/proc/sys/' + key.replace('.', '/')
+
+
+def network_state() -> TweakState:
+    """Estado desejado de `optimize_network` (sysctl de buffers, filas e congestionamento)."""
+    settings = [
+        Setting(f'network.{key}', value, _write(_sysctl_path(key), value), key, required=required,
+                undo=undo('file', path=_sysctl_path(key)))
+        for key, (value, required) in SYSCTL_NETWORK.items()
+    ]
+    return TweakState('network.sysctl', lambda: {f'network.{key}': _read(_sysctl_path(key)) for key in SYSCTL_NETWORK},
+                      settings, timeout=_FILE_TIMEOUT)
+
+
+def network_steps() -> List[Step]:
+    """Passos de `optimize_network`: sysctl pelo estado e limpeza do cache DNS (opcional)."""
+    return [
+        network_state().step(),
+        Step('network.flushdns', lambda: _run([['resolvectl', 'flush-caches']]), timeout=_CMD_TIMEOUT, optional=True),
+    ]
+
+
+def optimize_network(progress=None, cancel=None):
+    """Ajusta buffers TCP, fila de recepção e controle de congestionamento; limpa o cache DNS."""
+    if not _is_admin():
+        raise PermissionError("Requer privilégios de administrador")
+
+    report = run_steps(network_steps(), progress, cancel)
+    raise_on_failure(report, "Erro ao otimizar rede")
+    return True
+
+
+SERVICES = {
+    'apport.service': 'Relatórios de falhas (apport)',
+    'whoopsie.service': 'Envio de relatórios de erro',
+    'packagekit.service': 'Atualizações em segundo plano (PackageKit)',
+    'cups-browsed.service': 'Descoberta de impressoras na rede',
+}
+
+# Onde o systemd procura unidades; a máscara é um link para /dev/null na primeira
+_MASK_DIR = '/etc/systemd/system'
+_UNIT_DIRS = (_MASK_DIR, '/run/systemd/system', '/usr/lib/systemd/system', '/lib/systemd/system')
+
+
+def _installed_units() -> List[str]:
+    backend = get_backend()
+    return [unit for unit in SERVICES if any(backend.exists(f'{d}/{unit}') for d in _UNIT_DIRS)]
+
+
+def _is_masked(unit: str) -> bool:
+    return get_backend().readlink(f'{_MASK_DIR}/{unit}') == '/dev/null'
+
+
+def _mask(unit: str):
+    def apply():
+        link = f'{_MASK_DIR}/{unit}'
+        backend = get_backend()
+        if backend.exists(link):
+            raise Exception(f"{link} já existe (unidade com configuração local)")
+        backend.symlink('/dev/null', link)
+    return apply
+
+
+def services_state() -> TweakState:
+    """Estado desejado de `optimize_services`: cada unidade instalada mascarada."""
+    units = _installed_units()
+    settings = [Setting(f'services.{unit}.mask', 'masked', _mask(unit), f"{SERVICES[unit]} (mascarado)", required=False,
+                        undo=undo('mask', unit=unit, dir=_MASK_DIR))
+                for unit in units]
+    return TweakState('services', lambda: {f'services.{u}.mask': 'masked' if _is_masked(u) else 'unmasked' for u in units},
+                      settings, timeout=_FILE_TIMEOUT)
+
+
+def _stop_masked():
+    """Recarrega o systemd e para as unidades mascaradas (num lote só)."""
+    units = [u for u in SERVICES if _is_masked(u)]
+    if not units:
+        return []
+    return _run([['systemctl', 'daemon-reload'], ['systemctl', 'stop', *units]])
+
+
+def services_steps() -> List[Step]:
+    """Passos de `optimize_services`: mascara o que falta e depois para as unidades."""
+    return [
+        services_state().step(optional=True),
+        Step('services.stop', _stop_masked, deps=['services'], timeout=_CMD_TIMEOUT * 2, optional=True),
+    ]
+
+
+def optimize_services(progress=None, cancel=None):
+    """Mascara unidades do systemd desnecessárias (relatórios de falha, atualizações em segundo plano)."""
+    if not _is_admin():
+        raise PermissionError("Requer privilégios de administrador")
+
+    report = run_steps(services_steps(), progress, cancel)
+    step = report['steps']['services']
+    if step['status'] != 'ok':
+        raise Exception(f"Nenhum serviço desativado. Erros: {step['error'] or step['status']}")
+    failed = step['result']['failed']
+    units = _installed_units()
+    errors = [f"{SERVICES[u]}: {failed[f'services.{u}.mask']}" for u in units if f'services.{u}.mask' in failed]
+    if units and len(errors) == len(units):
+        raise Exception(f"Nenhum serviço desativado. Erros: {'; '.join(errors)}")
+
+    return True
+
+
+def _temp_folders() -> List[str]:
+    backend = get_backend()
+    cache = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return [backend.path(p) for p in ('/tmp', '/var/tmp', cache)]
+
+
+def temp_policies():
+    """Regras da limpeza de temporários. Sem `cleanup_policies.json`, a regra
+    padrão só apaga o que não foi modificado nem acessado há um dia, já que
+    programas em execução guardam arquivos nessas pastas."""
+    return load_policies(_temp_folders(), untouched_days=1)
+
+
+def clean_temp_files(progress=None, dry_run=False):
+    """Remove temporários de /tmp, /var/tmp e do cache do usuário (~/.cache).
+
+    Mesmas regras e relatório do `clean_temp_files` do Windows (ver
+    `temp_policies`); sockets e pipes nunca são apagados.
+    """
+    policies = temp_policies()
+    index = ScanIndex()
+    if dry_run:
+        return preview_policies(policies, index, progress=progress)
+
+    report = clean_policies(policies, index, progress=progress)
+    if report['files_removed'] == 0 and report['errors']:
+        raise Exception(f"Nenhum arquivo removido. Erros: {'; '.join(report['errors'])}")
+
+    return report
+
+
+def cleanup_steps() -> List[Step]:
+    return [Step('cleanup.temp', clean_temp_files, timeout=None)]
+
+
+PROFILES = {
+    'Desempenho': (
+        high_performance_steps,
+        network_steps,
+        services_steps,
+        cleanup_steps,
+    ),
+}
+
+# Ajustes com estado desejado: entram na prévia do perfil
+STATES = {
+    high_performance_steps: (cpu_state, io_scheduler_state),
+    network_steps: (network_state,),
+    services_steps: (services_state,),
+}
@@ -5,11 +5,33 @@
 import os
 import sys
 import ctypes
+import queue
+import shlex
+import stat
 import subprocess
+import threading
+import time
+import uuid
+from typing import List, Optional, Sequence
 
-__all__ = ["is_admin", "run_as_admin", "run_hidden_command"]
+__all__ = [
+    "is_admin",
+    "run_as_admin",
+    "run_hidden_command",
+    "ShellSession",
+    "CommandBatch",
+    "run_batch",
+    "app_data_dir",
+    "format_bytes",
+    "is_link",
+]
 
 _CREATE_NO_WINDOW = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+_REPARSE_POINT = getattr(stat, "FILE_ATTRIBUTE_REPARSE_POINT", 0x400)
+# Caracteres que o cmd.exe interpreta mesmo com o argumento entre aspas (%VAR%,
+# !VAR!) ou que quebram o controle de aspas; comandos com eles não vão para a
+# sessão em lote.
+_CMD_UNSAFE = frozenset('&|<>^%!"()\r\n')
 
 def is_admin() -> bool:
     try:
@@ -28,8 +50,7 @@ def run_as_admin():
         pass
 
 
-def run_hidden_command(cmd, **kwargs):
-    """Executa comandos sem abrir janela de console em sistemas Windows."""
+def _hidden(kwargs):
     if os.name == "nt":
         kwargs.setdefault("creationflags", _CREATE_NO_WINDOW)
         startupinfo = kwargs.get("startupinfo")
@@ -37,4 +58,238 @@ def run_hidden_command(cmd, **kwargs):
             startupinfo = subprocess.STARTUPINFO()
         startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
         kwargs["startupinfo"] = startupinfo
-    return subprocess.run(cmd, **kwargs)
+    return kwargs
+
+
+def run_hidden_command(cmd, **kwargs):
+    """Executa comandos sem abrir janela de console em sistemas Windows."""
+    return subprocess.run(cmd, **_hidden(kwargs))
+
+
+class ShellSession:
+    """Shell persistente (cmd.exe no Windows, sh nos demais) que recebe comandos pelo stdin.
+
+    Cada comando é seguido de um marcador único com o código de saída, então a
+    saída e o código de cada um voltam separados. O shell é aberto no primeiro
+    `run` e reaproveitado pelos seguintes: o app cria um processo (e um console)
+    por sessão, não por comando. stdout e stderr do comando chegam juntos em
+    `stdout`. Um comando que estoura o timeout derruba a sessão; o próximo
+    `run` abre outra. Uma sessão roda um comando por vez.
+
+    No cmd.exe não há escape confiável para `%` digitado no prompt, então
+    argumentos com metacaracteres (`& | < > ^ % ! " ( )`) são recusados
+    (`accepts`); o CommandBatch roda esses comandos num processo próprio.
+    """
+
+    def __init__(self, argv: Optional[Sequence[str]] = None, encoding: Optional[str] = None) -> None:
+        if argv is None:
+            argv = ['cmd.exe', '/D', '/Q', '/K'] if os.name == 'nt' else ['sh']
+        self.argv = list(argv)
+        # cmd.exe escreve na página de código OEM do console
+        self.encoding = encoding or ('oem' if os.name == 'nt' else 'utf-8')
+        self._cmd = os.path.basename(self.argv[0]).lower() in ('cmd', 'cmd.exe')
+        self._proc = None
+        self._lines: "queue.Queue" = queue.Queue()
+        self._lock = threading.Lock()
+        self.spawned = 0  # processos de shell criados (para medições)
+
+    def __enter__(self) -> "ShellSession":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _start(self) -> None:
+        self._lines = queue.Queue()
+        self._proc = subprocess.Popen(
+            self.argv, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, **_hidden({})
+        )
+        self.spawned += 1
+        threading.Thread(target=self._reader, args=(self._proc, self._lines), name="ShellSession", daemon=True).start()
+
+    @staticmethod
+    def _reader(proc, lines) -> None:
+        for line in proc.stdout:
+            lines.put(line)
+        lines.put(None)
+
+    def accepts(self, cmd: Sequence[str]) -> bool:
+        """True se `cmd` pode ser digitado na sessão sem o shell reinterpretar algum argumento."""
+        if not self._cmd:
+            return True  # sh: shlex.join cobre tudo
+        return not any(_CMD_UNSAFE.intersection(str(arg)) for arg in cmd)
+
+    def _script(self, cmd: Sequence[str], token: str) -> str:
+        if self._cmd:
+            # Linhas separadas: %errorlevel% é expandido quando a linha é lida
+            return f"{subprocess.list2cmdline(cmd)} <nul 2>&1\r\necho.\r\necho {token} %errorlevel%\r\n"
+        return f"{shlex.join(cmd)} </dev/null 2>&1\nprintf '\\n{token} %d\\n' $?\n"
+
+    def run(self, cmd: Sequence[str], timeout: Optional[float] = None) -> subprocess.CompletedProcess:
+        """Roda `cmd` na sessão; retorna CompletedProcess com returncode e stdout (texto).
+
+        Lança subprocess.TimeoutExpired (sessão encerrada), OSError se o shell
+        não puder ser aberto ou morrer no meio do comando, ou ValueError se o
+        comando tiver metacaracteres do cmd.exe (ver `accepts`).
+        """
+        if not self.accepts(cmd):
+            raise ValueError(f"Comando com metacaracteres do cmd não pode rodar na sessão: {list(cmd)!r}")
+        with self._lock:
+            if self._proc is None or self._proc.poll() is not None:
+                self._start()
+            token = f"__CO_END_{uuid.uuid4().hex}"
+            try:
+                self._proc.stdin.write(self._script(cmd, token).encode(self.encoding, 'replace'))
+                self._proc.stdin.flush()
+            except OSError:
+                self._kill()
+                raise
+            deadline = time.monotonic() + timeout if timeout else None
+            out: List[str] = []
+            while True:
+                try:
+                    wait = max(0.0, deadline - time.monotonic()) if deadline else None
+                    line = self._lines.get(timeout=wait)
+                except queue.Empty:
+                    self._kill()
+                    raise subprocess.TimeoutExpired(list(cmd), timeout, output=''.join(out))
+                if line is None:
+                    self._kill()
+                    raise OSError(f"Sessão de shell encerrada durante: {' '.join(cmd)}")
+                text = line.decode(self.encoding, 'replace').replace('\r\n', '\n')
+                if text.startswith(token):
+                    code = int(text.split()[1])
+                    break
+                out.append(text)
+            stdout = ''.join(out)
+            # Remove a quebra de linha extra emitida antes do marcador
+            if stdout.endswith('\n'):
+                stdout = stdout[:-1]
+            return subprocess.CompletedProcess(list(cmd), code, stdout, '')
+
+    def _kill(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.kill()
+            proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+
+    def close(self) -> None:
+        """Encerra o shell (exit pelo stdin; mata se não sair)."""
+        with self._lock:
+            proc = self._proc
+            if proc is None:
+                return
+            try:
+                proc.stdin.write(b"exit\r\n" if self._cmd else b"exit\n")
+                proc.stdin.close()
+                proc.wait(timeout=5)
+                self._proc = None
+            except (OSError, subprocess.TimeoutExpired):
+                self._kill()
+
+
+class CommandBatch:
+    """Fila de comandos executada de uma vez numa única ShellSession.
+
+    `run()` devolve um CompletedProcess por comando, na ordem em que foram
+    adicionados. Um comando que estoura o tempo vira returncode -1 e os
+    seguintes continuam numa sessão nova. Com `batch=False`, ou se o shell não
+    puder ser aberto, cada comando roda no seu próprio processo
+    (run_hidden_command), como antes; o mesmo vale para um comando que a
+    sessão recusa por ter metacaracteres do shell (ShellSession.accepts).
+    """
+
+    def __init__(self, timeout: Optional[float] = None, batch: bool = True, session: Optional[ShellSession] = None) -> None:
+        self.timeout = timeout
+        self.batch = batch
+        self.session = session
+        self.commands: List[List[str]] = []
+
+    def __len__(self) -> int:
+        return len(self.commands)
+
+    def add(self, cmd: Sequence[str]) -> int:
+        """Enfileira um comando; retorna o índice do resultado em `run()`."""
+        self.commands.append(list(cmd))
+        return len(self.commands) - 1
+
+    def run(self) -> List[subprocess.CompletedProcess]:
+        results: List[subprocess.CompletedProcess] = []
+        session = None
+        if self.batch and self.commands:
+            session = self.session or ShellSession()
+        try:
+            for cmd in self.commands:
+                if session is not None and session.accepts(cmd):
+                    try:
+                        results.append(session.run(cmd, self.timeout))
+                        continue
+                    except subprocess.TimeoutExpired as e:
+                        results.append(subprocess.CompletedProcess(cmd, -1, e.output or '', f"tempo limite de {self.timeout}s"))
+                        continue
+                    except OSError:
+                        # Shell indisponível: o resto vai em processos individuais
+                        if session is not self.session:
+                            session.close()
+                        session = None
+                results.append(self._spawn(cmd))
+        finally:
+            if session is not None and session is not self.session:
+                session.close()
+        return results
+
+    def _spawn(self, cmd: List[str]) -> subprocess.CompletedProcess:
+        try:
+            return run_hidden_command(cmd, capture_output=True, text=True, check=False, timeout=self.timeout)
+        except subprocess.TimeoutExpired as e:
+            output = e.output.decode(errors='replace') if isinstance(e.output, bytes) else (e.output or '')
+            return subprocess.CompletedProcess(cmd, -1, output, f"tempo limite de {self.timeout}s")
+        except OSError as e:
+            return subprocess.CompletedProcess(cmd, -1, '', str(e))
+
+
+def run_batch(commands: Sequence[Sequence[str]], timeout: Optional[float] = None, batch: bool = True) -> List[subprocess.CompletedProcess]:
+    """Roda `commands` em sequência numa só sessão de shell (atalho para CommandBatch)."""
+    runner = CommandBatch(timeout, batch)
+    for cmd in commands:
+        runner.add(cmd)
+    return runner.run()
+
+
+def app_data_dir(*parts: str) -> str:
+    """Diretório de dados do app (logs, índices, histórico); não cria nada em disco.
+
+    Windows: %LOCALAPPDATA%\\CloudOptimizer. Demais sistemas: $XDG_STATE_HOME/cloud-optimizer
+    (padrão ~/.local/state). CLOUD_OPTIMIZER_HOME sobrescreve ambos.
+    """
+    base = os.environ.get("CLOUD_OPTIMIZER_HOME")
+    if not base:
+        if os.name == "nt":
+            base = os.path.join(os.environ.get("LOCALAPPDATA") or os.path.expanduser("~"), "CloudOptimizer")
+        else:
+            state = os.environ.get("XDG_STATE_HOME") or os.path.join(os.path.expanduser("~"), ".local", "state")
+            base = os.path.join(state, "cloud-optimizer")
+    return os.path.join(base, *parts)
+
+
+def is_link(entry: os.DirEntry) -> bool:
+    """True para symlink ou junction (reparse point no Windows): varreduras não entram neles."""
+    if entry.is_symlink():
+        return True
+    try:
+        return bool(getattr(entry.stat(follow_symlinks=False), 'st_file_attributes', 0) & _REPARSE_POINT)
+    except OSError:
+        return False
+
+
+def format_bytes(num: float) -> str:
+    """Formata bytes em unidade legível (B, KB, MB, GB, TB)."""
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(num) < 1024.0:
+            return f"{num:.0f} {unit}" if unit == "B" else f"{num:.1f} {unit}"
+        num /= 1024.0
+    return f"{num:.1f} TB"
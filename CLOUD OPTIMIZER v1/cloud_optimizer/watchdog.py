@@ -0,0 +1,152 @@
+# Date: 19/10/2026
+# DEV: Martinez
+# Cloud Optimizer v1 Free Utility by Martinez
+
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Dict, List, Optional
+
+from PyQt6 import QtCore
+
+__all__ = ["UiStallWatchdog"]
+
+# Limites superiores (ms) das faixas do histograma de travamentos
+STALL_BUCKETS_MS = (100, 250, 500, 1000, 2500, 5000)
+
+
+class UiStallWatchdog(QtCore.QObject):
+    """Detecta travamentos do event loop do Qt e registra a pilha da UI thread.
+
+    Um QTimer (heartbeat) roda na UI thread e marca o instante de cada batida; a
+    diferença para o intervalo esperado é a latência do event loop. Uma thread
+    vigia as batidas e, se a UI ficar parada além de `threshold_ms`, captura a
+    pilha da UI thread com `sys._current_frames()`. Quando a UI volta, o
+    travamento (duração + pilha) vai para o log de atividades e para o histograma.
+    Travamentos acima de `hang_ms` são registrados na hora, mesmo sem recuperação.
+    """
+
+    def __init__(
+        self,
+        activity_log=None,
+        threshold_ms: Optional[float] = None,
+        heartbeat_ms: int = 20,
+        hang_ms: float = 2000.0,
+        parent=None,
+    ) -> None:
+        super().__init__(parent)
+        if threshold_ms is None:
+            threshold_ms = float(os.environ.get("CLOUD_OPTIMIZER_STALL_MS", "50"))
+        self.threshold = threshold_ms / 1000.0
+        self.interval = heartbeat_ms / 1000.0
+        self.hang = hang_ms / 1000.0
+        self._activity_log = activity_log
+        self._ui_ident = None
+        self._last_beat = time.monotonic()
+        self._beat_no = 0
+        self._captured_beat = -1
+        self._captured_stack: Optional[List[str]] = None
+        self._hang_reported_beat = -1
+        self._latencies = deque(maxlen=1024)
+        self._histogram = [0] * (len(STALL_BUCKETS_MS) + 1)
+        self._stall_count = 0
+        self._max_stall_ms = 0.0
+        self._stop = threading.Event()
+        self._thread = None
+        self._timer = QtCore.QTimer(self)
+        self._timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
+        self._timer.setInterval(heartbeat_ms)
+        self._timer.timeout.connect(self._beat)
+
+    def start(self) -> None:
+        """Inicia o heartbeat e a thread vigia (chamar na UI thread)."""
+        if self._thread is not None:
+            return
+        self._ui_ident = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._timer.start()
+        self._thread = threading.Thread(target=self._watch, name="UiStallWatchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Para o watchdog e grava o resumo do histograma no log."""
+        if self._thread is None:
+            return
+        self._timer.stop()
+        self._stop.set()
+        self._thread.join(1.0)
+        self._thread = None
+        if self._activity_log is not None and self._stall_count:
+            self._activity_log.record("ui_stall_stats", "", **self.stats())
+
+    def stats(self) -> Dict:
+        """Resumo: contagem, maior travamento, histograma e percentis de latência."""
+        labels = [f"<{b}ms" for b in STALL_BUCKETS_MS] + [f">={STALL_BUCKETS_MS[-1]}ms"]
+        lat = sorted(self._latencies)
+
+        def pct(p):
+            return round(lat[min(len(lat) - 1, int(p * len(lat)))] * 1000.0, 2) if lat else 0.0
+
+        return {
+            "stalls": self._stall_count,
+            "max_stall_ms": round(self._max_stall_ms, 1),
+            "histogram": dict(zip(labels, self._histogram)),
+            "latency_p50_ms": pct(0.50),
+            "latency_p99_ms": pct(0.99),
+        }
+
+    # UI thread
+    def _beat(self) -> None:
+        now = time.monotonic()
+        late = max(0.0, now - self._last_beat - self.interval)
+        beat = self._beat_no
+        self._last_beat = now
+        self._beat_no += 1
+        self._latencies.append(late)
+        if late < self.threshold:
+            return
+        stack = self._captured_stack if self._captured_beat == beat else None
+        self._record_stall(late * 1000.0, stack)
+
+    def _record_stall(self, duration_ms: float, stack: Optional[List[str]]) -> None:
+        self._stall_count += 1
+        self._max_stall_ms = max(self._max_stall_ms, duration_ms)
+        idx = len(STALL_BUCKETS_MS)
+        for i, bound in enumerate(STALL_BUCKETS_MS):
+            if duration_ms < bound:
+                idx = i
+                break
+        self._histogram[idx] += 1
+        if self._activity_log is not None:
+            self._activity_log.record(
+                "ui_stall", f"UI travada por {duration_ms:.0f} ms",
+                duration_ms=round(duration_ms, 1), stack=stack or [],
+            )
+
+    # Thread vigia
+    def _watch(self) -> None:
+        poll = max(0.005, self.threshold / 2.0)
+        while not self._stop.wait(poll):
+            beat = self._beat_no
+            blocked = time.monotonic() - self._last_beat - self.interval
+            if blocked < self.threshold:
+                continue
+            if self._captured_beat != beat:
+                self._captured_stack = self._capture_ui_stack()
+                self._captured_beat = beat
+            if blocked >= self.hang and self._hang_reported_beat != beat and self._activity_log is not None:
+                self._hang_reported_beat = beat
+                self._activity_log.record(
+                    "ui_hang", f"UI sem resposta há {blocked * 1000.0:.0f} ms",
+                    duration_ms=round(blocked * 1000.0, 1), stack=self._capture_ui_stack(),
+                )
+
+    def _capture_ui_stack(self, limit: int = 40) -> List[str]:
+        frame = sys._current_frames().get(self._ui_ident)
+        if frame is None:
+            return []
+        return [line.rstrip() for line in traceback.format_stack(frame, limit=limit)]
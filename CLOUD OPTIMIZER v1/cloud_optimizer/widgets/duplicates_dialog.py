@@ -0,0 +1,185 @@
+# Date: 19/10/2026
+# DEV: Martinez
+# Cloud Optimizer v1 Free Utility by Martinez
+
+import os
+import threading
+from PyQt6 import QtCore, QtWidgets
+
+from cloud_optimizer.duplicates import find_duplicates
+from cloud_optimizer.utils import format_bytes
+
+
+class DuplicatesDialog(QtWidgets.QDialog):
+    """Diálogo do localizador de duplicados.
+
+    A busca roda numa thread; cada grupo confirmado chega pela fila de eventos
+    do Qt e aparece na hora, sem esperar o fim da varredura. Em cada grupo a
+    primeira cópia fica desmarcada e as demais podem ser apagadas; a exclusão
+    também roda numa thread (volume lento ou de rede não trava a janela).
+    """
+
+    def __init__(self, parent=None, log_panel=None, folder: str = "") -> None:
+        super().__init__(parent)
+        self._log_panel = log_panel
+        self._cancel = None
+        self._deleting = []  # itens da árvore sendo apagados, na ordem enviada à thread
+        self.setWindowTitle("Arquivos Duplicados")
+        self.setMinimumSize(760, 520)
+        self._build_ui(folder or os.path.expanduser("~"))
+
+    def _build_ui(self, folder: str) -> None:
+        self.setStyleSheet("""
+            QDialog{background:qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #18122b, stop:1 #22113a);}
+            QLabel{color:#cfcfd6;font-size:12px;}
+            QLineEdit{background:rgba(255,255,255,0.05);border:1px solid rgba(255,255,255,0.08);border-radius:10px;padding:8px 12px;color:#e7e7e9;font-size:13px;}
+            QTreeWidget{background:rgba(255,255,255,0.04);border:1px solid rgba(159,89,255,0.35);border-radius:12px;color:#e7e7e9;font-size:13px;}
+            QHeaderView::section{background:transparent;color:#9aa0a6;border:none;padding:6px;font-weight:600;}
+            QPushButton{background:qlineargradient(x1:0,y1:0,x2:1,y2:0, stop:0 #c66bff, stop:1 #9f59ff);color:#fff;font-weight:600;font-size:13px;border:none;padding:8px 18px;border-radius:10px;}
+            QPushButton:hover{background:qlineargradient(x1:0,y1:0,x2:1,y2:0, stop:0 #d488ff, stop:1 #ae72ff);}
+            QPushButton:disabled{background:#2f2f33;color:#777;}
+        """)
+        layout = QtWidgets.QVBoxLayout(self); layout.setContentsMargins(20,20,20,20); layout.setSpacing(12)
+        row = QtWidgets.QHBoxLayout(); row.setSpacing(8)
+        self.folder_edit = QtWidgets.QLineEdit(folder); self.folder_edit.setPlaceholderText("Pastas separadas por ';'")
+        row.addWidget(self.folder_edit, 1)
+        self.btn_search = QtWidgets.QPushButton("PROCURAR"); self.btn_search.clicked.connect(self.start_search); row.addWidget(self.btn_search)
+        layout.addLayout(row)
+        self.status = QtWidgets.QLabel("Arquivos com tamanho único são descartados sem leitura; os demais são comparados por hash.")
+        layout.addWidget(self.status)
+        self.tree = QtWidgets.QTreeWidget(); self.tree.setColumnCount(2); self.tree.setHeaderLabels(["Arquivo", "Tamanho"]); self.tree.setUniformRowHeights(True)
+        self.tree.header().setSectionResizeMode(0, QtWidgets.QHeaderView.ResizeMode.Stretch)
+        self.tree.header().setSectionResizeMode(1, QtWidgets.QHeaderView.ResizeMode.ResizeToContents)
+        layout.addWidget(self.tree, 1)
+        bottom = QtWidgets.QHBoxLayout(); bottom.addStretch()
+        self.btn_delete = QtWidgets.QPushButton("APAGAR MARCADOS"); self.btn_delete.setEnabled(False); self.btn_delete.clicked.connect(self.delete_checked)
+        bottom.addWidget(self.btn_delete)
+        layout.addLayout(bottom)
+
+    def start_search(self) -> None:
+        if self._deleting:
+            return
+        if self._cancel is not None:
+            self._cancel.set(); return
+        folders = [f.strip() for f in self.folder_edit.text().split(';') if f.strip()]
+        if not any(os.path.isdir(f) for f in folders):
+            self.status.setText("Nenhuma pasta válida."); return
+        self.tree.clear(); self.btn_delete.setEnabled(False)
+        self._cancel = threading.Event(); cancel = self._cancel
+        self.btn_search.setText("CANCELAR")
+        self._log("Procurando duplicados em " + "; ".join(folders), event='duplicates_start', folders=folders)
+        queued = QtCore.Qt.ConnectionType.QueuedConnection
+
+        def on_group(group):
+            QtCore.QMetaObject.invokeMethod(self, "_add_group", queued, QtCore.Q_ARG(object, group))
+
+        def on_progress(ev):
+            if ev['phase'] == 'scan':
+                text = f"Varredura: {ev['files_scanned']} arquivos • {format_bytes(ev['bytes_scanned'])}"
+            else:
+                pct = ev['bytes_hashed'] * 100.0 / ev['bytes_to_hash'] if ev['bytes_to_hash'] else 100.0
+                text = f"Comparando: {pct:.0f}% de {format_bytes(ev['bytes_to_hash'])} • {ev['groups']} grupos"
+            QtCore.QMetaObject.invokeMethod(self.status, 'setText', queued, QtCore.Q_ARG(str, text))
+
+        def job():
+            try:
+                report = find_duplicates(folders, on_group=on_group, progress=on_progress, cancel=cancel)
+                result = {"report": report, "cancelled": cancel.is_set(), "error": None}
+            except Exception as exc:
+                result = {"report": None, "cancelled": False, "error": exc}
+            QtCore.QMetaObject.invokeMethod(self, "_search_finished", queued, QtCore.Q_ARG(object, result))
+
+        threading.Thread(target=job, daemon=True).start()
+
+    @QtCore.pyqtSlot(object)
+    def _add_group(self, group) -> None:
+        top = QtWidgets.QTreeWidgetItem([f"{len(group['paths'])} cópias • {format_bytes(group['wasted'])} recuperáveis", format_bytes(group['size'])])
+        for i, path in enumerate(group['paths']):
+            child = QtWidgets.QTreeWidgetItem([path, ""])
+            child.setFlags(child.flags() | QtCore.Qt.ItemFlag.ItemIsUserCheckable)
+            child.setCheckState(0, QtCore.Qt.CheckState.Unchecked if i == 0 else QtCore.Qt.CheckState.Checked)
+            child.setData(0, QtCore.Qt.ItemDataRole.UserRole, group['size'])
+            top.addChild(child)
+        self.tree.addTopLevelItem(top)
+        self.btn_delete.setEnabled(True)
+
+    @QtCore.pyqtSlot(object)
+    def _search_finished(self, payload) -> None:
+        self._cancel = None
+        self.btn_search.setText("PROCURAR")
+        if payload.get("error"):
+            self.status.setText(f"Erro: {payload['error']}")
+            self._log(f"Erro ao procurar duplicados: {payload['error']}", event='error'); return
+        report = payload["report"]
+        summary = (f"{len(report['groups'])} grupos • {report['duplicate_files']} cópias • {format_bytes(report['wasted_bytes'])} recuperáveis • "
+                   f"{report['files_scanned']} arquivos, {format_bytes(report['bytes_hashed'])} lidos • {report['elapsed_s']:.1f}s")
+        if payload.get("cancelled"):
+            summary = "Cancelado: " + summary
+        self.status.setText(summary)
+        self._log(f"Duplicados: {summary}", event='duplicates_finish',
+                  **{k: v for k, v in report.items() if k not in ('groups', 'errors')}, errors=len(report['errors']))
+
+    def delete_checked(self) -> None:
+        targets = []
+        for i in range(self.tree.topLevelItemCount()):
+            top = self.tree.topLevelItem(i)
+            children = [top.child(j) for j in range(top.childCount())]
+            checked = [c for c in children if c.checkState(0) == QtCore.Qt.CheckState.Checked]
+            if checked and len(checked) == len(children):
+                QtWidgets.QMessageBox.warning(self, "Duplicados", "Mantenha pelo menos uma cópia desmarcada em cada grupo.")
+                return
+            targets.extend(checked)
+        if not targets:
+            return
+        total = sum(c.data(0, QtCore.Qt.ItemDataRole.UserRole) for c in targets)
+        answer = QtWidgets.QMessageBox.question(self, "Duplicados", f"Apagar {len(targets)} arquivos ({format_bytes(total)})?")
+        if answer != QtWidgets.QMessageBox.StandardButton.Yes:
+            return
+        self._deleting = targets
+        paths = [c.text(0) for c in targets]
+        self.btn_delete.setEnabled(False); self.btn_search.setEnabled(False)
+        self.status.setText(f"Apagando {len(paths)} arquivos...")
+        queued = QtCore.Qt.ConnectionType.QueuedConnection
+
+        def job():
+            removed, errors = [], []
+            for i, path in enumerate(paths):
+                try:
+                    os.remove(path)
+                    removed.append(i)
+                except OSError as e:
+                    errors.append((i, str(e)))
+                if (i + 1) % 200 == 0:
+                    QtCore.QMetaObject.invokeMethod(self.status, 'setText', queued,
+                                                    QtCore.Q_ARG(str, f"Apagando: {i + 1} de {len(paths)} arquivos..."))
+            QtCore.QMetaObject.invokeMethod(self, "_delete_finished", queued,
+                                            QtCore.Q_ARG(object, {"removed": removed, "errors": errors}))
+
+        threading.Thread(target=job, daemon=True).start()
+
+    @QtCore.pyqtSlot(object)
+    def _delete_finished(self, payload) -> None:
+        targets, self._deleting = self._deleting, []
+        freed = 0
+        for i in payload["removed"]:
+            child = targets[i]
+            freed += child.data(0, QtCore.Qt.ItemDataRole.UserRole)
+            child.parent().removeChild(child)
+        for i, error in payload["errors"]:
+            self._log(f"Não foi possível apagar {targets[i].text(0)}: {error}", event='error')
+        for i in range(self.tree.topLevelItemCount() - 1, -1, -1):
+            if self.tree.topLevelItem(i).childCount() < 2:
+                self.tree.takeTopLevelItem(i)
+        removed = len(payload["removed"])
+        self.btn_search.setEnabled(True); self.btn_delete.setEnabled(self.tree.topLevelItemCount() > 0)
+        self.status.setText(f"{removed} arquivos apagados • {format_bytes(freed)} liberados")
+        self._log(f"Duplicados apagados: {removed} arquivos, {format_bytes(freed)}", event='duplicates_deleted', files=removed, bytes=freed)
+
+    def reject(self) -> None:
+        if self._cancel is not None:
+            self._cancel.set()
+        super().reject()
+
+    def _log(self, msg: str, event: str = 'info', **fields) -> None:
+        if self._log_panel is not None:
+            self._log_panel.append(msg, event=event, **fields)
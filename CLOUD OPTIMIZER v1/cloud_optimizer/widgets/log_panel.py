@@ -2,16 +2,34 @@
 # DEV: Martinez
 # Cloud Optimizer v1 Free Utility by Martinez
 
+import time
+from collections import deque
 from PyQt6 import QtCore, QtGui, QtWidgets
-from datetime import datetime
 
 
 class LogPanelWidget(QtWidgets.QFrame):
-    """Painel de log reutilizável com métodos append/clear/copy."""
+    """Painel de log reutilizável com métodos append/clear/copy.
 
-    def __init__(self, parent=None) -> None:
+    `append` pode ser chamado de qualquer thread: as mensagens entram numa fila
+    limitada (deque, operações atômicas no CPython) e são gravadas no widget em lotes
+    por um QTimer na UI thread. O QPlainTextEdit mantém no máximo `max_lines` linhas.
+    Se um `ActivityLog` for informado, cada mensagem também vira um evento em disco.
+    """
+
+    FLUSH_INTERVAL_MS = 100
+
+    def __init__(self, parent=None, max_lines: int = 2000, activity_log=None) -> None:
         super().__init__(parent)
+        self._max_lines = max_lines
+        self._activity_log = activity_log
+        # Se a UI travar, as mensagens mais antigas são descartadas (memória limitada)
+        self._pending = deque(maxlen=max_lines)
+        self._ts_cache = (0, '')
         self._build_ui()
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush_pending)
+        self._flush_timer.start()
 
     def _build_ui(self) -> None:
         self.setStyleSheet(
@@ -50,31 +68,52 @@ class LogPanelWidget(QtWidgets.QFrame):
         separator = QtWidgets.QFrame(); separator.setFixedHeight(1); separator.setStyleSheet("background:rgba(159,89,255,0.1);")
         v.addWidget(separator)
 
-        self.status_box = QtWidgets.QTextEdit(); self.status_box.setReadOnly(True); self.status_box.setFixedHeight(115)
+        self.status_box = QtWidgets.QPlainTextEdit(); self.status_box.setReadOnly(True); self.status_box.setFixedHeight(115)
+        self.status_box.setMaximumBlockCount(self._max_lines)
         self.status_box.setStyleSheet(
             """
-            QTextEdit{background:rgba(0,0,0,0.25);color:#e8e8e8;border:1px solid rgba(255,255,255,0.03);border-radius:8px;padding:10px;font-family:'Consolas','Courier New',monospace;font-size:11px;selection-background-color:rgba(159,89,255,0.3);} 
+            QPlainTextEdit{background:rgba(0,0,0,0.25);color:#e8e8e8;border:1px solid rgba(255,255,255,0.03);border-radius:8px;padding:10px;font-family:'Consolas','Courier New',monospace;font-size:11px;selection-background-color:rgba(159,89,255,0.3);} 
             QScrollBar:vertical{background:transparent;width:8px;margin:2px;border-radius:4px;} 
             QScrollBar::handle:vertical{background:rgba(180,120,255,0.6);min-height:20px;border-radius:4px;} 
             QScrollBar::handle:vertical:hover{background:rgba(180,120,255,0.9);} 
             QScrollBar::add-line,QScrollBar::sub-line{height:0;}
             """
         )
-        self.status_box.setLineWrapMode(QtWidgets.QTextEdit.LineWrapMode.NoWrap)
+        self.status_box.setLineWrapMode(QtWidgets.QPlainTextEdit.LineWrapMode.NoWrap)
         self.status_box.setPlaceholderText("Nenhuma atividade registrada ainda...")
         v.addWidget(self.status_box)
         self.setFixedHeight(190)
 
     # API pública
-    def append(self, msg: str) -> None:
-        try:
-            ts = datetime.now().strftime('%H:%M:%S')
-            self.status_box.append(f"[{ts}] {msg}")
-        except Exception:
-            pass
+    def append(self, msg: str, event: str = 'info', **fields) -> None:
+        """Enfileira uma mensagem (thread-safe); ela aparece no próximo flush.
+
+        `event` e os campos extras vão apenas para o log de atividades em disco.
+        """
+        self._pending.append((time.time(), msg))
+        if self._activity_log is not None:
+            self._activity_log.record(event, msg, **fields)
+
+    def load_previous_session(self, limit: int = 50) -> None:
+        """Carrega em segundo plano as últimas linhas gravadas da sessão anterior."""
+        if self._activity_log is None:
+            return
+        current = self._activity_log.session
+
+        def show(records):
+            previous = [r for r in records if r.get('session') != current]
+            if not previous:
+                return
+            self._pending.append((previous[0].get('ts', time.time()), '── Sessão anterior ──'))
+            for rec in previous:
+                self._pending.append((rec.get('ts', time.time()), rec.get('msg', '')))
+            self._pending.append((time.time(), '── Sessão atual ──'))
+
+        self._activity_log.load_tail_async(show, limit)
 
     def clear_logs(self) -> None:
         try:
+            self._pending.clear()
             self.status_box.clear()
             self.append('Logs limpos.')
         except Exception:
@@ -82,7 +121,34 @@ class LogPanelWidget(QtWidgets.QFrame):
 
     def copy_logs(self) -> None:
         try:
+            self._flush_pending()
             QtWidgets.QApplication.clipboard().setText(self.status_box.toPlainText())
             self.append('Logs copiados para a área de transferência.')
         except Exception:
             pass
+
+    def _format_ts(self, ts: float) -> str:
+        # Reaproveita o texto do horário enquanto o segundo não muda
+        sec = int(ts)
+        if sec != self._ts_cache[0]:
+            self._ts_cache = (sec, time.strftime('%H:%M:%S', time.localtime(sec)))
+        return self._ts_cache[1]
+
+    def _flush_pending(self) -> None:
+        pending = self._pending
+        if not pending:
+            return
+        lines = []
+        try:
+            while True:
+                ts, msg = pending.popleft()
+                lines.append(f"[{self._format_ts(ts)}] {msg}")
+        except IndexError:
+            pass
+        # Só as últimas linhas sobreviveriam ao limite do widget
+        if len(lines) > self._max_lines:
+            lines = lines[-self._max_lines:]
+        try:
+            self.status_box.appendPlainText('\n'.join(lines))
+        except Exception:
+            pass